@@ -0,0 +1,111 @@
+"""
+bench_docx_tables.py
+--------------------
+Benchmark for DOCX table construction on catalog-sized tables (the item and
+enemy catalogs in `content_design` routinely run to hundreds of rows).
+
+Compares the cell-by-cell python-docx path (table.rows[r].cells[c].text plus
+the style_table_* walks) with the single-pass XML builder used by
+generate_gdd_docx (docx_styles.build_table_element / add_styled_table).
+
+Usage:
+    python scripts/benchmarks/bench_docx_tables.py
+    python scripts/benchmarks/bench_docx_tables.py --rows 500 --cols 5 --tables 3 --repeat 3
+
+Requirements:
+    pip install python-docx
+"""
+
+import argparse
+import io
+import os
+import sys
+import time
+from typing import Callable, List
+
+SCRIPTS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if SCRIPTS_DIR not in sys.path:
+    sys.path.insert(0, SCRIPTS_DIR)
+
+from docx import Document  # noqa: E402
+
+from utils.docx_styles import (  # noqa: E402
+    set_document_margins, style_table_header_row, style_table_data_row,
+    set_table_borders, add_styled_table, register_gdd_styles,
+)
+
+
+def make_catalog_rows(n_rows: int, n_cols: int) -> List[List[str]]:
+    """Build a header row plus n_rows of item-catalog-like data."""
+    header = ["Item", "Tier", "Cost", "Effect", "Drop Source", "Notes"][:n_cols]
+    header += [f"Col {i}" for i in range(len(header), n_cols)]
+    rows = [header]
+    for i in range(n_rows):
+        row = [f"Item {i}", f"T{i % 5}", str(i * 3), f"+{i % 17}% damage vs shielded"]
+        row += [f"Zone {i % 9} elite", "Tradeable"]
+        row += [f"v{i}" for _ in range(len(row), n_cols)]
+        rows.append(row[:n_cols])
+    return rows
+
+
+def build_cell_by_cell(doc, rows: List[List[str]]) -> None:
+    """Reference implementation: the previous python-docx cell API path."""
+    n_cols = max(len(row) for row in rows)
+    table = doc.add_table(rows=len(rows), cols=n_cols)
+    table.style = "Table Grid"
+    for r_idx, row in enumerate(rows):
+        for c_idx, cell_text in enumerate(row):
+            table.rows[r_idx].cells[c_idx].text = cell_text
+    style_table_header_row(table.rows[0])
+    for r_idx in range(1, len(table.rows)):
+        style_table_data_row(table.rows[r_idx], alternate=(r_idx % 2 == 0))
+    set_table_borders(table)
+
+
+def build_single_pass(doc, rows: List[List[str]]) -> None:
+    """Single-pass XML builder used by generate_gdd_docx."""
+    add_styled_table(doc, rows)
+
+
+def run_case(builder: Callable, rows: List[List[str]], tables: int, repeat: int):
+    """Return (best seconds, saved .docx size in bytes) for one builder."""
+    best = float("inf")
+    size = 0
+    for _ in range(repeat):
+        doc = Document()
+        register_gdd_styles(doc)
+        set_document_margins(doc)
+        start = time.perf_counter()
+        for _ in range(tables):
+            builder(doc, rows)
+        elapsed = time.perf_counter() - start
+        best = min(best, elapsed)
+        buf = io.BytesIO()
+        doc.save(buf)
+        size = buf.tell()
+    return best, size
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark DOCX table construction")
+    parser.add_argument("--rows", type=int, default=500, help="Data rows per table")
+    parser.add_argument("--cols", type=int, default=4, help="Columns per table")
+    parser.add_argument("--tables", type=int, default=2, help="Tables per document")
+    parser.add_argument("--repeat", type=int, default=3, help="Repetitions (best is reported)")
+    args = parser.parse_args()
+
+    rows = make_catalog_rows(args.rows, args.cols)
+    print(f"Tables: {args.tables} × {args.rows} rows × {args.cols} cols "
+          f"(best of {args.repeat})")
+
+    old_t, old_size = run_case(build_cell_by_cell, rows, args.tables, args.repeat)
+    new_t, new_size = run_case(build_single_pass, rows, args.tables, args.repeat)
+
+    print(f"  cell-by-cell python-docx : {old_t * 1000:9.1f} ms   {old_size / 1024:8.1f} KB")
+    print(f"  single-pass XML builder  : {new_t * 1000:9.1f} ms   {new_size / 1024:8.1f} KB")
+    if new_t > 0:
+        print(f"  speedup                  : {old_t / new_t:9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+convert_gddpack.py
+------------------
+Converts GDD configs between JSON and the indexed .gddpack container, and
+lists a pack's sections and checks them against their CRCs.
+
+Usage:
+    python scripts/convert_gddpack.py gdd_content.json --output MyGame_v03.gddpack
+    python scripts/convert_gddpack.py MyGame_v03.gddpack --output gdd_content.json
+    python scripts/convert_gddpack.py MyGame_v03.gddpack --list
+
+Any generator's --config also accepts a .gddpack directly.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+if SCRIPT_DIR not in sys.path:
+    sys.path.insert(0, SCRIPT_DIR)
+
+from utils.gddpack import PACK_EXTENSION, GddPack, is_gddpack, unpack_to_json, write_pack
+from utils.project_loader import load_project
+
+
+def list_pack(path: str) -> None:
+    """
+    Print a pack's index: one line per section with its sizes. Every blob
+    is checked against its CRC; corrupt ones are marked and raise
+    ValueError once the listing is printed.
+    """
+    with GddPack(path) as pack:
+        entries = pack.index["sections"]
+        corrupt = pack.verify()
+        print(f"{pack.game_title or '(untitled)'} — {len(entries)} sections, "
+              f"{os.path.getsize(path):,} bytes")
+        for entry in entries:
+            mark = "  CORRUPT" if entry["key"] in corrupt else ""
+            print(f"  {entry['key']:<32} {entry['raw_size']:>10,} → {entry['size']:>9,} bytes{mark}")
+    if corrupt:
+        raise ValueError(f"{path}: {len(corrupt)} corrupt blob(s): {', '.join(corrupt)}")
+
+
+def convert(input_path: str, output_path: str) -> None:
+    """Pack a JSON config (or split-file project), or unpack a .gddpack to JSON."""
+    start = time.perf_counter()
+    if is_gddpack(input_path):
+        unpack_to_json(input_path, output_path)
+        print(f"✓ JSON written: {os.path.abspath(output_path)}")
+    else:
+        game_data = load_project(input_path)
+        size = write_pack(game_data, output_path)
+        print(f"✓ Pack written: {os.path.abspath(output_path)} "
+              f"({os.path.getsize(input_path):,} → {size:,} bytes)")
+    print(f"  {(time.perf_counter() - start) * 1000:.0f} ms")
+
+
+# ─────────────────────────────────────────────
+# CLI ENTRY POINT
+# ─────────────────────────────────────────────
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Convert GDD configs between JSON and .gddpack",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Pack a JSON config (or a split-file project) for the archive:
+  python convert_gddpack.py gdd_content.json --output MyGame_v03.gddpack
+
+  # Back to JSON (lossless):
+  python convert_gddpack.py MyGame_v03.gddpack --output gdd_content.json
+
+  # Show the section index and check every blob:
+  python convert_gddpack.py MyGame_v03.gddpack --list
+        """
+    )
+    parser.add_argument("input", help="JSON config or .gddpack file")
+    parser.add_argument("--output", help="Output path (default: input with the other extension)")
+    parser.add_argument("--list", action="store_true", help="List a .gddpack's sections and verify their CRCs")
+
+    args = parser.parse_args()
+
+    try:
+        if args.list:
+            list_pack(args.input)
+            return
+        output = args.output
+        if not output:
+            stem = os.path.splitext(args.input)[0]
+            output = stem + (".json" if is_gddpack(args.input) else PACK_EXTENSION)
+        if os.path.abspath(output) == os.path.abspath(args.input):
+            print("ERROR: Output would overwrite the input; pass --output")
+            sys.exit(1)
+        convert(args.input, output)
+    except (FileNotFoundError, ValueError) as e:
+        print(f"ERROR: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,185 @@
+"""
+diff_gdd.py
+-----------
+Compares two versions of a GDD section by section and writes a redline
+.docx with insertions and deletions as Word tracked changes (or as
+colored runs with --highlight).
+
+Either side may be a JSON config, a split-file project, a .gddpack or a
+version store (with --old-version-id / --new-version-id).
+
+Usage:
+    python scripts/diff_gdd.py gdd_v03.json gdd_v04.json
+    python scripts/diff_gdd.py gdd_v03.json gdd_v04.json --output "MyGame_GDD_v03-v04_redline.docx"
+    python scripts/diff_gdd.py echo.gddstore echo.gddstore --old-version-id 3 --new-version-id 4 \\
+        --output redline.docx --changed-only
+
+Requirements:
+    pip install python-docx
+"""
+
+import argparse
+import os
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+if SCRIPT_DIR not in sys.path:
+    sys.path.insert(0, SCRIPT_DIR)
+
+from utils.project_loader import CorruptContentError, load_project
+
+try:
+    from utils.docx_stream import RevisionMarks, StreamingDocxWriter
+    from utils.docx_styles import add_styled_table
+    from utils.docx_template import new_gdd_document
+    from utils.gdd_diff import UNCHANGED, SectionDiff, diff_configs, write_redline
+    DOCX_AVAILABLE = True
+except ImportError:
+    DOCX_AVAILABLE = False
+
+
+def print_summary(diffs: List["SectionDiff"]) -> None:
+    """One line per section: status and words added/removed."""
+    changed = [d for d in diffs if d.status != UNCHANGED]
+    print(f"{len(changed)} of {len(diffs)} section(s) changed")
+    for d in changed:
+        print(f"  {d.number:>2}. {d.title:<34} {d.status:<9} "
+              f"+{d.words_added:,} / -{d.words_removed:,} words")
+
+
+def generate_redline_docx(
+    old_data: Dict,
+    new_data: Dict,
+    output_path: str,
+    author: str = "GDD Diff",
+    track_changes: bool = True,
+    changed_only: bool = False,
+    diffs: Optional[List["SectionDiff"]] = None,
+) -> Tuple[str, List["SectionDiff"]]:
+    """
+    Write a redline .docx of new_data against old_data.
+
+    The document uses the GDD template (styles, header, footer), opens
+    with a change summary table, and then lists the sections with their
+    changes marked. Sections are streamed with StreamingDocxWriter.
+
+    Args:
+        old_data: Earlier version (as loaded by load_project).
+        new_data: Later version.
+        output_path: Output .docx path.
+        author: Author recorded on tracked changes.
+        track_changes: Write w:ins / w:del tracked changes; False colors
+            inserted (green, underlined) and deleted (red, struck) runs.
+        changed_only: Leave unchanged sections out.
+        diffs: Precomputed diff_configs(old_data, new_data) result.
+
+    Returns:
+        (absolute output path, section diffs)
+    """
+    if not DOCX_AVAILABLE:
+        raise ImportError(
+            "python-docx is required. Install with:\n"
+            "  pip install python-docx"
+        )
+    if diffs is None:
+        diffs = diff_configs(old_data, new_data)
+
+    title = new_data.get("game_title", "Untitled Game")
+    old_version = old_data.get("version", "old")
+    new_version = new_data.get("version", "new")
+    date = datetime.now().strftime("%B %Y")
+    doc = new_gdd_document(title, f"{old_version} → {new_version} redline", date)
+
+    doc.add_heading(f"{title} — Changes from {old_version} to {new_version}", level=1)
+    doc.add_paragraph(
+        (f"Insertions and deletions are tracked changes by {author}; accept or reject "
+         "them from Word's Review tab." if track_changes else
+         "Inserted text is green and underlined; deleted text is red and struck through."),
+        style="Normal",
+    )
+    rows = [["Section", "Change", "Words added", "Words removed"]]
+    rows += [[f"{d.number}. {d.title}", d.status.title(), f"{d.words_added:,}", f"{d.words_removed:,}"]
+             for d in diffs if d.status != UNCHANGED]
+    if len(rows) == 1:
+        rows.append(["—", "No changes", "0", "0"])
+    add_styled_table(doc, rows)
+    doc.add_page_break()
+
+    output_dir = os.path.dirname(os.path.abspath(output_path))
+    os.makedirs(output_dir, exist_ok=True)
+    marks = RevisionMarks(
+        author, datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"), track=track_changes
+    )
+    with StreamingDocxWriter(output_path, doc) as writer:
+        write_redline(writer, diffs, marks, changed_only=changed_only)
+    return os.path.abspath(output_path), diffs
+
+
+# ─────────────────────────────────────────────
+# CLI ENTRY POINT
+# ─────────────────────────────────────────────
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compare two GDD versions and write a redline .docx",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Summary of changed sections:
+  python diff_gdd.py gdd_v03.json gdd_v04.json
+
+  # Redline with Word tracked changes:
+  python diff_gdd.py gdd_v03.json gdd_v04.json --output "MyGame_GDD_v03-v04_redline.docx"
+
+  # Two versions from a version store, changed sections only, colored runs:
+  python diff_gdd.py echo.gddstore echo.gddstore --old-version-id 3 --new-version-id 4 \\
+      --output redline.docx --changed-only --highlight
+        """
+    )
+    parser.add_argument("old", help="Earlier version (config, project, .gddpack or version store)")
+    parser.add_argument("new", help="Later version")
+    parser.add_argument("--old-version-id", type=int, help="Version of OLD when it is a version store")
+    parser.add_argument("--new-version-id", type=int, help="Version of NEW when it is a version store")
+    parser.add_argument("--output", help="Write a redline .docx to this path")
+    parser.add_argument("--author", default="GDD Diff", help="Author shown on tracked changes")
+    parser.add_argument("--highlight", action="store_true",
+                        help="Color inserted/deleted text instead of using tracked changes")
+    parser.add_argument("--changed-only", action="store_true",
+                        help="Leave unchanged sections out of the redline")
+
+    args = parser.parse_args()
+
+    try:
+        old_data = load_project(args.old, args.old_version_id)
+        new_data = load_project(args.new, args.new_version_id)
+    except (FileNotFoundError, ValueError) as e:
+        print(f"ERROR loading config: {e}")
+        sys.exit(1)
+    if not DOCX_AVAILABLE:
+        print("ERROR: python-docx is not installed. Install with: pip install python-docx")
+        sys.exit(1)
+
+    start = time.perf_counter()
+    try:
+        diffs = diff_configs(old_data, new_data)
+    except CorruptContentError as e:  # A .gddpack / store blob, read on first use
+        print(f"ERROR loading config: {e}")
+        sys.exit(1)
+    diff_ms = (time.perf_counter() - start) * 1000
+    print_summary(diffs)
+    print(f"  Diff: {diff_ms:.0f} ms")
+
+    if args.output:
+        start = time.perf_counter()
+        path, _ = generate_redline_docx(
+            old_data, new_data, args.output, author=args.author,
+            track_changes=not args.highlight, changed_only=args.changed_only, diffs=diffs
+        )
+        print(f"✓ Redline generated: {path} ({(time.perf_counter() - start) * 1000:.0f} ms)")
+
+
+if __name__ == "__main__":
+    main()
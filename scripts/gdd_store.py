@@ -0,0 +1,138 @@
+"""
+gdd_store.py
+------------
+Keeps every revision of a GDD in a local SQLite version store, sharing
+unchanged sections between revisions.
+
+Usage:
+    python scripts/gdd_store.py echo.gddstore --commit gdd_content.json --summary "Economy pass"
+    python scripts/gdd_store.py echo.gddstore --log
+    python scripts/gdd_store.py echo.gddstore --changed economy_design
+    python scripts/gdd_store.py echo.gddstore --export 3 --output gdd_v3.json
+
+Any generator renders a stored version with --config STORE --version-id N,
+and fills the cover page's version history table from the store.
+"""
+
+import argparse
+import json
+import os
+import sys
+from typing import Optional
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+if SCRIPT_DIR not in sys.path:
+    sys.path.insert(0, SCRIPT_DIR)
+
+from utils.project_loader import load_project
+from utils.version_store import VersionInfo, VersionStore
+
+
+def _print_version(info: VersionInfo, changes: str = "") -> None:
+    print(f"  #{info.id:<5} {info.label:<8} {info.created_at[:16].replace('T', ' ')}  "
+          f"{info.author:<20} {info.summary}{changes}")
+
+
+def commit_config(store: VersionStore, config_path: str, args) -> int:
+    """Store a config (JSON, split-file project or .gddpack) as a new version."""
+    game_data = load_project(config_path)
+    version_id = store.commit(
+        game_data, project=args.project, label=args.label,
+        author=args.author, summary=args.summary
+    )
+    info = store.get_version(version_id)
+    changes = store.changes(version_id)
+    print(f"✓ Stored {info.project} {info.label} as version #{version_id}: {info.summary}")
+    print(f"  {len(changes)} section(s) changed, "
+          f"{len(game_data.get('sections') or {}) - len(changes)} shared with the previous version")
+    return version_id
+
+
+def print_log(store: VersionStore, project: Optional[str] = None) -> None:
+    """List versions per project, oldest first."""
+    for name in ([project] if project else store.projects()):
+        versions = store.list_versions(name)
+        print(f"{name} — {len(versions)} version(s)")
+        for info in versions:
+            _print_version(info)
+
+
+def print_changed(store: VersionStore, section_key: str, project: Optional[str] = None) -> None:
+    """List the versions that added, modified or removed a section."""
+    versions = store.versions_changing(section_key, project)
+    print(f"{section_key} — changed in {len(versions)} version(s)")
+    for info in versions:
+        _print_version(info, f"  [{store.changes(info.id)[section_key]}]")
+
+
+def export_version(store: VersionStore, version_id: int, output_path: str) -> None:
+    """Write a stored version back out as a JSON config."""
+    game_data = store.load_version(version_id, lazy=False)
+    game_data.pop("version_history", None)
+    with open(output_path, "w", encoding="utf-8") as f:
+        json.dump(game_data, f, indent=2, ensure_ascii=False)
+        f.write("\n")
+    print(f"✓ Version #{version_id} exported: {os.path.abspath(output_path)}")
+
+
+# ─────────────────────────────────────────────
+# CLI ENTRY POINT
+# ─────────────────────────────────────────────
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Store and query GDD versions in a local SQLite version store",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Record a revision (summary defaults to the sections that changed):
+  python gdd_store.py echo.gddstore --commit gdd_content.json --author "A. Designer"
+
+  # List versions, and the versions that touched one section:
+  python gdd_store.py echo.gddstore --log
+  python gdd_store.py echo.gddstore --changed monetization_strategy
+
+  # Render or export a stored version:
+  python generate_gdd_pdf.py --config echo.gddstore --version-id 3 --output Echo_v3.pdf
+  python gdd_store.py echo.gddstore --export 3 --output gdd_v3.json
+        """
+    )
+    parser.add_argument("store", help="Version store file (created by --commit if missing)")
+    action = parser.add_mutually_exclusive_group(required=True)
+    action.add_argument("--commit", metavar="CONFIG", help="Store a config as a new version")
+    action.add_argument("--log", action="store_true", help="List stored versions")
+    action.add_argument("--changed", metavar="SECTION",
+                        help="List versions that changed a section (e.g. game_mechanics)")
+    action.add_argument("--export", metavar="ID", type=int, help="Write a version as JSON")
+    parser.add_argument("--project", help="Project name (default: the config's game_title)")
+    parser.add_argument("--label", help="Version label (default: the config's version)")
+    parser.add_argument("--author", help="Author (default: the config's lead_designer)")
+    parser.add_argument("--summary", help="Summary of changes (default: generated)")
+    parser.add_argument("--output", help="Output path for --export")
+
+    args = parser.parse_args()
+
+    if not args.commit and not os.path.isfile(args.store):
+        print(f"ERROR: Version store not found: {args.store}")
+        sys.exit(1)
+    if args.export is not None and not args.output:
+        print("ERROR: --export needs --output")
+        sys.exit(1)
+
+    try:
+        with VersionStore(args.store, create=bool(args.commit)) as store:
+            if args.commit:
+                commit_config(store, args.commit, args)
+            elif args.log:
+                print_log(store, args.project)
+            elif args.changed:
+                print_changed(store, args.changed, args.project)
+            else:
+                export_version(store, args.export, args.output)
+    except (FileNotFoundError, ValueError) as e:
+        print(f"ERROR: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
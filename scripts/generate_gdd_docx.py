@@ -6,6 +6,7 @@ Generates a professional, publisher-grade Game Design Document as a .docx file.
 Usage:
     python scripts/generate_gdd_docx.py --title "My Game" --output "MyGame_GDD_v01.docx"
     python scripts/generate_gdd_docx.py --config gdd_content.json --output "MyGame_GDD_v01.docx"
+    python scripts/generate_gdd_docx.py --config mmo_bible.json --output "MMO_GDD_v03.docx" --stream
 
 Requirements:
     pip install python-docx
@@ -17,15 +18,26 @@ The script accepts either:
 """
 
 import argparse
-import json
+import io
 import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from itertools import repeat
 from typing import Any, Dict, List, Optional
 
 # Ensure utils is importable when running from scripts/
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
-sys.path.insert(0, SCRIPT_DIR)
+if SCRIPT_DIR not in sys.path:
+    sys.path.insert(0, SCRIPT_DIR)
+
+from utils.project_loader import CorruptContentError, load_project
+from utils.async_render import AsyncRenderer, RenderJob
+from utils.render_output import (
+    Output, RenderContext, RenderResult, StrictModeError, exit_on_strict_failure, raise_if_strict,
+    write_output,
+)
+from utils.version_store import history_table_rows
 
 try:
     from docx import Document
@@ -39,14 +51,18 @@ except ImportError:
 
 try:
     from utils.docx_styles import (
-        Colors, Fonts, PageLayout,
+        Colors, Fonts,
         apply_heading_1_style, apply_heading_2_style,
         apply_heading_3_style, apply_heading_4_style,
         apply_body_style, apply_code_style, apply_caption_style,
-        style_table_header_row, style_table_data_row, set_table_borders,
+        apply_bullet_style, apply_numbered_style,
+        add_styled_table,
         add_designer_note, add_open_question, add_placeholder_diagram,
-        set_document_margins, add_header_footer,
     )
+    from utils.docx_template import new_gdd_document
+    from utils import content_blocks as blocks
+    from utils.content_blocks import iter_content_blocks
+    from utils.docx_stream import BodyWriter, StreamingDocxWriter
     from utils.section_registry import (
         SECTIONS, SECTION_ORDER, print_section_outline,
         validate_gdd_content, validate_data_sensibility, estimate_content_size,
@@ -157,24 +173,17 @@ def build_cover_page(doc: Any, game_data: Dict) -> None:
     hist_heading = doc.add_heading("Version History", level=2)
     _style_heading(hist_heading, 2)
 
-    table = doc.add_table(rows=1, cols=4)
-    table.style = "Table Grid"
-    headers = ["Version", "Date", "Author", "Summary of Changes"]
-    hdr_cells = table.rows[0].cells
-    for i, h in enumerate(headers):
-        hdr_cells[i].text = h
-    if UTILS_AVAILABLE:
-        style_table_header_row(table.rows[0])
-        set_table_borders(table)
-
-    # Initial row
-    row = table.add_row()
-    row.cells[0].text = version
-    row.cells[1].text = date
-    row.cells[2].text = lead_designer
-    row.cells[3].text = "Initial draft"
+    history_rows = [["Version", "Date", "Author", "Summary of Changes"]]
+    history_rows += history_table_rows(game_data, version, date, lead_designer)
     if UTILS_AVAILABLE:
-        style_table_data_row(row, alternate=False)
+        add_styled_table(doc, history_rows)
+    else:
+        table = doc.add_table(rows=len(history_rows), cols=4)
+        table.style = "Table Grid"
+        for r_idx, row in enumerate(history_rows):
+            cells = table.rows[r_idx].cells
+            for c_idx, cell_text in enumerate(row):
+                cells[c_idx].text = cell_text
 
     doc.add_page_break()
 
@@ -248,6 +257,42 @@ def add_section(
                 _add_prose_content(doc, ssub_content)
 
 
+def stream_section(
+    writer: Any,
+    section_title: str,
+    section_number: int,
+    content: str,
+    subsections: Optional[List[Dict]] = None,
+    add_page_break: bool = True
+) -> None:
+    """
+    Streaming counterpart of add_section(): write a major section through a
+    StreamingDocxWriter instead of the python-docx tree.
+    """
+    if add_page_break:
+        writer.write_page_break()
+
+    writer.write_heading(1, f"{section_number}. {section_title}")
+    writer.write_blocks(iter_content_blocks(content))
+
+    for sub in subsections or []:
+        if sub.get("title", ""):
+            writer.write_heading(2, sub["title"])
+        writer.write_blocks(iter_content_blocks(sub.get("content", "")))
+
+        for subsub in sub.get("subsections", []):
+            if subsub.get("title", ""):
+                writer.write_heading(3, subsub["title"])
+            writer.write_blocks(iter_content_blocks(subsub.get("content", "")))
+
+
+def _render_section_xml(section: Dict, table_width: int) -> str:
+    """Worker-process entry point: render one section's body XML fragment."""
+    out = io.StringIO()
+    stream_section(BodyWriter(out, table_width), **section)
+    return out.getvalue()
+
+
 def _add_prose_content(doc: Any, content: str) -> None:
     """
     Parse and add prose content to document.
@@ -258,127 +303,33 @@ def _add_prose_content(doc: Any, content: str) -> None:
     if not content or not DOCX_AVAILABLE:
         return
 
-    lines = content.split("\n")
-    in_code_block = False
-    code_lines = []
-    in_table = False
-    table_rows = []
-
-    i = 0
-    while i < len(lines):
-        line = lines[i]
-
-        # Code block toggle
-        if line.strip().startswith("```"):
-            if in_code_block:
-                in_code_block = False
-                if code_lines:
-                    code_text = "\n".join(code_lines)
-                    p = doc.add_paragraph(code_text)
-                    if UTILS_AVAILABLE:
-                        apply_code_style(p)
-                    code_lines = []
-            else:
-                in_code_block = True
-            i += 1
-            continue
-
-        if in_code_block:
-            code_lines.append(line)
-            i += 1
-            continue
-
-        # Table rows (| delimited)
-        if line.strip().startswith("|"):
-            if not in_table:
-                in_table = True
-                table_rows = []
-            # Skip separator rows (|---|---|)
-            if not all(c in "-| " for c in line.strip()):
-                cells = [c.strip() for c in line.strip().strip("|").split("|")]
-                table_rows.append(cells)
-            i += 1
-            continue
-        elif in_table:
-            in_table = False
-            if len(table_rows) >= 2:
-                _add_table_from_rows(doc, table_rows)
-            table_rows = []
-
-        # Designer Note
-        if line.strip().startswith("> 🎮") or line.strip().startswith("> Designer"):
-            note_text = line.strip().lstrip("> 🎮").strip()
-            if note_text.startswith("Designer's Note:"):
-                note_text = note_text[len("Designer's Note:"):].strip()
-            if UTILS_AVAILABLE:
-                add_designer_note(doc, note_text)
-            i += 1
-            continue
-
-        # Open Question / Playtest flag
-        if "[OPEN QUESTION:" in line or "[PLAYTEST:" in line:
-            if UTILS_AVAILABLE:
-                # Extract the question text
-                text = line.strip()
-                add_open_question(doc, text)
-            else:
-                p = doc.add_paragraph(line.strip())
-            i += 1
-            continue
-
-        # Diagram placeholder
-        if line.strip().startswith("[DIAGRAM:"):
-            diagram_label = line.strip().lstrip("[DIAGRAM:").rstrip("]").strip()
-            if UTILS_AVAILABLE:
-                add_placeholder_diagram(doc, diagram_label)
-            i += 1
-            continue
-
-        # Headings (## prefix)
-        if line.startswith("#### "):
-            h = doc.add_heading(line[5:], level=4)
-            _style_heading(h, 4)
-        elif line.startswith("### "):
-            h = doc.add_heading(line[4:], level=3)
-            _style_heading(h, 3)
-        elif line.startswith("## "):
-            h = doc.add_heading(line[3:], level=2)
-            _style_heading(h, 2)
-
-        # Bullet points
-        elif line.strip().startswith("- ") or line.strip().startswith("* "):
-            bullet_text = line.strip().lstrip("-").lstrip("*").strip()
-            p = doc.add_paragraph(style="List Bullet")
-            run = p.add_run(bullet_text)
-            run.font.name = Fonts.BODY_FAMILY
-            run.font.size = Pt(Fonts.BODY_SIZE)
-            p.paragraph_format.space_before = Pt(PageLayout.SPACE_BEFORE_BULLET)
-            p.paragraph_format.space_after = Pt(PageLayout.SPACE_AFTER_BULLET)
-
-        # Numbered list
-        elif len(line) > 2 and line[0].isdigit() and line[1] in ".)" and line[2] == " ":
-            list_text = line[2:].strip()
-            p = doc.add_paragraph(style="List Number")
-            run = p.add_run(list_text)
-            run.font.name = Fonts.BODY_FAMILY
-            run.font.size = Pt(Fonts.BODY_SIZE)
-
-        # Empty line
-        elif not line.strip():
-            pass  # natural paragraph break
-
-        # Regular paragraph
-        else:
+    if not UTILS_AVAILABLE:
+        for line in content.split("\n"):
             if line.strip():
-                p = doc.add_paragraph(line.strip())
-                if UTILS_AVAILABLE:
-                    apply_body_style(p)
-
-        i += 1
+                doc.add_paragraph(line.strip())
+        return
 
-    # Flush any open table
-    if in_table and len(table_rows) >= 2:
-        _add_table_from_rows(doc, table_rows)
+    for kind, payload in iter_content_blocks(content):
+        if kind == blocks.HEADING:
+            level, text = payload
+            h = doc.add_heading(text, level=level)
+            _style_heading(h, level)
+        elif kind == blocks.PARAGRAPH:
+            apply_body_style(doc.add_paragraph(payload))
+        elif kind == blocks.BULLET:
+            apply_bullet_style(doc.add_paragraph(payload))
+        elif kind == blocks.NUMBERED:
+            apply_numbered_style(doc.add_paragraph(payload))
+        elif kind == blocks.CODE:
+            apply_code_style(doc.add_paragraph(payload))
+        elif kind == blocks.TABLE:
+            _add_table_from_rows(doc, payload)
+        elif kind == blocks.NOTE:
+            add_designer_note(doc, payload)
+        elif kind == blocks.QUESTION:
+            add_open_question(doc, payload)
+        elif kind == blocks.DIAGRAM:
+            add_placeholder_diagram(doc, payload)
 
 
 def _add_table_from_rows(doc: Any, rows: List[List[str]]) -> None:
@@ -386,21 +337,16 @@ def _add_table_from_rows(doc: Any, rows: List[List[str]]) -> None:
     if not rows or not DOCX_AVAILABLE:
         return
 
-    n_cols = max(len(row) for row in rows)
-    table = doc.add_table(rows=len(rows), cols=n_cols)
-    table.style = "Table Grid"
-
-    for r_idx, row in enumerate(rows):
-        for c_idx, cell_text in enumerate(row):
-            if c_idx < n_cols:
-                table.rows[r_idx].cells[c_idx].text = cell_text
-
     if UTILS_AVAILABLE:
-        if len(table.rows) > 0:
-            style_table_header_row(table.rows[0])
-        for r_idx in range(1, len(table.rows)):
-            style_table_data_row(table.rows[r_idx], alternate=(r_idx % 2 == 0))
-        set_table_borders(table)
+        add_styled_table(doc, rows)
+    else:
+        n_cols = max(len(row) for row in rows)
+        table = doc.add_table(rows=len(rows), cols=n_cols)
+        table.style = "Table Grid"
+        for r_idx, row in enumerate(rows):
+            cells = table.rows[r_idx].cells
+            for c_idx, cell_text in enumerate(row):
+                cells[c_idx].text = cell_text
 
     doc.add_paragraph()  # Space after table
 
@@ -443,27 +389,43 @@ def add_toc_placeholder(doc: Any) -> None:
 # MAIN GENERATION FUNCTION
 # ─────────────────────────────────────────────
 
-def generate_gdd_docx(
+DOCX_CONTENT_TYPE = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+
+
+def render_gdd_docx(
     game_data: Dict,
-    output_path: str,
+    out: Output = None,
+    context: Optional[RenderContext] = None,
     include_toc: bool = True,
     include_template_sections: bool = True,
-    strict: bool = False
-) -> str:
+    stream: bool = False,
+    jobs: int = 1
+) -> RenderResult:
     """
-    Generate a complete GDD .docx file.
+    Render a complete GDD .docx without printing anything.
 
     Args:
         game_data: Dictionary containing game metadata and section content.
             Required keys: game_title
             Optional keys: tagline, genre, platform, audience, studio_name,
                           version, date, lead_designer, sections (dict of section content)
-        output_path: Path for the output .docx file
+        out: Output path, writable binary stream, or None to return the
+            document bytes in result.data
+        context: Strict mode, warning sink and per-section progress
+            callback; defaults to RenderContext()
         include_toc: Whether to include a table of contents
         include_template_sections: Whether to add template placeholder sections
+        stream: Write section content straight into word/document.xml with
+            StreamingDocxWriter instead of building the python-docx tree;
+            keeps memory flat for very large (50k+ word) documents
+        jobs: Number of worker processes rendering section XML in parallel.
+            Values above 1 imply stream mode.
 
     Returns:
-        Absolute path to the generated file.
+        RenderResult with the document (or its path) and any warnings.
+
+    Raises:
+        StrictModeError: In strict mode, when business sections have warnings.
     """
     if not DOCX_AVAILABLE:
         raise ImportError(
@@ -471,39 +433,41 @@ def generate_gdd_docx(
             "  pip install python-docx"
         )
 
+    context = context or RenderContext()
+    strict = context.strict
+    result = context.new_result(DOCX_CONTENT_TYPE)
+
     # Pre-export validation
     sections_to_validate = game_data.get("sections", {})
     if UTILS_AVAILABLE and sections_to_validate:
-        for warning in validate_gdd_content(sections_to_validate):
-            print(f"  WARNING: {warning}")
+        result.warnings += validate_gdd_content(sections_to_validate)
         sensibility_warnings = validate_data_sensibility(
             sections_to_validate, strict=strict
         )
-        for warning in sensibility_warnings:
-            print(f"  WARNING: {warning}")
-        if strict and sensibility_warnings:
-            raise SystemExit(
-                "STRICT MODE: Export aborted due to unsourced metrics or "
-                "placeholders in business sections. Fix the warnings above "
-                "or remove --strict to export with warnings."
-            )
+        result.warnings += sensibility_warnings
+        raise_if_strict(
+            strict, sensibility_warnings,
+            "STRICT MODE: Export aborted due to unsourced metrics or "
+            "placeholders in business sections. Fix the warnings above "
+            "or remove --strict to export with warnings.",
+            result.warnings,
+        )
         size_info = estimate_content_size(sections_to_validate)
-        for warning in size_info["warnings"]:
-            print(f"  WARNING: {warning}")
-
-    doc = Document()
-
-    # Set document margins
-    if UTILS_AVAILABLE:
-        set_document_margins(doc)
+        result.warnings += size_info["warnings"]
+        result.stats["words"] = size_info["total_words"]
+        if size_info["total_words"] > 50000 and not stream:
+            result.notes.append("TIP: use --stream to write large documents with flat memory use.")
 
-    # Add header/footer
     game_title = game_data.get("game_title", "Untitled Game")
     version = game_data.get("version", "v0.1")
     date = game_data.get("date", datetime.now().strftime("%B %Y"))
 
+    # Start from the cached pre-styled base template (named styles, margins,
+    # header/footer) with this document's title, version and date filled in
     if UTILS_AVAILABLE:
-        add_header_footer(doc, game_title, version, date)
+        doc = new_gdd_document(game_title, version, date)
+    else:
+        doc = Document()
 
     # Cover page
     build_cover_page(doc, game_data)
@@ -512,10 +476,92 @@ def generate_gdd_docx(
     if include_toc:
         add_toc_placeholder(doc)
 
-    # Sections
-    sections_content = game_data.get("sections", {})
+    # Sections (progress is reported as each one is finished)
+    total = _count_sections(game_data, include_template_sections)
+    if jobs > 1 and UTILS_AVAILABLE:
+        # Sections are independent apart from the page break that opens each
+        # one, so render their body XML in worker processes and splice the
+        # fragments into document.xml in order.
+        sections = list(_iter_sections(game_data, include_template_sections))
+
+        def save(target) -> None:
+            with StreamingDocxWriter(target, doc) as writer, \
+                    ProcessPoolExecutor(max_workers=min(jobs, len(sections) or 1)) as pool:
+                fragments = pool.map(
+                    _render_section_xml, sections, repeat(writer.table_width)
+                )
+                for done, (section, fragment) in enumerate(zip(sections, fragments), start=1):
+                    writer.write_raw(fragment)
+                    context.report(section["section_title"], done, total)
+    elif stream and UTILS_AVAILABLE:
+        def save(target) -> None:
+            with StreamingDocxWriter(target, doc) as writer:
+                for done, section in enumerate(
+                    _iter_sections(game_data, include_template_sections), start=1
+                ):
+                    stream_section(writer, **section)
+                    context.report(section["section_title"], done, total)
+    else:
+        for done, section in enumerate(_iter_sections(game_data, include_template_sections), start=1):
+            add_section(doc, **section)
+            context.report(section["section_title"], done, total)
+        save = doc.save
+
+    return write_output(out, save, result)
+
+
+def render_gdd_docx_async(
+    renderer: AsyncRenderer,
+    game_data: Dict,
+    context: Optional[RenderContext] = None,
+    **options: Any
+) -> RenderJob:
+    """
+    Start render_gdd_docx() on an AsyncRenderer, off the event loop.
+
+    Returns:
+        RenderJob: await it for the RenderResult, or iterate it (async for)
+        for per-section RenderProgress first.
+    """
+    return renderer.start(render_gdd_docx, game_data, context, **options)
+
+
+def generate_gdd_docx(
+    game_data: Dict,
+    output_path: str,
+    include_toc: bool = True,
+    include_template_sections: bool = True,
+    strict: bool = False,
+    stream: bool = False,
+    jobs: int = 1
+) -> str:
+    """
+    Generate a complete GDD .docx file, printing warnings as it goes.
+
+    Takes the same arguments as render_gdd_docx(), with output_path in
+    place of out and strict in place of context.
+
+    Returns:
+        Absolute path to the generated file.
+    """
+    try:
+        result = render_gdd_docx(
+            game_data, output_path, RenderContext(strict=strict), include_toc=include_toc,
+            include_template_sections=include_template_sections, stream=stream, jobs=jobs,
+        )
+    except StrictModeError as e:
+        exit_on_strict_failure(e)
+    result.print_report()
+    print(f"✓ GDD document generated: {result.path}")
+    return result.path
+
 
-    section_defs = SECTIONS if UTILS_AVAILABLE else {}
+def _iter_sections(game_data: Dict, include_template_sections: bool):
+    """
+    Yield add_section() keyword arguments for each section in document order,
+    generating template placeholders for missing sections if requested.
+    """
+    sections_content = game_data.get("sections", {})
     section_order = SECTION_ORDER if UTILS_AVAILABLE else list(sections_content.keys())
 
     for idx, section_key in enumerate(section_order):
@@ -523,39 +569,41 @@ def generate_gdd_docx(
             # Generate template placeholder section
             if UTILS_AVAILABLE and section_key in SECTIONS:
                 sdef = SECTIONS[section_key]
-                placeholder_content = _generate_placeholder_section(sdef, game_data)
-                add_section(
-                    doc,
-                    sdef["name"],
-                    sdef["order"],
-                    placeholder_content,
-                    add_page_break=(idx > 0)
+                yield dict(
+                    section_title=sdef["name"],
+                    section_number=sdef["order"],
+                    content=_generate_placeholder_section(sdef, game_data),
+                    add_page_break=(idx > 0),
                 )
         elif section_key in sections_content:
             content = sections_content[section_key]
             if UTILS_AVAILABLE and section_key in SECTIONS:
                 sdef = SECTIONS[section_key]
-                add_section(
-                    doc,
-                    sdef["name"],
-                    sdef["order"],
-                    content if isinstance(content, str) else content.get("content", ""),
+                yield dict(
+                    section_title=sdef["name"],
+                    section_number=sdef["order"],
+                    content=content if isinstance(content, str) else content.get("content", ""),
                     subsections=content.get("subsections") if isinstance(content, dict) else None,
-                    add_page_break=(idx > 0)
+                    add_page_break=(idx > 0),
                 )
             else:
-                add_section(doc, section_key.replace("_", " ").title(), idx + 1,
-                            content if isinstance(content, str) else "",
-                            add_page_break=(idx > 0))
+                yield dict(
+                    section_title=section_key.replace("_", " ").title(),
+                    section_number=idx + 1,
+                    content=content if isinstance(content, str) else "",
+                    add_page_break=(idx > 0),
+                )
 
-    # Ensure output directory exists
-    output_dir = os.path.dirname(os.path.abspath(output_path))
-    os.makedirs(output_dir, exist_ok=True)
 
-    doc.save(output_path)
-    abs_path = os.path.abspath(output_path)
-    print(f"✓ GDD document generated: {abs_path}")
-    return abs_path
+def _count_sections(game_data: Dict, include_template_sections: bool) -> int:
+    """Number of sections _iter_sections() will yield, without reading their content."""
+    sections_content = game_data.get("sections", {})
+    if not UTILS_AVAILABLE:
+        return len(sections_content)
+    return sum(
+        1 for key in SECTION_ORDER
+        if key in sections_content or (include_template_sections and key in SECTIONS)
+    )
 
 
 def _generate_placeholder_section(section_def: Dict, game_data: Dict) -> str:
@@ -599,6 +647,12 @@ Examples:
   # Generate from a JSON config file:
   python generate_gdd_docx.py --config gdd_content.json --output "MyGame_GDD_v01.docx"
 
+  # Stream a very large design bible with flat memory use:
+  python generate_gdd_docx.py --config mmo_bible.json --output "MMO_GDD_v03.docx" --stream
+
+  # Render sections on all CPU cores:
+  python generate_gdd_docx.py --config mmo_bible.json --output "MMO_GDD_v03.docx" --jobs 0
+
   # Print section outline:
   python generate_gdd_docx.py --list-sections
         """
@@ -611,10 +665,16 @@ Examples:
     parser.add_argument("--tagline", default="", help="Game tagline")
     parser.add_argument("--version", default="v0.1", help="Document version")
     parser.add_argument("--config", help="Path to JSON config file with GDD content")
+    parser.add_argument("--version-id", type=int,
+                        help="Version to render when --config is a version store (default: newest)")
     parser.add_argument("--output", default="GDD_output.docx", help="Output file path")
     parser.add_argument("--no-toc", action="store_true", help="Skip table of contents")
     parser.add_argument("--strict", action="store_true",
                         help="Fail export if unsourced metrics or placeholders remain in business sections")
+    parser.add_argument("--stream", action="store_true",
+                        help="Stream section content into the .docx (for 50k+ word documents)")
+    parser.add_argument("--jobs", type=int, default=1, metavar="N",
+                        help="Render sections in N worker processes (0 = one per CPU; implies --stream)")
     parser.add_argument("--list-sections", action="store_true",
                         help="Print GDD section outline and exit")
 
@@ -635,13 +695,12 @@ Examples:
     # Load from config file if provided
     if args.config:
         try:
-            with open(args.config, "r", encoding="utf-8") as f:
-                game_data = json.load(f)
-        except FileNotFoundError:
-            print(f"ERROR: Config file not found: {args.config}")
+            game_data = load_project(args.config, args.version_id)
+        except FileNotFoundError as e:
+            print(f"ERROR: Config or section file not found: {e}")
             sys.exit(1)
-        except json.JSONDecodeError as e:
-            print(f"ERROR: Invalid JSON in config file: {e}")
+        except ValueError as e:
+            print(f"ERROR: Invalid config file: {e}")
             sys.exit(1)
     elif args.title:
         game_data = {
@@ -667,10 +726,15 @@ Examples:
             output_path=args.output,
             include_toc=not args.no_toc,
             include_template_sections=True,
-            strict=args.strict
+            strict=args.strict,
+            stream=args.stream,
+            jobs=args.jobs or os.cpu_count() or 1
         )
         print(f"\n✓ Success! Open in Word and right-click the TOC to update page numbers.")
         print(f"  File: {output_path}")
+    except CorruptContentError as e:  # A .gddpack / store blob, read on first use
+        print(f"ERROR loading config: {e}")
+        sys.exit(1)
     except Exception as e:
         print(f"ERROR during generation: {e}")
         import traceback
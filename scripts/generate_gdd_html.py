@@ -0,0 +1,254 @@
+"""
+generate_gdd_html.py
+--------------------
+Exports a Game Design Document as a static HTML site for reading on
+tablets and phones: a light index page (cover details and a table of
+contents in SECTION_ORDER) and one page per section, fetched only when a
+reader opens it.
+
+Tables are real HTML tables and callouts use the .docx/.pdf palette. The
+site has no scripts or external resources; serve the folder from any
+static file server (or open index.html from disk).
+
+Usage:
+    python scripts/generate_gdd_html.py --config gdd_content.json --output MyGame_GDD_site
+    python scripts/generate_gdd_html.py --config MyGame_GDD.md --output site --no-template-sections
+    python -m http.server --directory MyGame_GDD_site 8000
+"""
+
+import argparse
+import os
+import sys
+import time
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional, Tuple
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+if SCRIPT_DIR not in sys.path:
+    sys.path.insert(0, SCRIPT_DIR)
+
+from utils.html_builder import (
+    STYLESHEET_NAME, build_stylesheet, escape, nav_links, page, section_html, table_html,
+)
+from utils.project_loader import CorruptContentError, load_project
+from utils.section_registry import (
+    SECTIONS, SECTION_ORDER, validate_gdd_content,
+    validate_data_sensibility, estimate_content_size,
+)
+from utils.version_store import history_table_rows
+
+
+SECTIONS_DIR = "sections"
+
+
+def section_filename(section_key: str) -> str:
+    """Page file name for a section, e.g. "05-game_mechanics.html"."""
+    return f"{SECTIONS[section_key]['order']:02d}-{section_key}.html"
+
+
+def _placeholder_text(section_key: str) -> str:
+    sdef = SECTIONS[section_key]
+    lines = [
+        f"This section has not been written yet. Target length: {sdef['recommended_words']} words.",
+        "",
+        "Required elements:",
+    ]
+    lines += [f"- {element.replace('_', ' ').title()}" for element in sdef["key_elements"]]
+    return "\n".join(lines)
+
+
+def _iter_section_pages(
+    game_data: Dict, include_template_sections: bool
+) -> Iterator[Tuple[str, str, Optional[List[Dict]], bool]]:
+    """Yield (key, content, subsections, is_placeholder) in document order."""
+    sections = game_data.get("sections") or {}
+    for section_key in SECTION_ORDER:
+        if section_key in sections:
+            value = sections[section_key]
+            if isinstance(value, dict):
+                yield section_key, value.get("content", ""), value.get("subsections"), False
+            else:
+                yield section_key, value or "", None, False
+        elif include_template_sections:
+            yield section_key, _placeholder_text(section_key), None, True
+
+
+def _word_count(content: str, subsections: Optional[List[Dict]]) -> int:
+    words = len(content.split())
+    for sub in subsections or []:
+        words += len(sub.get("content", "").split())
+        words += sum(len(s.get("content", "").split()) for s in sub.get("subsections", []))
+    return words
+
+
+def _index_body(game_data: Dict, toc: List[Tuple[str, str, int, bool]]) -> str:
+    title = game_data.get("game_title", "Untitled Game")
+    version = game_data.get("version", "v0.1")
+    date = game_data.get("date", datetime.now().strftime("%B %Y"))
+    lead_designer = game_data.get("lead_designer", "Design Team")
+    meta = "  ·  ".join(game_data.get(k, d) for k, d in (
+        ("genre", "Genre TBD"), ("platform", "Platform TBD"), ("audience", "Audience TBD")))
+
+    out = [
+        '<header class="cover">\n',
+        f"<h1>{escape(title)}</h1>\n",
+        f'<p class="tagline">{escape(game_data.get("tagline", "A new gaming experience"))}</p>\n',
+        f'<p class="meta">{escape(meta)}</p>\n',
+        f'<p class="doc-info">{escape(game_data.get("studio_name", "Studio Name"))} — Game Design Document<br>'
+        f"Version: {escape(version)}  ·  Date: {escape(date)}<br>"
+        f"Lead Designer(s): {escape(lead_designer)}</p>\n",
+        "</header>\n",
+    ]
+    if game_data.get("version_history"):
+        out.append("<h2>Version History</h2>\n")
+        out.append(table_html([["Version", "Date", "Author", "Summary of Changes"]]
+                              + history_table_rows(game_data, version, date, lead_designer)))
+
+    out.append('<nav class="toc">\n<h2>Table of Contents</h2>\n<ol>\n')
+    for href, heading, words, placeholder in toc:
+        item_class = ' class="placeholder"' if placeholder else ""
+        length = "not yet written" if placeholder else f"{words:,} words"
+        out.append(f'<li{item_class}><a href="{escape(href)}">{escape(heading)}</a>'
+                   f'<span class="words">{length}</span></li>\n')
+    out.append("</ol>\n</nav>\n")
+    out.append('<p class="confidential">CONFIDENTIAL — For internal use and authorized partners only. '
+               "Do not distribute without written permission.</p>\n")
+    return "".join(out)
+
+
+def generate_gdd_html(
+    game_data: Dict,
+    output_dir: str,
+    include_template_sections: bool = True,
+    strict: bool = False
+) -> str:
+    """
+    Write the GDD as a static HTML site.
+
+    Args:
+        game_data: Dictionary with game metadata and sections content
+        output_dir: Site folder (created if missing): index.html, gdd.css
+            and sections/NN-key.html
+        include_template_sections: Add placeholder pages for missing sections
+        strict: If True, fail if unsourced metrics or placeholders remain
+
+    Returns:
+        Absolute path to index.html.
+    """
+    # Pre-export validation
+    sections_to_validate = game_data.get("sections", {})
+    if sections_to_validate:
+        for warning in validate_gdd_content(sections_to_validate):
+            print(f"  WARNING: {warning}")
+        sensibility_warnings = validate_data_sensibility(sections_to_validate, strict=strict)
+        for warning in sensibility_warnings:
+            print(f"  WARNING: {warning}")
+        if strict and sensibility_warnings:
+            raise SystemExit(
+                "STRICT MODE: Export aborted due to unsourced metrics or "
+                "placeholders in business sections. Fix the warnings above "
+                "or remove --strict to export with warnings."
+            )
+        for warning in estimate_content_size(sections_to_validate)["warnings"]:
+            print(f"  WARNING: {warning}")
+
+    game_title = game_data.get("game_title", "Untitled Game")
+    os.makedirs(os.path.join(output_dir, SECTIONS_DIR), exist_ok=True)
+    with open(os.path.join(output_dir, STYLESHEET_NAME), "w", encoding="utf-8") as f:
+        f.write(build_stylesheet())
+
+    # Section pages are written one at a time; each links to its neighbours,
+    # so the previous page is finished once the next section's name is known
+    toc: List[Tuple[str, str, int, bool]] = []
+    pending: Optional[Tuple[str, str, str]] = None  # filename, heading, body
+    previous: Tuple[str, str] = ("", "")
+
+    def write_page(next_link: Tuple[str, str]) -> None:
+        filename, heading, body = pending
+        nav = nav_links([previous, ("../index.html", "Contents"), next_link])
+        with open(os.path.join(output_dir, SECTIONS_DIR, filename), "w", encoding="utf-8") as f:
+            f.write(page(f"{heading} — {game_title}", body, f"../{STYLESHEET_NAME}", nav))
+
+    for section_key, content, subsections, placeholder in _iter_section_pages(
+        game_data, include_template_sections
+    ):
+        filename = section_filename(section_key)
+        heading = f"{SECTIONS[section_key]['order']}. {SECTIONS[section_key]['name']}"
+        if pending:
+            write_page((filename, f"{heading} →"))
+            previous = (pending[0], f"← {pending[1]}")
+        pending = (filename, heading, section_html(heading, content, subsections))
+        toc.append((f"{SECTIONS_DIR}/{filename}", heading,
+                    _word_count(content, subsections), placeholder))
+    if pending:
+        write_page(("", ""))
+
+    index_path = os.path.join(output_dir, "index.html")
+    with open(index_path, "w", encoding="utf-8") as f:
+        f.write(page(f"{game_title} — Game Design Document", _index_body(game_data, toc)))
+    return os.path.abspath(index_path)
+
+
+# ─────────────────────────────────────────────
+# CLI ENTRY POINT
+# ─────────────────────────────────────────────
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Export a Game Design Document as a static HTML site",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Site from a config (JSON, Markdown, project, .gddpack or version store):
+  python generate_gdd_html.py --config gdd_content.json --output MyGame_GDD_site
+
+  # Only the sections that have content:
+  python generate_gdd_html.py --config MyGame_GDD.md --output site --no-template-sections
+
+  # Serve it on the local network for tablets:
+  python -m http.server --directory MyGame_GDD_site 8000
+        """
+    )
+    parser.add_argument("--title", help="Game title (template site without a config)")
+    parser.add_argument("--config", help="Config file with GDD content")
+    parser.add_argument("--version-id", type=int,
+                        help="Version to render when --config is a version store (default: newest)")
+    parser.add_argument("--output", default="GDD_site", help="Output folder")
+    parser.add_argument("--no-template-sections", action="store_true",
+                        help="Leave out placeholder pages for missing sections")
+    parser.add_argument("--strict", action="store_true",
+                        help="Fail export if unsourced metrics or placeholders remain in business sections")
+
+    args = parser.parse_args()
+
+    if args.config:
+        try:
+            game_data = load_project(args.config, args.version_id)
+        except (FileNotFoundError, ValueError) as e:
+            print(f"ERROR loading config: {e}")
+            sys.exit(1)
+    elif args.title:
+        game_data = {"game_title": args.title}
+    else:
+        parser.print_help()
+        print("\nERROR: Provide --title or --config")
+        sys.exit(1)
+
+    start = time.perf_counter()
+    try:
+        path = generate_gdd_html(
+            game_data, args.output,
+            include_template_sections=not args.no_template_sections,
+            strict=args.strict
+        )
+    except OSError as e:
+        print(f"ERROR: {e}")
+        sys.exit(1)
+    except CorruptContentError as e:  # A .gddpack / store blob, read on first use
+        print(f"ERROR loading config: {e}")
+        sys.exit(1)
+    print(f"✓ HTML site generated: {path} ({(time.perf_counter() - start) * 1000:.0f} ms)")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,28 +7,39 @@ Usage:
     python scripts/generate_gdd_pdf.py --title "My Game" --output "MyGame_GDD_v01.pdf"
     python scripts/generate_gdd_pdf.py --config gdd_content.json --output "MyGame_GDD_v01.pdf"
     python scripts/generate_gdd_pdf.py --docx existing_gdd.docx --output output.pdf
+    python scripts/generate_gdd_pdf.py --config gdd_content.json --optimize-size --output small.pdf
 
 Requirements:
-    pip install fpdf2
+    pip install fpdf2 defusedxml
 
-    OR for docx conversion fallback:
+    OR for the optional office-suite docx conversion engine:
     pip install docx2pdf  (requires LibreOffice on Linux/Mac, Word on Windows)
 
 The script can either:
   (a) Generate a PDF directly from content using fpdf2
-  (b) Convert an existing .docx to PDF via docx2pdf (if available)
+  (b) Convert an existing .docx to PDF in-process (or via docx2pdf with
+      --docx-engine docx2pdf --trust-docx)
   (c) Generate from a JSON config file
 """
 
 import argparse
-import json
+import contextlib
 import os
 import sys
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
-sys.path.insert(0, SCRIPT_DIR)
+if SCRIPT_DIR not in sys.path:
+    sys.path.insert(0, SCRIPT_DIR)
+
+from utils.project_loader import CorruptContentError, load_project
+from utils.async_render import AsyncRenderer, RenderJob
+from utils.render_output import (
+    Output, RenderContext, RenderResult, StrictModeError, emit_warnings, exit_on_strict_failure,
+    raise_if_strict, write_bytes,
+)
+from utils.version_store import history_table_rows
 
 try:
     from utils.pdf_builder import (
@@ -37,6 +48,12 @@ try:
         render_body_text, render_bullet_point, render_code_block,
         render_callout_box, render_table, render_cover_page, render_toc
     )
+    from utils.pdf_optimize import optimize_pdf_bytes, format_size_report
+    from utils import content_blocks as blocks
+    from utils import docx_reader
+    from utils.office_pool import (
+        ConverterPool, UnoserverBackend, StdioBackend, serve_stdio,
+    )
     PDF_BUILDER_AVAILABLE = True
 except ImportError:
     PDF_BUILDER_AVAILABLE = False
@@ -178,22 +195,31 @@ def _parse_and_render_content(pdf: "GDDDocument", content: str) -> None:
         render_table(pdf, headers, rows, [col_w] * n_cols)
 
 
-def generate_gdd_pdf_from_content(
+def build_gdd_pdf(
     game_data: Dict,
-    output_path: str,
     include_toc: bool = True,
-    strict: bool = False
-) -> str:
+    strict: bool = False,
+    document_class: Optional[type] = None,
+    warnings: Optional[List[str]] = None,
+    progress: Optional[Callable[[str, int, int], None]] = None
+) -> "GDDDocument":
     """
-    Generate a GDD PDF directly from content using fpdf2.
+    Validate content and lay out the GDD into an fpdf2 document (not saved).
 
     Args:
         game_data: Dictionary with game metadata and sections content
-        output_path: Output PDF file path
         include_toc: Whether to generate a table of contents page
+        strict: If True, fail if unsourced metrics or placeholders remain
+        document_class: GDDDocument subclass to build into (e.g. a
+            utils.preview recording class); defaults to GDDDocument
+        warnings: List that collects validation warnings; printed when None
+        progress: Called with (section name, done, total) after each section
 
     Returns:
-        Absolute path to generated PDF.
+        The laid-out document.
+
+    Raises:
+        StrictModeError: In strict mode, when business sections have warnings.
     """
     if not FPDF_AVAILABLE:
         raise ImportError(
@@ -206,22 +232,19 @@ def generate_gdd_pdf_from_content(
     # Pre-export validation
     sections_to_validate = game_data.get("sections", {})
     if REGISTRY_AVAILABLE and sections_to_validate:
-        for warning in validate_gdd_content(sections_to_validate):
-            print(f"  WARNING: {warning}")
+        emit_warnings(validate_gdd_content(sections_to_validate), warnings)
         sensibility_warnings = validate_data_sensibility(
             sections_to_validate, strict=strict
         )
-        for warning in sensibility_warnings:
-            print(f"  WARNING: {warning}")
-        if strict and sensibility_warnings:
-            raise SystemExit(
-                "STRICT MODE: Export aborted due to unsourced metrics or "
-                "placeholders in business sections. Fix the warnings above "
-                "or remove --strict to export with warnings."
-            )
-        size_info = estimate_content_size(sections_to_validate)
-        for warning in size_info["warnings"]:
-            print(f"  WARNING: {warning}")
+        emit_warnings(sensibility_warnings, warnings)
+        raise_if_strict(
+            strict, sensibility_warnings,
+            "STRICT MODE: Export aborted due to unsourced metrics or "
+            "placeholders in business sections. Fix the warnings above "
+            "or remove --strict to export with warnings.",
+            warnings,
+        )
+        emit_warnings(estimate_content_size(sections_to_validate)["warnings"], warnings)
 
     game_title = game_data.get("game_title", "Untitled Game")
     tagline = game_data.get("tagline", "A new gaming experience")
@@ -232,7 +255,7 @@ def generate_gdd_pdf_from_content(
     version = game_data.get("version", "v0.1")
     date = game_data.get("date", datetime.now().strftime("%B %Y"))
 
-    pdf = GDDDocument(game_title=game_title, version=version, date=date)
+    pdf = (document_class or GDDDocument)(game_title=game_title, version=version, date=date)
 
     # Cover page
     render_cover_page(
@@ -240,6 +263,17 @@ def generate_gdd_pdf_from_content(
         studio, version, date
     )
 
+    # Version history (only when rendering from a version store or a config
+    # that lists one; the DOCX always has this page)
+    if game_data.get("version_history"):
+        pdf.add_page()
+        render_heading_2(pdf, "Version History")
+        render_table(
+            pdf, ["Version", "Date", "Author", "Summary of Changes"],
+            history_table_rows(game_data, version, date, game_data.get("lead_designer", "")),
+            col_widths=[22, 26, 38, PDFLayout.CONTENT_WIDTH - 86],
+        )
+
     # TOC placeholder (approximate — fpdf2 doesn't support dynamic TOC)
     if include_toc:
         pdf.add_page()
@@ -256,7 +290,7 @@ def generate_gdd_pdf_from_content(
     sections_content = game_data.get("sections", {})
     section_order = SECTION_ORDER if REGISTRY_AVAILABLE else list(sections_content.keys())
 
-    for section_key in section_order:
+    for done, section_key in enumerate(section_order, start=1):
         content = sections_content.get(section_key, "")
         section_name = section_key.replace("_", " ").title()
         section_num = 0
@@ -282,6 +316,8 @@ def generate_gdd_pdf_from_content(
             _parse_and_render_content(pdf, content)
         elif isinstance(content, dict):
             _parse_and_render_content(pdf, content.get("content", ""))
+        if progress:
+            progress(section_name, done, len(section_order))
 
     # Set PDF metadata
     pdf.set_title(f"{game_title} — Game Design Document")
@@ -294,20 +330,183 @@ def generate_gdd_pdf_from_content(
     if include_toc and pdf.toc_entries:
         # Insert TOC after cover — fpdf2 can't insert, so append as appendix
         render_toc(pdf)
+    return pdf
 
-    output_dir = os.path.dirname(os.path.abspath(output_path))
-    os.makedirs(output_dir, exist_ok=True)
-    pdf.output(output_path)
-    abs_path = os.path.abspath(output_path)
-    print(f"✓ PDF generated: {abs_path}")
-    return abs_path
+
+PDF_CONTENT_TYPE = "application/pdf"
 
 
-def convert_docx_to_pdf(docx_path: str, output_path: str, *, trusted: bool = False) -> str:
+def render_gdd_pdf(
+    game_data: Dict,
+    out: Output = None,
+    context: Optional[RenderContext] = None,
+    include_toc: bool = True,
+    optimize_size: bool = False
+) -> RenderResult:
     """
-    Convert an existing .docx file to PDF using docx2pdf.
-    Requires either Word (Windows/Mac) or LibreOffice (Linux).
+    Render a GDD PDF from content without printing anything.
 
+    Args:
+        game_data: Dictionary with game metadata and sections content
+        out: Output path, writable binary stream, or None to return the
+            PDF bytes in result.data
+        context: Strict mode, warning sink and per-section progress
+            callback; defaults to RenderContext()
+        include_toc: Whether to generate a table of contents page
+        optimize_size: Apply the size optimization profile (object streams,
+            compressed xref, deduplicated resources); the size report goes
+            to result.notes and result.stats["size"]
+
+    Returns:
+        RenderResult with the PDF (or its path) and any warnings.
+    """
+    context = context or RenderContext()
+    result = context.new_result(PDF_CONTENT_TYPE)
+    pdf = build_gdd_pdf(game_data, include_toc=include_toc, strict=context.strict,
+                        warnings=result.warnings, progress=context.report)
+    data = pdf.output()
+    result.stats["pages"] = pdf.page_no()
+    if optimize_size:
+        data, report = optimize_pdf_bytes(data)
+        result.notes.append(format_size_report(report))
+        result.stats["size"] = report
+    return write_bytes(out, data, result)
+
+
+def render_gdd_pdf_async(
+    renderer: AsyncRenderer,
+    game_data: Dict,
+    context: Optional[RenderContext] = None,
+    **options: Any
+) -> RenderJob:
+    """
+    Start render_gdd_pdf() on an AsyncRenderer, off the event loop.
+
+    Returns:
+        RenderJob: await it for the RenderResult, or iterate it (async for)
+        for per-section RenderProgress first.
+    """
+    return renderer.start(render_gdd_pdf, game_data, context, **options)
+
+
+def generate_gdd_pdf_from_content(
+    game_data: Dict,
+    output_path: str,
+    include_toc: bool = True,
+    strict: bool = False,
+    optimize_size: bool = False
+) -> str:
+    """
+    Generate a GDD PDF file directly from content using fpdf2, printing
+    warnings and (with optimize_size) a size report.
+
+    Takes the same arguments as render_gdd_pdf(), with output_path in
+    place of out and strict in place of context.
+
+    Returns:
+        Absolute path to generated PDF.
+    """
+    try:
+        result = render_gdd_pdf(game_data, output_path, RenderContext(strict=strict),
+                                include_toc=include_toc, optimize_size=optimize_size)
+    except StrictModeError as e:
+        exit_on_strict_failure(e)
+    for warning in result.warnings:
+        print(f"  WARNING: {warning}")
+    print(f"✓ PDF generated: {result.path}")
+    for note in result.notes:
+        print(f"  {note}")
+    return result.path
+
+
+def _render_docx_blocks(pdf: "GDDDocument", docx_blocks) -> None:
+    """
+    Render blocks streamed from a .docx (utils.docx_reader) with the same
+    pdf_builder functions used for JSON content.
+    """
+    page_has_content = False
+    numbered = 0
+    for kind, payload in docx_blocks:
+        if kind == docx_reader.PAGE_BREAK:
+            if page_has_content:
+                pdf.add_page()
+                page_has_content = False
+            continue
+        numbered = numbered + 1 if kind == blocks.NUMBERED else 0
+        page_has_content = True
+
+        if kind == blocks.HEADING:
+            level, text = payload
+            if level == 1:
+                render_heading_1(pdf, text)
+            elif level == 2:
+                render_heading_2(pdf, text)
+            else:
+                render_heading_3(pdf, text)
+        elif kind == blocks.PARAGRAPH:
+            render_body_text(pdf, payload)
+        elif kind == blocks.BULLET:
+            render_bullet_point(pdf, payload)
+        elif kind == blocks.NUMBERED:
+            render_body_text(pdf, f"{numbered}. {payload}")
+        elif kind == blocks.CODE:
+            render_code_block(pdf, payload)
+        elif kind == blocks.NOTE:
+            render_callout_box(
+                pdf, "🎮 Designer's Note", payload,
+                PDFColors.CALLOUT_NOTE_BG, PDFColors.CALLOUT_NOTE_BORDER
+            )
+        elif kind == blocks.QUESTION:
+            render_callout_box(
+                pdf, "⚠ Open Question", payload,
+                PDFColors.CALLOUT_WARN_BG, PDFColors.CALLOUT_WARN_BORDER
+            )
+        elif kind == blocks.DIAGRAM:
+            render_code_block(pdf, f"[ DIAGRAM: {payload} ]")
+        elif kind == blocks.TABLE:
+            headers, rows = payload[0], payload[1:]
+            n_cols = max(len(row) for row in payload)
+            headers = headers + [""] * (n_cols - len(headers))
+            rows = [row + [""] * (n_cols - len(row)) for row in rows]
+            render_table(pdf, headers, rows, [PDFLayout.CONTENT_WIDTH / n_cols] * n_cols)
+        elif kind == docx_reader.TOC:
+            render_body_text(
+                pdf,
+                "[ Note: Page numbers in this TOC are approximate. "
+                "For a fully linked TOC, see the appendix at the end of this PDF. ]"
+            )
+        elif kind in (docx_reader.CAPTION, docx_reader.CENTERED):
+            pdf.set_font("Helvetica", "I" if kind == docx_reader.CAPTION else "",
+                         PDFLayout.CAPTION_SIZE if kind == docx_reader.CAPTION
+                         else PDFLayout.BODY_SIZE)
+            pdf.set_text_color(*(PDFColors.CAPTION if kind == docx_reader.CAPTION
+                                 else PDFColors.BODY))
+            pdf.multi_cell(
+                PDFLayout.CONTENT_WIDTH, PDFLayout.LINE_HEIGHT_BODY, payload,
+                align="C", new_x=XPos.LMARGIN, new_y=YPos.NEXT
+            )
+            pdf.ln(2)
+
+
+def convert_docx_to_pdf(
+    docx_path: str,
+    output_path: str,
+    *,
+    trusted: bool = False,
+    engine: str = "native",
+    include_toc: bool = True,
+    optimize_size: bool = False
+) -> str:
+    """
+    Convert an existing .docx file to PDF.
+
+    The default "native" engine reads the DOCX body in-process with a
+    streaming zip/XML parse (utils.docx_reader) and renders it through the
+    pdf_builder functions: no external binary, and nothing in the file is
+    executed, so it is safe for any .docx.
+
+    The "docx2pdf" engine delegates to Word (Windows/Mac) or LibreOffice
+    (Linux) for exact Word layout.
     WARNING: This delegates document parsing to external desktop software
     (Word/LibreOffice). Only use with trusted .docx files that you or your
     team created. Do not process untrusted or user-uploaded documents.
@@ -315,18 +514,59 @@ def convert_docx_to_pdf(docx_path: str, output_path: str, *, trusted: bool = Fal
     Args:
         docx_path: Path to input .docx file
         output_path: Path for output .pdf file
-        trusted: Must be True to confirm the .docx source is trusted.
-                 Pass --trust-docx on the CLI to set this.
+        trusted: Must be True to confirm the .docx source is trusted when
+                 using the docx2pdf engine. Pass --trust-docx on the CLI to set this.
+        engine: "native" (default) or "docx2pdf"
+        include_toc: Append a table of contents (native engine)
+        optimize_size: Apply the size optimization profile (native engine)
 
     Returns:
         Absolute path to generated PDF.
     """
+    if not os.path.exists(docx_path):
+        raise FileNotFoundError(f"DOCX file not found: {docx_path}")
+
+    output_dir = os.path.dirname(os.path.abspath(output_path))
+
+    if engine == "native":
+        if not FPDF_AVAILABLE or not PDF_BUILDER_AVAILABLE:
+            raise ImportError(
+                "fpdf2 and scripts/utils/pdf_builder.py are required. Install with:\n"
+                "  pip install fpdf2"
+            )
+        info = docx_reader.read_docx_info(docx_path)
+        game_title = info["game_title"] or os.path.splitext(os.path.basename(docx_path))[0]
+        pdf = GDDDocument(game_title=game_title, version=info["version"], date=info["date"])
+        pdf.add_page()
+        _render_docx_blocks(pdf, docx_reader.iter_docx_blocks(docx_path))
+
+        pdf.set_title(f"{game_title} — Game Design Document")
+        pdf.set_creator("game-design-document generator")
+        if include_toc and pdf.toc_entries:
+            render_toc(pdf)
+
+        os.makedirs(output_dir, exist_ok=True)
+        if optimize_size:
+            optimized, report = optimize_pdf_bytes(pdf.output())
+            with open(output_path, "wb") as f:
+                f.write(optimized)
+        else:
+            pdf.output(output_path)
+        abs_path = os.path.abspath(output_path)
+        print(f"✓ PDF converted: {abs_path}")
+        if optimize_size:
+            print(f"  {format_size_report(report)}")
+        return abs_path
+
+    if engine != "docx2pdf":
+        raise ValueError(f"Unknown DOCX conversion engine: {engine!r}")
+
     if not trusted:
         raise ValueError(
-            "DOCX-to-PDF conversion requires --trust-docx flag.\n"
+            "DOCX-to-PDF conversion with docx2pdf requires --trust-docx flag.\n"
             "This conversion delegates to Word/LibreOffice which can execute "
             "macros or embedded content. Only use with .docx files you created "
-            "or trust. Pass --trust-docx to confirm."
+            "or trust. Pass --trust-docx to confirm, or use the default native engine."
         )
 
     if not DOCX2PDF_AVAILABLE:
@@ -336,10 +576,6 @@ def convert_docx_to_pdf(docx_path: str, output_path: str, *, trusted: bool = Fal
             "Also requires Microsoft Word (Windows/Mac) or LibreOffice (Linux)."
         )
 
-    if not os.path.exists(docx_path):
-        raise FileNotFoundError(f"DOCX file not found: {docx_path}")
-
-    output_dir = os.path.dirname(os.path.abspath(output_path))
     os.makedirs(output_dir, exist_ok=True)
 
     print(f"Converting {docx_path} to PDF...")
@@ -349,6 +585,73 @@ def convert_docx_to_pdf(docx_path: str, output_path: str, *, trusted: bool = Fal
     return abs_path
 
 
+def stand_in_converter_command() -> List[str]:
+    """argv for a local converter process serving this script's native engine."""
+    return [sys.executable, os.path.abspath(__file__), "--serve-stdio"]
+
+
+def _serve_native_converter() -> None:
+    """Serve the StdioBackend protocol using the in-process converter."""
+    stdout = sys.stdout
+
+    def convert(src: str, dst: str) -> None:
+        # Keep progress messages off the protocol stream
+        with contextlib.redirect_stdout(sys.stderr):
+            convert_docx_to_pdf(src, dst, engine="native")
+
+    serve_stdio(convert, stdout=stdout)
+
+
+def convert_docx_batch(
+    docx_paths: List[str],
+    output_dir: str,
+    *,
+    pool_size: int = 2,
+    job_timeout: float = 120.0,
+    recycle_after: int = 50,
+    backend: str = "unoserver"
+) -> List[Any]:
+    """
+    Convert many .docx files through a pool of long-lived office converters,
+    so the office-suite cold start is paid once per worker rather than once
+    per file.
+
+    Args:
+        docx_paths: Input .docx files
+        output_dir: Directory for the PDFs (named after each input)
+        pool_size: Number of converter processes kept alive
+        job_timeout: Seconds a single conversion may take
+        recycle_after: Restart a converter after this many jobs
+        backend: "unoserver" (LibreOffice) or "stand-in" (this script's
+                 native engine in a separate process, for tests)
+
+    Returns:
+        List of ConversionResult, in input order.
+    """
+    if backend == "stand-in":
+        def factory(_index):
+            return StdioBackend(stand_in_converter_command())
+    else:
+        factory = UnoserverBackend
+    jobs = [
+        (path, os.path.join(output_dir, os.path.splitext(os.path.basename(path))[0] + ".pdf"))
+        for path in docx_paths
+    ]
+    with ConverterPool(factory, size=pool_size, job_timeout=job_timeout,
+                       max_jobs_per_worker=recycle_after) as pool:
+        results = pool.convert_many(jobs)
+        cold_starts = pool.cold_starts
+    ok = sum(1 for r in results if r.ok)
+    for r in results:
+        if r.ok:
+            print(f"✓ PDF converted: {os.path.abspath(r.dst)} ({r.seconds:.1f}s)")
+        else:
+            print(f"  WARNING: {r.src}: {r.error}")
+    print(f"✓ {ok}/{len(results)} converted with {pool_size} converter(s), "
+          f"{cold_starts} cold start(s)")
+    return results
+
+
 # ─────────────────────────────────────────────
 # CLI ENTRY POINT
 # ─────────────────────────────────────────────
@@ -365,8 +668,18 @@ Examples:
   # Generate from JSON config:
   python generate_gdd_pdf.py --config gdd_content.json --output "MyGame_GDD.pdf"
 
-  # Convert existing DOCX to PDF:
+  # Smaller file for upload caps (object streams, deduplicated resources):
+  python generate_gdd_pdf.py --config gdd_content.json --optimize-size --output "MyGame_GDD.pdf"
+
+  # Convert existing DOCX to PDF (in-process, no office suite needed):
   python generate_gdd_pdf.py --docx MyGame_GDD.docx --output MyGame_GDD.pdf
+
+  # Convert with Word/LibreOffice for exact Word layout (trusted files only):
+  python generate_gdd_pdf.py --docx MyGame_GDD.docx --docx-engine docx2pdf --trust-docx --output MyGame_GDD.pdf
+
+  # Batch-convert a catalog through 4 long-lived headless LibreOffice processes:
+  python generate_gdd_pdf.py --docx catalog/*.docx --docx-engine office-pool --trust-docx \\
+      --pool-size 4 --output-dir catalog_pdf/
         """
     )
     parser.add_argument("--title", help="Game title")
@@ -377,22 +690,79 @@ Examples:
     parser.add_argument("--tagline", default="", help="Tagline")
     parser.add_argument("--version", default="v0.1", help="Document version")
     parser.add_argument("--config", help="JSON config file")
-    parser.add_argument("--docx", help="Existing .docx file to convert to PDF")
+    parser.add_argument("--version-id", type=int,
+                        help="Version to render when --config is a version store (default: newest)")
+    parser.add_argument("--docx", nargs="+", metavar="DOCX",
+                        help="Existing .docx file(s) to convert to PDF")
     parser.add_argument("--output", default="GDD_output.pdf", help="Output PDF path")
+    parser.add_argument("--output-dir",
+                        help="Output directory when converting several .docx files")
     parser.add_argument("--no-toc", action="store_true", help="Skip TOC page")
     parser.add_argument("--strict", action="store_true",
                         help="Fail export if unsourced metrics or placeholders remain in business sections")
+    parser.add_argument("--optimize-size", action="store_true",
+                        help="Pack objects into object streams, compress the xref and "
+                             "deduplicate resources; prints a before/after size report")
+    parser.add_argument(
+        "--docx-engine", choices=("native", "docx2pdf", "office-pool"), default="native",
+        help="DOCX→PDF converter: in-process renderer (default), docx2pdf via Word/LibreOffice, "
+             "or a pool of long-lived headless LibreOffice converters for batches"
+    )
     parser.add_argument(
         "--trust-docx", action="store_true",
-        help="Confirm that the .docx file is from a trusted source (required for --docx conversion)"
+        help="Confirm that the .docx file is from a trusted source "
+             "(required for the docx2pdf and office-pool engines)"
     )
+    parser.add_argument("--pool-size", type=int, default=2,
+                        help="office-pool: converter processes kept alive (default: 2)")
+    parser.add_argument("--pool-timeout", type=float, default=120.0,
+                        help="office-pool: seconds allowed per document (default: 120)")
+    parser.add_argument("--pool-recycle", type=int, default=50,
+                        help="office-pool: restart a converter after this many jobs (default: 50)")
+    parser.add_argument("--pool-backend", choices=("unoserver", "stand-in"), default="unoserver",
+                        help="office-pool: LibreOffice via unoserver, or the native engine "
+                             "in a separate process (for testing)")
+    parser.add_argument("--serve-stdio", action="store_true", help=argparse.SUPPRESS)
 
     args = parser.parse_args()
 
+    if args.serve_stdio:
+        _serve_native_converter()
+        return
+
     # Convert docx → pdf mode
+    if args.docx and args.docx_engine == "office-pool":
+        if not args.trust_docx and args.pool_backend != "stand-in":
+            print("ERROR: the office-pool engine runs LibreOffice on the input files; "
+                  "pass --trust-docx to confirm they are trusted.")
+            sys.exit(1)
+        results = convert_docx_batch(
+            args.docx,
+            args.output_dir or os.path.dirname(os.path.abspath(args.output)),
+            pool_size=args.pool_size,
+            job_timeout=args.pool_timeout,
+            recycle_after=args.pool_recycle,
+            backend=args.pool_backend
+        )
+        if not all(r.ok for r in results):
+            sys.exit(1)
+        return
+
     if args.docx:
         try:
-            convert_docx_to_pdf(args.docx, args.output, trusted=args.trust_docx)
+            for docx_path in args.docx:
+                if args.output_dir or len(args.docx) > 1:
+                    stem = os.path.splitext(os.path.basename(docx_path))[0]
+                    output_path = os.path.join(args.output_dir or ".", stem + ".pdf")
+                else:
+                    output_path = args.output
+                convert_docx_to_pdf(
+                    docx_path, output_path,
+                    trusted=args.trust_docx,
+                    engine=args.docx_engine,
+                    include_toc=not args.no_toc,
+                    optimize_size=args.optimize_size
+                )
         except Exception as e:
             print(f"ERROR: {e}")
             sys.exit(1)
@@ -405,9 +775,8 @@ Examples:
     # Load content
     if args.config:
         try:
-            with open(args.config, "r", encoding="utf-8") as f:
-                game_data = json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError) as e:
+            game_data = load_project(args.config, args.version_id)
+        except (FileNotFoundError, ValueError) as e:
             print(f"ERROR loading config: {e}")
             sys.exit(1)
     elif args.title:
@@ -431,8 +800,12 @@ Examples:
             game_data=game_data,
             output_path=args.output,
             include_toc=not args.no_toc,
-            strict=args.strict
+            strict=args.strict,
+            optimize_size=args.optimize_size
         )
+    except CorruptContentError as e:  # A .gddpack / store blob, read on first use
+        print(f"ERROR loading config: {e}")
+        sys.exit(1)
     except Exception as e:
         print(f"ERROR: {e}")
         import traceback
@@ -7,6 +7,7 @@ press kits, and conference leave-behinds.
 Usage:
     python scripts/generate_one_pager_pdf.py --title "My Game" --output "MyGame_OnePager.pdf"
     python scripts/generate_one_pager_pdf.py --config one_pager_content.json --output "MyGame_OnePager.pdf"
+    python scripts/generate_one_pager_pdf.py --catalog slate/ --output "Slate_Catalog.pdf"
 
 Requirements:
     pip install fpdf2
@@ -34,17 +35,26 @@ Layout (A4 portrait):
 """
 
 import argparse
-import json
+import math
 import os
 import sys
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple, Any
 
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
-sys.path.insert(0, SCRIPT_DIR)
+if SCRIPT_DIR not in sys.path:
+    sys.path.insert(0, SCRIPT_DIR)
+
+from utils.project_loader import CorruptContentError, load_project
+from utils.async_render import AsyncRenderer, RenderJob
+from utils.render_output import (
+    Output, RenderContext, RenderResult, StrictModeError, emit_warnings, exit_on_strict_failure,
+    raise_if_strict, write_bytes,
+)
 
 try:
     from fpdf import FPDF, XPos, YPos
+    from fpdf.enums import MethodReturnValue
     FPDF_AVAILABLE = True
 except ImportError:
     FPDF_AVAILABLE = False
@@ -86,6 +96,10 @@ class OP_Layout:
     CW = W - ML - MR   # Content width: 186mm
     COL_L = 90         # Left column width (in two-column layout)
     COL_R = CW - COL_L - 3  # Right column width (3mm gap)
+    LABEL_H = 4.5      # Section header bar height
+    FOOTER_H = 12
+    FOOTER_Y = H - FOOTER_H
+    FOOTER_GAP = 2     # Minimum space between the last divider and the footer
 
 
 def _sanitize_text(text: str) -> str:
@@ -134,7 +148,7 @@ class OnePager(FPDF if FPDF_AVAILABLE else object):
         self.set_font("Helvetica", "B", 7.5)
         self.set_xy(OP_Layout.ML, y)
         width = OP_Layout.CW if full_width else OP_Layout.COL_L
-        self.cell(width, 4.5, f"  {text.upper()}", fill=True,
+        self.cell(width, OP_Layout.LABEL_H, f"  {text.upper()}", fill=True,
                   new_x=XPos.LMARGIN, new_y=YPos.NEXT)
         return self.get_y()
 
@@ -175,14 +189,358 @@ class OnePager(FPDF if FPDF_AVAILABLE else object):
         return x + text_w + 2
 
 
+# ─────────────────────────────────────────────
+# FIT TO PAGE
+# ─────────────────────────────────────────────
+
+MIN_FONT_SIZE = 6.0       # Smallest body size (pt) the fit will shrink to
+SCALE_STEP = 0.02         # Granularity of the uniform scale search
+ELLIPSIS = "..."
+
+# Line heights (mm) of the flowing blocks at their full-scale sizes
+_BASE_LINE_HEIGHTS = {
+    "hook": 4.2,
+    "core_loop": 4.2,
+    "features": 4.2,
+    "comparables": 3.8,
+    "team": 4.2,
+}
+
+FLOW_BLOCKS = tuple(_BASE_LINE_HEIGHTS)
+
+
+class OnePagerSizes(NamedTuple):
+    """Font sizes (pt) of the one-pager's flowing text blocks."""
+    hook: float = 8.5
+    core_loop: float = 8.5
+    features: float = 8.0
+    comparables: float = 7.5   # Descriptions; titles are set 0.5 pt larger
+    team: float = 8.0
+
+    def line_height(self, block: str) -> float:
+        """Line height (mm) of a block, scaled with its font size."""
+        return _BASE_LINE_HEIGHTS[block] * getattr(self, block) / getattr(_FULL_SIZES, block)
+
+    def scaled(self, scale: float) -> "OnePagerSizes":
+        """Every block at scale × its full size, floored at MIN_FONT_SIZE."""
+        return OnePagerSizes(*(
+            max(MIN_FONT_SIZE, round(size * scale, 2)) if size > MIN_FONT_SIZE else size
+            for size in _FULL_SIZES
+        ))
+
+
+_FULL_SIZES = OnePagerSizes()
+
+
+class OnePagerFit(NamedTuple):
+    """Result of fit_one_pager: what to draw and what had to give."""
+    flow: Dict[str, Any]
+    sizes: OnePagerSizes
+    bottom: float             # Y of the last divider
+    trimmed: List[str]        # What was cut, e.g. "hook trimmed"
+
+    def report(self) -> List[str]:
+        """Human-readable list of everything that was shrunk or cut."""
+        lines = [
+            f"{block} {getattr(_FULL_SIZES, block):g} → {getattr(self.sizes, block):g} pt"
+            for block in FLOW_BLOCKS
+            if getattr(self.sizes, block) != getattr(_FULL_SIZES, block)
+        ]
+        return lines + self.trimmed
+
+
+def flow_blocks(content: Dict) -> Dict[str, Any]:
+    """The flowing text of the one-pager, with defaults applied and lists capped."""
+    return {
+        "hook": content.get(
+            "hook", "[2-sentence hook. First: the experience. Second: why it's different.]"
+        ),
+        "core_loop": content.get(
+            "core_loop", "[3 sentences: micro loop → macro loop → return motivation]"
+        ),
+        "features": [tuple(item) for item in content.get("key_features", [
+            ("Feature 1", "[One specific sentence about this mechanic]"),
+            ("Feature 2", "[One specific sentence about the innovation]"),
+            ("Feature 3", "[One specific sentence about the hook]"),
+            ("Feature 4", "[One specific sentence about the social/retention driver]"),
+        ])[:4]],
+        "comparables": [tuple(item) for item in content.get("comparable_titles", [
+            ("Game A × Game B", "but [your key differentiator]"),
+            ("Game C", "for [what you take from it]"),
+            ("Game D", "for [the market validation it provides]"),
+        ])[:3]],
+        "team": list(content.get("team_info", [
+            f"Team: {content.get('team_size', '6 developers')}",
+            f"Lead: {content.get('lead_credential', '[Name] — shipped [Title]')}",
+            f"Status: {content.get('dev_status', 'Vertical slice in progress')}",
+            f"Funding: {content.get('funding_status', 'Seeking seed round')}",
+        ])[:5]),
+    }
+
+
+class _TextMeasure:
+    """Cached fpdf2 text measurements, taken on a scratch OnePager."""
+
+    def __init__(self):
+        self.doc = OnePager()
+        self._cache: Dict[Tuple, float] = {}
+
+    def height(self, text: str, w: float, size: float, h: float, style: str = "") -> float:
+        """Height (mm) multi_cell(w, h, text) takes at the given font."""
+        return len(self.lines(text, w, size, h, style)) * h
+
+    def lines(self, text: str, w: float, size: float, h: float, style: str = "") -> List[str]:
+        """The lines multi_cell(w, h, text) breaks text into."""
+        key = ("l", text, w, size, h, style)
+        if key not in self._cache:
+            self.doc.set_font("Helvetica", style, size)
+            self._cache[key] = self.doc.multi_cell(
+                w, h, text, dry_run=True, output=MethodReturnValue.LINES
+            )
+        return self._cache[key]
+
+    def width(self, text: str, size: float, style: str = "") -> float:
+        """Width (mm) of a single line of text."""
+        key = ("w", text, size, style)
+        if key not in self._cache:
+            self.doc.set_font("Helvetica", style, size)
+            self._cache[key] = self.doc.get_string_width(text)
+        return self._cache[key]
+
+
+def _feature_label(name: str) -> str:
+    return f"★ {name}: "
+
+
+def _flow_bottom(measure: _TextMeasure, flow: Dict[str, Any],
+                 sizes: OnePagerSizes, top: float) -> float:
+    """Y of the last divider when the flow is drawn from top (see _draw_flow)."""
+    y = top
+    for block in ("hook", "core_loop"):
+        y += OP_Layout.LABEL_H + 1
+        y += measure.height(flow[block], OP_Layout.CW - 2, getattr(sizes, block),
+                            sizes.line_height(block))
+        y += 1 + 2
+
+    y += OP_Layout.LABEL_H
+    lh = sizes.line_height("features")
+    for name, desc in flow["features"]:
+        label_w = measure.width(_feature_label(name), sizes.features, "B") + 1
+        y += 1 + measure.height(desc, OP_Layout.CW - label_w - 2, sizes.features, lh)
+    y += 1 + 2
+
+    y_left = y + 5
+    name_h = 4 * sizes.line_height("comparables") / _BASE_LINE_HEIGHTS["comparables"]
+    for _, desc in flow["comparables"]:
+        y_left += name_h
+        y_left += measure.height(desc, OP_Layout.COL_L - 4, sizes.comparables,
+                                 sizes.line_height("comparables"), "I") + 1
+    y_right = y + 5
+    for item in flow["team"]:
+        y_right += measure.height(item, OP_Layout.COL_R - 2, sizes.team,
+                                  sizes.line_height("team"))
+    return max(y_left, y_right) + 2
+
+
+def _trim_candidates(flow: Dict[str, Any]) -> List[Tuple[str, Tuple]]:
+    """(report name, path into flow) for every trimmable text in the flow."""
+    candidates = [("hook", ("hook",)), ("core_loop", ("core_loop",))]
+    candidates += [(f"feature '{name}'", ("features", i, 1))
+                   for i, (name, _) in enumerate(flow["features"])]
+    candidates += [(f"comparable '{name}'", ("comparables", i, 1))
+                   for i, (name, _) in enumerate(flow["comparables"])]
+    candidates += [(f"team line {i + 1}", ("team", i)) for i in range(len(flow["team"]))]
+    return candidates
+
+
+def _get_path(flow: Dict[str, Any], path: Tuple) -> str:
+    value = flow[path[0]]
+    for key in path[1:]:
+        value = value[key]
+    return value
+
+
+def _set_path(flow: Dict[str, Any], path: Tuple, text: str) -> Dict[str, Any]:
+    """Copy of flow with the text at path replaced."""
+    flow = dict(flow)
+    if len(path) == 1:
+        flow[path[0]] = text
+    elif len(path) == 2:
+        items = list(flow[path[0]])
+        items[path[1]] = text
+        flow[path[0]] = items
+    else:
+        items = list(flow[path[0]])
+        pair = list(items[path[1]])
+        pair[path[2]] = text
+        items[path[1]] = tuple(pair)
+        flow[path[0]] = items
+    return flow
+
+
+def fit_one_pager(content: Dict, top: float) -> OnePagerFit:
+    """
+    Solve the flowing sections of the one-pager onto the page.
+
+    Every block is measured with fpdf2's own line breaking (dry runs on a
+    scratch document, cached across iterations). The largest uniform scale
+    that ends above the footer is found by binary search; blocks stop
+    shrinking at MIN_FONT_SIZE. If the content still overflows at the
+    minimum sizes, long texts are cut at a line end (with an ellipsis) to
+    the largest common line count that fits, spare lines are handed back
+    in reading order, and as a last resort trailing team lines,
+    comparables or features are dropped, so the sheet never overflows.
+
+    Args:
+        content: One-pager content.
+        top: Y (mm) where the hook section starts.
+
+    Returns:
+        OnePagerFit with the sizes, the (possibly trimmed) flow and a report.
+    """
+    measure = _TextMeasure()
+    flow = flow_blocks(content)
+    limit = OP_Layout.FOOTER_Y - OP_Layout.FOOTER_GAP
+
+    def bottom(flow: Dict[str, Any], sizes: OnePagerSizes) -> float:
+        return _flow_bottom(measure, flow, sizes, top)
+
+    full_bottom = bottom(flow, _FULL_SIZES)
+    if full_bottom <= limit:
+        return OnePagerFit(flow, _FULL_SIZES, full_bottom, [])
+
+    # Largest uniform scale that fits. Text height shrinks about with scale²
+    # and the bars and gaps not at all, so sqrt(available / needed) bounds it.
+    min_scale = MIN_FONT_SIZE / max(_FULL_SIZES)
+    min_sizes = _FULL_SIZES.scaled(min_scale)
+    bound = math.sqrt((limit - top) / (full_bottom - top))
+    steps = int((1 - min_scale) / SCALE_STEP)
+    scales = [scale for scale in (1 - i * SCALE_STEP for i in range(1, steps + 1))
+              if min_scale < scale <= bound] + [min_scale]
+    low, high = 0, len(scales) - 1
+    if bottom(flow, min_sizes) > limit:
+        low = high  # Overflows even at the minimum sizes: no scale to search for
+    while low < high:
+        mid = (low + high) // 2
+        if bottom(flow, _FULL_SIZES.scaled(scales[mid])) <= limit:
+            high = mid
+        else:
+            low = mid + 1
+    sizes = _FULL_SIZES.scaled(scales[low])
+    if bottom(flow, sizes) <= limit:
+        return OnePagerFit(flow, sizes, bottom(flow, sizes), [])
+
+    # Still too long at the minimum sizes: cap every text at the same number
+    # of lines, the largest cap that fits, cutting at a line end with an ellipsis
+    widths = {
+        "hook": OP_Layout.CW - 2, "core_loop": OP_Layout.CW - 2,
+        "comparables": OP_Layout.COL_L - 4, "team": OP_Layout.COL_R - 2,
+    }
+
+    def text_box(path: Tuple) -> Tuple[float, float, float, str]:
+        """(width, font size, line height, style) a text in the flow is set in."""
+        block = path[0]
+        if block == "features":
+            name = flow["features"][path[1]][0]
+            width = OP_Layout.CW - measure.width(_feature_label(name), sizes.features, "B") - 3
+        else:
+            width = widths[block]
+        style = "I" if block == "comparables" else ""
+        return width, getattr(sizes, block), sizes.line_height(block), style
+
+    texts = [
+        (name, path, text_box(path), measure.lines(_get_path(flow, path), *text_box(path)))
+        for name, path in _trim_candidates(flow)
+    ]
+
+    capped_texts: Dict[Tuple, str] = {}
+
+    def capped_text(path: Tuple, box: Tuple, lines: List[str], cap: int) -> str:
+        """The text at path cut to cap lines, ending in an ellipsis."""
+        key = (path, cap)
+        if key not in capped_texts:
+            width, size, _, style = box
+            # The first cap - 1 lines stay as broken; only the last one has
+            # to make room for the ellipsis
+            room = width - 2 * measure.doc.c_margin
+            last = lines[cap - 1].split()
+            while len(last) > 1 and measure.width(" ".join(last) + ELLIPSIS, size, style) > room:
+                last.pop()
+            words = " ".join([line.strip() for line in lines[:cap - 1]] + last).split()
+            text = " ".join(words) + ELLIPSIS
+            # Re-wrapping the joined lines gives the same breaks; should it
+            # not (an over-long word), cut words until it fits
+            while len(words) > 1 and len(measure.lines(text, *box)) > cap:
+                words.pop()
+                text = " ".join(words) + ELLIPSIS
+            capped_texts[key] = text
+        return capped_texts[key]
+
+    def capped(caps: Dict[Tuple, int]) -> Tuple[Dict[str, Any], List[str]]:
+        capped_flow, cut = flow, []
+        for name, path, box, lines in texts:
+            cap = caps[path]
+            if len(lines) <= cap:
+                continue
+            text = capped_text(path, box, lines, cap)
+            capped_flow = _set_path(capped_flow, path, text)
+            cut.append(f"{name} trimmed")
+        return capped_flow, cut
+
+    def uniform(cap: int) -> Dict[Tuple, int]:
+        return {path: cap for _, path, _, _ in texts}
+
+    low, high = 1, max(len(lines) for *_, lines in texts) - 1
+    while low < high:
+        mid = (low + high + 1) // 2
+        if bottom(capped(uniform(mid))[0], sizes) <= limit:
+            low = mid
+        else:
+            high = mid - 1
+
+    # Hand the slack back: one more line per text, in reading order, while it fits
+    caps = uniform(low)
+    for _, path, _, lines in texts:
+        if len(lines) > caps[path]:
+            more = dict(caps)
+            more[path] += 1
+            if bottom(capped(more)[0], sizes) <= limit:
+                caps = more
+    flow, trimmed = capped(caps)
+
+    # One line each is still too much: drop the last team line, comparable
+    # or feature (keeping one of each)
+    while bottom(flow, sizes) > limit:
+        for block, label in (("team", "team line"), ("comparables", "comparable"),
+                             ("features", "feature")):
+            if len(flow[block]) > 1:
+                flow = dict(flow, **{block: flow[block][:-1]})
+                trimmed.append(f"{label} {len(flow[block]) + 1} dropped")
+                break
+        else:
+            break  # nothing left to give; cannot happen with the fixed header
+    return OnePagerFit(flow, sizes, bottom(flow, sizes), trimmed)
+
+
 # ─────────────────────────────────────────────
 # LAYOUT BUILDER
 # ─────────────────────────────────────────────
 
-def build_one_pager(op: "OnePager", content: Dict) -> None:
+def build_one_pager(op: "OnePager", content: Dict, fit_to_page: bool = True) -> "OnePagerFit":
     """
     Render all sections of the one-pager.
-    Layout flows from top to bottom with fixed section heights.
+
+    The title block and footer are fixed; the text sections between them
+    (hook, core loop, features, comparables, team) are measured first and
+    shrunk or trimmed by fit_one_pager so they end above the footer.
+
+    Args:
+        op: Fresh OnePager document.
+        content: One-pager content.
+        fit_to_page: Set False to lay out at full size without fitting.
+
+    Returns:
+        The fit that was applied (sizes, trimmed text and report).
     """
 
     # ── TOP BAR ──────────────────────────────────────────────
@@ -250,10 +608,39 @@ def build_one_pager(op: "OnePager", content: Dict) -> None:
     op.divider(y)
     y += 2
 
+    fit = fit_one_pager(content, top=y) if fit_to_page else OnePagerFit(
+        flow_blocks(content), _FULL_SIZES, 0.0, []
+    )
+    fit = fit._replace(bottom=_draw_flow(op, fit.flow, fit.sizes, y))
+
+    # ── FOOTER ────────────────────────────────────────────────
+    # Always at bottom of page
+    footer_y = OP_Layout.FOOTER_Y
+    op.set_fill_color(*OP_Colors.ACCENT_DARK)
+    op.rect(0, footer_y, OP_Layout.W, OP_Layout.FOOTER_H, "F")
+
+    contact = content.get("contact_email", "contact@studio.com")
+    website = content.get("website", "studio.gg")
+    location = content.get("location", "Remote")
+    footer_text = f"{studio}  ·  {contact}  ·  {website}  ·  {location}"
+
+    op.set_font("Helvetica", size=7)
+    op.set_text_color(*OP_Colors.BG_WHITE)
+    op.set_xy(OP_Layout.ML, footer_y + 4)
+    op.cell(OP_Layout.CW, 4, footer_text, align="C")
+    return fit
+
+
+def _draw_flow(op: "OnePager", flow: Dict[str, Any], sizes: OnePagerSizes, y: float) -> float:
+    """
+    Draw hook, core loop, features and the comparables / team columns from y.
+    Keep in step with _flow_bottom, which measures the same layout.
+    Returns Y of the closing divider.
+    """
     # ── HOOK ────────────────────────────────────────────────
     y = op.section_label("HOOK", y)
-    hook = content.get("hook", "[2-sentence hook. First: the experience. Second: why it's different.]")
-    y = op.body_text(OP_Layout.ML + 1, y + 1, OP_Layout.CW - 2, hook, size=8.5, h=4.2)
+    y = op.body_text(OP_Layout.ML + 1, y + 1, OP_Layout.CW - 2, flow["hook"],
+                     size=sizes.hook, h=sizes.line_height("hook"))
     y += 1
 
     op.divider(y)
@@ -261,11 +648,8 @@ def build_one_pager(op: "OnePager", content: Dict) -> None:
 
     # ── CORE LOOP ────────────────────────────────────────────
     y = op.section_label("CORE GAMEPLAY LOOP", y)
-    loop = content.get(
-        "core_loop",
-        "[3 sentences: micro loop → macro loop → return motivation]"
-    )
-    y = op.body_text(OP_Layout.ML + 1, y + 1, OP_Layout.CW - 2, loop, size=8.5, h=4.2)
+    y = op.body_text(OP_Layout.ML + 1, y + 1, OP_Layout.CW - 2, flow["core_loop"],
+                     size=sizes.core_loop, h=sizes.line_height("core_loop"))
     y += 1
 
     op.divider(y)
@@ -273,24 +657,19 @@ def build_one_pager(op: "OnePager", content: Dict) -> None:
 
     # ── KEY FEATURES ─────────────────────────────────────────
     y = op.section_label("KEY FEATURES", y)
-    features = content.get("key_features", [
-        ("Feature 1", "[One specific sentence about this mechanic]"),
-        ("Feature 2", "[One specific sentence about the innovation]"),
-        ("Feature 3", "[One specific sentence about the hook]"),
-        ("Feature 4", "[One specific sentence about the social/retention driver]"),
-    ])
-    for feature_name, feature_desc in features[:4]:
+    feature_h = sizes.line_height("features")
+    for feature_name, feature_desc in flow["features"]:
         op.set_xy(OP_Layout.ML + 1, y + 1)
-        op.set_font("Helvetica", "B", 8.0)
+        op.set_font("Helvetica", "B", sizes.features)
         op.set_text_color(*OP_Colors.ACCENT_GOLD)
-        label_w = op.get_string_width(f"★ {feature_name}: ") + 1
-        op.cell(label_w, 4.2, f"★ {feature_name}: ")
+        label_w = op.get_string_width(_feature_label(feature_name)) + 1
+        op.cell(label_w, feature_h, _feature_label(feature_name))
 
-        op.set_font("Helvetica", size=8.0)
+        op.set_font("Helvetica", size=sizes.features)
         op.set_text_color(*OP_Colors.TEXT_DARK)
         feature_x = OP_Layout.ML + 1 + label_w
         op.set_xy(feature_x, y + 1)
-        op.multi_cell(OP_Layout.CW - label_w - 2, 4.2, feature_desc,
+        op.multi_cell(OP_Layout.CW - label_w - 2, feature_h, feature_desc,
                       new_x=XPos.LMARGIN, new_y=YPos.NEXT)
         y = op.get_y()
 
@@ -299,7 +678,6 @@ def build_one_pager(op: "OnePager", content: Dict) -> None:
     y += 2
 
     # ── TWO-COLUMN: COMPARABLE TITLES | TEAM / STATUS ────────
-    col_y_start = y
     left_x = OP_Layout.ML
     right_x = OP_Layout.ML + OP_Layout.COL_L + 3
 
@@ -307,21 +685,18 @@ def build_one_pager(op: "OnePager", content: Dict) -> None:
     op.section_label("COMPARABLE TITLES", y, full_width=False)
     y_left = y + 5
 
-    comps = content.get("comparable_titles", [
-        ("Game A × Game B", "but [your key differentiator]"),
-        ("Game C", "for [what you take from it]"),
-        ("Game D", "for [the market validation it provides]"),
-    ])
-    for comp_name, comp_desc in comps[:3]:
+    comp_h = sizes.line_height("comparables")
+    name_h = 4 * comp_h / _BASE_LINE_HEIGHTS["comparables"]
+    for comp_name, comp_desc in flow["comparables"]:
         op.set_xy(left_x + 1, y_left)
-        op.set_font("Helvetica", "B", 8.0)
+        op.set_font("Helvetica", "B", sizes.comparables + 0.5)
         op.set_text_color(*OP_Colors.ACCENT_MID)
-        op.cell(OP_Layout.COL_L - 2, 4, comp_name)
-        y_left += 4
+        op.cell(OP_Layout.COL_L - 2, name_h, comp_name)
+        y_left += name_h
         op.set_xy(left_x + 2, y_left)
-        op.set_font("Helvetica", "I", 7.5)
+        op.set_font("Helvetica", "I", sizes.comparables)
         op.set_text_color(*OP_Colors.TEXT_MID)
-        op.multi_cell(OP_Layout.COL_L - 4, 3.8, comp_desc,
+        op.multi_cell(OP_Layout.COL_L - 4, comp_h, comp_desc,
                       new_x=XPos.LMARGIN, new_y=YPos.NEXT)
         y_left = op.get_y() + 1
 
@@ -330,52 +705,131 @@ def build_one_pager(op: "OnePager", content: Dict) -> None:
     op.set_text_color(*OP_Colors.BG_WHITE)
     op.set_font("Helvetica", "B", 7.5)
     op.set_xy(right_x, y)
-    op.cell(OP_Layout.COL_R, 4.5, "  TEAM / STATUS", fill=True)
+    op.cell(OP_Layout.COL_R, OP_Layout.LABEL_H, "  TEAM / STATUS", fill=True)
     y_right = y + 5
 
     # Team info
-    team_info = content.get("team_info", [
-        f"Team: {content.get('team_size', '6 developers')}",
-        f"Lead: {content.get('lead_credential', '[Name] — shipped [Title]')}",
-        f"Status: {content.get('dev_status', 'Vertical slice in progress')}",
-        f"Funding: {content.get('funding_status', 'Seeking seed round')}",
-    ])
-    for item in team_info[:5]:
+    for item in flow["team"]:
         op.set_xy(right_x + 1, y_right)
-        op.set_font("Helvetica", size=8.0)
+        op.set_font("Helvetica", size=sizes.team)
         op.set_text_color(*OP_Colors.TEXT_DARK)
-        op.multi_cell(OP_Layout.COL_R - 2, 4.2, item,
+        op.multi_cell(OP_Layout.COL_R - 2, sizes.line_height("team"), item,
                       new_x=XPos.LMARGIN, new_y=YPos.NEXT)
         y_right = op.get_y()
 
     # Advance y to whichever column ended lower
     y = max(y_left, y_right) + 2
     op.divider(y)
-
-    # ── FOOTER ────────────────────────────────────────────────
-    # Always at bottom of page
-    footer_y = OP_Layout.H - 12
-    op.set_fill_color(*OP_Colors.ACCENT_DARK)
-    op.rect(0, footer_y, OP_Layout.W, 12, "F")
-
-    contact = content.get("contact_email", "contact@studio.com")
-    website = content.get("website", "studio.gg")
-    location = content.get("location", "Remote")
-    footer_text = f"{studio}  ·  {contact}  ·  {website}  ·  {location}"
-
-    op.set_font("Helvetica", size=7)
-    op.set_text_color(*OP_Colors.BG_WHITE)
-    op.set_xy(OP_Layout.ML, footer_y + 4)
-    op.cell(OP_Layout.CW, 4, footer_text, align="C")
+    return y
 
 
 # ─────────────────────────────────────────────
 # MAIN GENERATION FUNCTION
 # ─────────────────────────────────────────────
 
+def _validate_content(game_data: Dict, strict: bool, warnings: Optional[List[str]] = None) -> None:
+    """Pre-export validation; raises StrictModeError in strict mode on warnings."""
+    if not REGISTRY_AVAILABLE:
+        return
+    sections_to_validate = game_data.get("sections", {})
+    if sections_to_validate:
+        sensibility_warnings = validate_data_sensibility(
+            sections_to_validate, strict=strict
+        )
+        emit_warnings(sensibility_warnings, warnings)
+        raise_if_strict(
+            strict, sensibility_warnings,
+            "STRICT MODE: Export aborted due to unsourced metrics or "
+            "placeholders. Fix the warnings above or remove --strict.",
+            warnings,
+        )
+
+
+def _fit_warnings(fit: OnePagerFit, title: Optional[str] = None) -> List[str]:
+    if not fit.report():
+        return []
+    prefix = f"{title}: " if title else ""
+    return [f"{prefix}One-pager content shrunk to fit the page: {', '.join(fit.report())}"]
+
+
+def build_one_pager_document(
+    game_data: Dict,
+    strict: bool = False,
+    document_class: Optional[type] = None,
+    warnings: Optional[List[str]] = None
+) -> "OnePager":
+    """
+    Validate content and lay out the one-pager (not saved).
+
+    Args:
+        game_data: Dictionary with game metadata and one-pager content.
+        strict: If True, fail if unsourced metrics or placeholders remain.
+        document_class: OnePager subclass to build into (e.g. a
+            utils.preview recording class); defaults to OnePager.
+        warnings: List that collects validation and fit warnings; printed
+            when None.
+
+    Returns:
+        The laid-out document.
+
+    Raises:
+        StrictModeError: In strict mode, when business sections have warnings.
+    """
+    if not FPDF_AVAILABLE:
+        raise ImportError(
+            "fpdf2 is required. Install with:\n"
+            "  pip install fpdf2"
+        )
+
+    _validate_content(game_data, strict, warnings)
+    op = (document_class or OnePager)()
+    emit_warnings(_fit_warnings(build_one_pager(op, game_data)), warnings)
+    return op
+
+
+def render_one_pager(
+    game_data: Dict, out: Output = None, context: Optional[RenderContext] = None
+) -> RenderResult:
+    """
+    Render a single-page PDF concept sheet without printing anything.
+
+    Args:
+        game_data: Dictionary with game metadata and one-pager content.
+        out: Output path, writable binary stream, or None to return the
+            PDF bytes in result.data.
+        context: Strict mode, warning sink and progress callback (one
+            step: the page); defaults to RenderContext().
+
+    Returns:
+        RenderResult with the PDF (or its path) and any warnings, including
+        content that had to shrink to fit the page.
+    """
+    context = context or RenderContext()
+    result = context.new_result("application/pdf")
+    op = build_one_pager_document(game_data, strict=context.strict, warnings=result.warnings)
+    context.report("One-pager", 1, 1)
+    return write_bytes(out, op.output(), result)
+
+
+def render_one_pager_async(
+    renderer: AsyncRenderer,
+    game_data: Dict,
+    context: Optional[RenderContext] = None,
+    **options: Any
+) -> RenderJob:
+    """
+    Start render_one_pager() on an AsyncRenderer, off the event loop.
+
+    Returns:
+        RenderJob: await it for the RenderResult, or iterate it (async for)
+        for per-section RenderProgress first.
+    """
+    return renderer.start(render_one_pager, game_data, context, **options)
+
+
 def generate_one_pager(game_data: Dict, output_path: str, strict: bool = False) -> str:
     """
-    Generate a single-page PDF concept sheet.
+    Generate a single-page PDF concept sheet, printing any warnings.
 
     Args:
         game_data: Dictionary with game metadata and one-pager content.
@@ -385,35 +839,254 @@ def generate_one_pager(game_data: Dict, output_path: str, strict: bool = False)
     Returns:
         Absolute path to generated file.
     """
+    try:
+        result = render_one_pager(game_data, output_path, RenderContext(strict=strict))
+    except StrictModeError as e:
+        exit_on_strict_failure(e)
+    result.print_report()
+    print(f"✓ One-pager generated: {result.path}")
+    return result.path
+
+
+# ─────────────────────────────────────────────
+# CATALOG (MANY TITLES, ONE PDF)
+# ─────────────────────────────────────────────
+
+INDEX_ROW_H = 11          # Height of one title row on the index pages (mm)
+INDEX_FIRST_TOP = 34      # Y of the first row on the first index page
+INDEX_CONT_TOP = 20       # Y of the first row on continuation pages
+
+
+class CatalogEntry(NamedTuple):
+    """One title in a catalog, as listed on the index pages."""
+    title: str
+    genre: str
+    platform: str
+    tagline: str
+    page: int
+    source: str
+
+
+def catalog_config_paths(paths: List[str]) -> List[str]:
+    """Expand directories to their *.json / *.gddpack / *.md files (sorted); files are kept in order."""
+    expanded = []
+    for path in paths:
+        if os.path.isdir(path):
+            expanded += sorted(
+                os.path.join(path, name) for name in os.listdir(path)
+                if name.lower().endswith((".json", ".gddpack", ".md"))
+            )
+        else:
+            expanded.append(path)
+    return expanded
+
+
+def iter_catalog_configs(paths: List[str]) -> Iterator[Tuple[str, Dict]]:
+    """
+    Load catalog configs one at a time (only one is in memory at once).
+    Unreadable configs are reported and skipped.
+    """
+    for path in paths:
+        found: List[str] = []
+        try:
+            game_data = load_project(path, warnings=found)
+        except (OSError, ValueError) as e:
+            print(f"  WARNING: Skipping {path}: {e}")
+            continue
+        for warning in found:
+            print(f"  WARNING: {path}: {warning}")
+        yield path, game_data
+
+
+def catalog_index_pages(count: int) -> int:
+    """Number of index pages needed to list count titles."""
+    limit = OP_Layout.FOOTER_Y - OP_Layout.FOOTER_GAP
+    first = int((limit - INDEX_FIRST_TOP) // INDEX_ROW_H)
+    per_page = int((limit - INDEX_CONT_TOP) // INDEX_ROW_H)
+    return 1 + max(0, -(-(count - first) // per_page))
+
+
+def _clip_to_width(op: "OnePager", text: str, width: float) -> str:
+    """Shorten text with an ellipsis so it fits on one line at the current font."""
+    if op.get_string_width(text) <= width:
+        return text
+    words = text.split()
+    while words and op.get_string_width(" ".join(words) + ELLIPSIS) > width:
+        words.pop()
+    return " ".join(words) + ELLIPSIS
+
+
+def _draw_index_chrome(op: "OnePager", catalog_title: str, count: int, date_str: str) -> None:
+    """Top bar and footer band of an index page."""
+    op.set_fill_color(*OP_Colors.ACCENT_DARK)
+    op.rect(0, 0, OP_Layout.W, 7, "F")
+    op.rect(0, OP_Layout.FOOTER_Y, OP_Layout.W, OP_Layout.FOOTER_H, "F")
+    op.set_font("Helvetica", size=7)
+    op.set_text_color(*OP_Colors.BG_WHITE)
+    op.set_xy(OP_Layout.ML, 1.5)
+    op.cell(OP_Layout.CW, 4, f"{catalog_title}  ·  {date_str}", align="R")
+    op.set_xy(OP_Layout.ML, OP_Layout.FOOTER_Y + 4)
+    op.cell(OP_Layout.CW, 4, f"{catalog_title}  ·  {count} titles", align="C")
+
+
+def _render_catalog_index(op: "OnePager", entries: List[CatalogEntry],
+                          catalog_title: str, pages: int) -> None:
+    """
+    Draw the index into the pages reserved by insert_toc_placeholder
+    (called by fpdf2 once every title has been rendered).
+    """
+    start_page = op.page
+    # fpdf2 still tracks the last title's colors here, but the reserved page
+    # starts from the defaults: re-sync so the colors below are emitted
+    op.set_draw_color(0)
+    op.set_fill_color(0)
+    date_str = datetime.now().strftime("%B %Y")
+    limit = OP_Layout.FOOTER_Y - OP_Layout.FOOTER_GAP
+    _draw_index_chrome(op, catalog_title, len(entries), date_str)
+
+    op.set_font("Helvetica", "B", 22)
+    op.set_text_color(*OP_Colors.ACCENT_DARK)
+    op.set_xy(OP_Layout.ML, 11)
+    op.cell(OP_Layout.CW, 12, catalog_title)
+    op.set_font("Helvetica", "I", 9.5)
+    op.set_text_color(*OP_Colors.TEXT_MID)
+    op.set_xy(OP_Layout.ML, 23)
+    op.cell(OP_Layout.CW, 5.5, f"{len(entries)} game concepts  ·  {date_str}")
+    op.set_draw_color(*OP_Colors.ACCENT_GOLD)
+    op.set_line_width(0.7)
+    op.line(OP_Layout.ML, 30, OP_Layout.ML + 50, 30)
+
+    y = INDEX_FIRST_TOP
+    for entry in entries:
+        if y + INDEX_ROW_H > limit:
+            op.add_page()
+            _draw_index_chrome(op, catalog_title, len(entries), date_str)
+            y = INDEX_CONT_TOP
+        link = op.add_link(page=entry.page)
+
+        op.set_font("Helvetica", "B", 8)
+        op.set_text_color(*OP_Colors.ACCENT_MID)
+        op.set_xy(OP_Layout.W - OP_Layout.MR - 20, y)
+        op.cell(20, 5, f"p. {entry.page}", align="R", link=link)
+
+        op.set_font("Helvetica", "B", 10)
+        op.set_text_color(*OP_Colors.ACCENT_DARK)
+        op.set_xy(OP_Layout.ML, y)
+        op.cell(OP_Layout.CW - 22, 5, _clip_to_width(op, entry.title, OP_Layout.CW - 24),
+                link=link)
+
+        op.set_font("Helvetica", size=7.5)
+        op.set_text_color(*OP_Colors.TEXT_MID)
+        details = f"{entry.genre}  ·  {entry.platform}"
+        if entry.tagline:
+            details += f"  —  {entry.tagline}"
+        op.set_xy(OP_Layout.ML, y + 5)
+        op.cell(OP_Layout.CW - 22, 4, _clip_to_width(op, details, OP_Layout.CW - 24))
+
+        op.divider(y + INDEX_ROW_H - 1)
+        y += INDEX_ROW_H
+
+    # Titles that failed to load leave reserved pages over; fill them with chrome
+    while op.page < start_page + pages - 1:
+        op.add_page()
+        _draw_index_chrome(op, catalog_title, len(entries), date_str)
+
+
+def build_catalog_document(
+    config_paths: List[str],
+    catalog_title: str = "Concept Catalog",
+    strict: bool = False,
+    document_class: Optional[type] = None
+) -> Tuple["OnePager", List[CatalogEntry]]:
+    """
+    Render many one-pager configs into one multi-page document.
+
+    Titles are laid out one per page on a single OnePager, so fonts and
+    other resources are written once for the whole catalog. Configs are
+    loaded lazily, one at a time. Each title gets a bookmark, and index
+    pages with linked page numbers are filled in at the front once all
+    titles are placed.
+
+    Args:
+        config_paths: One-pager JSON configs and/or directories of them.
+        catalog_title: Title of the index page and PDF metadata.
+        strict: If True, fail if unsourced metrics or placeholders remain.
+        document_class: OnePager subclass to build into; defaults to OnePager.
+
+    Returns:
+        (document, catalog entries in page order).
+    """
     if not FPDF_AVAILABLE:
         raise ImportError(
             "fpdf2 is required. Install with:\n"
             "  pip install fpdf2"
         )
+    paths = catalog_config_paths(config_paths)
+    if not paths:
+        raise ValueError("No one-pager configs found for the catalog")
+
+    op = (document_class or OnePager)()
+    entries: List[CatalogEntry] = []
+    index_pages = catalog_index_pages(len(paths))
+    # The placeholder reserves its pages through automatic page breaks,
+    # which OnePager otherwise keeps off
+    op.set_auto_page_break(auto=True, margin=0)
+    op.insert_toc_placeholder(
+        lambda pdf, outline: _render_catalog_index(pdf, entries, catalog_title, index_pages),
+        pages=index_pages,
+    )
+    op.set_auto_page_break(auto=False)
+
+    for path, game_data in iter_catalog_configs(paths):
+        _validate_content(game_data, strict)
+        if entries:
+            op.add_page()
+        title = game_data.get("game_title", "GAME TITLE")
+        op.start_section(title)
+        entries.append(CatalogEntry(
+            title=title,
+            genre=game_data.get("genre", "Genre TBD"),
+            platform=game_data.get("platform", "Platform TBD"),
+            tagline=game_data.get("tagline", ""),
+            page=op.page,
+            source=path,
+        ))
+        emit_warnings(_fit_warnings(build_one_pager(op, game_data), title), None)
+
+    if not entries:
+        raise ValueError("None of the catalog configs could be loaded")
+    op.set_title(catalog_title)
+    op.set_subject(f"{len(entries)} game concept one-pagers")
+    op.set_creator("game-design-document generator")
+    return op, entries
+
+
+def generate_one_pager_catalog(
+    config_paths: List[str],
+    output_path: str,
+    catalog_title: str = "Concept Catalog",
+    strict: bool = False
+) -> str:
+    """
+    Generate a catalog PDF: an index, then one one-pager per title.
 
-    # Pre-export validation
-    if REGISTRY_AVAILABLE:
-        sections_to_validate = game_data.get("sections", {})
-        if sections_to_validate:
-            sensibility_warnings = validate_data_sensibility(
-                sections_to_validate, strict=strict
-            )
-            for warning in sensibility_warnings:
-                print(f"  WARNING: {warning}")
-            if strict and sensibility_warnings:
-                raise SystemExit(
-                    "STRICT MODE: Export aborted due to unsourced metrics or "
-                    "placeholders. Fix the warnings above or remove --strict."
-                )
+    Args:
+        config_paths: One-pager JSON configs and/or directories of them.
+        output_path: Output PDF path.
+        catalog_title: Title of the index page and PDF metadata.
+        strict: If True, fail export if unsourced metrics or placeholders remain.
 
-    op = OnePager()
-    build_one_pager(op, game_data)
+    Returns:
+        Absolute path to generated file.
+    """
+    op, entries = build_catalog_document(config_paths, catalog_title, strict)
 
     output_dir = os.path.dirname(os.path.abspath(output_path))
     os.makedirs(output_dir, exist_ok=True)
     op.output(output_path)
     abs_path = os.path.abspath(output_path)
-    print(f"✓ One-pager generated: {abs_path}")
+    print(f"✓ Catalog generated: {abs_path}")
+    print(f"  Titles: {len(entries)}  Pages: {op.pages_count}")
     return abs_path
 
 
@@ -429,6 +1102,8 @@ def main():
 Examples:
   python generate_one_pager_pdf.py --title "Echo Chamber" --output "EchoChamber_OnePager.pdf"
   python generate_one_pager_pdf.py --config one_pager.json --output "MyGame_OnePager.pdf"
+  python generate_one_pager_pdf.py --catalog slate/ --catalog-title "Studio Slate 2026" --output "Slate.pdf"
+  python generate_one_pager_pdf.py --catalog a.json b.json c.json --output "Catalog.pdf"
         """
     )
     parser.add_argument("--title", help="Game title")
@@ -438,6 +1113,13 @@ Examples:
     parser.add_argument("--audience", default="Ages 18-35, midcore gamers", help="Audience")
     parser.add_argument("--tagline", default="", help="Tagline")
     parser.add_argument("--config", help="JSON config file with one-pager content")
+    parser.add_argument("--version-id", type=int,
+                        help="Version to render when --config is a version store (default: newest)")
+    parser.add_argument("--catalog", nargs="+", metavar="CONFIG",
+                        help="Render many configs (files or directories of .json) into one "
+                             "catalog PDF with an index page and bookmarks")
+    parser.add_argument("--catalog-title", default="Concept Catalog",
+                        help="Title of the catalog index page")
     parser.add_argument("--output", default="one_pager.pdf", help="Output PDF path")
     parser.add_argument("--strict", action="store_true",
                         help="Fail export if unsourced metrics or placeholders remain")
@@ -448,11 +1130,21 @@ Examples:
         print("ERROR: fpdf2 is not installed. Install with: pip install fpdf2")
         sys.exit(1)
 
+    if args.catalog:
+        try:
+            generate_one_pager_catalog(
+                args.catalog, output_path=args.output,
+                catalog_title=args.catalog_title, strict=args.strict
+            )
+        except ValueError as e:
+            print(f"ERROR: {e}")
+            sys.exit(1)
+        return
+
     if args.config:
         try:
-            with open(args.config, "r", encoding="utf-8") as f:
-                game_data = json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError) as e:
+            game_data = load_project(args.config, args.version_id)
+        except (FileNotFoundError, ValueError) as e:
             print(f"ERROR loading config: {e}")
             sys.exit(1)
     elif args.title:
@@ -469,11 +1161,14 @@ Examples:
         }
     else:
         parser.print_help()
-        print("\nERROR: Provide --title or --config")
+        print("\nERROR: Provide --title, --config or --catalog")
         sys.exit(1)
 
     try:
         generate_one_pager(game_data=game_data, output_path=args.output, strict=args.strict)
+    except CorruptContentError as e:  # A .gddpack / store blob, read on first use
+        print(f"ERROR loading config: {e}")
+        sys.exit(1)
     except Exception as e:
         print(f"ERROR: {e}")
         import traceback
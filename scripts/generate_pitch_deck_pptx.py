@@ -25,14 +25,24 @@ Slide Structure:
 """
 
 import argparse
+import io
 import json
 import os
+import re
 import sys
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from typing import Callable, Dict, List, Any, Optional
 
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
-sys.path.insert(0, SCRIPT_DIR)
+if SCRIPT_DIR not in sys.path:
+    sys.path.insert(0, SCRIPT_DIR)
+
+from utils.project_loader import CorruptContentError, load_project
+from utils.async_render import AsyncRenderer, RenderJob
+from utils.render_output import (
+    Output, RenderContext, RenderResult, StrictModeError, emit_warnings, exit_on_strict_failure,
+    raise_if_strict, write_output,
+)
 
 try:
     from utils.pptx_builder import (
@@ -41,8 +51,10 @@ try:
         add_background, add_text_box, add_bullet_text_box,
         add_accent_bar, add_divider_line,
         build_title_slide, build_content_slide,
-        build_comparison_slide, build_closing_slide
+        build_comparison_slide, build_closing_slide,
+        symbolic_theme, theme_from_dict, theme_part_name, write_theme_variant
     )
+    from utils.text_fit import font_metrics_scope
     PPTX_BUILDER_AVAILABLE = True
 except ImportError:
     PPTX_BUILDER_AVAILABLE = False
@@ -311,23 +323,35 @@ def _get_default_pitch_content(game_data: Dict) -> Dict:
 # MAIN GENERATION FUNCTION
 # ─────────────────────────────────────────────
 
-def generate_pitch_deck(
+# Slides in the standard deck structure (continuation slides not counted)
+PITCH_SLIDE_COUNT = 11
+
+
+def build_pitch_deck(
     game_data: Dict,
-    output_path: str,
     theme: Optional["PitchTheme"] = None,
-    strict: bool = False
-) -> str:
+    strict: bool = False,
+    warnings: Optional[List[str]] = None,
+    progress: Optional[Callable[[str, int, int], None]] = None
+) -> "Presentation":
     """
-    Generate a complete pitch deck .pptx file.
+    Validate the pitch content and build all slides in memory.
 
     Args:
         game_data: Dictionary with game metadata and optional slide content.
-        output_path: Output .pptx file path.
         theme: Optional PitchTheme. Defaults to DEFAULT_THEME.
         strict: If True, fail export if unsourced metrics or placeholders remain.
+        warnings: List that collects validation warnings; printed when None.
+        progress: Called with (slide name, done, PITCH_SLIDE_COUNT) as each
+            of the deck's slides is built (long slides may continue onto
+            extra "(cont.)" slides).
 
     Returns:
-        Absolute path to the generated file.
+        The unsaved python-pptx Presentation.
+
+    Raises:
+        StrictModeError: In strict mode, when business sections or pitch
+            slides have warnings.
     """
     if not PPTX_AVAILABLE:
         raise ImportError(
@@ -344,17 +368,16 @@ def generate_pitch_deck(
             sensibility_warnings = validate_data_sensibility(
                 sections_to_validate, strict=strict
             )
-            for warning in sensibility_warnings:
-                print(f"  WARNING: {warning}")
-            if strict and sensibility_warnings:
-                raise SystemExit(
-                    "STRICT MODE: Export aborted due to unsourced metrics or "
-                    "placeholders in business sections. Fix the warnings above "
-                    "or remove --strict to export with warnings."
-                )
+            emit_warnings(sensibility_warnings, warnings)
+            raise_if_strict(
+                strict, sensibility_warnings,
+                "STRICT MODE: Export aborted due to unsourced metrics or "
+                "placeholders in business sections. Fix the warnings above "
+                "or remove --strict to export with warnings.",
+                warnings,
+            )
 
     # Check pitch slide content for SOURCE NEEDED placeholders
-    import re
     source_needed_re = re.compile(r"\bSOURCE NEEDED\b", re.IGNORECASE)
     pitch_slides = game_data.get("pitch_slides", {})
     pitch_warnings = []
@@ -365,13 +388,13 @@ def generate_pitch_deck(
                 f"PLACEHOLDER in '{slide_key}': Contains 'SOURCE NEEDED' markers. "
                 f"Replace with real data before external use."
             )
-    for warning in pitch_warnings:
-        print(f"  WARNING: {warning}")
-    if strict and pitch_warnings:
-        raise SystemExit(
-            "STRICT MODE: Export aborted due to SOURCE NEEDED placeholders "
-            "in pitch slides. Fix the warnings above or remove --strict."
-        )
+    emit_warnings(pitch_warnings, warnings)
+    raise_if_strict(
+        strict, pitch_warnings,
+        "STRICT MODE: Export aborted due to SOURCE NEEDED placeholders "
+        "in pitch slides. Fix the warnings above or remove --strict.",
+        warnings,
+    )
 
     if theme is None:
         theme = DEFAULT_THEME
@@ -389,72 +412,80 @@ def generate_pitch_deck(
     platform = game_data.get("platform", "Platform")
 
     slide_num = 1
+    slides_done = 0
+
+    def slide_done(name: str) -> None:
+        nonlocal slides_done
+        slides_done += 1
+        if progress:
+            progress(name, slides_done, PITCH_SLIDE_COUNT)
 
     # ── Slide 1: Title ──────────────────────────────────────
     build_title_slide(
         prs, game_title, tagline, studio, genre, platform, theme
     )
     slide_num += 1
+    slide_done("Title")
 
     # ── Slide 2: Market Opportunity ──────────────────────────
     s2 = pitch_content.get("slide_2_problem", {})
-    build_content_slide(
+    slide_num += build_content_slide(
         prs, slide_num,
         s2.get("title", "The Market Opportunity"),
         s2.get("blocks", []),
         theme
     )
-    slide_num += 1
+    slide_done("Market Opportunity")
 
     # ── Slide 3: Game Concept ────────────────────────────────
     s3 = pitch_content.get("slide_3_solution", {})
-    build_content_slide(
+    slide_num += build_content_slide(
         prs, slide_num,
         s3.get("title", f"The Game: {game_title}"),
         s3.get("blocks", []),
         theme
     )
-    slide_num += 1
+    slide_done("Game Concept")
 
     # ── Slide 4: Core Loop ───────────────────────────────────
     s4 = pitch_content.get("slide_4_loop", {})
-    build_content_slide(
+    slide_num += build_content_slide(
         prs, slide_num,
         s4.get("title", "Core Gameplay Loop"),
         s4.get("blocks", []),
         theme
     )
-    slide_num += 1
+    slide_done("Core Loop")
 
     # ── Slide 5: Key Features ────────────────────────────────
     s5 = pitch_content.get("slide_5_features", {})
-    build_content_slide(
+    slide_num += build_content_slide(
         prs, slide_num,
         s5.get("title", "Key Features"),
         s5.get("blocks", []),
         theme
     )
-    slide_num += 1
+    slide_done("Key Features")
 
     # ── Slide 6: Audience & Market ───────────────────────────
     s6 = pitch_content.get("slide_6_audience", {})
-    build_content_slide(
+    slide_num += build_content_slide(
         prs, slide_num,
         s6.get("title", "Target Audience & Market"),
         s6.get("blocks", []),
         theme
     )
-    slide_num += 1
+    slide_done("Audience & Market")
 
     # ── Slide 7: Monetization ────────────────────────────────
     s7 = pitch_content.get("slide_7_monetization", {})
-    build_content_slide(
+    slide_num += build_content_slide(
         prs, slide_num,
         s7.get("title", "Monetization Strategy"),
         s7.get("blocks", []),
         theme
     )
-    slide_num += 1
+    slide_done("Monetization")
 
     # ── Slide 8: Competitive Landscape ───────────────────────
     s8 = pitch_content.get("slide_8_competitive", {})
@@ -473,26 +504,27 @@ def generate_pitch_deck(
         differentiator=differentiator
     )
     slide_num += 1
+    slide_done("Competitive Landscape")
 
     # ── Slide 9: Development Timeline ────────────────────────
     s9 = pitch_content.get("slide_9_timeline", {})
-    build_content_slide(
+    slide_num += build_content_slide(
         prs, slide_num,
         s9.get("title", "Development Timeline"),
         s9.get("blocks", []),
         theme
     )
-    slide_num += 1
+    slide_done("Development Timeline")
 
     # ── Slide 10: Team ────────────────────────────────────────
     s10 = pitch_content.get("slide_10_team", {})
-    build_content_slide(
+    slide_num += build_content_slide(
         prs, slide_num,
         s10.get("title", "The Team"),
         s10.get("blocks", []),
         theme
     )
-    slide_num += 1
+    slide_done("Team")
 
     # ── Slide 11: The Ask / Closing ───────────────────────────
     s11 = pitch_content.get("slide_11_ask", {})
@@ -520,15 +552,140 @@ def generate_pitch_deck(
         s11.get("contact", f"{studio}  ·  contact@studio.com"),
         theme
     )
+    slide_done("The Ask / Closing")
+    return prs
+
+
+PPTX_CONTENT_TYPE = "application/vnd.openxmlformats-officedocument.presentationml.presentation"
+
+
+def render_pitch_deck(
+    game_data: Dict,
+    out: Output = None,
+    context: Optional[RenderContext] = None
+) -> RenderResult:
+    """
+    Render a complete pitch deck without printing anything.
+
+    Args:
+        game_data: Dictionary with game metadata and optional slide content.
+        out: Output path, writable binary stream, or None to return the
+            .pptx bytes in result.data.
+        context: Theme, strict mode, warning sink, per-slide progress
+            callback and font metrics cache; defaults to RenderContext()
+            (DEFAULT_THEME, not strict).
+
+    Returns:
+        RenderResult with the deck (or its path), warnings and
+        stats["slides"].
+    """
+    context = context or RenderContext()
+    result = context.new_result(PPTX_CONTENT_TYPE)
+    with font_metrics_scope(context.fonts):
+        prs = build_pitch_deck(game_data, context.theme, context.strict,
+                               warnings=result.warnings, progress=context.report)
+    result.stats["slides"] = len(prs.slides)
+    return write_output(out, prs.save, result)
+
+
+def render_pitch_deck_async(
+    renderer: AsyncRenderer,
+    game_data: Dict,
+    context: Optional[RenderContext] = None,
+    **options: Any
+) -> RenderJob:
+    """
+    Start render_pitch_deck() on an AsyncRenderer, off the event loop.
+
+    Returns:
+        RenderJob: await it for the RenderResult, or iterate it (async for)
+        for per-slide RenderProgress first.
+    """
+    return renderer.start(render_pitch_deck, game_data, context, **options)
+
+
+def generate_pitch_deck(
+    game_data: Dict,
+    output_path: str,
+    theme: Optional["PitchTheme"] = None,
+    strict: bool = False
+) -> str:
+    """
+    Generate a complete pitch deck .pptx file, printing warnings and the
+    slide count.
+
+    Takes the same arguments as render_pitch_deck(), with output_path in
+    place of out and theme / strict in place of context.
+
+    Returns:
+        Absolute path to the generated file.
+    """
+    try:
+        result = render_pitch_deck(game_data, output_path, RenderContext(strict=strict, theme=theme))
+    except StrictModeError as e:
+        exit_on_strict_failure(e)
+    result.print_report()
+    print(f"✓ Pitch deck generated: {result.path}")
+    print(f"  Slides: {result.stats['slides']}")
+    return result.path
+
+
+def variant_output_path(output_path: str, variant_name: str) -> str:
+    """Derive a variant's file name: MyGame_Pitch.pptx -> MyGame_Pitch_<variant>.pptx."""
+    stem, ext = os.path.splitext(output_path)
+    safe_name = re.sub(r"[^\w.-]+", "_", variant_name).strip("_") or "variant"
+    return f"{stem}_{safe_name}{ext or '.pptx'}"
+
+
+def generate_pitch_deck_variants(
+    game_data: Dict,
+    output_path: str,
+    variants: Dict[str, "PitchTheme"],
+    strict: bool = False
+) -> Dict[str, str]:
+    """
+    Generate one pitch deck per theme variant from a single build.
+
+    The deck is built once with symbolic scheme colors and theme fonts (see
+    pptx_builder.symbolic_theme); each variant is then written by patching
+    only the package's theme part with that variant's colors and fonts.
+
+    Args:
+        game_data: Dictionary with game metadata and optional slide content.
+        output_path: Base output path; variants are saved next to it as
+            <stem>_<variant name>.pptx.
+        variants: Variant name -> PitchTheme. All variants must share the
+            same slide dimensions.
+        strict: If True, fail export if unsourced metrics or placeholders remain.
+
+    Returns:
+        Variant name -> absolute path of the generated file.
+    """
+    if not variants:
+        raise ValueError("At least one theme variant is required")
+    first = next(iter(variants.values()))
+    for name, variant in variants.items():
+        if (variant.slide_width, variant.slide_height) != (first.slide_width, first.slide_height):
+            raise ValueError(
+                f"Theme variant '{name}' changes the slide size; only colors and "
+                f"fonts can vary between variants of one build."
+            )
+
+    prs = build_pitch_deck(game_data, symbolic_theme(first), strict)
+    package = io.BytesIO()
+    prs.save(package)
+    theme_part = theme_part_name(prs)
 
-    # Save
     output_dir = os.path.dirname(os.path.abspath(output_path))
     os.makedirs(output_dir, exist_ok=True)
-    prs.save(output_path)
-    abs_path = os.path.abspath(output_path)
-    print(f"✓ Pitch deck generated: {abs_path}")
-    print(f"  Slides: {slide_num}")
-    return abs_path
+    paths = {}
+    for name, variant in variants.items():
+        path = os.path.abspath(variant_output_path(output_path, name))
+        write_theme_variant(package.getvalue(), theme_part, variant, path)
+        paths[name] = path
+        print(f"✓ Pitch deck generated: {path}  [{name}]")
+    print(f"  Slides: {len(prs.slides)}  ·  Variants: {len(paths)}")
+    return paths
 
 
 # ─────────────────────────────────────────────
@@ -543,6 +700,12 @@ def main():
 Examples:
   python generate_pitch_deck_pptx.py --title "Echo Chamber" --output "EchoChamber_Pitch.pptx"
   python generate_pitch_deck_pptx.py --config pitch_content.json --output "MyGame_Pitch.pptx"
+  python generate_pitch_deck_pptx.py --config pitch_content.json --themes publisher_themes.json --output "MyGame_Pitch.pptx"
+
+Theme variants file (--themes): a JSON object mapping variant names to
+PitchTheme overrides, e.g.
+  {"dark": {}, "light": {"bg_dark": "#F4F6FA", "text_primary": [20, 24, 33]}}
+Each variant is written as <output stem>_<variant>.pptx from a single build.
         """
     )
     parser.add_argument("--title", help="Game title")
@@ -552,9 +715,13 @@ Examples:
     parser.add_argument("--audience", default="Ages 18-35, midcore gamers", help="Audience")
     parser.add_argument("--tagline", default="", help="Tagline")
     parser.add_argument("--config", help="JSON config file with pitch content")
+    parser.add_argument("--version-id", type=int,
+                        help="Version to render when --config is a version store (default: newest)")
     parser.add_argument("--output", default="pitch_deck.pptx", help="Output .pptx path")
     parser.add_argument("--strict", action="store_true",
                         help="Fail export if SOURCE NEEDED placeholders or unsourced metrics remain")
+    parser.add_argument("--themes",
+                        help="JSON file of named PitchTheme variants; writes one deck per variant")
 
     args = parser.parse_args()
 
@@ -564,9 +731,8 @@ Examples:
 
     if args.config:
         try:
-            with open(args.config, "r", encoding="utf-8") as f:
-                game_data = json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError) as e:
+            game_data = load_project(args.config, args.version_id)
+        except (FileNotFoundError, ValueError) as e:
             print(f"ERROR loading config: {e}")
             sys.exit(1)
     elif args.title:
@@ -583,8 +749,29 @@ Examples:
         print("\nERROR: Provide --title or --config")
         sys.exit(1)
 
+    variants = None
+    if args.themes:
+        try:
+            with open(args.themes, "r", encoding="utf-8") as f:
+                variants = {
+                    name: theme_from_dict(overrides)
+                    for name, overrides in json.load(f).items()
+                }
+        except (FileNotFoundError, json.JSONDecodeError, AttributeError, ValueError) as e:
+            print(f"ERROR loading themes: {e}")
+            sys.exit(1)
+
     try:
-        generate_pitch_deck(game_data=game_data, output_path=args.output, strict=args.strict)
+        if variants is not None:
+            generate_pitch_deck_variants(
+                game_data=game_data, output_path=args.output,
+                variants=variants, strict=args.strict
+            )
+        else:
+            generate_pitch_deck(game_data=game_data, output_path=args.output, strict=args.strict)
+    except CorruptContentError as e:  # A .gddpack / store blob, read on first use
+        print(f"ERROR loading config: {e}")
+        sys.exit(1)
     except Exception as e:
         print(f"ERROR: {e}")
         import traceback
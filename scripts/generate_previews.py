@@ -0,0 +1,197 @@
+"""
+generate_previews.py
+--------------------
+Writes a contact sheet PNG of pitch deck slides, one-pager and GDD pages,
+drawn straight from the generators' layout calls with Pillow (no
+PowerPoint, LibreOffice or PDF rasterizer needed).
+
+Usage:
+    python scripts/generate_previews.py --config game.json --output previews.png
+    python scripts/generate_previews.py --config game.json --kind pitch --thumb-width 480
+    python scripts/generate_previews.py --pptx MyGame_Pitch.pptx --output deck_preview.png
+
+Requirements:
+    pip install pillow python-pptx fpdf2
+"""
+
+import argparse
+import os
+import sys
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+if SCRIPT_DIR not in sys.path:
+    sys.path.insert(0, SCRIPT_DIR)
+
+from utils.project_loader import CorruptContentError, load_project
+
+try:
+    from utils.preview import (
+        PIL_AVAILABLE, contact_sheet, page_label, recording_class,
+        render_pptx_slides, render_recorded_pages
+    )
+    PREVIEW_AVAILABLE = PIL_AVAILABLE
+except ImportError:
+    PREVIEW_AVAILABLE = False
+
+
+KINDS = ("pitch", "one-pager", "gdd")
+
+
+# ─────────────────────────────────────────────
+# RENDERERS
+# ─────────────────────────────────────────────
+
+def preview_pitch_deck(game_data: Dict, thumb_width: int, strict: bool = False):
+    """Thumbnails of the pitch deck built from game_data."""
+    from generate_pitch_deck_pptx import build_pitch_deck
+    return render_pptx_slides(build_pitch_deck(game_data, strict=strict), width=thumb_width)
+
+
+def preview_one_pager(game_data: Dict, thumb_width: int, strict: bool = False):
+    """Thumbnail(s) of the one-pager built from game_data."""
+    from generate_one_pager_pdf import OnePager, build_one_pager_document
+    op = build_one_pager_document(
+        game_data, strict=strict, document_class=recording_class(OnePager)
+    )
+    return render_recorded_pages(op, width=thumb_width)
+
+
+def preview_gdd(game_data: Dict, thumb_width: int, strict: bool = False,
+                max_pages: Optional[int] = None):
+    """Page thumbnails of the full GDD PDF built from game_data."""
+    from generate_gdd_pdf import build_gdd_pdf
+    from utils.pdf_builder import GDDDocument
+    pdf = build_gdd_pdf(game_data, strict=strict, document_class=recording_class(GDDDocument))
+    return render_recorded_pages(pdf, width=thumb_width, max_pages=max_pages)
+
+
+def generate_previews(
+    game_data: Optional[Dict],
+    output_path: str,
+    kinds: Sequence[str] = KINDS,
+    pptx_path: Optional[str] = None,
+    columns: int = 4,
+    thumb_width: int = 320,
+    max_pages: Optional[int] = None,
+    strict: bool = False
+) -> str:
+    """
+    Render previews and write them as one contact sheet PNG.
+
+    Args:
+        game_data: Game content (as for the generators); may be None when
+            only an existing deck is previewed.
+        output_path: Output PNG path.
+        kinds: Which documents to build and preview ("pitch", "one-pager", "gdd").
+        pptx_path: Existing .pptx to preview instead of building the pitch deck.
+        columns: Thumbnails per contact sheet row.
+        thumb_width: Thumbnail width in pixels.
+        max_pages: Preview only the first N GDD pages.
+        strict: Passed to the generators' pre-export validation.
+
+    Returns:
+        Absolute path to the contact sheet.
+    """
+    if not PREVIEW_AVAILABLE:
+        raise ImportError("Pillow is required. Install with:\n  pip install pillow")
+
+    groups: List[Tuple[str, list]] = []
+    timings: List[str] = []
+
+    def add(label: str, render):
+        start = time.perf_counter()
+        images = render()
+        timings.append(f"{label}: {len(images)} in {(time.perf_counter() - start) * 1000:.0f} ms")
+        groups.append((label, page_label(images)))
+
+    if pptx_path:
+        add(f"Pitch deck — {os.path.basename(pptx_path)}",
+            lambda: render_pptx_slides(pptx_path, width=thumb_width))
+    elif "pitch" in kinds:
+        add("Pitch deck", lambda: preview_pitch_deck(game_data, thumb_width, strict))
+    if game_data is not None and "one-pager" in kinds:
+        add("One-pager", lambda: preview_one_pager(game_data, thumb_width, strict))
+    if game_data is not None and "gdd" in kinds:
+        add("Game Design Document",
+            lambda: preview_gdd(game_data, thumb_width, strict, max_pages))
+
+    sheet = contact_sheet(groups, columns=columns)
+    output_dir = os.path.dirname(os.path.abspath(output_path))
+    os.makedirs(output_dir, exist_ok=True)
+    sheet.save(output_path, optimize=True)
+    abs_path = os.path.abspath(output_path)
+    print(f"✓ Previews generated: {abs_path}")
+    for timing in timings:
+        print(f"  {timing}")
+    return abs_path
+
+
+# ─────────────────────────────────────────────
+# CLI ENTRY POINT
+# ─────────────────────────────────────────────
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Render a contact sheet of pitch deck, one-pager and GDD previews",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python generate_previews.py --config game.json --output previews.png
+  python generate_previews.py --config game.json --kind pitch --kind one-pager
+  python generate_previews.py --title "Echo Chamber" --kind pitch --thumb-width 480
+  python generate_previews.py --pptx MyGame_Pitch.pptx --output deck_preview.png
+        """
+    )
+    parser.add_argument("--title", help="Game title")
+    parser.add_argument("--config", help="JSON config file with game content")
+    parser.add_argument("--version-id", type=int,
+                        help="Version to render when --config is a version store (default: newest)")
+    parser.add_argument("--pptx", help="Preview an existing .pptx instead of building the deck")
+    parser.add_argument("--kind", action="append", choices=KINDS,
+                        help="Document to preview (repeatable; default: all)")
+    parser.add_argument("--output", default="previews.png", help="Output PNG path")
+    parser.add_argument("--columns", type=int, default=4, help="Thumbnails per row")
+    parser.add_argument("--thumb-width", type=int, default=320, help="Thumbnail width in pixels")
+    parser.add_argument("--max-pages", type=int, help="Preview only the first N GDD pages")
+    parser.add_argument("--strict", action="store_true",
+                        help="Fail if unsourced metrics or placeholders remain")
+
+    args = parser.parse_args()
+
+    if not PREVIEW_AVAILABLE:
+        print("ERROR: Pillow is not installed. Install with: pip install pillow")
+        sys.exit(1)
+
+    game_data = None
+    if args.config:
+        try:
+            game_data = load_project(args.config, args.version_id)
+        except (FileNotFoundError, ValueError) as e:
+            print(f"ERROR loading config: {e}")
+            sys.exit(1)
+    elif args.title:
+        game_data = {"game_title": args.title}
+    elif not args.pptx:
+        parser.print_help()
+        print("\nERROR: Provide --title, --config or --pptx")
+        sys.exit(1)
+
+    kinds = args.kind or (["pitch"] if game_data is None else list(KINDS))
+    try:
+        generate_previews(
+            game_data, args.output, kinds=kinds, pptx_path=args.pptx,
+            columns=args.columns, thumb_width=args.thumb_width,
+            max_pages=args.max_pages, strict=args.strict
+        )
+    except ImportError as e:
+        print(f"ERROR: {e}")
+        sys.exit(1)
+    except CorruptContentError as e:  # A .gddpack / store blob, read on first use
+        print(f"ERROR loading config: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
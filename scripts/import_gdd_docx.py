@@ -0,0 +1,137 @@
+"""
+import_gdd_docx.py
+------------------
+Imports GDD .docx files (generated by generate_gdd_docx.py, then edited in
+Word) back into JSON configs, so legacy documents can be migrated and
+regenerated.
+
+The document body is streamed and each section is written out as soon as
+it ends, so 300-page files import in bounded memory. With --split, every
+section goes to its own Markdown file next to a small project config (see
+utils/project_loader.py).
+
+Usage:
+    python scripts/import_gdd_docx.py MyGame_GDD_v04.docx --output gdd_content.json
+    python scripts/import_gdd_docx.py MyGame_GDD_v04.docx --split MyGame_project
+    python scripts/import_gdd_docx.py legacy/*.docx --output-dir migrated/
+
+Requirements:
+    pip install defusedxml
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+import zipfile
+from typing import Dict, List
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+if SCRIPT_DIR not in sys.path:
+    sys.path.insert(0, SCRIPT_DIR)
+
+from utils.docx_import import import_docx, iter_docx_sections
+from utils.project_loader import FILE_KEY
+
+
+def _write_json(game_data: Dict, output_path: str) -> None:
+    with open(output_path, "w", encoding="utf-8") as f:
+        json.dump(game_data, f, indent=2, ensure_ascii=False)
+        f.write("\n")
+
+
+def import_to_json(docx_path: str, output_path: str) -> Dict:
+    """Import a .docx into a single JSON config."""
+    warnings: List[str] = []
+    game_data = import_docx(docx_path, warnings)
+    for warning in warnings:
+        print(f"  WARNING: {warning}")
+    _write_json(game_data, output_path)
+    return game_data
+
+
+def import_to_project(docx_path: str, project_dir: str) -> Dict:
+    """
+    Import a .docx into a split-file project: gdd.json plus one
+    sections/<key>.md per section, each written as soon as it is read.
+    """
+    os.makedirs(os.path.join(project_dir, "sections"), exist_ok=True)
+    warnings: List[str] = []
+    game_data: Dict = {}
+    sections = {}
+    for key, content in iter_docx_sections(docx_path, warnings, game_data):
+        relative = f"sections/{key}.md"
+        with open(os.path.join(project_dir, relative), "w", encoding="utf-8") as f:
+            f.write(content + "\n")
+        sections[key] = {FILE_KEY: relative}
+    for warning in warnings:
+        print(f"  WARNING: {warning}")
+    game_data["sections"] = sections
+    _write_json(game_data, os.path.join(project_dir, "gdd.json"))
+    return game_data
+
+
+# ─────────────────────────────────────────────
+# CLI ENTRY POINT
+# ─────────────────────────────────────────────
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Import GDD .docx files back into JSON configs",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # One document to a JSON config:
+  python import_gdd_docx.py MyGame_GDD_v04.docx --output gdd_content.json
+
+  # One document to a split-file project (gdd.json + sections/*.md):
+  python import_gdd_docx.py MyGame_GDD_v04.docx --split MyGame_project
+
+  # Bulk migration, one <name>.json per document:
+  python import_gdd_docx.py legacy/*.docx --output-dir migrated/
+        """
+    )
+    parser.add_argument("inputs", nargs="+", help=".docx file(s) to import")
+    target = parser.add_mutually_exclusive_group()
+    target.add_argument("--output", help="Output JSON path (single input only)")
+    target.add_argument("--split", metavar="DIR", help="Write a split-file project to DIR (single input only)")
+    target.add_argument("--output-dir", help="Directory for one <name>.json per input")
+
+    args = parser.parse_args()
+
+    if (args.output or args.split) and len(args.inputs) > 1:
+        print("ERROR: --output and --split take a single input; use --output-dir for several")
+        sys.exit(1)
+    if args.output_dir:
+        os.makedirs(args.output_dir, exist_ok=True)
+
+    failed = 0
+    for docx_path in args.inputs:
+        stem = os.path.splitext(os.path.basename(docx_path))[0]
+        start = time.perf_counter()
+        try:
+            if args.split:
+                game_data = import_to_project(docx_path, args.split)
+                output = os.path.join(args.split, "gdd.json")
+            else:
+                output = args.output or os.path.join(
+                    args.output_dir or os.path.dirname(docx_path), stem + ".json"
+                )
+                if os.path.abspath(output) == os.path.abspath(docx_path):
+                    raise ValueError("Output would overwrite the input")
+                game_data = import_to_json(docx_path, output)
+        except (OSError, ValueError, KeyError, SyntaxError, zipfile.BadZipFile) as e:
+            # KeyError: a zip without word/document.xml; SyntaxError: malformed XML
+            print(f"ERROR importing {docx_path}: {e}")
+            failed += 1
+            continue
+        print(f"✓ {docx_path} → {os.path.abspath(output)} "
+              f"({len(game_data['sections'])} sections, {(time.perf_counter() - start) * 1000:.0f} ms)")
+
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,237 @@
+"""
+async_render.py
+---------------
+asyncio front end for the render_* functions, for servers that render on
+demand from an event loop (e.g. an aiohttp portal).
+
+Renders run on an executor, so the loop never blocks on a long PDF build:
+a thread pool by default, or a ProcessPoolExecutor for CPU-bound renders
+that should not share the GIL. A semaphore caps how many renders run at
+once; the rest wait their turn without holding a worker.
+
+Each render is a RenderJob. Iterate it for a RenderProgress per finished
+section (slide, for pitch decks), await it for the RenderResult, and
+cancel it to stop the render at the next section boundary. A cancelled
+render keeps its concurrency slot until its worker has actually stopped.
+
+Usage:
+    async with AsyncRenderer(max_concurrency=4) as renderer:
+        result = await renderer.run(render_gdd_pdf, game_data)
+
+        job = renderer.start(render_gdd_docx, game_data, RenderContext(strict=True))
+        async for step in job:
+            await ws.send_json(step._asdict())
+        result = await job
+
+Each generator module also has a *_async shortcut, e.g.
+render_gdd_pdf_async(renderer, game_data), which returns the RenderJob.
+"""
+
+import asyncio
+import multiprocessing
+import threading
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import replace
+from typing import Any, Callable, Dict, Optional
+
+from .render_output import RenderContext, RenderProgress, RenderResult, StrictModeError
+
+
+DEFAULT_CONCURRENCY = 4
+
+Render = Callable[..., RenderResult]
+
+
+class RenderCancelled(Exception):
+    """Raised inside a render, at its next progress step, once its job is cancelled."""
+
+
+class _ProcessProgress:
+    """Progress callback for a render in a worker process (picklable: Manager proxies)."""
+
+    def __init__(self, queue, cancelled):
+        self.queue = queue
+        self.cancelled = cancelled
+
+    def __call__(self, step: RenderProgress) -> None:
+        if self.cancelled.is_set():
+            raise RenderCancelled()
+        self.queue.put(step)
+
+
+class RenderJob:
+    """
+    A render started by AsyncRenderer.start().
+
+    `async for step in job` yields RenderProgress steps as they finish and
+    ends with the render; `await job` returns the RenderResult (or raises
+    what the render raised); job.cancel() stops it.
+    """
+
+    def __init__(self):
+        self._steps: "asyncio.Queue[Optional[RenderProgress]]" = asyncio.Queue()
+        self._task: Optional[asyncio.Task] = None
+
+    def __aiter__(self) -> "RenderJob":
+        return self
+
+    async def __anext__(self) -> RenderProgress:
+        step = await self._steps.get()
+        if step is None:
+            self._steps.put_nowait(None)  # Later iterations end at once too
+            raise StopAsyncIteration
+        return step
+
+    def __await__(self):
+        return self._task.__await__()
+
+    def cancel(self) -> bool:
+        """Cancel the render; returns False if it has already finished."""
+        return self._task.cancel()
+
+    def done(self) -> bool:
+        return self._task.done()
+
+
+class AsyncRenderer:
+    """
+    Runs render_* functions on an executor with bounded concurrency.
+
+    Args:
+        executor: ThreadPoolExecutor or ProcessPoolExecutor to render on.
+            Defaults to a thread pool of max_concurrency threads, owned and
+            shut down by the renderer.
+        max_concurrency: Renders allowed to run at once; further renders
+            wait on a semaphore. Defaults to DEFAULT_CONCURRENCY.
+
+    With a process pool, render functions, contexts and game data must be
+    picklable, and out should be None or a path (streams stay in the
+    parent process). Configs from load_project() all are: split-file
+    projects, .gddpack files and version stores are sent by path and
+    reopened in the worker, which reads only the sections it renders.
+    """
+
+    def __init__(self, executor: Optional[Executor] = None,
+                 max_concurrency: Optional[int] = None):
+        self.max_concurrency = max_concurrency or DEFAULT_CONCURRENCY
+        self._own_executor = executor is None
+        self.executor = executor or ThreadPoolExecutor(
+            max_workers=self.max_concurrency, thread_name_prefix="gdd-render"
+        )
+        self._in_processes = isinstance(self.executor, ProcessPoolExecutor)
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._manager = None
+
+    async def __aenter__(self) -> "AsyncRenderer":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    def start(self, render: Render, game_data: Dict,
+              context: Optional[RenderContext] = None, **options: Any) -> RenderJob:
+        """
+        Start render(game_data, context=..., **options) and return its job.
+        Must be called from a running event loop.
+        """
+        job = RenderJob()
+        job._task = asyncio.get_running_loop().create_task(
+            self._run(job, render, game_data, context or RenderContext(), options)
+        )
+        return job
+
+    async def run(self, render: Render, game_data: Dict,
+                  context: Optional[RenderContext] = None, **options: Any) -> RenderResult:
+        """Render and return the result, ignoring progress."""
+        return await self.start(render, game_data, context, **options)
+
+    async def close(self) -> None:
+        """Shut down the executor (if the renderer created it) and the progress manager."""
+        if self._own_executor:
+            await asyncio.get_running_loop().run_in_executor(None, self.executor.shutdown)
+        if self._manager is not None:
+            self._manager.shutdown()
+            self._manager = None
+
+    # ── internals ─────────────────────────────────────────
+
+    async def _run(self, job: RenderJob, render: Render, game_data: Dict,
+                   context: RenderContext, options: Dict[str, Any]) -> RenderResult:
+        # Steps reach the caller's own progress callback (if any) and the job
+        # on the event loop thread, in order
+        forward = context.progress
+
+        def deliver(step: RenderProgress) -> None:
+            if forward is not None:
+                forward(step)
+            job._steps.put_nowait(step)
+
+        try:
+            async with self._semaphore:
+                if self._in_processes:
+                    return await self._run_in_process(render, game_data, context, options, deliver)
+                return await self._run_in_thread(render, game_data, context, options, deliver)
+        finally:
+            job._steps.put_nowait(None)
+
+    async def _run_in_thread(self, render, game_data, context, options, deliver) -> RenderResult:
+        loop = asyncio.get_running_loop()
+        cancelled = threading.Event()
+
+        def progress(step: RenderProgress) -> None:
+            if cancelled.is_set():
+                raise RenderCancelled()
+            loop.call_soon_threadsafe(deliver, step)
+
+        future = self.executor.submit(
+            render, game_data, context=replace(context, progress=progress), **options
+        )
+        return await self._wait(future, cancelled)
+
+    async def _run_in_process(self, render, game_data, context, options, deliver) -> RenderResult:
+        loop = asyncio.get_running_loop()
+        if self._manager is None:
+            self._manager = multiprocessing.Manager()
+        queue, cancelled = self._manager.Queue(), self._manager.Event()
+
+        async def pump() -> None:
+            while True:
+                step = await loop.run_in_executor(None, queue.get)
+                if step is None:
+                    return
+                deliver(step)
+
+        pumping = loop.create_task(pump())
+        future = self.executor.submit(
+            render, game_data,
+            context=replace(context, progress=_ProcessProgress(queue, cancelled), warnings=[]),
+            **options,
+        )
+        try:
+            result = await self._wait(future, cancelled)
+        except StrictModeError as e:
+            context.warnings.extend(e.warnings)  # As below, for a strict-mode abort
+            raise
+        finally:
+            await loop.run_in_executor(None, queue.put, None)
+            await pumping
+        # The worker filled a copy of the warning list; hand them to the caller's
+        context.warnings.extend(result.warnings)
+        result.warnings = context.warnings
+        return result
+
+    @staticmethod
+    async def _wait(future: Future, cancelled) -> RenderResult:
+        """Await a submitted render; on cancellation, stop it and wait until it has."""
+        try:
+            return await asyncio.wrap_future(future)
+        except asyncio.CancelledError:
+            # A queued render is dropped by the cancel; a running one raises
+            # RenderCancelled at its next step. Keep the slot until it stops.
+            future.cancel()
+            cancelled.set()
+            stopping = asyncio.wrap_future(future)
+            await asyncio.wait([stopping])
+            if not stopping.cancelled():
+                stopping.exception()  # Retrieved: RenderCancelled is the expected outcome
+            raise
@@ -0,0 +1,133 @@
+"""
+content_blocks.py
+-----------------
+Shared parser for GDD section prose.
+
+Turns the lightweight markdown used in section content into a stream of
+(kind, payload) blocks, so every writer (python-docx, streaming DOCX, ...)
+interprets the same text the same way. Handles: paragraphs, headings
+(##, ###, ####), bullet points (- / * prefix), numbered lists, tables
+(| delimited), code blocks (``` delimited), designer notes (> 🎮 prefix),
+open questions ([OPEN QUESTION: / [PLAYTEST:) and diagrams ([DIAGRAM:).
+
+Block kinds and payloads:
+    HEADING   -> (level, text)        level 2–4
+    PARAGRAPH -> text
+    BULLET    -> text
+    NUMBERED  -> text
+    CODE      -> text (lines joined with "\\n")
+    TABLE     -> list of rows, each a list of cell strings (header first)
+    NOTE      -> designer note text (without the "Designer's Note:" label)
+    QUESTION  -> full open question / playtest line
+    DIAGRAM   -> diagram label
+"""
+
+import re
+from typing import Iterator, List, Tuple, Any
+
+
+HEADING = "heading"
+PARAGRAPH = "paragraph"
+BULLET = "bullet"
+NUMBERED = "numbered"
+CODE = "code"
+TABLE = "table"
+NOTE = "note"
+QUESTION = "question"
+DIAGRAM = "diagram"
+
+Block = Tuple[str, Any]
+
+# "1. " / "12) " list item prefix (up to three digits, so "2024. " stays prose)
+_NUMBERED_PREFIX = re.compile(r"\d{1,3}[.)] ")
+
+
+def iter_content_blocks(content: str) -> Iterator[Block]:
+    """
+    Parse section prose into blocks, one line at a time.
+
+    Tables need at least two rows (header + data) to be emitted; a code
+    block left open at the end of the content is dropped.
+
+    Args:
+        content: Section prose.
+
+    Yields:
+        (kind, payload) tuples in document order.
+    """
+    if not content:
+        return
+
+    in_code_block = False
+    code_lines: List[str] = []
+    in_table = False
+    table_rows: List[List[str]] = []
+
+    for line in content.split("\n"):
+        stripped = line.strip()
+
+        # Code block toggle
+        if stripped.startswith("```"):
+            if in_code_block:
+                in_code_block = False
+                if code_lines:
+                    yield CODE, "\n".join(code_lines)
+                    code_lines = []
+            else:
+                in_code_block = True
+            continue
+
+        if in_code_block:
+            code_lines.append(line)
+            continue
+
+        # Table rows (| delimited)
+        if stripped.startswith("|"):
+            if not in_table:
+                in_table = True
+                table_rows = []
+            # Skip separator rows (|---|---|)
+            if not all(c in "-| " for c in stripped):
+                table_rows.append([c.strip() for c in stripped.strip("|").split("|")])
+            continue
+        elif in_table:
+            in_table = False
+            if len(table_rows) >= 2:
+                yield TABLE, table_rows
+            table_rows = []
+
+        # Designer Note
+        if stripped.startswith("> 🎮") or stripped.startswith("> Designer"):
+            note_text = stripped.lstrip("> 🎮").strip()
+            if note_text.startswith("Designer's Note:"):
+                note_text = note_text[len("Designer's Note:"):].strip()
+            yield NOTE, note_text
+            continue
+
+        # Open Question / Playtest flag
+        if "[OPEN QUESTION:" in line or "[PLAYTEST:" in line:
+            yield QUESTION, stripped
+            continue
+
+        # Diagram placeholder
+        if stripped.startswith("[DIAGRAM:"):
+            yield DIAGRAM, stripped.lstrip("[DIAGRAM:").rstrip("]").strip()
+            continue
+
+        numbered = _NUMBERED_PREFIX.match(line)
+        if line.startswith("#### "):
+            yield HEADING, (4, line[5:])
+        elif line.startswith("### "):
+            yield HEADING, (3, line[4:])
+        elif line.startswith("## "):
+            yield HEADING, (2, line[3:])
+        elif stripped.startswith("- ") or stripped.startswith("* "):
+            yield BULLET, stripped.lstrip("-").lstrip("*").strip()
+        elif numbered:
+            yield NUMBERED, line[numbered.end():].strip()
+        elif stripped:
+            yield PARAGRAPH, stripped
+
+    # Flush any open table
+    if in_table and len(table_rows) >= 2:
+        yield TABLE, table_rows
@@ -0,0 +1,228 @@
+"""
+docx_import.py
+--------------
+Turns a GDD .docx (generated by generate_gdd_docx.py and possibly edited in
+Word since) back into a config.
+
+The body is streamed with utils.docx_reader, so only the section being
+rebuilt is held in memory. Each "N. Name" Heading 1 starts a section and
+is mapped to its SECTION_ORDER key by name (or by number when the name was
+edited). Everything under it is written back as the section prose markup
+that content_blocks parses:
+
+    Heading 2–4      -> ## / ### / #### lines
+    List paragraphs  -> "- " / "1. ", "2. ", ... lines
+    Tables           -> | pipe | rows | with a |---| separator
+    Designer notes   -> > 🎮 lines
+    Open questions   -> [OPEN QUESTION: ...] lines
+    Diagrams         -> [DIAGRAM: ...] lines (their "Figure:" caption is dropped)
+    Code             -> ``` fenced blocks
+
+Cover-page lines (tagline, genre · platform · audience, studio, lead
+designer) and the header/footer (title, version, date) fill the
+top-level fields. Template placeholder sections are left out, so
+regenerating the document adds them again.
+
+Usage:
+    game_data = import_docx("MyGame_GDD_v04.docx")
+    for key, content in iter_docx_sections("MyGame_GDD_v04.docx"): ...
+"""
+
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from . import content_blocks as blocks
+from . import docx_reader
+from .content_blocks import Block
+from .section_registry import section_key_for_heading
+
+
+_PLACEHOLDER_START = "[This section covers the "
+_PLACEHOLDER_END = "[OPEN QUESTION: Replace this placeholder with actual content]"
+
+
+# ─────────────────────────────────────────────
+# BLOCKS → PROSE
+# ─────────────────────────────────────────────
+
+def _one_line(text: str) -> str:
+    return " ".join(text.split())
+
+
+def _table_lines(rows: List[List[str]]) -> List[str]:
+    width = max(len(row) for row in rows)
+    lines = []
+    for idx, row in enumerate(rows):
+        cells = [_one_line(cell).replace("|", "/") for cell in row]
+        cells += [""] * (width - len(cells))
+        lines.append("| " + " | ".join(cells) + " |")
+        if idx == 0:
+            lines.append("|" + "---|" * width)
+    return lines
+
+
+def block_lines(kind: str, payload, number: int = 1) -> List[str]:
+    """
+    Section prose lines for one docx_reader block.
+
+    Args:
+        kind: Block kind.
+        payload: Block payload.
+        number: Position of a NUMBERED block in its list (from 1).
+
+    Returns:
+        The lines; empty for blocks with no prose form (page breaks, TOC).
+    """
+    if kind == blocks.HEADING:
+        level, text = payload
+        return [f"{'#' * min(max(level, 2), 4)} {_one_line(text)}"]
+    if kind == blocks.BULLET:
+        return [f"- {_one_line(payload)}"]
+    if kind == blocks.NUMBERED:
+        return [f"{number}. {_one_line(payload)}"]
+    if kind == blocks.CODE:
+        return ["```", *payload.split("\n"), "```"]
+    if kind == blocks.TABLE:
+        # Blank line after, so back-to-back tables stay separate
+        return _table_lines(payload) + [""]
+    if kind == blocks.NOTE:
+        return [f"> 🎮 {_one_line(payload)}"]
+    if kind == blocks.QUESTION:
+        text = _one_line(payload)
+        if "[OPEN QUESTION:" not in text and "[PLAYTEST:" not in text:
+            text = f"[OPEN QUESTION: {text}]"
+        return [text]
+    if kind == blocks.DIAGRAM:
+        return [f"[DIAGRAM: {_one_line(payload)}]"]
+    if kind in (blocks.PARAGRAPH, docx_reader.CAPTION, docx_reader.CENTERED):
+        return [_one_line(payload)]
+    return []
+
+
+def blocks_to_prose(body: Iterable[Block]) -> str:
+    """Rebuild section prose from a section's body blocks."""
+    lines: List[str] = []
+    diagram_caption = None
+    number = 0  # Items so far in the current numbered list
+    for kind, payload in body:
+        if kind == docx_reader.CAPTION and payload.strip() == diagram_caption:
+            diagram_caption = None
+            continue
+        diagram_caption = f"Figure: {payload.strip()}" if kind == blocks.DIAGRAM else None
+        number = number + 1 if kind == blocks.NUMBERED else 0
+        lines.extend(block_lines(kind, payload, number))
+    while lines and not lines[-1]:
+        lines.pop()
+    return "\n".join(lines)
+
+
+def is_placeholder_prose(content: str) -> bool:
+    """True for the template text generate_gdd_docx writes for missing sections."""
+    return content.startswith(_PLACEHOLDER_START) and content.rstrip().endswith(_PLACEHOLDER_END)
+
+
+# ─────────────────────────────────────────────
+# DOCUMENT
+# ─────────────────────────────────────────────
+
+def _cover_fields(lines: List[str]) -> Dict[str, str]:
+    """Recover cover-page fields from the centered lines before the first section."""
+    fields: Dict[str, str] = {}
+    for idx, line in enumerate(lines):
+        parts = line.split("  ·  ")
+        if line.startswith("Lead Designer(s): "):
+            fields["lead_designer"] = line[len("Lead Designer(s): "):]
+        elif line == "Game Design Document":
+            if idx > 0:
+                fields["studio_name"] = lines[idx - 1]
+        elif len(parts) == 3 and not line.startswith("Version: "):
+            fields["genre"], fields["platform"], fields["audience"] = parts
+            if idx >= 2 and set(lines[idx - 1]) == {"─"}:
+                fields["tagline"] = lines[idx - 2]
+    return fields
+
+
+def _iter_document(
+    body: Iterator[Block], cover: List[str], warnings: List[str]
+) -> Iterator[Tuple[str, str]]:
+    seen = set()
+    key: Optional[str] = None
+    section: List[Block] = []
+
+    def finish() -> Iterator[Tuple[str, str]]:
+        content = blocks_to_prose(section)
+        if key in seen:
+            warnings.append(f"Section '{key}' appears twice; later copy dropped")
+        elif not is_placeholder_prose(content):
+            seen.add(key)
+            yield key, content
+
+    for kind, payload in body:
+        if kind == blocks.HEADING and payload[0] == 1:
+            heading_key = section_key_for_heading(payload[1])
+            if heading_key is not None:
+                if key is not None:
+                    yield from finish()
+                key, section = heading_key, []
+                continue
+            if key is not None:
+                warnings.append(f"Heading '{payload[1]}' is not a GDD section; "
+                                f"kept as a level 2 heading in '{key}'")
+                section.append((blocks.HEADING, (2, payload[1])))
+            continue
+        if key is not None:
+            section.append((kind, payload))
+        elif kind == docx_reader.CENTERED:
+            cover.append(payload.strip())
+    if key is not None:
+        yield from finish()
+
+
+def iter_docx_sections(
+    path: str,
+    warnings: Optional[List[str]] = None,
+    fields: Optional[Dict] = None,
+) -> Iterator[Tuple[str, str]]:
+    """
+    Stream a GDD .docx as (section key, prose) pairs, in document order.
+
+    Args:
+        path: Path to the .docx file.
+        warnings: Optional list that collects import warnings.
+        fields: Optional dict that receives the top-level config fields
+            (title, version, date, cover-page lines) before the first
+            section is yielded.
+
+    Yields:
+        (key, content) for every non-placeholder section.
+    """
+    warnings = warnings if warnings is not None else []
+    fields = fields if fields is not None else {}
+    fields.update((key, value) for key, value in docx_reader.read_docx_info(path).items() if value)
+
+    cover: List[str] = []
+    found = False
+    for key, content in _iter_document(docx_reader.iter_docx_blocks(path), cover, warnings):
+        if not found:
+            for field, value in _cover_fields(cover).items():
+                fields.setdefault(field, value)
+            found = True
+        yield key, content
+    if not found:
+        warnings.append("No numbered section headings found")
+
+
+def import_docx(path: str, warnings: Optional[List[str]] = None) -> Dict:
+    """
+    Rebuild a config dict from a GDD .docx.
+
+    Args:
+        path: Path to the .docx file.
+        warnings: Optional list that collects import warnings.
+
+    Returns:
+        game_data with the recovered top-level fields and "sections".
+    """
+    game_data: Dict = {}
+    sections = dict(iter_docx_sections(path, warnings, game_data))
+    game_data["sections"] = sections
+    return game_data
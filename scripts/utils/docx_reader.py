@@ -0,0 +1,308 @@
+"""
+docx_reader.py
+--------------
+Streaming reader for .docx bodies, used by the native DOCX→PDF converter.
+
+Reads word/document.xml straight out of the zip with an incremental
+(iterparse) XML parse, handing back one body block at a time and
+discarding it afterwards, so memory stays flat for very large documents.
+Paragraphs are classified by their style, resolved through styles.xml
+(GDD named styles, Word's built-in Heading/List/Title/Caption styles and
+outline levels) with callout shading as a fallback for documents from
+other tools.
+
+Blocks use the utils.content_blocks vocabulary, plus:
+    PAGE_BREAK -> None
+    CAPTION    -> text
+    CENTERED   -> text (unstyled, centered paragraph such as cover lines)
+    TOC        -> None (Word TOC field)
+
+HEADING payloads may also have level 1 here.
+
+XML is parsed with defusedxml (no DTDs, entities or external references),
+and nothing in the package is executed, so untrusted files are safe to read.
+"""
+
+import re
+import zipfile
+from typing import Dict, Iterator, List, Optional, Tuple
+
+try:
+    import defusedxml.ElementTree as SafeET
+    DEFUSEDXML_AVAILABLE = True
+except ImportError:
+    DEFUSEDXML_AVAILABLE = False
+
+from . import content_blocks as blocks
+from .content_blocks import Block
+
+
+PAGE_BREAK = "page_break"
+CAPTION = "caption"
+CENTERED = "centered"
+TOC = "toc"
+
+W_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+_W = "{" + W_NS + "}"
+
+DOCUMENT_PART = "word/document.xml"
+STYLES_PART = "word/styles.xml"
+CORE_PART = "docProps/core.xml"
+
+NOTE_LABEL = "🎮 Designer's Note: "
+QUESTION_LABEL = "⚠ Open Question: "
+
+# Style name (lowercased) → block kind. Heading/list families are matched by prefix below.
+_STYLE_KINDS = {
+    "gdd body": blocks.PARAGRAPH,
+    "normal": blocks.PARAGRAPH,
+    "body text": blocks.PARAGRAPH,
+    "gdd code": blocks.CODE,
+    "gdd caption": CAPTION,
+    "caption": CAPTION,
+    "gdd designer note": blocks.NOTE,
+    "gdd open question": blocks.QUESTION,
+    "gdd diagram": blocks.DIAGRAM,
+    "title": "title",
+}
+
+_HEADER_RE = re.compile(r"^(?P<title>.+?) — Game Design Document — (?P<version>\S+)")
+_FOOTER_DATE_RE = re.compile(r"CONFIDENTIAL\s*\|\s*(?P<date>.+?)\s*$")
+
+
+def _require_defusedxml() -> None:
+    if not DEFUSEDXML_AVAILABLE:
+        raise ImportError(
+            "defusedxml is required for the native DOCX reader. Install with:\n"
+            "  pip install defusedxml"
+        )
+
+
+# ─────────────────────────────────────────────
+# STYLES
+# ─────────────────────────────────────────────
+
+def _style_kind(name: str, outline_level: Optional[int]) -> Optional[Tuple[str, int]]:
+    """Classify a style by name/outline level; returns (kind, heading level)."""
+    lowered = name.lower()
+    match = re.match(r"heading (\d)$", lowered)
+    if match:
+        return blocks.HEADING, int(match.group(1))
+    if lowered in _STYLE_KINDS:
+        kind = _STYLE_KINDS[lowered]
+        return (blocks.HEADING, 1) if kind == "title" else (kind, 0)
+    if lowered.startswith("list bullet"):
+        return blocks.BULLET, 0
+    if lowered.startswith("list number"):
+        return blocks.NUMBERED, 0
+    if outline_level is not None and outline_level < 9:
+        return blocks.HEADING, outline_level + 1
+    return None
+
+
+def read_style_kinds(archive: zipfile.ZipFile) -> Dict[str, Tuple[str, int]]:
+    """
+    Map paragraph style IDs to (block kind, heading level), following basedOn
+    chains. Styles with shading but no known role map to NOTE (callouts).
+    """
+    if STYLES_PART not in archive.namelist():
+        return {}
+    root = SafeET.fromstring(archive.read(STYLES_PART), forbid_dtd=True)
+    raw: Dict[str, Tuple[str, Optional[str], Optional[int], bool]] = {}
+    for style in root.iter(_W + "style"):
+        if style.get(_W + "type") != "paragraph":
+            continue
+        style_id = style.get(_W + "styleId")
+        name_el = style.find(_W + "name")
+        based_el = style.find(_W + "basedOn")
+        outline_el = style.find(f"{_W}pPr/{_W}outlineLvl")
+        shaded = style.find(f"{_W}pPr/{_W}shd") is not None
+        raw[style_id] = (
+            name_el.get(_W + "val") if name_el is not None else style_id,
+            based_el.get(_W + "val") if based_el is not None else None,
+            int(outline_el.get(_W + "val")) if outline_el is not None else None,
+            shaded,
+        )
+
+    kinds: Dict[str, Tuple[str, int]] = {}
+    for style_id in raw:
+        current: Optional[str] = style_id
+        seen = set()
+        while current in raw and current not in seen:
+            seen.add(current)
+            name, based_on, outline_level, shaded = raw[current]
+            kind = _style_kind(name, outline_level)
+            if kind is None and shaded:
+                kind = (blocks.NOTE, 0)
+            if kind is not None:
+                kinds[style_id] = kind
+                break
+            current = based_on
+    return kinds
+
+
+# ─────────────────────────────────────────────
+# METADATA
+# ─────────────────────────────────────────────
+
+def _part_text(archive: zipfile.ZipFile, name: str) -> str:
+    root = SafeET.fromstring(archive.read(name), forbid_dtd=True)
+    return "".join(t.text or "" for t in root.iter(_W + "t"))
+
+
+def read_docx_info(path: str) -> Dict[str, str]:
+    """
+    Return game_title / version / date recovered from the document.
+
+    Uses the GDD header ("<title> — Game Design Document — <version>") and
+    footer ("... CONFIDENTIAL | <date>") when present, then the core
+    properties title. Missing values are returned as empty strings.
+    """
+    _require_defusedxml()
+    info = {"game_title": "", "version": "", "date": ""}
+    with zipfile.ZipFile(path) as archive:
+        names = archive.namelist()
+        for name in sorted(n for n in names if re.match(r"word/header\d*\.xml$", n)):
+            match = _HEADER_RE.match(_part_text(archive, name).strip())
+            if match:
+                info["game_title"] = match.group("title")
+                info["version"] = match.group("version")
+                break
+        for name in sorted(n for n in names if re.match(r"word/footer\d*\.xml$", n)):
+            match = _FOOTER_DATE_RE.search(_part_text(archive, name))
+            if match:
+                info["date"] = match.group("date")
+                break
+        if not info["game_title"] and CORE_PART in names:
+            root = SafeET.fromstring(archive.read(CORE_PART), forbid_dtd=True)
+            for element in root.iter("{http://purl.org/dc/elements/1.1/}title"):
+                info["game_title"] = (element.text or "").strip()
+    return info
+
+
+# ─────────────────────────────────────────────
+# BODY
+# ─────────────────────────────────────────────
+
+def _paragraph_text(p) -> Tuple[str, bool, bool]:
+    """Return (text, has_page_break, has_toc_field) for a w:p element."""
+    parts: List[str] = []
+    page_break = toc = False
+    for element in p.iter():
+        tag = element.tag
+        if tag == _W + "t":
+            parts.append(element.text or "")
+        elif tag == _W + "tab":
+            parts.append("\t")
+        elif tag == _W + "br":
+            if element.get(_W + "type") == "page":
+                page_break = True
+            else:
+                parts.append("\n")
+        elif tag == _W + "instrText" and (element.text or "").strip().startswith("TOC"):
+            toc = True
+    return "".join(parts), page_break, toc
+
+
+def _cell_text(tc) -> str:
+    return "\n".join(_paragraph_text(p)[0] for p in tc.iter(_W + "p")).strip()
+
+
+def _paragraph_block(p, style_kinds: Dict[str, Tuple[str, int]]) -> Optional[Block]:
+    """Classify one body paragraph (text already known to be non-empty)."""
+    text, _, _ = _paragraph_text(p)
+    text = text.strip()
+    ppr = p.find(_W + "pPr")
+    style_id = None
+    centered = shaded = has_numbering = False
+    if ppr is not None:
+        style_el = ppr.find(_W + "pStyle")
+        style_id = style_el.get(_W + "val") if style_el is not None else None
+        jc = ppr.find(_W + "jc")
+        centered = jc is not None and jc.get(_W + "val") == "center"
+        shaded = ppr.find(_W + "shd") is not None
+        has_numbering = ppr.find(_W + "numPr") is not None
+
+    kind, level = style_kinds.get(style_id, (None, 0)) if style_id else (None, 0)
+    if kind is None:
+        if shaded:
+            kind = blocks.NOTE
+        elif has_numbering:
+            kind = blocks.BULLET
+        elif centered:
+            kind = CENTERED
+        else:
+            kind = blocks.PARAGRAPH
+
+    if kind == blocks.HEADING:
+        return blocks.HEADING, (level, text)
+    if kind == blocks.NOTE:
+        return blocks.NOTE, text[len(NOTE_LABEL.strip()):].strip() \
+            if text.startswith(NOTE_LABEL.strip()) else text
+    if kind == blocks.QUESTION:
+        return blocks.QUESTION, text[len(QUESTION_LABEL.strip()):].strip() \
+            if text.startswith(QUESTION_LABEL.strip()) else text
+    if kind == blocks.DIAGRAM:
+        label = text
+        if label.startswith("[ DIAGRAM:") and label.endswith("]"):
+            label = label[len("[ DIAGRAM:"):-1].strip()
+        return blocks.DIAGRAM, label
+    if kind == blocks.CODE:
+        # Code keeps its line breaks; only trailing whitespace is dropped
+        return blocks.CODE, _paragraph_text(p)[0].rstrip()
+    return kind, text
+
+
+def iter_docx_blocks(path: str) -> Iterator[Block]:
+    """
+    Stream the body of a .docx as blocks, in document order.
+
+    Args:
+        path: Path to the .docx file.
+
+    Yields:
+        (kind, payload) tuples (see module docstring).
+    """
+    _require_defusedxml()
+    with zipfile.ZipFile(path) as archive:
+        style_kinds = read_style_kinds(archive)
+        with archive.open(DOCUMENT_PART) as stream:
+            depth = 0
+            body = None
+            after_toc = False
+            events = SafeET.iterparse(stream, events=("start", "end"), forbid_dtd=True)
+            for event, element in events:
+                if event == "start":
+                    depth += 1
+                    if depth == 2 and element.tag == _W + "body":
+                        body = element
+                    continue
+                depth -= 1
+                if depth != 2 or body is None:
+                    continue
+
+                # A complete direct child of w:body
+                if element.tag == _W + "p":
+                    text, page_break, toc = _paragraph_text(element)
+                    if toc:
+                        after_toc = True
+                        yield TOC, None
+                    elif text.strip():
+                        if after_toc and text.strip().startswith("[ Right-click"):
+                            pass  # "Update Field" hint under the TOC field
+                        else:
+                            block = _paragraph_block(element, style_kinds)
+                            if block is not None:
+                                yield block
+                        after_toc = False
+                    if page_break:
+                        yield PAGE_BREAK, None
+                elif element.tag == _W + "tbl":
+                    rows = [
+                        [_cell_text(tc) for tc in tr.findall(_W + "tc")]
+                        for tr in element.findall(_W + "tr")
+                    ]
+                    rows = [row for row in rows if row]
+                    if rows:
+                        yield blocks.TABLE, rows
+                body.remove(element)
@@ -0,0 +1,395 @@
+"""
+docx_stream.py
+--------------
+Streaming writer for very large GDD .docx files (50k+ words).
+
+python-docx keeps the whole document tree in memory and serializes it in
+one go on save. StreamingDocxWriter instead writes word/document.xml
+incrementally into the output zip with an XML generator, block by block,
+so memory stays flat regardless of document length.
+
+Everything except the body stream is taken from a regular python-docx
+Document passed in by the caller: styles, numbering, header/footer parts,
+section properties, and any body content already added to it (the cover
+page and TOC). The streamed markup references the same named styles as
+the python-docx path (see docx_styles.StyleNames), so both produce the
+same document.
+
+Usage:
+    doc = new_gdd_document(title, version, date)
+    build_cover_page(doc, game_data)
+    with StreamingDocxWriter("out.docx", doc) as writer:
+        writer.write_heading(1, "1. Executive Summary")
+        writer.write_blocks(iter_content_blocks(text))
+"""
+
+import io
+import os
+import zipfile
+from typing import IO, Iterable, List, Optional, Tuple, Union
+from xml.sax.saxutils import XMLGenerator
+
+try:
+    from lxml import etree
+    DOCX_AVAILABLE = True
+except ImportError:
+    DOCX_AVAILABLE = False
+
+from . import content_blocks as blocks
+from .docx_styles import StyleNames, style_id, table_start_xml, table_xml, content_width_twips
+
+
+DOCUMENT_PART = "word/document.xml"
+XML_DECLARATION = '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+
+# Revision kinds for write_revised_paragraph() / write_revised_table()
+INSERTED = "ins"
+DELETED = "del"
+
+# Run colors when revisions are highlighted instead of tracked
+HIGHLIGHT_COLORS = {INSERTED: "1E7B34", DELETED: "B3261E"}
+
+_NO_ATTRS = {}
+
+# (text, character style name or None, INSERTED / DELETED / None)
+Segment = Tuple[str, Optional[str], Optional[str]]
+
+
+class RevisionMarks:
+    """
+    How revisions are written: as Word tracked changes (w:ins / w:del with
+    this author and date, accepted or rejected in Word's Review tab), or,
+    with track=False, as plain runs colored green/underlined for
+    insertions and red/struck through for deletions.
+    """
+
+    def __init__(self, author: str, date: str, track: bool = True):
+        self.author = author
+        self.date = date
+        self.track = track
+        self._next_id = 0
+
+    def attrs(self) -> dict:
+        """w:id / w:author / w:date for the next revision element."""
+        self._next_id += 1
+        return {"w:id": str(self._next_id), "w:author": self.author, "w:date": self.date}
+
+
+class BodyWriter:
+    """
+    Write WordprocessingML body content (paragraphs, headings, tables) as
+    text to any stream. The output is a fragment of w:body children that
+    relies on the w: prefix being declared by the enclosing document.
+
+    Fragments contain no relationship IDs (no images or hyperlinks) and
+    lists use the style-linked numbering of List Bullet / List Number, so
+    fragments rendered independently can simply be concatenated.
+
+    Args:
+        out: Text stream to write to.
+        table_width: Table width in twips (see content_width_twips).
+    """
+
+    def __init__(self, out, table_width: int):
+        self._out = out
+        self.table_width = table_width
+        self._xml = XMLGenerator(out, encoding="utf-8", short_empty_elements=True)
+
+    def write_raw(self, markup: str) -> None:
+        """Write pre-rendered body markup (e.g. a fragment from another BodyWriter)."""
+        self._out.write(markup)
+
+    # ── Low-level markup ─────────────────────
+
+    def _start(self, name: str, attrs: Optional[dict] = None) -> None:
+        self._xml.startElement(name, attrs or _NO_ATTRS)
+
+    def _end(self, name: str) -> None:
+        self._xml.endElement(name)
+
+    def _empty(self, name: str, attrs: Optional[dict] = None) -> None:
+        self._xml.startElement(name, attrs or _NO_ATTRS)
+        self._xml.endElement(name)
+
+    def _text(self, text: str, tag: str = "w:t") -> None:
+        """Write run content, mapping tabs and newlines the way python-docx does."""
+        chunk: List[str] = []
+
+        def flush() -> None:
+            if not chunk:
+                return
+            value = "".join(chunk)
+            attrs = ({"xml:space": "preserve"}
+                     if len(value.strip()) < len(value) else None)
+            self._start(tag, attrs)
+            self._xml.characters(value)
+            self._end(tag)
+            chunk.clear()
+
+        for char in text:
+            if char == "\t":
+                flush()
+                self._empty("w:tab")
+            elif char in "\r\n":
+                flush()
+                self._empty("w:br")
+            else:
+                chunk.append(char)
+        flush()
+
+    def write_paragraph(
+        self,
+        runs: Iterable[Tuple[str, Optional[str]]] = (),
+        style: Optional[str] = None,
+        align: Optional[str] = None,
+    ) -> None:
+        """
+        Write one w:p.
+
+        Args:
+            runs: (text, character style name or None) pairs.
+            style: Paragraph style name (see StyleNames), or None for Normal.
+            align: w:jc value (e.g. "center"), or None.
+        """
+        self._start("w:p")
+        if style or align:
+            self._start("w:pPr")
+            if style:
+                self._empty("w:pStyle", {"w:val": style_id(style)})
+            if align:
+                self._empty("w:jc", {"w:val": align})
+            self._end("w:pPr")
+        for text, char_style in runs:
+            self._start("w:r")
+            if char_style:
+                self._start("w:rPr")
+                self._empty("w:rStyle", {"w:val": style_id(char_style)})
+                self._end("w:rPr")
+            self._text(text)
+            self._end("w:r")
+        self._end("w:p")
+
+    # ── Revisions ────────────────────────────
+
+    def _revised_run(self, text: str, char_style: Optional[str], change: Optional[str],
+                     marks: RevisionMarks) -> None:
+        tracked = change and marks.track
+        if tracked:
+            self._start(f"w:{change}", marks.attrs())
+        self._start("w:r")
+        highlighted = change and not marks.track
+        if char_style or highlighted:
+            self._start("w:rPr")
+            if char_style:
+                self._empty("w:rStyle", {"w:val": style_id(char_style)})
+            if highlighted:
+                if change == DELETED:
+                    self._empty("w:strike")
+                self._empty("w:color", {"w:val": HIGHLIGHT_COLORS[change]})
+                if change == INSERTED:
+                    self._empty("w:u", {"w:val": "single"})
+            self._end("w:rPr")
+        self._text(text, "w:delText" if tracked and change == DELETED else "w:t")
+        self._end("w:r")
+        if tracked:
+            self._end(f"w:{change}")
+
+    def write_revised_paragraph(
+        self,
+        segments: Iterable[Segment],
+        marks: RevisionMarks,
+        style: Optional[str] = None,
+        align: Optional[str] = None,
+        change: Optional[str] = None,
+    ) -> None:
+        """
+        Write one w:p whose runs may be marked as inserted or deleted.
+
+        Args:
+            segments: (text, character style or None, INSERTED / DELETED / None).
+            marks: Revision author/date and tracked vs highlighted output.
+            style: Paragraph style name, or None for Normal.
+            align: w:jc value, or None.
+            change: INSERTED / DELETED if the whole paragraph is new or
+                removed (also marks the paragraph mark, so accepting or
+                rejecting the change leaves no empty paragraph).
+        """
+        self._start("w:p")
+        mark_paragraph = change and marks.track
+        if style or align or mark_paragraph:
+            self._start("w:pPr")
+            if style:
+                self._empty("w:pStyle", {"w:val": style_id(style)})
+            if align:
+                self._empty("w:jc", {"w:val": align})
+            if mark_paragraph:
+                self._start("w:rPr")
+                self._empty(f"w:{change}", marks.attrs())
+                self._end("w:rPr")
+            self._end("w:pPr")
+        for text, char_style, seg_change in segments:
+            self._revised_run(text, char_style, seg_change, marks)
+        self._end("w:p")
+
+    def write_revised_page_break(self, marks: RevisionMarks, change: Optional[str]) -> None:
+        """Page break that is itself inserted or deleted (None: a plain one)."""
+        if not change or not marks.track:
+            self.write_page_break()
+            return
+        self._start("w:p")
+        self._start("w:pPr")
+        self._start("w:rPr")
+        self._empty(f"w:{change}", marks.attrs())
+        self._end("w:rPr")
+        self._end("w:pPr")
+        self._start(f"w:{change}", marks.attrs())
+        self._start("w:r")
+        self._empty("w:br", {"w:type": "page"})
+        self._end("w:r")
+        self._end(f"w:{change}")
+        self._end("w:p")
+
+    def write_revised_table(
+        self,
+        rows: List[Tuple[Optional[str], List[List[Segment]]]],
+        marks: RevisionMarks,
+    ) -> None:
+        """
+        Write a GDD Table-styled table whose rows and cell runs may be marked
+        as inserted or deleted, followed by a spacer paragraph.
+
+        Args:
+            rows: (INSERTED / DELETED / None for the whole row, cells), each
+                cell a list of segments. The first row is the header.
+            marks: Revision author/date and tracked vs highlighted output.
+        """
+        n_cols = max(len(cells) for _, cells in rows)
+        self._out.write(table_start_xml(n_cols, self.table_width, declare_ns=False))
+        for row_change, cells in rows:
+            self._start("w:tr")
+            if row_change and marks.track:
+                self._start("w:trPr")
+                self._empty(f"w:{row_change}", marks.attrs())
+                self._end("w:trPr")
+            for c_idx in range(n_cols):
+                self._start("w:tc")
+                self.write_revised_paragraph(
+                    cells[c_idx] if c_idx < len(cells) else [], marks, StyleNames.TABLE_TEXT
+                )
+                self._end("w:tc")
+            self._end("w:tr")
+        self._out.write("</w:tbl>")
+        self.write_paragraph()
+
+    # ── GDD blocks ───────────────────────────
+
+    def write_page_break(self) -> None:
+        self._start("w:p")
+        self._start("w:r")
+        self._empty("w:br", {"w:type": "page"})
+        self._end("w:r")
+        self._end("w:p")
+
+    def write_heading(self, level: int, text: str) -> None:
+        self.write_paragraph([(text, None)], f"Heading {level}")
+
+    def write_table(self, rows: List[List[str]]) -> None:
+        """Write a GDD Table-styled table followed by a spacer paragraph."""
+        if not any(rows):
+            return
+        self._out.write(table_xml(rows, self.table_width, declare_ns=False))
+        self.write_paragraph()
+
+    def write_blocks(self, content: Iterable[blocks.Block]) -> None:
+        """Write parsed content blocks (see utils.content_blocks)."""
+        for kind, payload in content:
+            if kind == blocks.HEADING:
+                self.write_heading(*payload)
+            elif kind == blocks.PARAGRAPH:
+                self.write_paragraph([(payload, None)], StyleNames.BODY)
+            elif kind == blocks.BULLET:
+                self.write_paragraph([(payload, None)], StyleNames.BULLET)
+            elif kind == blocks.NUMBERED:
+                self.write_paragraph([(payload, None)], StyleNames.NUMBERED)
+            elif kind == blocks.CODE:
+                self.write_paragraph([(payload, None)], StyleNames.CODE)
+            elif kind == blocks.TABLE:
+                self.write_table(payload)
+            elif kind == blocks.NOTE:
+                self.write_paragraph(
+                    [("🎮 Designer's Note: ", StyleNames.DESIGNER_NOTE_LABEL), (payload, None)],
+                    StyleNames.DESIGNER_NOTE,
+                )
+            elif kind == blocks.QUESTION:
+                self.write_paragraph(
+                    [("⚠ Open Question: ", StyleNames.OPEN_QUESTION_LABEL), (payload, None)],
+                    StyleNames.OPEN_QUESTION,
+                )
+            elif kind == blocks.DIAGRAM:
+                self.write_paragraph([(f"[ DIAGRAM: {payload} ]", None)], StyleNames.DIAGRAM)
+                self.write_paragraph([(f"Figure: {payload}", None)], StyleNames.CAPTION,
+                                     align="center")
+
+
+class StreamingDocxWriter(BodyWriter):
+    """
+    Write a .docx whose body is streamed instead of built as a tree.
+
+    Args:
+        output_path: Destination .docx path, or a writable binary stream
+            (which need not be seekable).
+        document: python-docx Document supplying every package part except
+            the streamed body; its existing body content is written first.
+    """
+
+    def __init__(self, output_path: Union[str, IO[bytes]], document):
+        self.output_path = output_path
+
+        package = io.BytesIO()
+        document.save(package)
+        body_xml = etree.tostring(document.element, encoding="unicode")
+        split = body_xml.rfind("<w:sectPr")
+        self._head, self._tail = body_xml[:split], body_xml[split:]
+
+        self._zip = zipfile.ZipFile(output_path, "w", zipfile.ZIP_DEFLATED)
+        with zipfile.ZipFile(package) as template:
+            for info in template.infolist():
+                if info.filename != DOCUMENT_PART:
+                    self._zip.writestr(info, template.read(info.filename),
+                                       compress_type=zipfile.ZIP_DEFLATED)
+
+        self._part = self._zip.open(DOCUMENT_PART, "w", force_zip64=True)
+        super().__init__(io.TextIOWrapper(self._part, encoding="utf-8"),
+                         content_width_twips(document))
+        self._out.write(XML_DECLARATION)
+        self._out.write(self._head)
+
+    def __enter__(self) -> "StreamingDocxWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def close(self) -> None:
+        """Finish document.xml (section properties, closing tags) and the zip."""
+        if self._zip is None:
+            return
+        self._out.write(self._tail)
+        self._out.close()
+        self._zip.close()
+        self._zip = None
+
+    def abort(self) -> None:
+        """Close the zip and remove the partially written output file, if any."""
+        if self._zip is None:
+            return
+        try:
+            self._out.close()
+            self._zip.close()
+        finally:
+            self._zip = None
+            if isinstance(self.output_path, str) and os.path.exists(self.output_path):
+                os.remove(self.output_path)
@@ -6,13 +6,16 @@ All style constants, color palettes, font configurations, and
 paragraph format presets for a professional publisher-grade document.
 """
 
-from typing import Tuple, Optional
+from typing import List, Tuple, Optional
+from xml.sax.saxutils import escape
+
 try:
     from docx.shared import Pt, RGBColor, Inches, Cm
     from docx.enum.text import WD_ALIGN_PARAGRAPH
+    from docx.enum.style import WD_STYLE_TYPE
     from docx.enum.table import WD_TABLE_ALIGNMENT
-    from docx.oxml.ns import qn
-    from docx.oxml import OxmlElement
+    from docx.oxml.ns import qn, nsdecls
+    from docx.oxml import OxmlElement, parse_xml
     DOCX_AVAILABLE = True
 except ImportError:
     DOCX_AVAILABLE = False
@@ -20,6 +23,12 @@ except ImportError:
     Pt = Inches = Cm = RGBColor = None
 
 
+# Bump whenever a constant or helper below changes what register_gdd_styles,
+# set_document_margins or add_header_footer write; it keys the cached base
+# template built by utils.docx_template.
+STYLE_VERSION = "3"
+
+
 # ─────────────────────────────────────────────
 # COLOR PALETTES
 # ─────────────────────────────────────────────
@@ -146,102 +155,323 @@ class PageLayout:
     CALLOUT_INDENT_RIGHT = 0.25
 
 
+# ─────────────────────────────────────────────
+# NAMED STYLES
+# ─────────────────────────────────────────────
+
+class StyleNames:
+    """
+    Named paragraph/character styles defined once in styles.xml by
+    register_gdd_styles(). Paragraphs and runs reference these by style ID
+    instead of carrying their own font, size and color properties.
+    """
+    HEADING_1 = "Heading 1"
+    HEADING_2 = "Heading 2"
+    HEADING_3 = "Heading 3"
+    HEADING_4 = "Heading 4"
+    BODY = "GDD Body"
+    BULLET = "List Bullet"
+    NUMBERED = "List Number"
+    CODE = "GDD Code"
+    CAPTION = "GDD Caption"
+    DESIGNER_NOTE = "GDD Designer Note"
+    DESIGNER_NOTE_LABEL = "GDD Designer Note Label"
+    OPEN_QUESTION = "GDD Open Question"
+    OPEN_QUESTION_LABEL = "GDD Open Question Label"
+    DIAGRAM = "GDD Diagram"
+    TABLE = "GDD Table"
+    TABLE_TEXT = "GDD Table Text"
+
+
+def style_id(style_name: str) -> str:
+    """Return the styles.xml style ID Word and python-docx use for a style name."""
+    return style_name.replace(" ", "")
+
+
+# Schema order of w:pPr children (CT_PPr), used to place w:pBdr / w:shd
+_PPR_TAG_SEQ = (
+    "w:pStyle", "w:keepNext", "w:keepLines", "w:pageBreakBefore", "w:framePr",
+    "w:widowControl", "w:numPr", "w:suppressLineNumbers", "w:pBdr", "w:shd",
+    "w:tabs", "w:suppressAutoHyphens", "w:kinsoku", "w:wordWrap", "w:overflowPunct",
+    "w:topLinePunct", "w:autoSpaceDE", "w:autoSpaceDN", "w:bidi", "w:adjustRightInd",
+    "w:snapToGrid", "w:spacing", "w:ind", "w:contextualSpacing", "w:mirrorIndents",
+    "w:suppressOverlap", "w:jc", "w:textDirection", "w:textAlignment",
+    "w:textboxTightWrap", "w:outlineLvl", "w:divId", "w:cnfStyle", "w:rPr",
+    "w:sectPr", "w:pPrChange",
+)
+
+
+def _insert_ppr_child(pPr, element) -> None:
+    """Insert a pPr child (w:shd, w:pBdr, ...) at its schema position."""
+    tag = element.tag.split("}")[1]
+    successors = _PPR_TAG_SEQ[_PPR_TAG_SEQ.index(f"w:{tag}") + 1:]
+    existing = pPr.find(qn(f"w:{tag}"))
+    if existing is not None:
+        pPr.remove(existing)
+    pPr.insert_element_before(element, *successors)
+
+
+def _shading(fill: Tuple[int, int, int]):
+    """Build a solid w:shd element."""
+    shd = OxmlElement("w:shd")
+    shd.set(qn("w:val"), "clear")
+    shd.set(qn("w:color"), "auto")
+    shd.set(qn("w:fill"), "{:02X}{:02X}{:02X}".format(*fill))
+    return shd
+
+
+def _paragraph_borders(color: Tuple[int, int, int], sides, size: int):
+    """Build a w:pBdr element with single-line borders on the given sides."""
+    pBdr = OxmlElement("w:pBdr")
+    for border_name in sides:
+        b = OxmlElement(f"w:{border_name}")
+        b.set(qn("w:val"), "single")
+        b.set(qn("w:sz"), str(size))
+        b.set(qn("w:space"), "4")
+        b.set(qn("w:color"), "{:02X}{:02X}{:02X}".format(*color))
+        pBdr.append(b)
+    return pBdr
+
+
+def _set_font(font, family: Optional[str] = None, size: Optional[float] = None,
+              color: Optional[Tuple[int, int, int]] = None, bold: Optional[bool] = None,
+              italic: Optional[bool] = None) -> None:
+    """Set style font properties, dropping theme fonts so the family applies."""
+    if family is not None:
+        font.name = family
+        rFonts = font._element.rPr.rFonts
+        for attr in ("w:asciiTheme", "w:hAnsiTheme", "w:eastAsiaTheme", "w:cstheme"):
+            if rFonts.get(qn(attr)) is not None:
+                del rFonts.attrib[qn(attr)]
+    if size is not None:
+        font.size = Pt(size)
+    if color is not None:
+        font.color.rgb = RGBColor(*color)
+    if bold is not None:
+        font.bold = bold
+    if italic is not None:
+        font.italic = italic
+
+
+def _get_or_add_style(document, name: str, style_type, base: Optional[str] = None):
+    """Return the named style, creating it (based on `base`) if missing."""
+    styles = document.styles
+    try:
+        return styles[name]
+    except KeyError:
+        style = styles.add_style(name, style_type)
+        if base is not None:
+            style.base_style = styles[base]
+        style.quick_style = True
+        return style
+
+
+def register_gdd_styles(document) -> None:
+    """
+    Define the GDD named styles in the document's styles.xml.
+
+    Built-in Heading 1–4, List Bullet and List Number are restyled in place
+    (so Word's TOC field and numbering keep working); the GDD-specific body,
+    code, caption, callout, diagram and table styles are added. Safe to call
+    more than once.
+    """
+    if not DOCX_AVAILABLE:
+        return
+    para = WD_STYLE_TYPE.PARAGRAPH
+    char = WD_STYLE_TYPE.CHARACTER
+
+    headings = (
+        (StyleNames.HEADING_1, Fonts.H1_SIZE, Colors.HEADING_1,
+         PageLayout.SPACE_BEFORE_H1, PageLayout.SPACE_AFTER_H1),
+        (StyleNames.HEADING_2, Fonts.H2_SIZE, Colors.HEADING_2,
+         PageLayout.SPACE_BEFORE_H2, PageLayout.SPACE_AFTER_H2),
+        (StyleNames.HEADING_3, Fonts.H3_SIZE, Colors.HEADING_3,
+         PageLayout.SPACE_BEFORE_H3, PageLayout.SPACE_AFTER_H3),
+        (StyleNames.HEADING_4, Fonts.H4_SIZE, Colors.HEADING_4,
+         PageLayout.SPACE_BEFORE_H4, PageLayout.SPACE_AFTER_H4),
+    )
+    for name, size, color, before, after in headings:
+        style = document.styles[name]
+        _set_font(style.font, Fonts.HEADING_FAMILY, size, color, bold=True)
+        style.paragraph_format.space_before = Pt(before)
+        style.paragraph_format.space_after = Pt(after)
+        if name != StyleNames.HEADING_4:
+            style.paragraph_format.keep_with_next = True
+
+    body = _get_or_add_style(document, StyleNames.BODY, para, "Normal")
+    _set_font(body.font, Fonts.BODY_FAMILY, Fonts.BODY_SIZE, Colors.BODY_TEXT)
+    body.paragraph_format.space_before = Pt(PageLayout.SPACE_BEFORE_BODY)
+    body.paragraph_format.space_after = Pt(PageLayout.SPACE_AFTER_BODY)
+    body.paragraph_format.line_spacing = PageLayout.BODY_LINE_SPACING
+
+    bullet = document.styles[StyleNames.BULLET]
+    _set_font(bullet.font, Fonts.BODY_FAMILY, Fonts.BODY_SIZE)
+    bullet.paragraph_format.space_before = Pt(PageLayout.SPACE_BEFORE_BULLET)
+    bullet.paragraph_format.space_after = Pt(PageLayout.SPACE_AFTER_BULLET)
+
+    numbered = document.styles[StyleNames.NUMBERED]
+    _set_font(numbered.font, Fonts.BODY_FAMILY, Fonts.BODY_SIZE)
+
+    code = _get_or_add_style(document, StyleNames.CODE, para, "Normal")
+    _set_font(code.font, Fonts.CODE_FAMILY, Fonts.CODE_SIZE, Colors.BODY_TEXT)
+    code.paragraph_format.space_before = Pt(4)
+    code.paragraph_format.space_after = Pt(4)
+    code.paragraph_format.left_indent = Inches(0.25)
+
+    caption = _get_or_add_style(document, StyleNames.CAPTION, para, "Normal")
+    _set_font(caption.font, Fonts.CAPTION_FAMILY, Fonts.CAPTION_SIZE, Colors.CAPTION,
+              italic=True)
+    caption.paragraph_format.space_before = Pt(2)
+    caption.paragraph_format.space_after = Pt(8)
+
+    callouts = (
+        (StyleNames.DESIGNER_NOTE, StyleNames.DESIGNER_NOTE_LABEL,
+         Colors.DESIGNER_NOTE_BG, Colors.DESIGNER_NOTE_BORDER, Colors.HEADING_2, True),
+        (StyleNames.OPEN_QUESTION, StyleNames.OPEN_QUESTION_LABEL,
+         Colors.OPEN_QUESTION_BG, Colors.OPEN_QUESTION_BORDER, Colors.OPEN_QUESTION_BORDER,
+         None),
+    )
+    for name, label_name, bg, border, label_color, italic in callouts:
+        callout = _get_or_add_style(document, name, para, "Normal")
+        _set_font(callout.font, Fonts.BODY_FAMILY, Fonts.CALLOUT_SIZE, Colors.BODY_TEXT,
+                  italic=italic)
+        fmt = callout.paragraph_format
+        fmt.space_before = Pt(PageLayout.SPACE_BEFORE_CALLOUT)
+        fmt.space_after = Pt(PageLayout.SPACE_AFTER_CALLOUT)
+        fmt.left_indent = Inches(PageLayout.CALLOUT_INDENT_LEFT)
+        fmt.right_indent = Inches(PageLayout.CALLOUT_INDENT_RIGHT)
+        pPr = callout._element.get_or_add_pPr()
+        _insert_ppr_child(pPr, _paragraph_borders(border, ("left",), 24))
+        _insert_ppr_child(pPr, _shading(bg))
+
+        label = _get_or_add_style(document, label_name, char)
+        _set_font(label.font, Fonts.BODY_FAMILY, Fonts.CALLOUT_SIZE, label_color,
+                  bold=True, italic=False)
+
+    diagram = _get_or_add_style(document, StyleNames.DIAGRAM, para, "Normal")
+    _set_font(diagram.font, Fonts.CODE_FAMILY, Fonts.CAPTION_SIZE, Colors.PLACEHOLDER_TEXT,
+              bold=True)
+    diagram.paragraph_format.space_before = Pt(20)
+    diagram.paragraph_format.space_after = Pt(20)
+    diagram.paragraph_format.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    pPr = diagram._element.get_or_add_pPr()
+    _insert_ppr_child(pPr, _paragraph_borders(
+        Colors.PLACEHOLDER_BORDER, ("top", "left", "bottom", "right"), 6))
+    _insert_ppr_child(pPr, _shading(Colors.PLACEHOLDER_BG))
+
+    table_text = _get_or_add_style(document, StyleNames.TABLE_TEXT, para, "Normal")
+    _set_font(table_text.font, Fonts.BODY_FAMILY, Fonts.BODY_SIZE)
+
+    table = _get_or_add_style(document, StyleNames.TABLE, WD_STYLE_TYPE.TABLE, "Normal Table")
+    if table._element.find(qn("w:tblStylePr")) is None:
+        for child in _table_style_children():
+            table._element.append(child)
+
+
+def _table_style_children():
+    """
+    Return the w:tblPr / w:tblStylePr elements for the GDD Table style:
+    thin borders on every edge, a navy header row with white bold text
+    (firstRow) and alternating white / light-blue data rows (band1Horz /
+    band2Horz).
+    """
+    border_hex = _hex(Colors.TABLE_BORDER)
+    borders = "".join(
+        f'<w:{side} w:val="single" w:sz="4" w:space="0" w:color="{border_hex}"/>'
+        for side in ("top", "left", "bottom", "right", "insideH", "insideV")
+    )
+
+    def shaded(kind: str, fill: Tuple[int, int, int], run_props: str = "") -> str:
+        return (
+            f'<w:tblStylePr {nsdecls("w")} w:type="{kind}">{run_props}'
+            f'<w:tcPr><w:shd w:val="clear" w:color="auto" w:fill="{_hex(fill)}"/></w:tcPr>'
+            "</w:tblStylePr>"
+        )
+
+    header_run = (
+        f'<w:rPr><w:b/><w:bCs/><w:color w:val="{_hex(Colors.TABLE_HEADER_TEXT)}"/></w:rPr>'
+    )
+    return [
+        parse_xml(
+            f'<w:tblPr {nsdecls("w")}><w:tblStyleRowBandSize w:val="1"/>'
+            f'<w:tblBorders>{borders}</w:tblBorders></w:tblPr>'
+        ),
+        parse_xml(shaded("firstRow", Colors.TABLE_HEADER_BG, header_run)),
+        parse_xml(shaded("band1Horz", Colors.TABLE_ROW_NORMAL)),
+        parse_xml(shaded("band2Horz", Colors.TABLE_ROW_ALT)),
+    ]
+
+
 # ─────────────────────────────────────────────
 # PARAGRAPH FORMAT PRESETS
 # ─────────────────────────────────────────────
 
+def _apply_paragraph_style(paragraph, style_name: str) -> None:
+    """Point a paragraph at a named style by ID (no per-run formatting)."""
+    paragraph._p.style = style_id(style_name)
+
+
 def apply_heading_1_style(paragraph, document) -> None:
     """Apply H1 style: large, dark navy, Cambria, page-break-before on major sections."""
     if not DOCX_AVAILABLE:
         return
-    run = paragraph.runs[0] if paragraph.runs else paragraph.add_run(paragraph.text)
-    run.font.name = Fonts.HEADING_FAMILY
-    run.font.size = Pt(Fonts.H1_SIZE)
-    run.font.bold = True
-    run.font.color.rgb = RGBColor(*Colors.HEADING_1)
-    paragraph.paragraph_format.space_before = Pt(PageLayout.SPACE_BEFORE_H1)
-    paragraph.paragraph_format.space_after = Pt(PageLayout.SPACE_AFTER_H1)
-    paragraph.paragraph_format.keep_with_next = True
+    _apply_paragraph_style(paragraph, StyleNames.HEADING_1)
 
 
 def apply_heading_2_style(paragraph) -> None:
     """Apply H2 style: medium, mid blue, Cambria."""
     if not DOCX_AVAILABLE:
         return
-    run = paragraph.runs[0] if paragraph.runs else paragraph.add_run(paragraph.text)
-    run.font.name = Fonts.HEADING_FAMILY
-    run.font.size = Pt(Fonts.H2_SIZE)
-    run.font.bold = True
-    run.font.color.rgb = RGBColor(*Colors.HEADING_2)
-    paragraph.paragraph_format.space_before = Pt(PageLayout.SPACE_BEFORE_H2)
-    paragraph.paragraph_format.space_after = Pt(PageLayout.SPACE_AFTER_H2)
-    paragraph.paragraph_format.keep_with_next = True
+    _apply_paragraph_style(paragraph, StyleNames.HEADING_2)
 
 
 def apply_heading_3_style(paragraph) -> None:
     """Apply H3 style: small heading, light blue, Cambria."""
     if not DOCX_AVAILABLE:
         return
-    run = paragraph.runs[0] if paragraph.runs else paragraph.add_run(paragraph.text)
-    run.font.name = Fonts.HEADING_FAMILY
-    run.font.size = Pt(Fonts.H3_SIZE)
-    run.font.bold = True
-    run.font.color.rgb = RGBColor(*Colors.HEADING_3)
-    paragraph.paragraph_format.space_before = Pt(PageLayout.SPACE_BEFORE_H3)
-    paragraph.paragraph_format.space_after = Pt(PageLayout.SPACE_AFTER_H3)
-    paragraph.paragraph_format.keep_with_next = True
+    _apply_paragraph_style(paragraph, StyleNames.HEADING_3)
 
 
 def apply_heading_4_style(paragraph) -> None:
     """Apply H4 style: small, dark grey, Cambria, bold."""
     if not DOCX_AVAILABLE:
         return
-    run = paragraph.runs[0] if paragraph.runs else paragraph.add_run(paragraph.text)
-    run.font.name = Fonts.HEADING_FAMILY
-    run.font.size = Pt(Fonts.H4_SIZE)
-    run.font.bold = True
-    run.font.color.rgb = RGBColor(*Colors.HEADING_4)
-    paragraph.paragraph_format.space_before = Pt(PageLayout.SPACE_BEFORE_H4)
-    paragraph.paragraph_format.space_after = Pt(PageLayout.SPACE_AFTER_H4)
+    _apply_paragraph_style(paragraph, StyleNames.HEADING_4)
 
 
 def apply_body_style(paragraph) -> None:
     """Apply body text style: Calibri 11pt, near black."""
     if not DOCX_AVAILABLE:
         return
-    for run in paragraph.runs:
-        run.font.name = Fonts.BODY_FAMILY
-        run.font.size = Pt(Fonts.BODY_SIZE)
-        run.font.color.rgb = RGBColor(*Colors.BODY_TEXT)
-    paragraph.paragraph_format.space_before = Pt(PageLayout.SPACE_BEFORE_BODY)
-    paragraph.paragraph_format.space_after = Pt(PageLayout.SPACE_AFTER_BODY)
-    paragraph.paragraph_format.line_spacing = PageLayout.BODY_LINE_SPACING
+    _apply_paragraph_style(paragraph, StyleNames.BODY)
+
+
+def apply_bullet_style(paragraph) -> None:
+    """Apply bulleted list style: Calibri 11pt, tight spacing."""
+    if not DOCX_AVAILABLE:
+        return
+    _apply_paragraph_style(paragraph, StyleNames.BULLET)
+
+
+def apply_numbered_style(paragraph) -> None:
+    """Apply numbered list style: Calibri 11pt."""
+    if not DOCX_AVAILABLE:
+        return
+    _apply_paragraph_style(paragraph, StyleNames.NUMBERED)
 
 
 def apply_code_style(paragraph) -> None:
     """Apply code/formula style: Courier New, slightly grey background."""
     if not DOCX_AVAILABLE:
         return
-    for run in paragraph.runs:
-        run.font.name = Fonts.CODE_FAMILY
-        run.font.size = Pt(Fonts.CODE_SIZE)
-        run.font.color.rgb = RGBColor(*Colors.BODY_TEXT)
-    paragraph.paragraph_format.space_before = Pt(4)
-    paragraph.paragraph_format.space_after = Pt(4)
-    paragraph.paragraph_format.left_indent = Inches(0.25)
+    _apply_paragraph_style(paragraph, StyleNames.CODE)
 
 
 def apply_caption_style(paragraph) -> None:
     """Apply caption style: Calibri 9pt, grey, italic."""
     if not DOCX_AVAILABLE:
         return
-    for run in paragraph.runs:
-        run.font.name = Fonts.CAPTION_FAMILY
-        run.font.size = Pt(Fonts.CAPTION_SIZE)
-        run.font.color.rgb = RGBColor(*Colors.CAPTION)
-        run.font.italic = True
-    paragraph.paragraph_format.space_before = Pt(2)
-    paragraph.paragraph_format.space_after = Pt(8)
+    _apply_paragraph_style(paragraph, StyleNames.CAPTION)
 
 
 # ─────────────────────────────────────────────
@@ -310,6 +540,117 @@ def set_table_borders(table) -> None:
     tblPr.append(tblBorders)
 
 
+def _hex(rgb_tuple: Tuple[int, int, int]) -> str:
+    """Convert (r, g, b) tuple to the RRGGBB form used in WordprocessingML."""
+    return "{:02X}{:02X}{:02X}".format(*rgb_tuple)
+
+
+def _table_cell_xml(text: str) -> str:
+    """Return the w:tc markup for one table cell (all formatting comes from styles)."""
+    if text:
+        space = ' xml:space="preserve"' if text != text.strip() else ""
+        run = f'<w:r><w:t{space}>{escape(text)}</w:t></w:r>'
+    else:
+        run = ""
+    return (
+        f'<w:tc><w:p><w:pPr><w:pStyle w:val="{style_id(StyleNames.TABLE_TEXT)}"/></w:pPr>'
+        f'{run}</w:p></w:tc>'
+    )
+
+
+def table_start_xml(n_cols: int, width_twips: int, declare_ns: bool = True) -> str:
+    """
+    Return the opening w:tbl markup (properties and grid) of a GDD Table-styled
+    table with n_cols equal columns; rows and "</w:tbl>" follow.
+    """
+    col_width = width_twips // n_cols
+    ns = f" {nsdecls('w')}" if declare_ns else ""
+    return (
+        f"<w:tbl{ns}><w:tblPr>"
+        f'<w:tblStyle w:val="{style_id(StyleNames.TABLE)}"/><w:tblW w:type="auto" w:w="0"/>'
+        '<w:tblLook w:val="0420" w:firstRow="1" w:lastRow="0" '
+        'w:firstColumn="0" w:lastColumn="0" w:noHBand="0" w:noVBand="1"/></w:tblPr><w:tblGrid>'
+        + f'<w:gridCol w:w="{col_width}"/>' * n_cols
+        + "</w:tblGrid>"
+    )
+
+
+def table_xml(rows: List[List[str]], width_twips: int, declare_ns: bool = True) -> str:
+    """
+    Return the w:tbl markup for a GDD Table-styled table.
+
+    The table references the GDD Table style through w:tblStyle / w:tblLook,
+    so header shading, banded rows and borders come from styles.xml and the
+    cells themselves carry no formatting. The first row is the header.
+
+    Args:
+        rows: List of rows, each a list of cell strings. Short rows are padded.
+        width_twips: Total table width in twentieths of a point.
+        declare_ns: Declare the w: namespace on the w:tbl element. Pass False
+            when writing into a document.xml stream that already declares it.
+    """
+    n_cols = max(len(row) for row in rows)
+    parts = [table_start_xml(n_cols, width_twips, declare_ns)]
+    for row in rows:
+        parts.append("<w:tr>")
+        for c_idx in range(n_cols):
+            parts.append(_table_cell_xml(row[c_idx] if c_idx < len(row) else ""))
+        parts.append("</w:tr>")
+    parts.append("</w:tbl>")
+    return "".join(parts)
+
+
+def build_table_element(rows: List[List[str]], width_twips: int):
+    """
+    Build a complete w:tbl element from row data in a single pass.
+
+    See table_xml(); register_gdd_styles() must have been called on the
+    document so the GDD Table style exists.
+
+    Args:
+        rows: List of rows, each a list of cell strings. Short rows are padded.
+        width_twips: Total table width in twentieths of a point.
+
+    Returns:
+        CT_Tbl element ready to be inserted into a document body, or None
+        when no row has any cells.
+    """
+    if not DOCX_AVAILABLE or not any(rows):
+        return None
+    return parse_xml(table_xml(rows, width_twips))
+
+
+def content_width_twips(document) -> int:
+    """Return the text width of the document's last section in twips."""
+    section = document.sections[-1]
+    width_emu = section.page_width - section.left_margin - section.right_margin
+    return int(width_emu / 635)
+
+
+def add_styled_table(document, rows: List[List[str]]):
+    """
+    Append a GDD Table-styled table (header row, banded rows, borders) to
+    the document body using build_table_element.
+
+    Args:
+        document: python-docx Document object
+        rows: List of rows, each a list of cell strings; the first row is the header
+
+    Returns:
+        The inserted CT_Tbl element, or None when no row has any cells.
+    """
+    if not DOCX_AVAILABLE or not any(rows):
+        return None
+    tbl = build_table_element(rows, content_width_twips(document))
+    body = document.element.body
+    sectPr = body.sectPr
+    if sectPr is not None:
+        sectPr.addprevious(tbl)
+    else:
+        body.append(tbl)
+    return tbl
+
+
 # ─────────────────────────────────────────────
 # CALLOUT BOX HELPERS
 # ─────────────────────────────────────────────
@@ -322,40 +663,10 @@ def add_designer_note(document, text: str) -> None:
     if not DOCX_AVAILABLE:
         return
     p = document.add_paragraph()
-    p.paragraph_format.space_before = Pt(PageLayout.SPACE_BEFORE_CALLOUT)
-    p.paragraph_format.space_after = Pt(PageLayout.SPACE_AFTER_CALLOUT)
-    p.paragraph_format.left_indent = Inches(PageLayout.CALLOUT_INDENT_LEFT)
-    p.paragraph_format.right_indent = Inches(PageLayout.CALLOUT_INDENT_RIGHT)
-
-    # Background shading
-    pPr = p._p.get_or_add_pPr()
-    shd = OxmlElement("w:shd")
-    shd.set(qn("w:val"), "clear")
-    shd.set(qn("w:color"), "auto")
-    shd.set(qn("w:fill"), "{:02X}{:02X}{:02X}".format(*Colors.DESIGNER_NOTE_BG))
-    pPr.append(shd)
-
-    # Left border
-    pBdr = OxmlElement("w:pBdr")
-    left = OxmlElement("w:left")
-    left.set(qn("w:val"), "single")
-    left.set(qn("w:sz"), "24")  # 3pt border
-    left.set(qn("w:space"), "4")
-    left.set(qn("w:color"), "{:02X}{:02X}{:02X}".format(*Colors.DESIGNER_NOTE_BORDER))
-    pBdr.append(left)
-    pPr.append(pBdr)
-
+    _apply_paragraph_style(p, StyleNames.DESIGNER_NOTE)
     run = p.add_run("🎮 Designer's Note: ")
-    run.font.bold = True
-    run.font.name = Fonts.BODY_FAMILY
-    run.font.size = Pt(Fonts.CALLOUT_SIZE)
-    run.font.color.rgb = RGBColor(*Colors.HEADING_2)
-
-    run2 = p.add_run(text)
-    run2.font.name = Fonts.BODY_FAMILY
-    run2.font.size = Pt(Fonts.CALLOUT_SIZE)
-    run2.font.italic = True
-    run2.font.color.rgb = RGBColor(*Colors.BODY_TEXT)
+    run._r.style = style_id(StyleNames.DESIGNER_NOTE_LABEL)
+    p.add_run(text)
 
 
 def add_open_question(document, text: str) -> None:
@@ -366,37 +677,10 @@ def add_open_question(document, text: str) -> None:
     if not DOCX_AVAILABLE:
         return
     p = document.add_paragraph()
-    p.paragraph_format.space_before = Pt(PageLayout.SPACE_BEFORE_CALLOUT)
-    p.paragraph_format.space_after = Pt(PageLayout.SPACE_AFTER_CALLOUT)
-    p.paragraph_format.left_indent = Inches(PageLayout.CALLOUT_INDENT_LEFT)
-    p.paragraph_format.right_indent = Inches(PageLayout.CALLOUT_INDENT_RIGHT)
-
-    pPr = p._p.get_or_add_pPr()
-    shd = OxmlElement("w:shd")
-    shd.set(qn("w:val"), "clear")
-    shd.set(qn("w:color"), "auto")
-    shd.set(qn("w:fill"), "{:02X}{:02X}{:02X}".format(*Colors.OPEN_QUESTION_BG))
-    pPr.append(shd)
-
-    pBdr = OxmlElement("w:pBdr")
-    left = OxmlElement("w:left")
-    left.set(qn("w:val"), "single")
-    left.set(qn("w:sz"), "24")
-    left.set(qn("w:space"), "4")
-    left.set(qn("w:color"), "{:02X}{:02X}{:02X}".format(*Colors.OPEN_QUESTION_BORDER))
-    pBdr.append(left)
-    pPr.append(pBdr)
-
+    _apply_paragraph_style(p, StyleNames.OPEN_QUESTION)
     run = p.add_run("⚠ Open Question: ")
-    run.font.bold = True
-    run.font.name = Fonts.BODY_FAMILY
-    run.font.size = Pt(Fonts.CALLOUT_SIZE)
-    run.font.color.rgb = RGBColor(*Colors.OPEN_QUESTION_BORDER)
-
-    run2 = p.add_run(text)
-    run2.font.name = Fonts.BODY_FAMILY
-    run2.font.size = Pt(Fonts.CALLOUT_SIZE)
-    run2.font.color.rgb = RGBColor(*Colors.BODY_TEXT)
+    run._r.style = style_id(StyleNames.OPEN_QUESTION_LABEL)
+    p.add_run(text)
 
 
 def add_placeholder_diagram(document, label: str, width_description: str = "Full width") -> None:
@@ -406,42 +690,13 @@ def add_placeholder_diagram(document, label: str, width_description: str = "Full
     """
     if not DOCX_AVAILABLE:
         return
-    p = document.add_paragraph()
-    p.paragraph_format.space_before = Pt(10)
-    p.paragraph_format.space_after = Pt(4)
-    p.alignment = WD_ALIGN_PARAGRAPH.CENTER if DOCX_AVAILABLE else None
-
-    pPr = p._p.get_or_add_pPr()
-    shd = OxmlElement("w:shd")
-    shd.set(qn("w:val"), "clear")
-    shd.set(qn("w:color"), "auto")
-    shd.set(qn("w:fill"), "{:02X}{:02X}{:02X}".format(*Colors.PLACEHOLDER_BG))
-    pPr.append(shd)
-
-    pBdr = OxmlElement("w:pBdr")
-    for border_name in ("top", "left", "bottom", "right"):
-        b = OxmlElement(f"w:{border_name}")
-        b.set(qn("w:val"), "single")
-        b.set(qn("w:sz"), "6")
-        b.set(qn("w:space"), "4")
-        b.set(qn("w:color"), "{:02X}{:02X}{:02X}".format(*Colors.PLACEHOLDER_BORDER))
-        pBdr.append(b)
-    pPr.append(pBdr)
-
-    run = p.add_run(f"[ DIAGRAM: {label} ]")
-    run.font.name = Fonts.CODE_FAMILY
-    run.font.size = Pt(Fonts.CAPTION_SIZE)
-    run.font.color.rgb = RGBColor(*Colors.PLACEHOLDER_TEXT)
-    run.font.bold = True
-
-    # Add space padding above/below text within box
-    p.paragraph_format.space_before = Pt(20)
-    p.paragraph_format.space_after = Pt(20)
+    p = document.add_paragraph(f"[ DIAGRAM: {label} ]")
+    _apply_paragraph_style(p, StyleNames.DIAGRAM)
 
     # Caption below the box
     caption = document.add_paragraph(f"Figure: {label}")
     apply_caption_style(caption)
-    caption.alignment = WD_ALIGN_PARAGRAPH.CENTER if DOCX_AVAILABLE else None
+    caption.alignment = WD_ALIGN_PARAGRAPH.CENTER
 
 
 # ─────────────────────────────────────────────
@@ -529,3 +784,25 @@ def add_header_footer(document, title: str, version: str, date: str) -> None:
         run3.font.name = Fonts.BODY_FAMILY
         run3.font.size = Pt(Fonts.FOOTER_SIZE)
         run3.font.color.rgb = RGBColor(*Colors.CAPTION)
+
+
+def set_header_footer_text(document, title: str, version: str, date: str) -> None:
+    """
+    Replace the title/version and date text in a header and footer previously
+    built by add_header_footer, leaving the field codes and formatting intact.
+
+    Args:
+        document: python-docx Document object
+        title: Game title for header
+        version: Document version string (e.g., "v0.1")
+        date: Document date string (e.g., "January 2025")
+    """
+    if not DOCX_AVAILABLE:
+        return
+    for section in document.sections:
+        hdr_runs = section.header.paragraphs[0].runs
+        if hdr_runs:
+            hdr_runs[0].text = f"{title} — Game Design Document — {version}  "
+        ftr_runs = section.footer.paragraphs[0].runs
+        if ftr_runs:
+            ftr_runs[-1].text = f"   |   CONFIDENTIAL   |   {date}"
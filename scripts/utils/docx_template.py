@@ -0,0 +1,138 @@
+"""
+docx_template.py
+----------------
+Cached, pre-styled base document for GDD .docx generation.
+
+The base template (GDD named styles, page margins and the header/footer
+scaffold) is built once from the docx_styles constants, written to an
+on-disk cache keyed by STYLE_VERSION and the python-docx version, and kept
+parsed in memory. Every new document starts as a deep copy of that parsed
+template, so per-document setup is a copy plus filling in the header/footer
+text instead of rebuilding styles.xml and section properties from scratch.
+
+Cache location: $GDD_TEMPLATE_CACHE, else $XDG_CACHE_HOME/game-design-document,
+else ~/.cache/game-design-document. Set GDD_TEMPLATE_CACHE to an empty string
+to keep the template in memory only.
+"""
+
+import copy
+import os
+import tempfile
+import threading
+import zipfile
+from typing import Optional
+
+try:
+    import docx
+    from docx import Document
+    from docx.opc.exceptions import PackageNotFoundError
+    DOCX_AVAILABLE = True
+except ImportError:
+    DOCX_AVAILABLE = False
+
+from .docx_styles import (
+    STYLE_VERSION, register_gdd_styles, set_document_margins,
+    add_header_footer, set_header_footer_text,
+)
+
+
+_lock = threading.Lock()
+_base_document = None
+
+
+def template_cache_dir() -> Optional[str]:
+    """Return the on-disk template cache directory, or None if disabled."""
+    configured = os.environ.get("GDD_TEMPLATE_CACHE")
+    if configured is not None:
+        return configured or None
+    root = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(root, "game-design-document")
+
+
+def template_cache_path() -> Optional[str]:
+    """Return the cache file path for the current style version, or None."""
+    cache_dir = template_cache_dir()
+    if cache_dir is None:
+        return None
+    docx_version = getattr(docx, "__version__", "0")
+    return os.path.join(
+        cache_dir, f"gdd_base_s{STYLE_VERSION}_docx{docx_version}.docx"
+    )
+
+
+def build_base_document():
+    """Build the base template from scratch (styles, margins, header/footer)."""
+    document = Document()
+    register_gdd_styles(document)
+    set_document_margins(document)
+    add_header_footer(document, "", "", "")
+    return document
+
+
+def _load_or_build():
+    """Load the cached template from disk, building and caching it if needed."""
+    path = template_cache_path()
+    if path and os.path.isfile(path):
+        try:
+            return Document(path)
+        except (OSError, KeyError, zipfile.BadZipFile, PackageNotFoundError):
+            pass  # Stale or corrupt cache entry: rebuild below
+
+    document = build_base_document()
+    if path:
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(
+                suffix=".docx", dir=os.path.dirname(path)
+            )
+            try:
+                with os.fdopen(fd, "wb") as fh:
+                    document.save(fh)
+                os.replace(tmp_path, path)
+            except OSError:
+                os.remove(tmp_path)
+                raise
+        except OSError:
+            pass  # Read-only or unavailable cache dir: keep it in memory only
+    return document
+
+
+def get_base_document():
+    """Return the process-wide parsed base template (do not modify it)."""
+    global _base_document
+    if _base_document is None:
+        with _lock:
+            if _base_document is None:
+                _base_document = _load_or_build()
+    return _base_document
+
+
+def new_gdd_document(title: str, version: str, date: str):
+    """
+    Return a fresh, fully styled GDD document with header/footer filled in.
+
+    Args:
+        title: Game title for header
+        version: Document version string (e.g., "v0.1")
+        date: Document date string (e.g., "January 2025")
+
+    Returns:
+        python-docx Document independent of the cached template.
+    """
+    base = get_base_document()
+    with _lock:
+        document = copy.deepcopy(base)
+    set_header_footer_text(document, title, version, date)
+    return document
+
+
+def clear_template_cache() -> None:
+    """Drop the in-memory template and delete the on-disk cache entry."""
+    global _base_document
+    with _lock:
+        _base_document = None
+        path = template_cache_path()
+        if path and os.path.isfile(path):
+            os.remove(path)
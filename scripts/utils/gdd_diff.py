@@ -0,0 +1,550 @@
+"""
+gdd_diff.py
+-----------
+Section-level diff of two GDD configs, and redline output through the
+streaming DOCX writer.
+
+Sections whose content hashes match (see version_store.content_hash) are
+skipped without being parsed; for two sections from the same version store
+the hashes are read from the store and the section text is not even
+fetched. Changed sections are parsed into content blocks (the same blocks
+every writer renders) and diffed in two passes:
+
+  1. blocks (paragraphs, bullets, tables, ...) with a patience diff, which
+     anchors on blocks that occur exactly once on each side and so keeps
+     moved or repeated boilerplate from producing noisy matches
+  2. within each changed block, words (and within changed tables, rows
+     and then cell words) with the same algorithm
+
+Regions with no unique anchors fall back to difflib.SequenceMatcher.
+
+Usage:
+    diffs = diff_configs(old_data, new_data)
+    with StreamingDocxWriter("redline.docx", doc) as writer:
+        write_redline(writer, diffs, RevisionMarks("Reviewer", date))
+"""
+
+import re
+from bisect import bisect_left
+from collections import Counter
+from difflib import SequenceMatcher
+from typing import Any, Dict, Hashable, List, NamedTuple, Optional, Sequence, Tuple
+
+from . import content_blocks as blocks
+from .content_blocks import iter_content_blocks
+from .docx_stream import DELETED, INSERTED, BodyWriter, RevisionMarks, Segment
+from .docx_styles import StyleNames
+from .version_store import content_hash
+
+try:
+    from .section_registry import SECTIONS, SECTION_ORDER
+except ImportError:
+    SECTIONS, SECTION_ORDER = {}, []
+
+
+EQUAL = "equal"
+MODIFIED = "modified"
+ADDED = "added"
+REMOVED = "removed"
+UNCHANGED = "unchanged"
+
+Opcode = Tuple[str, int, int, int, int]
+
+_TOKEN_RE = re.compile(r"\s+|\w+|[^\w\s]")
+_WORD_RE = re.compile(r"\w+")
+
+# Replaced regions up to this many old x new blocks are aligned by word
+# overlap; larger ones are paired in order.
+ALIGN_LIMIT = 400
+ALIGN_MIN_SIMILARITY = 0.3
+
+
+# ─────────────────────────────────────────────
+# PATIENCE DIFF
+# ─────────────────────────────────────────────
+
+def _unique_lcs(a: Sequence[Hashable], alo: int, ahi: int,
+                b: Sequence[Hashable], blo: int, bhi: int) -> List[Tuple[int, int]]:
+    """Longest increasing run of items that occur once in a[alo:ahi] and once in b[blo:bhi]."""
+    a_count = Counter(a[alo:ahi])
+    b_count = Counter(b[blo:bhi])
+    b_index = {b[j]: j for j in range(blo, bhi) if b_count[b[j]] == 1}
+    pairs = [(i, b_index[a[i]]) for i in range(alo, ahi)
+             if a_count[a[i]] == 1 and a[i] in b_index]
+    if not pairs:
+        return []
+
+    # Patience sorting on the b positions, with back-pointers
+    tails: List[int] = []
+    tail_pair: List[int] = []
+    back: List[int] = [-1] * len(pairs)
+    for k, (_, j) in enumerate(pairs):
+        pile = bisect_left(tails, j)
+        if pile == len(tails):
+            tails.append(j)
+            tail_pair.append(k)
+        else:
+            tails[pile] = j
+            tail_pair[pile] = k
+        back[k] = tail_pair[pile - 1] if pile else -1
+
+    lcs = []
+    k = tail_pair[-1]
+    while k != -1:
+        lcs.append(pairs[k])
+        k = back[k]
+    lcs.reverse()
+    return lcs
+
+
+def _match(a: Sequence[Hashable], alo: int, ahi: int,
+           b: Sequence[Hashable], blo: int, bhi: int,
+           out: List[Tuple[int, int]]) -> None:
+    while alo < ahi and blo < bhi and a[alo] == b[blo]:
+        out.append((alo, blo))
+        alo += 1
+        blo += 1
+    tail = []
+    while alo < ahi and blo < bhi and a[ahi - 1] == b[bhi - 1]:
+        ahi -= 1
+        bhi -= 1
+        tail.append((ahi, bhi))
+
+    if alo < ahi and blo < bhi:
+        anchors = _unique_lcs(a, alo, ahi, b, blo, bhi)
+        if anchors:
+            i0, j0 = alo, blo
+            for i, j in anchors:
+                _match(a, i0, i, b, j0, j, out)
+                out.append((i, j))
+                i0, j0 = i + 1, j + 1
+            _match(a, i0, ahi, b, j0, bhi, out)
+        else:
+            matcher = SequenceMatcher(None, a[alo:ahi], b[blo:bhi], autojunk=False)
+            for block in matcher.get_matching_blocks():
+                out.extend((alo + block.a + k, blo + block.b + k) for k in range(block.size))
+
+    out.extend(reversed(tail))
+
+
+def patience_opcodes(a: Sequence[Hashable], b: Sequence[Hashable]) -> List[Opcode]:
+    """
+    Diff two sequences of hashable items.
+
+    Returns:
+        difflib-style opcodes: (tag, i1, i2, j1, j2) with tag one of
+        "equal", "replace", "delete", "insert".
+    """
+    matches: List[Tuple[int, int]] = []
+    _match(a, 0, len(a), b, 0, len(b), matches)
+
+    opcodes: List[Opcode] = []
+    i = j = 0
+    for mi, mj in matches + [(len(a), len(b))]:
+        if i < mi or j < mj:
+            tag = "replace" if i < mi and j < mj else ("delete" if i < mi else "insert")
+            opcodes.append((tag, i, mi, j, mj))
+        if mi < len(a):
+            if opcodes and opcodes[-1][0] == "equal" and opcodes[-1][2] == mi:
+                _, i1, _, j1, _ = opcodes[-1]
+                opcodes[-1] = ("equal", i1, mi + 1, j1, mj + 1)
+            else:
+                opcodes.append(("equal", mi, mi + 1, mj, mj + 1))
+        i, j = mi + 1, mj + 1
+    return opcodes
+
+
+# ─────────────────────────────────────────────
+# WORD AND BLOCK DIFFS
+# ─────────────────────────────────────────────
+
+class WordDiff(NamedTuple):
+    """Word-level diff of one text: segments plus inserted/deleted word counts."""
+    segments: List[Segment]
+    added: int
+    removed: int
+
+
+def _absorb_spaces(opcodes: List[Opcode], a: List[str]) -> List[Opcode]:
+    """Fold whitespace-only equal runs between two changes into one replace."""
+    merged: List[Opcode] = []
+    for k, (tag, i1, i2, j1, j2) in enumerate(opcodes):
+        after_change = bool(merged) and merged[-1][0] != "equal"
+        between_changes = (tag == "equal" and after_change and k + 1 < len(opcodes)
+                           and not "".join(a[i1:i2]).strip())
+        if after_change and (tag != "equal" or between_changes):
+            _, pi1, _, pj1, _ = merged[-1]
+            merged[-1] = ("replace", pi1, i2, pj1, j2)
+        else:
+            merged.append((tag, i1, i2, j1, j2))
+    return merged
+
+
+def word_diff(old: str, new: str) -> WordDiff:
+    """Diff two texts word by word (whitespace and punctuation are separate tokens)."""
+    a = _TOKEN_RE.findall(old)
+    b = _TOKEN_RE.findall(new)
+    segments: List[Segment] = []
+    added = removed = 0
+
+    def emit(tokens: List[str], change: Optional[str]) -> None:
+        if not tokens:
+            return
+        text = "".join(tokens)
+        if segments and segments[-1][2] == change:
+            segments[-1] = (segments[-1][0] + text, None, change)
+        else:
+            segments.append((text, None, change))
+
+    for tag, i1, i2, j1, j2 in _absorb_spaces(patience_opcodes(a, b), a):
+        if tag == "equal":
+            emit(a[i1:i2], None)
+            continue
+        if tag in ("delete", "replace"):
+            emit(a[i1:i2], DELETED)
+            removed += sum(1 for t in a[i1:i2] if _WORD_RE.match(t))
+        if tag in ("insert", "replace"):
+            emit(b[j1:j2], INSERTED)
+            added += sum(1 for t in b[j1:j2] if _WORD_RE.match(t))
+    return WordDiff(segments, added, removed)
+
+
+class BlockChange(NamedTuple):
+    """
+    One entry of a section's redline.
+
+    change is EQUAL, INSERTED, DELETED or MODIFIED; old / new are the block
+    payloads (None where absent). For MODIFIED text blocks detail is a
+    WordDiff; for MODIFIED tables it is a list of (row change, cells) with
+    each cell a list of segments.
+    """
+    change: str
+    kind: str
+    old: Any
+    new: Any
+    detail: Any = None
+
+
+def _block_key(block: blocks.Block) -> Hashable:
+    kind, payload = block
+    if kind == blocks.TABLE:
+        return kind, tuple(tuple(row) for row in payload)
+    return kind, payload
+
+
+def _block_text(block: blocks.Block) -> str:
+    kind, payload = block
+    if kind == blocks.HEADING:
+        return payload[1]
+    if kind == blocks.TABLE:
+        return " ".join(" ".join(row) for row in payload)
+    return payload
+
+
+def _comparable(old: blocks.Block, new: blocks.Block) -> bool:
+    if old[0] != new[0]:
+        return False
+    return old[0] != blocks.HEADING or old[1][0] == new[1][0]
+
+
+def _similarity(old: blocks.Block, new: blocks.Block) -> float:
+    a = set(_WORD_RE.findall(_block_text(old).lower()))
+    b = set(_WORD_RE.findall(_block_text(new).lower()))
+    return len(a & b) / len(a | b) if a or b else 1.0
+
+
+def _align(old: List[blocks.Block], new: List[blocks.Block]) -> List[Tuple[Optional[int], Optional[int]]]:
+    """
+    Pair up the blocks of a replaced region, in order. Small regions are
+    aligned to maximize word overlap between paired blocks; a pair needs
+    the same kind (and heading level) and some minimum overlap.
+    """
+    n, m = len(old), len(new)
+    if n * m > ALIGN_LIMIT:
+        pairs = [(k, k) if _comparable(old[k], new[k]) else None for k in range(min(n, m))]
+        aligned: List[Tuple[Optional[int], Optional[int]]] = []
+        for k in range(min(n, m)):
+            aligned += [pairs[k]] if pairs[k] else [(k, None), (None, k)]
+        aligned += [(k, None) for k in range(m, n)] + [(None, k) for k in range(n, m)]
+        return aligned
+
+    score = [[0.0] * (m + 1) for _ in range(n + 1)]
+    for i in range(n - 1, -1, -1):
+        for j in range(m - 1, -1, -1):
+            best = max(score[i + 1][j], score[i][j + 1])
+            if _comparable(old[i], new[j]):
+                sim = _similarity(old[i], new[j])
+                if sim >= ALIGN_MIN_SIMILARITY:
+                    best = max(best, sim + score[i + 1][j + 1])
+            score[i][j] = best
+
+    aligned = []
+    i = j = 0
+    while i < n and j < m:
+        if (_comparable(old[i], new[j])
+                and _similarity(old[i], new[j]) >= ALIGN_MIN_SIMILARITY
+                and score[i][j] == _similarity(old[i], new[j]) + score[i + 1][j + 1]):
+            aligned.append((i, j))
+            i += 1
+            j += 1
+        elif score[i + 1][j] >= score[i][j + 1]:
+            aligned.append((i, None))
+            i += 1
+        else:
+            aligned.append((None, j))
+            j += 1
+    aligned += [(k, None) for k in range(i, n)] + [(None, k) for k in range(j, m)]
+    return aligned
+
+
+def _table_diff(old_rows: List[List[str]], new_rows: List[List[str]]) -> Tuple[list, int, int]:
+    rows = []
+    added = removed = 0
+
+    def plain(row, change=None):
+        return [[(cell, None, change)] if cell else [] for cell in row]
+
+    opcodes = patience_opcodes([tuple(r) for r in old_rows], [tuple(r) for r in new_rows])
+    for tag, i1, i2, j1, j2 in opcodes:
+        if tag == "equal":
+            rows += [(None, plain(row)) for row in new_rows[j1:j2]]
+            continue
+        paired = min(i2 - i1, j2 - j1) if tag == "replace" else 0
+        for k in range(paired):
+            old_row, new_row = old_rows[i1 + k], new_rows[j1 + k]
+            cells = []
+            for c in range(max(len(old_row), len(new_row))):
+                cell = word_diff(old_row[c] if c < len(old_row) else "",
+                                 new_row[c] if c < len(new_row) else "")
+                cells.append(cell.segments)
+                added += cell.added
+                removed += cell.removed
+            rows.append((None, cells))
+        for row in old_rows[i1 + paired:i2]:
+            rows.append((DELETED, plain(row, DELETED)))
+            removed += sum(len(_WORD_RE.findall(cell)) for cell in row)
+        for row in new_rows[j1 + paired:j2]:
+            rows.append((INSERTED, plain(row, INSERTED)))
+            added += sum(len(_WORD_RE.findall(cell)) for cell in row)
+    return rows, added, removed
+
+
+def _modified(old: blocks.Block, new: blocks.Block) -> Tuple[BlockChange, int, int]:
+    kind = new[0]
+    if kind == blocks.TABLE:
+        rows, added, removed = _table_diff(old[1], new[1])
+        return BlockChange(MODIFIED, kind, old[1], new[1], rows), added, removed
+    diff = word_diff(_block_text(old), _block_text(new))
+    return BlockChange(MODIFIED, kind, old[1], new[1], diff), diff.added, diff.removed
+
+
+def _words(block: blocks.Block) -> int:
+    return len(_WORD_RE.findall(_block_text(block)))
+
+
+def diff_blocks(old: List[blocks.Block], new: List[blocks.Block]) -> Tuple[List[BlockChange], int, int]:
+    """
+    Diff two block lists.
+
+    Returns:
+        (changes in document order, words added, words removed)
+    """
+    changes: List[BlockChange] = []
+    added = removed = 0
+    opcodes = patience_opcodes([_block_key(b) for b in old], [_block_key(b) for b in new])
+    for tag, i1, i2, j1, j2 in opcodes:
+        if tag == "equal":
+            changes += [BlockChange(EQUAL, kind, payload, payload) for kind, payload in new[j1:j2]]
+            continue
+        for i, j in _align(old[i1:i2], new[j1:j2]):
+            if i is not None and j is not None:
+                change, a, r = _modified(old[i1 + i], new[j1 + j])
+                changes.append(change)
+                added += a
+                removed += r
+            elif i is not None:
+                kind, payload = old[i1 + i]
+                changes.append(BlockChange(DELETED, kind, payload, None))
+                removed += _words(old[i1 + i])
+            else:
+                kind, payload = new[j1 + j]
+                changes.append(BlockChange(INSERTED, kind, None, payload))
+                added += _words(new[j1 + j])
+    return changes, added, removed
+
+
+# ─────────────────────────────────────────────
+# SECTION DIFF
+# ─────────────────────────────────────────────
+
+class SectionDiff(NamedTuple):
+    """Diff of one section; changes is empty for UNCHANGED sections."""
+    key: str
+    title: str
+    number: int
+    status: str
+    changes: List[BlockChange]
+    words_added: int
+    words_removed: int
+    value: Any = None
+
+
+def section_blocks(value: Any) -> List[blocks.Block]:
+    """
+    Flatten a section (prose string, or dict with content and subsections)
+    into content blocks, with subsection titles as level 2 / 3 headings, in
+    the order the GDD generators render them.
+    """
+    if isinstance(value, str):
+        return list(iter_content_blocks(value))
+    if not isinstance(value, dict):
+        return []
+    result = list(iter_content_blocks(value.get("content", "")))
+    for sub in value.get("subsections") or []:
+        if sub.get("title", ""):
+            result.append((blocks.HEADING, (2, sub["title"])))
+        result += iter_content_blocks(sub.get("content", ""))
+        for subsub in sub.get("subsections", []):
+            if subsub.get("title", ""):
+                result.append((blocks.HEADING, (3, subsub["title"])))
+            result += iter_content_blocks(subsub.get("content", ""))
+    return result
+
+
+def _hash(sections: Any, key: str) -> str:
+    stored_hash = getattr(sections, "content_hash", None)
+    return stored_hash(key) if stored_hash else content_hash(sections[key])
+
+
+def diff_configs(old_data: Dict[str, Any], new_data: Dict[str, Any]) -> List[SectionDiff]:
+    """
+    Diff the sections of two game data dictionaries.
+
+    Sections are returned in GDD order (registry sections first, then any
+    others in the order they appear). Unchanged sections carry their value
+    in SectionDiff.value so a redline can still show them.
+
+    Args:
+        old_data: Earlier version (as loaded by load_project).
+        new_data: Later version.
+    """
+    old_sections = old_data.get("sections") or {}
+    new_sections = new_data.get("sections") or {}
+    keys = [k for k in SECTION_ORDER if k in old_sections or k in new_sections]
+    keys += [k for k in list(new_sections) + list(old_sections) if k not in keys]
+
+    diffs: List[SectionDiff] = []
+    for idx, key in enumerate(dict.fromkeys(keys)):
+        sdef = SECTIONS.get(key)
+        title = sdef["name"] if sdef else key.replace("_", " ").title()
+        number = sdef["order"] if sdef else idx + 1
+        in_old, in_new = key in old_sections, key in new_sections
+
+        if in_old and in_new and _hash(old_sections, key) == _hash(new_sections, key):
+            diffs.append(SectionDiff(key, title, number, UNCHANGED, [], 0, 0,
+                                     new_sections[key]))
+            continue
+        old_blocks = section_blocks(old_sections[key]) if in_old else []
+        new_blocks = section_blocks(new_sections[key]) if in_new else []
+        changes, added, removed = diff_blocks(old_blocks, new_blocks)
+        status = MODIFIED if in_old and in_new else (ADDED if in_new else REMOVED)
+        diffs.append(SectionDiff(key, title, number, status, changes, added, removed))
+    return diffs
+
+
+# ─────────────────────────────────────────────
+# REDLINE OUTPUT
+# ─────────────────────────────────────────────
+
+_TEXT_STYLES = {
+    blocks.PARAGRAPH: StyleNames.BODY,
+    blocks.BULLET: StyleNames.BULLET,
+    blocks.NUMBERED: StyleNames.NUMBERED,
+    blocks.CODE: StyleNames.CODE,
+}
+
+
+def _segments(text: str, change: Optional[str]) -> List[Segment]:
+    return [(text, None, change)] if text else []
+
+
+def _write_change(writer: BodyWriter, item: BlockChange, marks: RevisionMarks) -> None:
+    """Write one BlockChange the way BodyWriter.write_blocks writes the block."""
+    if item.change == MODIFIED and item.kind == blocks.TABLE:
+        writer.write_revised_table(item.detail, marks)
+        return
+    if item.kind == blocks.TABLE:
+        change = None if item.change == EQUAL else item.change
+        payload = item.new if item.new is not None else item.old
+        writer.write_revised_table(
+            [(change, [_segments(cell, change) for cell in row]) for row in payload], marks
+        )
+        return
+
+    if item.change == MODIFIED:
+        segments, paragraph_change = item.detail.segments, None
+    else:
+        paragraph_change = None if item.change == EQUAL else item.change
+        payload = item.new if item.new is not None else item.old
+        text = payload[1] if item.kind == blocks.HEADING else payload
+        segments = _segments(text, paragraph_change)
+
+    def write(prefix: List[Segment], style: Optional[str], suffix: Optional[List[Segment]] = None,
+              align: Optional[str] = None):
+        writer.write_revised_paragraph(
+            prefix + segments + (suffix or []), marks, style, align, paragraph_change
+        )
+
+    if item.kind == blocks.HEADING:
+        level = (item.new or item.old)[0]
+        write([], f"Heading {level}")
+    elif item.kind in _TEXT_STYLES:
+        write([], _TEXT_STYLES[item.kind])
+    elif item.kind == blocks.NOTE:
+        label = [("🎮 Designer's Note: ", StyleNames.DESIGNER_NOTE_LABEL, paragraph_change)]
+        write(label, StyleNames.DESIGNER_NOTE)
+    elif item.kind == blocks.QUESTION:
+        label = [("⚠ Open Question: ", StyleNames.OPEN_QUESTION_LABEL, paragraph_change)]
+        write(label, StyleNames.OPEN_QUESTION)
+    elif item.kind == blocks.DIAGRAM:
+        write([("[ DIAGRAM: ", None, paragraph_change)], StyleNames.DIAGRAM,
+              [(" ]", None, paragraph_change)])
+        write([("Figure: ", None, paragraph_change)], StyleNames.CAPTION, align="center")
+
+
+def write_redline(
+    writer: BodyWriter,
+    diffs: List[SectionDiff],
+    marks: RevisionMarks,
+    changed_only: bool = False,
+) -> None:
+    """
+    Write sections with their changes marked (see RevisionMarks).
+
+    Args:
+        writer: BodyWriter / StreamingDocxWriter to write into.
+        diffs: Result of diff_configs().
+        marks: Tracked changes or highlighted runs, and their author/date.
+        changed_only: Leave out unchanged sections.
+    """
+    first = True
+    for diff in diffs:
+        if changed_only and diff.status == UNCHANGED:
+            continue
+        heading_change = {ADDED: INSERTED, REMOVED: DELETED}.get(diff.status)
+        if not first:
+            writer.write_revised_page_break(marks, heading_change)
+        first = False
+
+        writer.write_revised_paragraph(
+            [(f"{diff.number}. {diff.title}", None, heading_change)],
+            marks, "Heading 1", change=heading_change,
+        )
+        if diff.status == UNCHANGED:
+            writer.write_blocks(section_blocks(diff.value))
+            continue
+        for item in diff.changes:
+            if item.change == EQUAL:
+                writer.write_blocks([(item.kind, item.new)])
+            else:
+                _write_change(writer, item, marks)
@@ -0,0 +1,305 @@
+"""
+gddpack.py
+----------
+Indexed binary container (.gddpack) for GDD configs, with random access to
+sections.
+
+Layout (all integers little-endian):
+
+    offset 0   magic      8 bytes  b"GDDPACK\\0"
+           8   version    uint16
+          10   reserved   uint16   (0)
+          12   index_len  uint32
+          16   index      index_len bytes of UTF-8 JSON
+           …   blobs      zlib-compressed JSON values, back to back
+
+The index lists every blob with its offset (from the start of the file),
+compressed and raw size, CRC-32 of the raw bytes and JSON type:
+
+    {
+      "game_title": "Echo Chamber",
+      "config": {"offset": …, "size": …, "raw_size": …, "crc32": …, "type": "dict"},
+      "sections_position": 3,
+      "sections": [{"key": "game_mechanics", "offset": …, …}, …]
+    }
+
+"config" holds every top-level key except "sections"; "sections_position"
+records where "sections" sat among them so key order survives a round trip.
+Opening a pack reads only the header and index (through mmap); a section's
+blob is decompressed the first time it is looked up, so a generator that
+needs five sections never inflates the other fourteen.
+
+Usage:
+    write_pack(game_data, "game.gddpack")
+    pack = GddPack("game.gddpack")
+    pack.sections["executive_summary"]     # inflates one blob
+    game_data = pack.game_data()           # config + lazy sections
+"""
+
+import json
+import mmap
+import struct
+import zlib
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator, List, Optional
+
+MAGIC = b"GDDPACK\0"
+VERSION = 1
+COMPRESSION_LEVEL = 9
+PACK_EXTENSION = ".gddpack"
+
+_HEADER = struct.Struct("<8sHHI")
+
+
+class CorruptContentError(ValueError):
+    """A stored blob (.gddpack or version store) failed its integrity check."""
+
+
+def is_gddpack(path: str) -> bool:
+    """True if the file at path starts with the .gddpack magic."""
+    try:
+        with open(path, "rb") as f:
+            return f.read(len(MAGIC)) == MAGIC
+    except OSError:
+        return False
+
+
+# ─────────────────────────────────────────────
+# WRITING
+# ─────────────────────────────────────────────
+
+def _encode(value: Any) -> bytes:
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def pack_bytes(game_data: Dict[str, Any]) -> bytes:
+    """
+    Serialize a game data dictionary into .gddpack bytes.
+
+    A "sections" value that is not a mapping is stored in the config blob
+    like any other key.
+
+    Args:
+        game_data: Game content, as loaded from a JSON config.
+
+    Returns:
+        The complete .gddpack file contents.
+    """
+    sections = game_data.get("sections")
+    split = isinstance(sections, Mapping)
+    config = {k: v for k, v in game_data.items() if not (split and k == "sections")}
+
+    blobs: List[bytes] = []
+    entries: List[Dict[str, Any]] = []
+    for key, value in [(None, config)] + (list(sections.items()) if split else []):
+        raw = _encode(value)
+        blob = zlib.compress(raw, COMPRESSION_LEVEL)
+        entry = {"size": len(blob), "raw_size": len(raw),
+                 "crc32": zlib.crc32(raw), "type": type(value).__name__}
+        if key is not None:
+            entry["key"] = key
+        entries.append(entry)
+        blobs.append(blob)
+
+    index: Dict[str, Any] = {
+        "game_title": game_data.get("game_title", ""),
+        "config": entries[0],
+        "sections_position": list(game_data).index("sections") if split else None,
+        "sections": entries[1:],
+    }
+    # Blob offsets follow the index, whose length depends on the offsets'
+    # digits: recompute until the encoded index length stops changing.
+    index_len = 0
+    while True:
+        offset = _HEADER.size + index_len
+        for entry, blob in zip(entries, blobs):
+            entry["offset"] = offset
+            offset += len(blob)
+        index_bytes = _encode(index)
+        if len(index_bytes) == index_len:
+            break
+        index_len = len(index_bytes)
+
+    header = _HEADER.pack(MAGIC, VERSION, 0, len(index_bytes))
+    return b"".join([header, index_bytes] + blobs)
+
+
+def write_pack(game_data: Dict[str, Any], output_path: str) -> int:
+    """
+    Write game data as a .gddpack file.
+
+    Returns:
+        Size of the written file in bytes.
+    """
+    data = pack_bytes(game_data)
+    with open(output_path, "wb") as f:
+        f.write(data)
+    return len(data)
+
+
+# ─────────────────────────────────────────────
+# READING
+# ─────────────────────────────────────────────
+
+def _pack_sections(path: str) -> "PackSections":
+    """Unpickle a PackSections by reopening its pack."""
+    return GddPack(path).sections
+
+
+class PackSections(Mapping):
+    """
+    Read-only mapping of section key -> content backed by a pack's blobs.
+    A section is inflated on first lookup and cached; iteration, len() and
+    `in` only use the index. Pickles as the pack's path (so it can be sent
+    to worker processes) and reopens the pack on unpickling.
+    """
+
+    def __init__(self, pack: "GddPack"):
+        self._pack = pack
+        self._entries = {entry["key"]: entry for entry in pack.index["sections"]}
+        self._loaded: Dict[str, Any] = {}
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self._loaded:
+            self._loaded[key] = self._pack.read_blob(self._entries[key])
+        return self._loaded[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+    def is_loaded(self, key: str) -> bool:
+        """Whether a section has already been inflated."""
+        return key in self._loaded
+
+    def __reduce__(self):
+        return _pack_sections, (self._pack.path,)
+
+    def __repr__(self) -> str:
+        return f"PackSections({len(self._entries)} sections, {len(self._loaded)} loaded)"
+
+
+class GddPack:
+    """
+    A memory-mapped .gddpack file.
+
+    Only the header and index are parsed on open. Blobs are sliced out of
+    the map and inflated on demand, so untouched sections cost neither
+    I/O nor decompression.
+
+    Raises:
+        ValueError: If the file is not a .gddpack, has an unsupported
+            version, or its index points outside the file.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            try:
+                self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                raise ValueError(f"{path}: empty file is not a .gddpack") from None
+        try:
+            self.index = self._read_index()
+        except (ValueError, KeyError, TypeError) as e:
+            self._map.close()
+            raise ValueError(f"{path}: {e}") from None
+        self.sections = PackSections(self)
+
+    def _read_index(self) -> Dict[str, Any]:
+        if len(self._map) < _HEADER.size:
+            raise ValueError("truncated .gddpack header")
+        magic, version, _, index_len = _HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC:
+            raise ValueError("not a .gddpack file")
+        if version != VERSION:
+            raise ValueError(f"unsupported .gddpack version {version}")
+        end = _HEADER.size + index_len
+        if end > len(self._map):
+            raise ValueError("truncated .gddpack index")
+        index = json.loads(self._map[_HEADER.size:end].decode("utf-8"))
+        for entry in [index["config"]] + index["sections"]:
+            if entry["offset"] < end or entry["offset"] + entry["size"] > len(self._map):
+                raise ValueError("blob outside the file")
+        return index
+
+    @property
+    def game_title(self) -> str:
+        return self.index.get("game_title", "")
+
+    def _inflate(self, entry: Dict[str, Any]) -> Optional[bytes]:
+        """Raw bytes of one blob, or None if it fails its size or CRC check."""
+        blob = self._map[entry["offset"]:entry["offset"] + entry["size"]]
+        try:
+            raw = zlib.decompressobj().decompress(blob, entry["raw_size"] + 1)
+        except zlib.error:
+            return None
+        if len(raw) != entry["raw_size"] or zlib.crc32(raw) != entry["crc32"]:
+            return None
+        return raw
+
+    def read_blob(self, entry: Dict[str, Any]) -> Any:
+        """Inflate and decode one blob described by an index entry."""
+        raw = self._inflate(entry)
+        if raw is None:
+            raise CorruptContentError(f"{self.path}: corrupt blob for '{entry.get('key', 'config')}'")
+        return json.loads(raw.decode("utf-8"))
+
+    def verify(self) -> List[str]:
+        """
+        Check every blob against its CRC-32 without decoding it.
+
+        Returns:
+            Names of the corrupt blobs ("config" or a section key); empty
+            if the pack is intact.
+        """
+        return [entry.get("key", "config")
+                for entry in [self.index["config"]] + self.index["sections"]
+                if self._inflate(entry) is None]
+
+    def config(self) -> Dict[str, Any]:
+        """Top-level keys other than "sections" (inflated on each call)."""
+        return self.read_blob(self.index["config"])
+
+    def game_data(self, lazy: bool = True) -> Dict[str, Any]:
+        """
+        The game data dictionary, with top-level key order restored.
+
+        Args:
+            lazy: Keep "sections" as a PackSections mapping (inflated on
+                lookup) instead of reading every section now.
+        """
+        config = self.config()
+        position: Optional[int] = self.index.get("sections_position")
+        if position is None:
+            return config
+        sections = self.sections if lazy else dict(self.sections)
+        items = list(config.items())
+        items.insert(position, ("sections", sections))
+        return dict(items)
+
+    def close(self) -> None:
+        self._map.close()
+
+    def __reduce__(self):
+        return GddPack, (self.path,)
+
+    def __enter__(self) -> "GddPack":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def unpack_to_json(pack_path: str, output_path: str) -> None:
+    """Write a .gddpack back out as a JSON config."""
+    with GddPack(pack_path) as pack:
+        game_data = pack.game_data(lazy=False)
+    with open(output_path, "w", encoding="utf-8") as f:
+        json.dump(game_data, f, indent=2, ensure_ascii=False)
+        f.write("\n")
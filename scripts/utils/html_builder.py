@@ -0,0 +1,188 @@
+"""
+html_builder.py
+---------------
+HTML utility functions for the static GDD site export: the stylesheet
+(built from the Word document's Colors / Fonts palettes, so callouts and
+tables match the .docx and .pdf), page shells, and section prose rendered
+from utils.content_blocks.
+
+Pages are plain HTML5 with no scripts and no external resources, so the
+site works from any static file server or straight from disk.
+"""
+
+import re
+from html import escape as _html_escape
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from . import content_blocks as blocks
+from .content_blocks import Block
+from .docx_styles import Colors, Fonts
+
+
+STYLESHEET_NAME = "gdd.css"
+
+_SPECIAL_CHARS = re.compile(r"[&<>\"']").search
+
+
+def escape(text: str) -> str:
+    """html.escape, skipping the common case of text with nothing to escape."""
+    return _html_escape(text) if _SPECIAL_CHARS(text) else text
+
+
+def _hex(rgb: Tuple[int, int, int]) -> str:
+    return "#{:02x}{:02x}{:02x}".format(*rgb)
+
+
+# ─────────────────────────────────────────────
+# STYLESHEET
+# ─────────────────────────────────────────────
+
+def build_stylesheet() -> str:
+    """The site stylesheet, in the GDD document palette."""
+    c = {name: _hex(value) for name, value in vars(Colors).items() if isinstance(value, tuple)}
+    return f"""\
+:root {{ color-scheme: light; }}
+* {{ box-sizing: border-box; }}
+body {{
+  margin: 0; background: #fff; color: {c['BODY_TEXT']};
+  font: {Fonts.BODY_SIZE + 5}px/1.55 {Fonts.BODY_FAMILY}, "Segoe UI", Roboto, Helvetica, Arial, sans-serif;
+}}
+main, .site-nav {{ max-width: 46rem; margin: 0 auto; padding: 0 1.25rem; }}
+main {{ padding-bottom: 3rem; }}
+h1, h2, h3, h4 {{ font-family: {Fonts.HEADING_FAMILY}, Georgia, "Times New Roman", serif; line-height: 1.25; }}
+h1 {{ color: {c['HEADING_1']}; font-size: 1.9rem; margin: 1.5rem 0 1rem;
+      border-bottom: 2px solid {c['COVER_ACCENT_LINE']}; padding-bottom: .3rem; }}
+h2 {{ color: {c['HEADING_2']}; font-size: 1.45rem; margin: 1.6rem 0 .6rem; }}
+h3 {{ color: {c['HEADING_3']}; font-size: 1.15rem; margin: 1.3rem 0 .5rem; }}
+h4 {{ color: {c['HEADING_4']}; font-size: 1rem; margin: 1.1rem 0 .4rem; }}
+p, ul, ol {{ margin: 0 0 .8rem; }}
+a {{ color: {c['LINK']}; }}
+pre {{ background: {c['PLACEHOLDER_BG']}; border: 1px solid {c['PLACEHOLDER_BORDER']};
+       padding: .7rem .9rem; overflow-x: auto; font: .9em/1.45 "{Fonts.CODE_FAMILY}", monospace; }}
+.table-wrap {{ overflow-x: auto; margin: 0 0 1rem; }}
+table {{ border-collapse: collapse; width: 100%; font-size: .92em; }}
+th, td {{ border: 1px solid {c['TABLE_BORDER']}; padding: .4rem .55rem; text-align: left; vertical-align: top; }}
+th {{ background: {c['TABLE_HEADER_BG']}; color: {c['TABLE_HEADER_TEXT']}; }}
+tbody tr:nth-child(even) {{ background: {c['TABLE_ROW_ALT']}; }}
+.callout {{ margin: 0 0 1rem; padding: .6rem .9rem; border-left: 4px solid; font-size: .95em; }}
+.callout .label {{ font-weight: bold; }}
+.note {{ background: {c['DESIGNER_NOTE_BG']}; border-color: {c['DESIGNER_NOTE_BORDER']}; }}
+.note .label {{ color: {c['DESIGNER_NOTE_BORDER']}; }}
+.question {{ background: {c['OPEN_QUESTION_BG']}; border-color: {c['OPEN_QUESTION_BORDER']}; }}
+.question .label {{ color: {c['OPEN_QUESTION_BORDER']}; }}
+.diagram {{ margin: 0 0 1rem; padding: 1.6rem 1rem; text-align: center; color: {c['PLACEHOLDER_TEXT']};
+            background: {c['PLACEHOLDER_BG']}; border: 1px dashed {c['PLACEHOLDER_BORDER']}; }}
+.diagram figcaption {{ color: {c['CAPTION']}; font-size: .85em; font-style: italic; margin-top: .4rem; }}
+.site-nav {{ display: flex; justify-content: space-between; gap: 1rem; padding-top: .8rem;
+             padding-bottom: .8rem; font-size: .9em; border-bottom: 1px solid {c['TABLE_BORDER']}; }}
+.site-nav a {{ text-decoration: none; }}
+.cover {{ text-align: center; padding: 2.5rem 0 1rem; }}
+.cover h1 {{ color: {c['COVER_TITLE']}; font-size: 2.4rem; border: 0; margin-bottom: .3rem; }}
+.cover .tagline {{ color: {c['COVER_SUBTITLE']}; font-style: italic; font-size: 1.15rem; }}
+.cover .meta {{ color: {c['COVER_META']}; }}
+.cover .doc-info {{ color: {c['CAPTION']}; font-size: .9em; }}
+.toc ol {{ padding-left: 0; list-style: none; }}
+.toc li {{ padding: .45rem 0; border-bottom: 1px solid {c['TABLE_ROW_ALT']}; }}
+.toc .words {{ float: right; color: {c['CAPTION']}; font-size: .85em; }}
+.toc .placeholder a {{ color: {c['PLACEHOLDER_TEXT']}; }}
+.confidential {{ color: {c['CAPTION']}; font-size: .8em; font-style: italic; text-align: center; margin-top: 2rem; }}
+"""
+
+
+# ─────────────────────────────────────────────
+# PAGES
+# ─────────────────────────────────────────────
+
+def page(title: str, body: str, stylesheet_href: str = STYLESHEET_NAME,
+         nav: Optional[str] = None) -> str:
+    """Wrap body HTML in a complete page."""
+    return (
+        "<!DOCTYPE html>\n"
+        '<html lang="en">\n<head>\n<meta charset="utf-8">\n'
+        '<meta name="viewport" content="width=device-width, initial-scale=1">\n'
+        f"<title>{escape(title)}</title>\n"
+        f'<link rel="stylesheet" href="{escape(stylesheet_href)}">\n'
+        "</head>\n<body>\n"
+        + (f'<nav class="site-nav">{nav}</nav>\n' if nav else "")
+        + f"<main>\n{body}</main>\n</body>\n</html>\n"
+    )
+
+
+def nav_links(links: Iterable[Tuple[str, str]]) -> str:
+    """Navigation bar contents: (href, label) pairs; empty hrefs leave a gap."""
+    return "".join(
+        f'<a href="{escape(href)}">{escape(label)}</a>' if href else "<span></span>"
+        for href, label in links
+    )
+
+
+def table_html(rows: List[List[str]]) -> str:
+    """A real HTML table; the first row is the header."""
+    if not rows:
+        return ""
+    width = max(len(row) for row in rows)
+    head = "".join(f"<th>{escape(cell)}</th>" for cell in rows[0])
+    body = "".join(
+        "<tr>" + "".join(f"<td>{escape(cell)}</td>" for cell in row)
+        + "<td></td>" * (width - len(row)) + "</tr>\n"
+        for row in rows[1:]
+    )
+    return (f'<div class="table-wrap"><table>\n<thead><tr>{head}</tr></thead>\n'
+            f"<tbody>\n{body}</tbody></table></div>\n")
+
+
+def blocks_html(content_blocks: Iterable[Block]) -> str:
+    """
+    Render content blocks as HTML. Consecutive bullet / numbered blocks
+    are grouped into one list.
+    """
+    out: List[str] = []
+    open_list: Optional[str] = None
+    for kind, payload in content_blocks:
+        list_tag = {blocks.BULLET: "ul", blocks.NUMBERED: "ol"}.get(kind)
+        if open_list and list_tag != open_list:
+            out.append(f"</{open_list}>\n")
+            open_list = None
+        if list_tag:
+            if not open_list:
+                out.append(f"<{list_tag}>\n")
+                open_list = list_tag
+            out.append(f"<li>{escape(payload)}</li>\n")
+        elif kind == blocks.HEADING:
+            level, text = payload
+            out.append(f"<h{level}>{escape(text)}</h{level}>\n")
+        elif kind == blocks.PARAGRAPH:
+            out.append(f"<p>{escape(payload)}</p>\n")
+        elif kind == blocks.CODE:
+            out.append(f"<pre><code>{escape(payload)}</code></pre>\n")
+        elif kind == blocks.TABLE:
+            out.append(table_html(payload))
+        elif kind == blocks.NOTE:
+            out.append('<aside class="callout note"><span class="label">🎮 Designer\'s Note: </span>'
+                       f"{escape(payload)}</aside>\n")
+        elif kind == blocks.QUESTION:
+            out.append('<aside class="callout question"><span class="label">⚠ Open Question: </span>'
+                       f"{escape(payload)}</aside>\n")
+        elif kind == blocks.DIAGRAM:
+            out.append(f'<figure class="diagram">[ DIAGRAM: {escape(payload)} ]'
+                       f"<figcaption>Figure: {escape(payload)}</figcaption></figure>\n")
+    if open_list:
+        out.append(f"</{open_list}>\n")
+    return "".join(out)
+
+
+def section_html(title: str, content: str, subsections: Optional[List[Dict]] = None) -> str:
+    """
+    A section's body: H1, prose, and subsections (H2) with their own
+    subsections (H3), mirroring the .docx layout.
+    """
+    out = [f"<h1>{escape(title)}</h1>\n", blocks_html(blocks.iter_content_blocks(content))]
+    for sub in subsections or []:
+        if sub.get("title"):
+            out.append(f"<h2>{escape(sub['title'])}</h2>\n")
+        out.append(blocks_html(blocks.iter_content_blocks(sub.get("content", ""))))
+        for subsub in sub.get("subsections", []):
+            if subsub.get("title"):
+                out.append(f"<h3>{escape(subsub['title'])}</h3>\n")
+            out.append(blocks_html(blocks.iter_content_blocks(subsub.get("content", ""))))
+    return "".join(out)
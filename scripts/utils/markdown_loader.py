@@ -0,0 +1,227 @@
+"""
+markdown_loader.py
+------------------
+Loads a GDD written as a single Markdown file.
+
+    ---
+    game_title: Echo Chamber
+    tagline: "Fight the sound"
+    genre: Roguelike
+    version: v0.3
+    ---
+
+    # Echo Chamber
+
+    # 1. Cover Page
+    ...
+    # 5. Game Mechanics
+    Prose, - bullets, | tables |, > 🎮 notes, [OPEN QUESTION: ...] lines,
+    ## Subheadings ...
+
+Front matter holds the top-level config fields as flat "key: value" lines
+(values may be quoted; lines starting with # are comments). Numbered
+headings ("N. Section Name") start sections and map to their registry keys
+by name, or by number when the name is not a registry name. Sections may
+be level 1 or level 2 headings (the examples/*_outline.md files use ## under
+a # title); the level of the first one is used for the whole file and the
+headings below it move up to match. Section bodies are kept as the section
+prose markup the generators already parse; horizontal rules are dropped.
+Text before the first section is ignored apart from a leading # title,
+which becomes game_title when the front matter has none.
+
+The file is parsed line by line into the config dict, with no JSON in
+between.
+
+Usage:
+    game_data = load_markdown("MyGame_GDD.md")
+"""
+
+import re
+from typing import Dict, Iterable, List, Optional
+
+from .section_registry import section_key_for_heading
+
+
+MARKDOWN_EXTENSIONS = (".md", ".markdown")
+
+_HEADING_RE = re.compile(r"^(?P<hashes>#{1,6})[ \t]+(?P<text>.+?)[ \t]*#*[ \t]*$")
+_FRONT_MATTER_RE = re.compile(r"^(?P<key>[A-Za-z_][\w-]*)\s*:\s*(?P<value>.*)$")
+# Lines that need a look of their own: headings, ``` fences, horizontal rules.
+# Matched with their leading newline, so the scan only stops at line starts.
+_MARKER_LINE_RE = re.compile(
+    r"\n(?=[ \t]*[#`*_-])(?:#{1,6}[ \t][^\n]*|[ \t]*```[^\n]*|[ \t]*([-*_])(?:[ \t]*\1){2,}[ \t]*)(?=\n|$)"
+)
+_LEADING_BLANK_RE = re.compile(r"(?:[ \t]*\n)*")
+_FENCE = "```"
+_CHUNK_SIZE = 1 << 20
+
+
+def is_markdown_config(path: str) -> bool:
+    """True for a .md / .markdown config path."""
+    return path.lower().endswith(MARKDOWN_EXTENSIONS)
+
+
+def _unquote(value: str) -> str:
+    value = value.strip()
+    if len(value) >= 2 and value[0] == value[-1] and value[0] in "\"'":
+        return value[1:-1]
+    return value
+
+
+def _decode(data: bytes, encoding: str = "utf-8") -> str:
+    text = data.decode(encoding)
+    return text.replace("\r\n", "\n") if "\r" in text else text
+
+
+def parse_front_matter(lines: Iterable[str], path: str = "<markdown>") -> Dict[str, str]:
+    """
+    Parse front matter lines (between the --- fences) into a dict.
+
+    Raises:
+        ValueError: On a line that is not "key: value", a comment or blank.
+    """
+    fields: Dict[str, str] = {}
+    for number, line in enumerate(lines, start=2):
+        stripped = line.strip()
+        if not stripped or stripped.startswith("#"):
+            continue
+        match = _FRONT_MATTER_RE.match(stripped)
+        if not match:
+            raise ValueError(f"{path}:{number}: front matter lines must be 'key: value'")
+        fields[match.group("key")] = _unquote(match.group("value"))
+    return fields
+
+
+class _SectionBuilder:
+    """Collects section bodies from a stream of Markdown text."""
+
+    def __init__(self, warnings: List[str]):
+        self.warnings = warnings
+        self.sections: Dict[str, str] = {}
+        self.title: Optional[str] = None
+        self.level: Optional[int] = None
+        self._key: Optional[str] = None
+        self._parts: List[str] = []
+        self._in_code = False
+
+    def _finish(self) -> None:
+        if self._key is None:
+            return
+        content = "".join(self._parts)
+        content = content[_LEADING_BLANK_RE.match(content).end():].rstrip()
+        if self._key in self.sections:
+            self.warnings.append(f"Section '{self._key}' appears twice; contents joined")
+            content = self.sections[self._key] + "\n\n" + content
+        self.sections[self._key] = content
+        self._parts = []
+
+    def _heading(self, level: int, text: str) -> Optional[str]:
+        """Handle a heading line; returns the line to keep, or None."""
+        key = section_key_for_heading(text) if self.level in (None, level) else None
+        if key is not None and level <= 2:
+            self._finish()
+            self.level = level
+            self._key = key
+            return None
+        if self._key is None:
+            if level == 1 and self.title is None:
+                self.title = text
+            return None
+        if level <= self.level:
+            self.warnings.append(f"Heading '{text}' is not a GDD section; "
+                                 f"kept as a subheading of '{self._key}'")
+            level = self.level + 1
+        return "#" * min(level - self.level + 1, 4) + " " + text
+
+    def _marker_line(self, line: str) -> Optional[str]:
+        """Handle a heading, fence or rule line; returns the line to keep, or None."""
+        if line.lstrip().startswith(_FENCE):
+            self._in_code = not self._in_code
+            return line
+        if self._in_code:
+            return line
+        match = _HEADING_RE.match(line)
+        if match:
+            return self._heading(len(match.group("hashes")), match.group("text"))
+        return None  # horizontal rule
+
+    def feed(self, text: str) -> None:
+        """
+        Take the next run of whole lines (ending in a newline, except at
+        the end of the file). Only heading, fence and rule lines are looked
+        at one by one; the prose between them is copied in bulk.
+        """
+        text = "\n" + text
+        position = 1
+        for match in _MARKER_LINE_RE.finditer(text):
+            if self._key is not None:
+                self._parts.append(text[position:match.start() + 1])
+            line = self._marker_line(match.group()[1:])
+            if line is not None and self._key is not None:
+                self._parts.append(line)
+            # A dropped line takes its newline with it; a kept one's starts the next run
+            position = match.end() + (line is None)
+        if self._key is not None:
+            self._parts.append(text[position:])
+
+    def close(self) -> Dict[str, str]:
+        self._finish()
+        return self.sections
+
+
+def load_markdown(path: str, warnings: Optional[List[str]] = None) -> Dict:
+    """
+    Load a Markdown GDD into a config dict.
+
+    Args:
+        path: Path to the .md file.
+        warnings: Optional list that collects parse warnings.
+
+    Returns:
+        The game data dictionary (front matter fields plus "sections").
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+        ValueError: If the front matter is malformed or never closed, or
+            the file is not UTF-8.
+    """
+    warnings = warnings if warnings is not None else []
+    builder = _SectionBuilder(warnings)
+    fields: Dict[str, str] = {}
+    # Read as bytes and decode a chunk at a time: a newline byte never sits
+    # inside a UTF-8 sequence, so chunks cut at newlines decode on their own
+    with open(path, "rb") as f:
+        first = _decode(f.readline(), "utf-8-sig")
+        if first.strip() == "---":
+            matter: List[str] = []
+            for line in f:
+                text = _decode(line)
+                if text.strip() in ("---", "..."):
+                    break
+                matter.append(text)
+            else:
+                raise ValueError(f"{path}: front matter is not closed with ---")
+            fields = parse_front_matter(matter, path)
+        else:
+            builder.feed(first)
+        pending = b""
+        while True:
+            chunk = f.read(_CHUNK_SIZE)
+            if not chunk:
+                break
+            chunk = pending + chunk
+            cut = chunk.rfind(b"\n") + 1
+            builder.feed(_decode(chunk[:cut]))
+            pending = chunk[cut:]
+        if pending:
+            builder.feed(_decode(pending))
+
+    sections = builder.close()
+    if not sections:
+        warnings.append("No numbered section headings found (e.g. '# 5. Game Mechanics')")
+    game_data: Dict = dict(fields)
+    if builder.title and "game_title" not in game_data:
+        game_data["game_title"] = builder.title
+    game_data["sections"] = sections
+    return game_data
+
@@ -0,0 +1,419 @@
+"""
+office_pool.py
+--------------
+Pool of long-lived headless converter processes for batch DOCX→PDF.
+
+Starting an office suite costs seconds, so converting a catalog one
+`docx2pdf` call at a time pays that cold start for every file. A
+ConverterPool keeps N converter processes alive and feeds them jobs:
+
+  - each worker is health-checked before it takes a job and restarted if
+    it has died or stopped answering,
+  - every job has a timeout; a worker that overruns it is killed and
+    restarted, and the job fails with ConversionTimeout,
+  - workers are recycled after K jobs to cap leaks in the office process.
+
+Backends are pluggable (ConverterBackend):
+  - UnoserverBackend: LibreOffice kept running by `unoserver`, driven with
+    `unoconvert` (pip install unoserver; needs LibreOffice installed).
+  - StdioBackend: any long-lived command speaking a JSON-lines protocol on
+    stdin/stdout. serve_stdio() implements the server side; the GDD PDF
+    script exposes it as `generate_gdd_pdf.py --serve-stdio` using its
+    in-process converter, which makes a local stand-in for tests.
+
+Usage:
+    with ConverterPool(UnoserverBackend, size=4) as pool:
+        for result in pool.convert_many(pairs):
+            print(result.src, result.ok, result.error)
+"""
+
+import json
+import os
+import queue
+import shutil
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Iterable, List, NamedTuple, Optional, Tuple
+
+
+class ConversionError(RuntimeError):
+    """A converter rejected or failed a job."""
+
+
+class ConversionTimeout(ConversionError):
+    """A job exceeded the pool's per-job timeout."""
+
+
+class ConversionResult(NamedTuple):
+    src: str
+    dst: str
+    ok: bool
+    error: str
+    seconds: float
+
+
+# ─────────────────────────────────────────────
+# BACKENDS
+# ─────────────────────────────────────────────
+
+class ConverterBackend(ABC):
+    """
+    One converter process. Subclasses implement start/stop/is_healthy/convert;
+    the pool calls them from a single worker thread at a time.
+    """
+
+    name = "converter"
+
+    @abstractmethod
+    def start(self) -> None:
+        """Start the converter process."""
+
+    @abstractmethod
+    def stop(self) -> None:
+        """Shut the converter process down."""
+
+    def kill(self) -> None:
+        """Stop immediately, e.g. after a job timed out. Defaults to stop()."""
+        self.stop()
+
+    @abstractmethod
+    def is_healthy(self) -> bool:
+        """True if the process is running and answering."""
+
+    @abstractmethod
+    def convert(self, src: str, dst: str, timeout: float) -> None:
+        """Convert src to dst; raise ConversionError / ConversionTimeout."""
+
+
+class UnoserverBackend(ConverterBackend):
+    """
+    LibreOffice held open by `unoserver`, one instance (with its own user
+    profile and ports) per pool worker.
+
+    Args:
+        index: Worker index; selects the port pair base_port + 2 * index.
+        host: Interface unoserver listens on.
+        base_port: First XML-RPC port; the UNO port is the next one up.
+        unoserver / unoconvert: Executables (resolved on PATH).
+        startup_timeout: Seconds to wait for the server to accept connections.
+    """
+
+    name = "unoserver"
+
+    def __init__(self, index: int, host: str = "127.0.0.1", base_port: int = 2003,
+                 unoserver: str = "unoserver", unoconvert: str = "unoconvert",
+                 startup_timeout: float = 60.0):
+        self.host = host
+        self.port = base_port + 2 * index
+        self.uno_port = self.port + 1
+        self.unoserver = unoserver
+        self.unoconvert = unoconvert
+        self.startup_timeout = startup_timeout
+        self._proc: Optional[subprocess.Popen] = None
+        self._profile: Optional[str] = None
+
+    def start(self) -> None:
+        server = shutil.which(self.unoserver)
+        if server is None or shutil.which(self.unoconvert) is None:
+            raise ConversionError(
+                "unoserver/unoconvert not found. Install with: pip install unoserver "
+                "(LibreOffice must also be installed)."
+            )
+        self._profile = tempfile.mkdtemp(prefix="gdd-office-")
+        self._proc = subprocess.Popen(
+            [server, "--interface", self.host,
+             "--port", str(self.port), "--uno-port", str(self.uno_port),
+             "--user-installation", Path(self._profile).as_uri()],
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+            start_new_session=True,  # Own process group, shared with its soffice child
+        )
+        deadline = time.monotonic() + self.startup_timeout
+        while time.monotonic() < deadline:
+            if self.is_healthy():
+                return
+            if self._proc.poll() is not None:
+                break
+            time.sleep(0.25)
+        self.stop()
+        raise ConversionError(f"unoserver on port {self.port} did not start")
+
+    def _signal_group(self, terminate: bool) -> None:
+        """
+        Terminate or kill unoserver's process group, so its soffice child
+        goes too and frees the UNO port (the process alone off POSIX).
+        """
+        if hasattr(os, "killpg"):
+            try:
+                os.killpg(self._proc.pid, signal.SIGTERM if terminate else signal.SIGKILL)
+            except ProcessLookupError:
+                pass  # The whole group has already exited
+        elif terminate:
+            self._proc.terminate()
+        else:
+            self._proc.kill()
+
+    def stop(self) -> None:
+        if self._proc is not None:
+            self._signal_group(terminate=True)
+            try:
+                self._proc.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                self._signal_group(terminate=False)
+                self._proc.wait()
+            # unoserver is gone; make sure no soffice outlived it
+            self._signal_group(terminate=False)
+            self._proc = None
+        if self._profile:
+            shutil.rmtree(self._profile, ignore_errors=True)
+            self._profile = None
+
+    def kill(self) -> None:
+        if self._proc is not None:
+            self._signal_group(terminate=False)
+            self._proc.wait()
+            self._proc = None
+        self.stop()
+
+    def is_healthy(self) -> bool:
+        if self._proc is None or self._proc.poll() is not None:
+            return False
+        try:
+            with socket.create_connection((self.host, self.port), timeout=2):
+                return True
+        except OSError:
+            return False
+
+    def convert(self, src: str, dst: str, timeout: float) -> None:
+        try:
+            done = subprocess.run(
+                [shutil.which(self.unoconvert) or self.unoconvert,
+                 "--host", self.host, "--port", str(self.port),
+                 "--convert-to", "pdf", src, dst],
+                capture_output=True, text=True, timeout=timeout,
+            )
+        except subprocess.TimeoutExpired as e:
+            raise ConversionTimeout(f"{src}: no result after {timeout:.0f}s") from e
+        if done.returncode != 0:
+            raise ConversionError(f"{src}: {done.stderr.strip() or 'unoconvert failed'}")
+
+
+class StdioBackend(ConverterBackend):
+    """
+    Long-lived command speaking JSON lines on stdin/stdout (see serve_stdio).
+
+    Requests:  {"op": "ping"} or {"op": "convert", "src": ..., "dst": ...}
+    Responses: {"ok": true} or {"ok": false, "error": "..."}
+
+    Args:
+        command: argv of the converter process.
+        ping_timeout: Seconds a health-check ping may take.
+    """
+
+    name = "stdio"
+
+    def __init__(self, command: List[str], ping_timeout: float = 10.0):
+        self.command = command
+        self.ping_timeout = ping_timeout
+        self._proc: Optional[subprocess.Popen] = None
+        self._replies: "queue.Queue[Optional[str]]" = queue.Queue()
+
+    def start(self) -> None:
+        self._replies = queue.Queue()
+        self._proc = subprocess.Popen(
+            self.command, stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL, text=True, encoding="utf-8", bufsize=1,
+        )
+        threading.Thread(
+            target=self._read_replies, args=(self._proc, self._replies), daemon=True
+        ).start()
+        if not self.is_healthy():
+            self.stop()
+            raise ConversionError(f"converter did not answer: {' '.join(self.command)}")
+
+    @staticmethod
+    def _read_replies(proc: subprocess.Popen, replies: "queue.Queue[Optional[str]]") -> None:
+        for line in proc.stdout:
+            replies.put(line)
+        replies.put(None)  # EOF: process exited
+
+    def _request(self, message: dict, timeout: float) -> dict:
+        if self._proc is None or self._proc.poll() is not None:
+            raise ConversionError("converter process is not running")
+        try:
+            self._proc.stdin.write(json.dumps(message) + "\n")
+            self._proc.stdin.flush()
+        except OSError as e:
+            raise ConversionError(f"converter process went away: {e}") from e
+        try:
+            line = self._replies.get(timeout=timeout)
+        except queue.Empty:
+            raise ConversionTimeout(f"no reply after {timeout:.0f}s") from None
+        if line is None:
+            raise ConversionError("converter process exited")
+        try:
+            reply = json.loads(line)
+        except ValueError:
+            reply = None
+        if not isinstance(reply, dict):
+            raise ConversionError(f"converter sent a malformed reply: {line.strip()[:200]!r}")
+        return reply
+
+    def stop(self) -> None:
+        if self._proc is None:
+            return
+        try:
+            self._proc.stdin.close()
+            self._proc.wait(timeout=5)
+        except (OSError, subprocess.TimeoutExpired):
+            self._proc.kill()
+            self._proc.wait()
+        self._proc = None
+
+    def kill(self) -> None:
+        if self._proc is not None:
+            self._proc.kill()
+            self._proc.wait()
+            self._proc = None
+
+    def is_healthy(self) -> bool:
+        try:
+            return bool(self._request({"op": "ping"}, self.ping_timeout).get("ok"))
+        except ConversionError:
+            return False
+
+    def convert(self, src: str, dst: str, timeout: float) -> None:
+        reply = self._request({"op": "convert", "src": src, "dst": dst}, timeout)
+        if not reply.get("ok"):
+            raise ConversionError(f"{src}: {reply.get('error', 'conversion failed')}")
+
+
+def serve_stdio(convert: Callable[[str, str], None], stdin=None, stdout=None) -> None:
+    """
+    Run the server side of the StdioBackend protocol until stdin closes.
+
+    Args:
+        convert: Function converting a .docx path to a .pdf path.
+    """
+    stdin = stdin or sys.stdin
+    stdout = stdout or sys.stdout
+    for line in stdin:
+        try:
+            message = json.loads(line)
+            if message.get("op") == "convert":
+                convert(message["src"], message["dst"])
+            reply = {"ok": True}
+        except Exception as e:  # report every failure to the client, keep serving
+            reply = {"ok": False, "error": str(e)}
+        stdout.write(json.dumps(reply) + "\n")
+        stdout.flush()
+
+
+# ─────────────────────────────────────────────
+# POOL
+# ─────────────────────────────────────────────
+
+class _Worker:
+    """A backend plus its lifecycle bookkeeping."""
+
+    def __init__(self, backend: ConverterBackend, max_jobs: int):
+        self.backend = backend
+        self.max_jobs = max_jobs
+        self.running = False
+        self.jobs = 0
+        self.starts = 0
+
+    def _restart(self) -> None:
+        if self.running:
+            self.backend.stop()
+            self.running = False
+        self.backend.start()
+        self.running = True
+        self.jobs = 0
+        self.starts += 1
+
+    def run(self, src: str, dst: str, timeout: float) -> None:
+        if not self.running or self.jobs >= self.max_jobs or not self.backend.is_healthy():
+            self._restart()
+        self.jobs += 1
+        try:
+            self.backend.convert(src, dst, timeout)
+        except ConversionTimeout:
+            # The process may still be chewing on the job: replace it
+            self.backend.kill()
+            self.running = False
+            raise
+
+    def stop(self) -> None:
+        if self.running:
+            self.backend.stop()
+            self.running = False
+
+
+class ConverterPool:
+    """
+    Keep `size` converter processes alive and distribute jobs across them.
+
+    Args:
+        backend_factory: Called with the worker index to create its backend.
+        size: Number of converter processes.
+        job_timeout: Seconds a single conversion may take.
+        max_jobs_per_worker: Restart a converter after this many jobs.
+    """
+
+    def __init__(self, backend_factory: Callable[[int], ConverterBackend], size: int = 2,
+                 job_timeout: float = 120.0, max_jobs_per_worker: int = 50):
+        self.size = max(1, size)
+        self.job_timeout = job_timeout
+        self._workers = [_Worker(backend_factory(i), max(1, max_jobs_per_worker))
+                         for i in range(self.size)]
+        self._idle: "queue.Queue[_Worker]" = queue.Queue()
+        for worker in self._workers:
+            self._idle.put(worker)
+        self._executor = ThreadPoolExecutor(max_workers=self.size,
+                                            thread_name_prefix="gdd-convert")
+
+    def __enter__(self) -> "ConverterPool":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    @property
+    def cold_starts(self) -> int:
+        """Number of converter process starts so far."""
+        return sum(worker.starts for worker in self._workers)
+
+    def _run(self, src: str, dst: str) -> ConversionResult:
+        worker = self._idle.get()
+        started = time.perf_counter()
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(dst)), exist_ok=True)
+            worker.run(os.path.abspath(src), os.path.abspath(dst), self.job_timeout)
+            return ConversionResult(src, dst, True, "", time.perf_counter() - started)
+        except (ConversionError, OSError) as e:
+            return ConversionResult(src, dst, False, str(e), time.perf_counter() - started)
+        finally:
+            self._idle.put(worker)
+
+    def submit(self, src: str, dst: str) -> "Future[ConversionResult]":
+        """Queue one conversion; the future resolves to a ConversionResult."""
+        return self._executor.submit(self._run, src, dst)
+
+    def convert_many(self, jobs: Iterable[Tuple[str, str]]) -> List[ConversionResult]:
+        """Convert (src, dst) pairs across the pool; results keep input order."""
+        futures = [self.submit(src, dst) for src, dst in jobs]
+        return [future.result() for future in futures]
+
+    def close(self) -> None:
+        """Wait for queued jobs, then stop every converter process."""
+        self._executor.shutdown(wait=True)
+        for worker in self._workers:
+            worker.stop()
@@ -43,6 +43,7 @@ def _sanitize_text(text: str) -> str:
         "\u03A3": "Sigma",  # sigma
         "\U0001F3AE": "[Game]",  # game controller emoji
         "\u26A0": "[!]",  # warning sign
+        "\u2500": "-",    # box drawing horizontal (DOCX cover rule)
     }
     for char, replacement in replacements.items():
         text = text.replace(char, replacement)
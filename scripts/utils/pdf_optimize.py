@@ -0,0 +1,361 @@
+"""
+pdf_optimize.py
+---------------
+Size optimization pass for PDFs written by fpdf2 (GDDDocument, OnePager).
+
+fpdf2 writes one plain object per resource and a classic cross-reference
+table, and gives every page its own (usually identical) /Resources
+dictionary. This module rewrites that output into a compact PDF 1.5 file:
+
+  - identical objects (resource dictionaries, fonts, images, graphics
+    states) are collapsed into a single shared object
+  - uncompressed streams are Flate-compressed and existing Flate streams
+    are recompressed at the maximum level when that makes them smaller
+  - non-stream objects are packed into object streams (/Type /ObjStm)
+  - the xref table and trailer are replaced by a compressed xref stream
+
+The pass is lossless: page content and rendering are unchanged. Input that
+does not look like plain fpdf2 output (incremental updates, encryption,
+indirect stream lengths) is returned untouched.
+"""
+
+import hashlib
+import re
+import zlib
+from typing import Dict, List, Optional, Tuple
+
+OBJECTS_PER_STREAM = 100
+
+_OBJ_HEADER_RE = re.compile(rb"(\d+) (\d+) obj\s*")
+_REF_RE = re.compile(rb"(\d+) 0 R\b")
+_LENGTH_RE = re.compile(rb"/Length (\d+)(?!\s+\d+\s+R)")
+_FILTER_RE = re.compile(rb"/Filter\s*/FlateDecode")
+_STREAM_RE = re.compile(rb">>\s*stream(\r\n|\n)")
+
+
+class _PdfObject:
+    """A single indirect object: dictionary/value text plus optional stream data."""
+
+    __slots__ = ("num", "body", "stream")
+
+    def __init__(self, num: int, body: bytes, stream: Optional[bytes]):
+        self.num = num
+        self.body = body
+        self.stream = stream
+
+
+# ─────────────────────────────────────────────
+# PARSING
+# ─────────────────────────────────────────────
+
+def _parse_objects(data: bytes) -> Optional[Tuple[Dict[int, _PdfObject], bytes]]:
+    """
+    Split fpdf2 output into indirect objects and the trailer dictionary.
+
+    Returns None if the file uses features this pass does not handle.
+    """
+    if data.count(b"%%EOF") != 1 or b"/Encrypt" in data:
+        return None
+
+    objects: Dict[int, _PdfObject] = {}
+    pos = 0
+    while True:
+        match = _OBJ_HEADER_RE.search(data, pos)
+        if match is None:
+            break
+        if match.group(2) != b"0":
+            return None
+        num = int(match.group(1))
+        start = match.end()
+        end_kw = data.find(b"endobj", start)
+        if end_kw == -1:
+            return None
+        stream_kw = _STREAM_RE.search(data, start, end_kw)
+        if stream_kw is not None:
+            body = data[start:stream_kw.start() + 2].rstrip()
+            length = _LENGTH_RE.search(body)
+            if length is None:
+                return None
+            stream_start = stream_kw.end()
+            stream_end = stream_start + int(length.group(1))
+            stream = data[stream_start:stream_end]
+            end_kw = data.find(b"endobj", stream_end)
+            if end_kw == -1:
+                return None
+            objects[num] = _PdfObject(num, body, stream)
+        else:
+            objects[num] = _PdfObject(num, data[start:end_kw].strip(), None)
+        pos = end_kw + len(b"endobj")
+
+    trailer_at = data.rfind(b"trailer")
+    if not objects or trailer_at == -1:
+        return None
+    trailer_end = data.find(b"startxref", trailer_at)
+    trailer = data[trailer_at + len(b"trailer"):trailer_end].strip()
+    return objects, trailer
+
+
+def _split_strings(body: bytes) -> List[Tuple[bool, bytes]]:
+    """
+    Split an object body into (is_string, chunk) pieces so that references
+    are only rewritten outside of literal "( ... )" and hex "< ... >" strings.
+    """
+    chunks: List[Tuple[bool, bytes]] = []
+    i = 0
+    last = 0
+    n = len(body)
+    while i < n:
+        ch = body[i:i + 1]
+        if ch == b"(":
+            chunks.append((False, body[last:i]))
+            depth = 0
+            j = i
+            while j < n:
+                c = body[j:j + 1]
+                if c == b"\\":
+                    j += 2
+                    continue
+                if c == b"(":
+                    depth += 1
+                elif c == b")":
+                    depth -= 1
+                    if depth == 0:
+                        break
+                j += 1
+            chunks.append((True, body[i:j + 1]))
+            i = last = j + 1
+        elif ch == b"<" and body[i + 1:i + 2] != b"<":
+            chunks.append((False, body[last:i]))
+            j = body.find(b">", i)
+            j = n - 1 if j == -1 else j
+            chunks.append((True, body[i:j + 1]))
+            i = last = j + 1
+        elif ch == b"<":
+            i += 2
+        else:
+            i += 1
+    chunks.append((False, body[last:]))
+    return chunks
+
+
+def _rewrite_refs(body: bytes, mapping: Dict[int, int]) -> bytes:
+    """Rewrite "N 0 R" references in an object body according to mapping."""
+    if b" R" not in body:
+        return body
+
+    def _sub(m: "re.Match") -> bytes:
+        num = int(m.group(1))
+        return b"%d 0 R" % mapping.get(num, num)
+
+    return b"".join(
+        chunk if is_string else _REF_RE.sub(_sub, chunk)
+        for is_string, chunk in _split_strings(body)
+    )
+
+
+# ─────────────────────────────────────────────
+# OPTIMIZATION STEPS
+# ─────────────────────────────────────────────
+
+def _recompress(obj: _PdfObject) -> None:
+    """Flate-compress (or recompress at level 9) a stream when it gets smaller."""
+    if obj.stream is None:
+        return
+    if _FILTER_RE.search(obj.body):
+        if b"/DecodeParms" in obj.body:
+            return
+        try:
+            raw = zlib.decompress(obj.stream)
+        except zlib.error:
+            return
+        packed = zlib.compress(raw, 9)
+        if len(packed) < len(obj.stream):
+            obj.stream = packed
+    elif b"/Filter" not in obj.body:
+        packed = zlib.compress(obj.stream, 9)
+        if len(packed) < len(obj.stream):
+            obj.stream = packed
+            obj.body = obj.body.replace(b"<<", b"<<\n/Filter /FlateDecode", 1)
+    obj.body = _LENGTH_RE.sub(b"/Length %d" % len(obj.stream), obj.body, count=1)
+
+
+def _deduplicate(objects: Dict[int, _PdfObject], protected: set) -> int:
+    """
+    Collapse byte-identical objects into one, repeating until no further
+    merges happen (merging fonts can make resource dictionaries identical).
+
+    Returns the number of objects removed.
+    """
+    removed = 0
+    while True:
+        seen: Dict[bytes, int] = {}
+        mapping: Dict[int, int] = {}
+        for num in sorted(objects):
+            obj = objects[num]
+            if num in protected or b"/Type /Page\n" in obj.body or obj.body.endswith(b"/Type /Page"):
+                continue
+            digest = hashlib.sha256(obj.body + b"\x00" + (obj.stream or b"")).digest()
+            if obj.stream is None:
+                digest = b"o" + digest
+            if digest in seen:
+                mapping[num] = seen[digest]
+            else:
+                seen[digest] = num
+        if not mapping:
+            return removed
+        for num in mapping:
+            del objects[num]
+        removed += len(mapping)
+        for obj in objects.values():
+            obj.body = _rewrite_refs(obj.body, mapping)
+
+
+def _trailer_value(trailer: bytes, key: bytes) -> Optional[bytes]:
+    """Return the raw value of a simple trailer key (/Root, /Info, /ID)."""
+    if key == b"/ID":
+        m = re.search(rb"/ID\s*(\[[^\]]*\])", trailer)
+    else:
+        m = re.search(re.escape(key) + rb"\s+(\d+ 0 R)", trailer)
+    return m.group(1) if m else None
+
+
+def _write_compact(objects: Dict[int, _PdfObject], trailer: bytes) -> bytes:
+    """Serialize objects as PDF 1.5 with object streams and an xref stream."""
+    old_nums = sorted(objects)
+    renumber = {old: new for new, old in enumerate(old_nums, start=1)}
+    for obj in objects.values():
+        obj.body = _rewrite_refs(obj.body, renumber)
+    trailer = _rewrite_refs(trailer, renumber)
+    ordered = [objects[old] for old in old_nums]
+    for new, obj in enumerate(ordered, start=1):
+        obj.num = new
+
+    plain = [o for o in ordered if o.stream is None]
+    streamed = [o for o in ordered if o.stream is not None]
+    next_num = len(ordered) + 1
+
+    out = bytearray(b"%PDF-1.5\n%\xe2\xe3\xcf\xd3\n")
+    # xref entries: num -> (type, field2, field3)
+    entries: Dict[int, Tuple[int, int, int]] = {0: (0, 0, 65535)}
+
+    for obj in streamed:
+        entries[obj.num] = (1, len(out), 0)
+        out += b"%d 0 obj\n%s\nstream\n" % (obj.num, obj.body)
+        out += obj.stream
+        out += b"\nendstream\nendobj\n"
+
+    for chunk_start in range(0, len(plain), OBJECTS_PER_STREAM):
+        chunk = plain[chunk_start:chunk_start + OBJECTS_PER_STREAM]
+        stm_num = next_num
+        next_num += 1
+        header = bytearray()
+        payload = bytearray()
+        for index, obj in enumerate(chunk):
+            header += b"%d %d " % (obj.num, len(payload))
+            payload += obj.body + b"\n"
+            entries[obj.num] = (2, stm_num, index)
+        raw = bytes(header) + bytes(payload)
+        packed = zlib.compress(raw, 9)
+        entries[stm_num] = (1, len(out), 0)
+        out += (
+            b"%d 0 obj\n<<\n/Type /ObjStm\n/N %d\n/First %d\n/Filter /FlateDecode\n"
+            b"/Length %d\n>>\nstream\n" % (stm_num, len(chunk), len(header), len(packed))
+        )
+        out += packed
+        out += b"\nendstream\nendobj\n"
+
+    xref_num = next_num
+    size = xref_num + 1
+    entries[xref_num] = (1, len(out), 0)
+    rows = bytearray()
+    for num in range(size):
+        kind, f2, f3 = entries.get(num, (0, 0, 0))
+        rows += bytes([kind]) + f2.to_bytes(4, "big") + f3.to_bytes(2, "big")
+    packed_rows = zlib.compress(bytes(rows), 9)
+
+    extra = b""
+    for key in (b"/Root", b"/Info"):
+        value = _trailer_value(trailer, key)
+        if value:
+            extra += b"%s %s\n" % (key, value)
+    doc_id = _trailer_value(trailer, b"/ID")
+    if doc_id:
+        extra += b"/ID %s\n" % doc_id
+
+    xref_offset = len(out)
+    out += (
+        b"%d 0 obj\n<<\n/Type /XRef\n/Size %d\n/W [1 4 2]\n%s/Filter /FlateDecode\n"
+        b"/Length %d\n>>\nstream\n" % (xref_num, size, extra, len(packed_rows))
+    )
+    out += packed_rows
+    out += b"\nendstream\nendobj\nstartxref\n%d\n%%%%EOF\n" % xref_offset
+    return bytes(out)
+
+
+# ─────────────────────────────────────────────
+# PUBLIC API
+# ─────────────────────────────────────────────
+
+def optimize_pdf_bytes(data: bytes) -> Tuple[bytes, Dict[str, int]]:
+    """
+    Apply the size optimization profile to a PDF produced by fpdf2.
+
+    Args:
+        data: Complete PDF file contents (e.g. the return value of FPDF.output()).
+
+    Returns:
+        Tuple of (optimized PDF bytes, report dict). The report contains
+        original_bytes, optimized_bytes, objects_before, objects_after,
+        duplicates_removed and object_streams. If the input could not be
+        processed, the original bytes are returned and optimized_bytes
+        equals original_bytes.
+    """
+    data = bytes(data)
+    report = {
+        "original_bytes": len(data),
+        "optimized_bytes": len(data),
+        "objects_before": 0,
+        "objects_after": 0,
+        "duplicates_removed": 0,
+        "object_streams": 0,
+    }
+    parsed = _parse_objects(data)
+    if parsed is None:
+        return data, report
+    objects, trailer = parsed
+    report["objects_before"] = len(objects)
+
+    protected = set()
+    for key in (b"/Root", b"/Info"):
+        value = _trailer_value(trailer, key)
+        if value:
+            protected.add(int(value.split()[0]))
+
+    for obj in objects.values():
+        _recompress(obj)
+    report["duplicates_removed"] = _deduplicate(objects, protected)
+
+    plain_count = sum(1 for o in objects.values() if o.stream is None)
+    report["object_streams"] = -(-plain_count // OBJECTS_PER_STREAM)
+    optimized = _write_compact(objects, trailer)
+    report["objects_after"] = len(objects)
+
+    if len(optimized) >= len(data):
+        return data, report
+    report["optimized_bytes"] = len(optimized)
+    return optimized, report
+
+
+def format_size_report(report: Dict[str, int]) -> str:
+    """Format an optimize_pdf_bytes() report as a short before/after summary."""
+    before = report["original_bytes"]
+    after = report["optimized_bytes"]
+    saved = before - after
+    pct = (saved / before * 100) if before else 0.0
+    return (
+        f"Size: {before / 1024:,.1f} KB → {after / 1024:,.1f} KB "
+        f"(-{pct:.1f}%, {saved / 1024:,.1f} KB saved)\n"
+        f"  Objects: {report['objects_before']} → {report['objects_after']} "
+        f"({report['duplicates_removed']} duplicates merged, "
+        f"{report['object_streams']} object streams)"
+    )
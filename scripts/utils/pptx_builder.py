@@ -4,30 +4,62 @@ pptx_builder.py
 PowerPoint utility functions for GDD pitch deck generation using python-pptx.
 Provides slide layout templates, text box creation, color theme management,
 bullet list rendering, and slide builders for title, content, and comparison slides.
+
+The static chrome of each slide kind (background, accent bars, slide number)
+lives in custom slide layouts built once per presentation from the PitchTheme
+("GDD Title", "GDD Content", "GDD Closing"); slides only add their own text
+and content shapes on top, so edits to a layout apply to the whole deck.
+
+Text boxes can autofit in-process (utils.text_fit): the largest font size
+that fits the box is chosen from TrueType metrics, and content slides move
+text that cannot fit even at MIN_FONT_SIZE onto continuation slides.
+
+For multi-theme output, a deck can be built once with symbolic_theme(),
+which turns every theme color into a reference to a slot of the
+presentation's color scheme (and the fonts into theme font references).
+write_theme_variant() then produces each PitchTheme variant by rewriting
+only the theme part (ppt/theme/theme1.xml) of that package.
 """
 
+import copy
+import io
+import re
+import zipfile
 from typing import List, Tuple, Optional, Dict, Any
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields, replace
+from xml.sax.saxutils import escape
 
 try:
     from pptx import Presentation
     from pptx.util import Inches, Pt, Emu
     from pptx.dml.color import RGBColor
-    from pptx.enum.text import PP_ALIGN
+    from pptx.enum.text import PP_ALIGN, MSO_AUTO_SIZE
+    from pptx.enum.dml import MSO_THEME_COLOR
     from pptx.util import Emu
+    from pptx.opc.constants import CONTENT_TYPE as CT, RELATIONSHIP_TYPE as RT
+    from pptx.oxml.ns import qn
+    from pptx.oxml.xmlchemy import OxmlElement
+    from pptx.parts.slide import SlideLayoutPart
+    from pptx.shapes.shapetree import SlideShapes
     PPTX_AVAILABLE = True
 except ImportError:
     PPTX_AVAILABLE = False
-    Presentation = Inches = Pt = Emu = RGBColor = PP_ALIGN = None
+    Presentation = Inches = Pt = Emu = RGBColor = PP_ALIGN = MSO_THEME_COLOR = None
+
+from .text_fit import Paragraph, fit_text, scaled_size, PIL_AVAILABLE as TEXT_FIT_AVAILABLE
 
 
 # ─────────────────────────────────────────────
 # THEME DEFINITION
 # ─────────────────────────────────────────────
 
-@dataclass
+@dataclass(frozen=True)
 class PitchTheme:
-    """Color and font theme for the pitch deck."""
+    """
+    Color and font theme for the pitch deck. Frozen, so one theme can be
+    shared by renders on several threads; derive variants with
+    dataclasses.replace() or theme_from_dict().
+    """
     # Backgrounds
     bg_dark: Tuple[int, int, int] = (15, 23, 42)         # Dark navy
     bg_slide: Tuple[int, int, int] = (22, 33, 57)         # Slightly lighter navy
@@ -57,6 +89,148 @@ class PitchTheme:
 # Default theme
 DEFAULT_THEME = PitchTheme()
 
+# Smallest font size autofit may shrink text to (points)
+MIN_FONT_SIZE = 8.0
+
+BULLET_PREFIX = "  •  "
+CONTINUED_SUFFIX = " (cont.)"
+
+
+# ─────────────────────────────────────────────
+# THEME VARIANTS (SCHEME COLORS)
+# ─────────────────────────────────────────────
+
+# PitchTheme color field -> color scheme slot in the theme part
+SCHEME_SLOTS = {
+    "bg_dark": "dk1",
+    "text_primary": "lt1",
+    "bg_slide": "dk2",
+    "text_secondary": "lt2",
+    "accent_gold": "accent1",
+    "accent_blue": "accent2",
+    "accent_green": "accent3",
+    "accent_red": "accent4",
+    "bg_card": "accent5",
+    "bg_accent": "accent6",
+    "text_accent": "hlink",
+}
+
+# Theme font references (major = headings, minor = body)
+SCHEME_FONT_HEADING = "+mj-lt"
+SCHEME_FONT_BODY = "+mn-lt"
+
+_SLOT_RE = re.compile(r"<a:(dk1|lt1|dk2|lt2|accent[1-6]|hlink)>.*?</a:\1>", re.DOTALL)
+_CLR_SCHEME_RE = re.compile(r"<a:clrScheme\b.*?</a:clrScheme>", re.DOTALL)
+_FONT_RE = re.compile(r'(<a:(majorFont|minorFont)>\s*<a:latin typeface=")[^"]*(")')
+
+
+class SchemeColor(tuple):
+    """An (r, g, b) tuple that also names the color scheme slot it stands for."""
+
+    def __new__(cls, color: Tuple[int, int, int], slot: str):
+        obj = super().__new__(cls, color)
+        obj.slot = slot
+        return obj
+
+
+def symbolic_theme(theme: PitchTheme = DEFAULT_THEME) -> PitchTheme:
+    """
+    Return a copy of `theme` whose colors are SchemeColor slot references and
+    whose fonts are theme font references. Slides built with it take their
+    colors and fonts from the theme part, so they follow any variant written
+    by write_theme_variant().
+    """
+    colors = {
+        name: SchemeColor(getattr(theme, name), slot)
+        for name, slot in SCHEME_SLOTS.items()
+    }
+    return replace(
+        theme, font_heading=SCHEME_FONT_HEADING, font_body=SCHEME_FONT_BODY, **colors
+    )
+
+
+def theme_from_dict(data: Dict[str, Any], base: PitchTheme = DEFAULT_THEME) -> PitchTheme:
+    """
+    Build a PitchTheme from a JSON-style dict, starting from `base`.
+
+    Colors may be given as [r, g, b] lists or "#RRGGBB" strings.
+
+    Raises:
+        ValueError: For unknown fields or malformed colors.
+    """
+    known = {f.name for f in fields(PitchTheme)}
+    values = {}
+    for key, value in data.items():
+        if key not in known:
+            raise ValueError(f"Unknown PitchTheme field: {key!r}")
+        if key in SCHEME_SLOTS:
+            if isinstance(value, str) and re.fullmatch(r"#?[0-9A-Fa-f]{6}", value):
+                hex_value = value.lstrip("#")
+                value = tuple(int(hex_value[i:i + 2], 16) for i in (0, 2, 4))
+            elif (isinstance(value, (list, tuple)) and len(value) == 3
+                    and all(isinstance(c, int) and 0 <= c <= 255 for c in value)):
+                value = tuple(value)
+            else:
+                raise ValueError(f"Invalid color for {key!r}: {value!r}")
+        values[key] = value
+    return replace(base, **values)
+
+
+def patch_theme_xml(theme_xml: bytes, theme: PitchTheme) -> bytes:
+    """
+    Rewrite a theme part's color scheme slots and major/minor Latin fonts
+    from `theme` (see SCHEME_SLOTS). Everything else is left untouched.
+    """
+    xml = theme_xml.decode("utf-8")
+    slot_colors = {
+        slot: "%02X%02X%02X" % tuple(getattr(theme, name))
+        for name, slot in SCHEME_SLOTS.items()
+    }
+    fonts = {"majorFont": theme.font_heading, "minorFont": theme.font_body}
+
+    def patch_slot(match):
+        slot = match.group(1)
+        return f'<a:{slot}><a:srgbClr val="{slot_colors[slot]}"/></a:{slot}>'
+
+    xml = _CLR_SCHEME_RE.sub(lambda m: _SLOT_RE.sub(patch_slot, m.group(0)), xml, count=1)
+    xml = _FONT_RE.sub(
+        lambda m: m.group(1) + escape(fonts[m.group(2)], {'"': "&quot;"}) + m.group(3), xml
+    )
+    return xml.encode("utf-8")
+
+
+def theme_part_name(prs: "Presentation") -> str:
+    """Zip member name of the slide master's theme part (e.g. ppt/theme/theme1.xml)."""
+    return prs.slide_master.part.part_related_by(RT.THEME).partname.membername
+
+
+def write_theme_variant(
+    package: bytes,
+    theme_part: str,
+    theme: PitchTheme,
+    output_path: str
+) -> str:
+    """
+    Write one theme variant of a deck built with symbolic_theme().
+
+    Args:
+        package: The saved .pptx bytes of the symbolic build.
+        theme_part: Theme part member name (see theme_part_name).
+        theme: Variant theme supplying the scheme colors and fonts.
+        output_path: Destination .pptx path.
+
+    Returns:
+        output_path
+    """
+    with zipfile.ZipFile(io.BytesIO(package)) as source, \
+            zipfile.ZipFile(output_path, "w", zipfile.ZIP_DEFLATED) as target:
+        for info in source.infolist():
+            data = source.read(info.filename)
+            if info.filename == theme_part:
+                data = patch_theme_xml(data, theme)
+            target.writestr(info, data, compress_type=zipfile.ZIP_DEFLATED)
+    return output_path
+
 
 # ─────────────────────────────────────────────
 # HELPERS
@@ -76,9 +250,19 @@ def create_presentation(theme: PitchTheme = DEFAULT_THEME) -> "Presentation":
     prs = Presentation()
     prs.slide_width = Inches(theme.slide_width)
     prs.slide_height = Inches(theme.slide_height)
+    add_theme_layouts(prs, theme)
     return prs
 
 
+def set_color(color_format, color: Tuple[int, int, int]) -> None:
+    """Set a python-pptx ColorFormat to a scheme slot (SchemeColor) or RGB color."""
+    slot = getattr(color, "slot", None)
+    if slot:
+        color_format.theme_color = MSO_THEME_COLOR.from_xml(slot)
+    else:
+        color_format.rgb = rgb(color)
+
+
 def add_background(slide, color: Tuple[int, int, int], theme: PitchTheme = DEFAULT_THEME) -> None:
     """Fill slide background with a solid color."""
     if not PPTX_AVAILABLE:
@@ -87,7 +271,7 @@ def add_background(slide, color: Tuple[int, int, int], theme: PitchTheme = DEFAU
     from pptx.enum.dml import MSO_THEME_COLOR
     fill = slide.background.fill
     fill.solid()
-    fill.fore_color.rgb = rgb(color)
+    set_color(fill.fore_color, color)
 
 
 def add_text_box(
@@ -100,7 +284,9 @@ def add_text_box(
     italic: bool = False,
     color: Tuple[int, int, int] = (240, 244, 255),
     align: str = "left",
-    word_wrap: bool = True
+    word_wrap: bool = True,
+    fit: bool = False,
+    min_font_size: float = MIN_FONT_SIZE
 ) -> Any:
     """
     Add a styled text box to a slide.
@@ -115,6 +301,9 @@ def add_text_box(
         color: RGB color tuple
         align: "left", "center", "right"
         word_wrap: Enable word wrap
+        fit: Shrink font_size (down to min_font_size) until the text fits
+            the box, measured in-process; the box keeps its size
+        min_font_size: Smallest size fit may use
 
     Returns:
         TextBox shape object
@@ -127,6 +316,13 @@ def add_text_box(
     )
     tf = txBox.text_frame
     tf.word_wrap = word_wrap
+    if fit and TEXT_FIT_AVAILABLE:
+        result = fit_text(
+            [Paragraph(text, font_size, font_name, bold, italic)],
+            width, height, min(1.0, min_font_size / font_size)
+        )
+        font_size = scaled_size(font_size, result.scale)
+        tf.auto_size = MSO_AUTO_SIZE.NONE
 
     p = tf.paragraphs[0]
     p.text = text
@@ -144,7 +340,7 @@ def add_text_box(
     run.font.size = Pt(font_size)
     run.font.bold = bold
     run.font.italic = italic
-    run.font.color.rgb = rgb(color)
+    set_color(run.font.color, color)
 
     return txBox
 
@@ -156,7 +352,9 @@ def add_bullet_text_box(
     left: float, top: float, width: float, height: float,
     theme: PitchTheme = DEFAULT_THEME,
     title_size: int = 16,
-    bullet_size: int = 12
+    bullet_size: int = 12,
+    fit: bool = False,
+    min_bullet_size: float = MIN_FONT_SIZE
 ) -> Any:
     """
     Add a text box with a title and bulleted list.
@@ -168,6 +366,9 @@ def add_bullet_text_box(
         left, top, width, height: Position in inches
         theme: Color theme
         title_size, bullet_size: Font sizes
+        fit: Scale both sizes down (bullets to min_bullet_size at most)
+            until the list fits the box, measured in-process
+        min_bullet_size: Smallest bullet size fit may use
 
     Returns:
         TextBox shape
@@ -180,6 +381,14 @@ def add_bullet_text_box(
     )
     tf = txBox.text_frame
     tf.word_wrap = True
+    if fit and TEXT_FIT_AVAILABLE:
+        result = fit_text(
+            _bullet_paragraphs(title, bullets, theme, title_size, bullet_size),
+            width, height, min(1.0, min_bullet_size / bullet_size)
+        )
+        title_size = scaled_size(title_size, result.scale)
+        bullet_size = scaled_size(bullet_size, result.scale)
+        tf.auto_size = MSO_AUTO_SIZE.NONE
 
     # Title paragraph
     p = tf.paragraphs[0]
@@ -190,22 +399,36 @@ def add_bullet_text_box(
     run.font.name = theme.font_heading
     run.font.size = Pt(title_size)
     run.font.bold = True
-    run.font.color.rgb = rgb(theme.accent_gold)
+    set_color(run.font.color, theme.accent_gold)
 
     # Bullet paragraphs
     for bullet in bullets:
         p_new = tf.add_paragraph()
-        p_new.text = f"  •  {bullet}"
+        p_new.text = f"{BULLET_PREFIX}{bullet}"
         p_new.alignment = PP_ALIGN.LEFT
         run_b = p_new.runs[0] if p_new.runs else p_new.add_run()
-        run_b.text = f"  •  {bullet}"
+        run_b.text = f"{BULLET_PREFIX}{bullet}"
         run_b.font.name = theme.font_body
         run_b.font.size = Pt(bullet_size)
-        run_b.font.color.rgb = rgb(theme.text_primary)
+        set_color(run_b.font.color, theme.text_primary)
 
     return txBox
 
 
+def _bullet_paragraphs(
+    title: str,
+    bullets: List[str],
+    theme: PitchTheme,
+    title_size: float,
+    bullet_size: float
+) -> List[Paragraph]:
+    """Measurement view of add_bullet_text_box content (title first)."""
+    return [Paragraph(title, title_size, theme.font_heading, bold=True)] + [
+        Paragraph(f"{BULLET_PREFIX}{bullet}", bullet_size, theme.font_body)
+        for bullet in bullets
+    ]
+
+
 def add_accent_bar(
     slide,
     left: float, top: float, width: float, height: float,
@@ -220,7 +443,7 @@ def add_accent_bar(
         Inches(left), Inches(top), Inches(width), Inches(height)
     )
     shape.fill.solid()
-    shape.fill.fore_color.rgb = rgb(color)
+    set_color(shape.fill.fore_color, color)
     shape.line.fill.background()  # No border
 
 
@@ -240,10 +463,165 @@ def add_divider_line(
         Inches(x1), Inches(y1),
         Inches(x2), Inches(y2)
     )
-    line.line.color.rgb = rgb(color)
+    set_color(line.line.color, color)
     line.line.width = Pt(width_pt)
 
 
+# ─────────────────────────────────────────────
+# SLIDE LAYOUTS
+# ─────────────────────────────────────────────
+
+LAYOUT_TITLE = "GDD Title"
+LAYOUT_CONTENT = "GDD Content"
+LAYOUT_CLOSING = "GDD Closing"
+
+BLANK_LAYOUT_INDEX = 6
+SLIDE_NUMBER_FIELD_ID = "{B6F15528-21DE-4FAA-801E-634DDDAF4B2B}"
+
+
+class _LayoutCanvas:
+    """Slide-like view of a slide layout, so the shape helpers above can draw on it."""
+
+    def __init__(self, layout):
+        self.shapes = SlideShapes(layout.shapes._spTree, layout)
+        self.background = layout.background
+
+
+def _new_layout_id(prs: "Presentation") -> int:
+    """Next free sldLayoutId (unique across slide masters and layouts)."""
+    ids = [int(v) for v in prs.part._element.xpath("//p:sldMasterId/@id")]
+    for master in prs.slide_masters:
+        ids.extend(int(v) for v in master._element.xpath("//p:sldLayoutId/@id"))
+    return max(ids) + 1
+
+
+def _add_blank_layout(prs: "Presentation", name: str):
+    """
+    Clone the Blank layout into a new, empty layout named `name` on the
+    first slide master and return it.
+    """
+    blank = prs.slide_layouts[BLANK_LAYOUT_INDEX]
+    master = prs.slide_master
+    package = prs.part.package
+
+    element = copy.deepcopy(blank._element)
+    element.attrib.pop("type", None)  # custom layout
+    element.cSld.set("name", name)
+    for sp in element.cSld.spTree.xpath("./p:sp"):
+        element.cSld.spTree.remove(sp)  # date/footer/number placeholders
+    for ext_list in element.cSld.findall(qn("p:extLst")):
+        element.cSld.remove(ext_list)  # creationId must stay unique
+
+    partname = package.next_partname("/ppt/slideLayouts/slideLayout%d.xml")
+    part = SlideLayoutPart(partname, CT.PML_SLIDE_LAYOUT, package, element)
+    part.relate_to(master.part, RT.SLIDE_MASTER)
+    r_id = master.part.relate_to(part, RT.SLIDE_LAYOUT)
+
+    layout_id = OxmlElement("p:sldLayoutId")
+    layout_id.set("id", str(_new_layout_id(prs)))
+    layout_id.set(qn("r:id"), r_id)
+    master._element.get_or_add_sldLayoutIdLst().append(layout_id)
+    return part.slide_layout
+
+
+def add_slide_number_field(
+    canvas,
+    left: float, top: float, width: float, height: float,
+    theme: PitchTheme = DEFAULT_THEME
+) -> Any:
+    """
+    Add a text box holding a slide-number field. On a layout, every slide
+    using it shows its own number.
+    """
+    if not PPTX_AVAILABLE:
+        return None
+    txBox = add_text_box(
+        canvas, "‹#›",
+        left, top, width, height,
+        font_size=8, color=theme.text_secondary, align="right"
+    )
+    run = txBox.text_frame.paragraphs[0].runs[0]._r
+    fld = OxmlElement("a:fld")
+    fld.set("id", SLIDE_NUMBER_FIELD_ID)
+    fld.set("type", "slidenum")
+    fld.append(run.get_or_add_rPr())
+    fld_text = OxmlElement("a:t")
+    fld_text.text = "‹#›"
+    fld.append(fld_text)
+    run.addprevious(fld)
+    run.getparent().remove(run)
+    return txBox
+
+
+def _draw_title_chrome(canvas, theme: PitchTheme) -> None:
+    add_background(canvas, theme.bg_dark)
+    # Left accent bar
+    add_accent_bar(canvas, 0, 0, 0.08, theme.slide_height, theme.accent_gold)
+    # "Game Design Document" label in corner
+    add_text_box(
+        canvas, "GAME DESIGN DOCUMENT",
+        7.0, 5.1, 2.8, 0.4,
+        font_name=theme.font_body,
+        font_size=8, color=theme.text_secondary, align="right"
+    )
+
+
+def _draw_content_chrome(canvas, theme: PitchTheme) -> None:
+    add_background(canvas, theme.bg_slide)
+    # Top accent bar
+    add_accent_bar(canvas, 0, 0, 10.0, 0.08, theme.accent_blue)
+    # Slide number indicator
+    add_slide_number_field(canvas, 9.5, 0.1, 0.4, 0.35, theme)
+    # Divider under the title
+    add_accent_bar(canvas, 0.4, 0.88, 9.2, 0.02, theme.accent_blue)
+
+
+def _draw_closing_chrome(canvas, theme: PitchTheme) -> None:
+    add_background(canvas, theme.bg_dark)
+    add_accent_bar(canvas, 0, 0, 10.0, 0.08, theme.accent_gold)
+    add_slide_number_field(canvas, 9.5, 0.1, 0.4, 0.35, theme)
+    add_accent_bar(canvas, 0, theme.slide_height - 0.08, 10.0, 0.08, theme.accent_gold)
+
+
+# Attribute on the presentation part holding {layout name: layout}, so slides
+# skip the by-name scan. It lives and dies with its deck.
+_THEME_LAYOUTS_ATTR = "_gdd_theme_layouts"
+
+_LAYOUT_CHROME = {
+    LAYOUT_TITLE: _draw_title_chrome,
+    LAYOUT_CONTENT: _draw_content_chrome,
+    LAYOUT_CLOSING: _draw_closing_chrome,
+}
+
+
+def get_theme_layout(prs: "Presentation", name: str, theme: PitchTheme = DEFAULT_THEME):
+    """
+    Return the themed layout `name` (LAYOUT_TITLE / LAYOUT_CONTENT /
+    LAYOUT_CLOSING), building it from `theme` if the presentation lacks it.
+    An existing layout is reused as-is, whatever theme it was built with.
+    """
+    layouts = getattr(prs.part, _THEME_LAYOUTS_ATTR, None)
+    if layouts is None:
+        layouts = {}
+        setattr(prs.part, _THEME_LAYOUTS_ATTR, layouts)
+    layout = layouts.get(name)
+    if layout is None:
+        layout = prs.slide_layouts.get_by_name(name)
+        if layout is None:
+            layout = _add_blank_layout(prs, name)
+            _LAYOUT_CHROME[name](_LayoutCanvas(layout), theme)
+        layouts[name] = layout
+    return layout
+
+
+def add_theme_layouts(prs: "Presentation", theme: PitchTheme = DEFAULT_THEME) -> None:
+    """Build all themed layouts (background, accent bars, slide number) for a deck."""
+    if not PPTX_AVAILABLE:
+        return
+    for name in _LAYOUT_CHROME:
+        get_theme_layout(prs, name, theme)
+
+
 # ─────────────────────────────────────────────
 # SLIDE BUILDERS
 # ─────────────────────────────────────────────
@@ -255,20 +633,17 @@ def build_title_slide(
     studio_name: str,
     genre: str,
     platform: str,
-    theme: PitchTheme = DEFAULT_THEME
+    theme: PitchTheme = DEFAULT_THEME,
+    autofit: bool = True
 ) -> None:
     """
     Build the title slide (Slide 1).
     Layout: Full dark background, large title, tagline, studio name, metadata.
+    With autofit, long titles and taglines shrink to fit their boxes.
     """
     if not PPTX_AVAILABLE:
         return
-    slide_layout = prs.slide_layouts[6]  # Blank layout
-    slide = prs.slides.add_slide(slide_layout)
-    add_background(slide, theme.bg_dark)
-
-    # Left accent bar
-    add_accent_bar(slide, 0, 0, 0.08, theme.slide_height, theme.accent_gold)
+    slide = prs.slides.add_slide(get_theme_layout(prs, LAYOUT_TITLE, theme))
 
     # Game title
     add_text_box(
@@ -276,7 +651,8 @@ def build_title_slide(
         0.3, 1.2, 9.5, 1.8,
         font_name=theme.font_heading,
         font_size=48, bold=True,
-        color=theme.text_primary, align="left"
+        color=theme.text_primary, align="left",
+        fit=autofit, min_font_size=24
     )
 
     # Tagline
@@ -285,7 +661,8 @@ def build_title_slide(
         0.3, 2.9, 9.0, 0.8,
         font_name=theme.font_body,
         font_size=18, italic=True,
-        color=theme.accent_gold, align="left"
+        color=theme.accent_gold, align="left",
+        fit=autofit, min_font_size=11
     )
 
     # Separator line
@@ -297,16 +674,56 @@ def build_title_slide(
         slide, meta,
         0.3, 3.9, 9.0, 0.5,
         font_name=theme.font_body,
-        font_size=12, color=theme.text_secondary, align="left"
+        font_size=12, color=theme.text_secondary, align="left",
+        fit=autofit
     )
 
-    # "Game Design Document" label in corner
-    add_text_box(
-        slide, "GAME DESIGN DOCUMENT",
-        7.0, 5.1, 2.8, 0.4,
-        font_name=theme.font_body,
-        font_size=8, color=theme.text_secondary, align="right"
-    )
+
+def _strip_bullet(text: str) -> str:
+    return text[len(BULLET_PREFIX):] if text.startswith(BULLET_PREFIX) else text
+
+
+def _split_content_block(
+    block: Dict[str, Any],
+    col_width: float,
+    theme: PitchTheme
+) -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
+    """
+    Split a content block into the part that fits its column at MIN_FONT_SIZE
+    and the overflow for a continuation slide (None if it all fits). A
+    block of which nothing but its sub-title fits comes back as
+    (None, block): it moves whole to the continuation slide.
+    """
+    block_type = block.get("type", "bullets")
+
+    if block_type == "bullets":
+        items = block.get("items", [])
+        paragraphs = _bullet_paragraphs(block.get("title", ""), items, theme, 13, 10)
+        result = fit_text(paragraphs, col_width, 4.0, MIN_FONT_SIZE / 10)
+        fitted_items = [_strip_bullet(p.text) for p in result.fitted[1:]]
+        if not result.overflow:
+            return block, None
+        if not fitted_items:
+            return None, block
+        # The overflow keeps the sub-title; a bullet cut mid-way is its first item
+        overflow_items = [_strip_bullet(p.text) for p in result.overflow]
+        return {**block, "items": fitted_items}, {**block, "items": overflow_items}
+
+    if block_type == "text":
+        text = block.get("text", "")
+        result = fit_text(
+            [Paragraph(text, 10.5)], col_width, 3.5, MIN_FONT_SIZE / 10.5
+        )
+        if not result.overflow:
+            return block, None
+        if not result.fitted:
+            return None, block
+        return (
+            {**block, "text": result.fitted[0].text},
+            {**block, "text": result.overflow[0].text},
+        )
+
+    return block, None
 
 
 def build_content_slide(
@@ -314,8 +731,9 @@ def build_content_slide(
     slide_number: int,
     title: str,
     content_blocks: List[Dict[str, Any]],
-    theme: PitchTheme = DEFAULT_THEME
-) -> None:
+    theme: PitchTheme = DEFAULT_THEME,
+    autofit: bool = True
+) -> int:
     """
     Build a standard content slide with title and content blocks.
 
@@ -326,22 +744,22 @@ def build_content_slide(
         - text: string (for text type)
         - value: string (for stat type — large number display)
         - label: string (for stat type — label below value)
-    """
-    if not PPTX_AVAILABLE:
-        return
-    slide_layout = prs.slide_layouts[6]
-    slide = prs.slides.add_slide(slide_layout)
-    add_background(slide, theme.bg_slide)
 
-    # Top accent bar
-    add_accent_bar(slide, 0, 0, 10.0, 0.08, theme.accent_blue)
+    Background, accent bars and the slide number come from the "GDD Content"
+    layout; the number shown is the slide's position in the deck, which
+    slide_number is expected to match.
 
-    # Slide number indicator
-    add_text_box(
-        slide, str(slide_number),
-        9.5, 0.1, 0.4, 0.35,
-        font_size=8, color=theme.text_secondary, align="right"
-    )
+    With autofit, every text box is shrunk to the largest font size that
+    fits it (see utils.text_fit); bullets or text that do not fit even at
+    MIN_FONT_SIZE continue on "<title> (cont.)" slides added right after.
+
+    Returns:
+        Number of slides added (1 + continuation slides).
+    """
+    if not PPTX_AVAILABLE:
+        return 0
+    fit = autofit and TEXT_FIT_AVAILABLE
+    slide = prs.slides.add_slide(get_theme_layout(prs, LAYOUT_CONTENT, theme))
 
     # Title
     add_text_box(
@@ -349,16 +767,14 @@ def build_content_slide(
         0.4, 0.15, 9.0, 0.7,
         font_name=theme.font_heading,
         font_size=22, bold=True,
-        color=theme.text_primary, align="left"
+        color=theme.text_primary, align="left",
+        fit=fit, min_font_size=14
     )
 
-    # Divider
-    add_accent_bar(slide, 0.4, 0.88, 9.2, 0.02, theme.accent_blue)
-
     # Content blocks — auto-layout up to 4 blocks in a grid
     n = len(content_blocks)
     if n == 0:
-        return
+        return 1
     elif n <= 2:
         col_width = 4.4
         positions = [(0.4, 1.0), (5.2, 1.0)]
@@ -369,9 +785,19 @@ def build_content_slide(
         col_width = 2.1
         positions = [(0.4, 1.0), (2.65, 1.0), (4.9, 1.0), (7.15, 1.0)]
 
-    for i, block in enumerate(content_blocks[:4]):
-        if i >= len(positions):
-            break
+    placed = content_blocks[:len(positions)]
+    overflow_blocks = []
+    if fit:
+        splits = [_split_content_block(block, col_width, theme) for block in placed]
+        if all(fitted is None for fitted, _ in splits):
+            # Moving every block on would repeat this slide forever: draw them
+            splits = [(overflow, None) for _, overflow in splits]
+        placed = [fitted for fitted, _ in splits]
+        overflow_blocks = [overflow for _, overflow in splits if overflow is not None]
+
+    for i, block in enumerate(placed):
+        if block is None:
+            continue  # Moved whole to the continuation slide
         x, y = positions[i]
 
         block_type = block.get("type", "bullets")
@@ -382,12 +808,14 @@ def build_content_slide(
                 slide, block.get("value", "—"),
                 x, y, col_width, 1.5,
                 font_size=36, bold=True,
-                color=theme.accent_gold, align="center"
+                color=theme.accent_gold, align="center",
+                fit=fit, min_font_size=18
             )
             add_text_box(
                 slide, block.get("label", ""),
                 x, y + 1.5, col_width, 0.6,
-                font_size=10, color=theme.text_secondary, align="center"
+                font_size=10, color=theme.text_secondary, align="center",
+                fit=fit
             )
 
         elif block_type == "text":
@@ -398,14 +826,16 @@ def build_content_slide(
                     slide, sub_title,
                     x, y, col_width, 0.45,
                     font_size=13, bold=True,
-                    color=theme.accent_gold, align="left"
+                    color=theme.accent_gold, align="left",
+                    fit=fit
                 )
                 y += 0.45
             add_text_box(
                 slide, text,
                 x, y, col_width, 3.5,
                 font_size=10.5,
-                color=theme.text_primary, align="left"
+                color=theme.text_primary, align="left",
+                fit=fit
             )
 
         elif block_type == "bullets":
@@ -415,9 +845,18 @@ def build_content_slide(
                 slide, sub_title, items,
                 x, y, col_width, 4.0,
                 theme=theme,
-                title_size=13, bullet_size=10
+                title_size=13, bullet_size=10,
+                fit=fit
             )
 
+    if not overflow_blocks:
+        return 1
+    base_title = title[:-len(CONTINUED_SUFFIX)] if title.endswith(CONTINUED_SUFFIX) else title
+    return 1 + build_content_slide(
+        prs, slide_number + 1, base_title + CONTINUED_SUFFIX,
+        overflow_blocks, theme, autofit
+    )
+
 
 def build_comparison_slide(
     prs: "Presentation",
@@ -426,7 +865,8 @@ def build_comparison_slide(
     competitors: List[Dict[str, str]],
     our_game_name: str,
     theme: PitchTheme = DEFAULT_THEME,
-    differentiator: str = ""
+    differentiator: str = "",
+    autofit: bool = True
 ) -> None:
     """
     Build a competitive comparison slide.
@@ -436,28 +876,20 @@ def build_comparison_slide(
         - strength: what they do well
         - weakness: what they lack
     differentiator: text explaining how our game is different (displayed at bottom)
+    autofit: shrink long names, strengths/weaknesses and the differentiator to fit
     """
     if not PPTX_AVAILABLE:
         return
-    slide_layout = prs.slide_layouts[6]
-    slide = prs.slides.add_slide(slide_layout)
-    add_background(slide, theme.bg_slide)
-
-    add_accent_bar(slide, 0, 0, 10.0, 0.08, theme.accent_blue)
+    slide = prs.slides.add_slide(get_theme_layout(prs, LAYOUT_CONTENT, theme))
 
-    add_text_box(
-        slide, str(slide_number),
-        9.5, 0.1, 0.4, 0.35,
-        font_size=8, color=theme.text_secondary, align="right"
-    )
     add_text_box(
         slide, title,
         0.4, 0.15, 9.0, 0.7,
         font_name=theme.font_heading,
         font_size=22, bold=True,
-        color=theme.text_primary, align="left"
+        color=theme.text_primary, align="left",
+        fit=autofit, min_font_size=14
     )
-    add_accent_bar(slide, 0.4, 0.88, 9.2, 0.02, theme.accent_blue)
 
     # Competitor cards
     n_comps = min(len(competitors), 3)
@@ -474,21 +906,24 @@ def build_comparison_slide(
             slide, comp.get("name", ""),
             x + 0.1, 1.05, comp_width - 0.2, 0.5,
             font_size=13, bold=True,
-            color=theme.accent_blue, align="center"
+            color=theme.accent_blue, align="center",
+            fit=autofit
         )
         # Strength
         add_text_box(
             slide, f"✓ {comp.get('strength', '')}",
             x + 0.1, 1.65, comp_width - 0.2, 1.0,
             font_size=9.5,
-            color=theme.accent_green, align="left"
+            color=theme.accent_green, align="left",
+            fit=autofit
         )
         # Weakness
         add_text_box(
             slide, f"✗ {comp.get('weakness', '')}",
             x + 0.1, 2.75, comp_width - 0.2, 1.0,
             font_size=9.5,
-            color=theme.accent_red, align="left"
+            color=theme.accent_red, align="left",
+            fit=autofit
         )
 
     # "Our game" differentiation at bottom
@@ -498,7 +933,8 @@ def build_comparison_slide(
         slide, f"★  {our_game_name}: {diff_text}",
         0.4, 4.85, 9.2, 0.6,
         font_size=12, bold=True,
-        color=theme.accent_gold, align="center"
+        color=theme.accent_gold, align="center",
+        fit=autofit
     )
 
 
@@ -508,30 +944,29 @@ def build_closing_slide(
     game_title: str,
     ask: str,
     contact_info: str,
-    theme: PitchTheme = DEFAULT_THEME
+    theme: PitchTheme = DEFAULT_THEME,
+    autofit: bool = True
 ) -> None:
-    """Build the closing/CTA slide."""
+    """Build the closing/CTA slide. With autofit, a long ask shrinks to fit its box."""
     if not PPTX_AVAILABLE:
         return
-    slide_layout = prs.slide_layouts[6]
-    slide = prs.slides.add_slide(slide_layout)
-    add_background(slide, theme.bg_dark)
-
-    add_accent_bar(slide, 0, 0, 10.0, 0.08, theme.accent_gold)
+    slide = prs.slides.add_slide(get_theme_layout(prs, LAYOUT_CLOSING, theme))
 
     add_text_box(
         slide, game_title,
         0.5, 1.0, 9.0, 1.2,
         font_name=theme.font_heading,
         font_size=36, bold=True,
-        color=theme.text_primary, align="center"
+        color=theme.text_primary, align="center",
+        fit=autofit, min_font_size=20
     )
 
     add_text_box(
         slide, ask,
         0.5, 2.2, 9.0, 1.2,
         font_size=16,
-        color=theme.accent_gold, align="center"
+        color=theme.accent_gold, align="center",
+        fit=autofit
     )
 
     add_accent_bar(slide, 2.5, 3.5, 5.0, 0.02, theme.accent_blue)
@@ -540,13 +975,6 @@ def build_closing_slide(
         slide, contact_info,
         0.5, 3.7, 9.0, 0.8,
         font_size=11,
-        color=theme.text_secondary, align="center"
+        color=theme.text_secondary, align="center",
+        fit=autofit
     )
-
-    add_text_box(
-        slide, str(slide_number),
-        9.5, 0.1, 0.4, 0.35,
-        font_size=8, color=theme.text_secondary, align="right"
-    )
-
-    add_accent_bar(slide, 0, theme.slide_height - 0.08, 10.0, 0.08, theme.accent_gold)
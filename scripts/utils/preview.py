@@ -0,0 +1,533 @@
+"""
+preview.py
+----------
+Fast raster previews (thumbnails and contact sheets) of generated documents,
+drawn with Pillow, with no PowerPoint, PDF viewer or rasterizer involved.
+
+Pitch slides are drawn from the python-pptx shape tree that the
+pptx_builder calls produce: layout chrome (background, accent bars,
+slide-number field) first, then the slide's own rectangles and text boxes,
+with scheme colors resolved through the deck's theme.
+
+PDF pages (one-pager, GDD) are drawn from a recording of the fpdf2 calls:
+recording_class(OnePager) / recording_class(GDDDocument) returns a subclass
+that keeps every rect, line and text line (with its font, colors and
+position, after wrapping and page breaks) per page, so the page can be
+redrawn without parsing the PDF. The text hook relies on fpdf2 internals
+(_render_styled_text_line), which is why fpdf2 is pinned.
+
+Text is set in the installed font closest to the requested one (see
+utils.text_fit.find_font_file); previews are for layout review, not proofing.
+
+Usage:
+    images = render_pptx_slides(prs)
+    contact_sheet([("Pitch deck", images)]).save("previews.png")
+"""
+
+from functools import lru_cache
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+try:
+    from PIL import Image, ImageDraw, ImageFont
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
+
+try:
+    import defusedxml.ElementTree as SafeET
+    DEFUSEDXML_AVAILABLE = True
+except ImportError:
+    DEFUSEDXML_AVAILABLE = False
+
+from .text_fit import Paragraph, find_font_file, wrap_lines
+
+
+Color = Tuple[int, int, int]
+
+A_NS = "http://schemas.openxmlformats.org/drawingml/2006/main"
+P_NS = "http://schemas.openxmlformats.org/presentationml/2006/main"
+_A = "{" + A_NS + "}"
+_P = "{" + P_NS + "}"
+
+EMU_PER_PT = 12700
+MM_PER_PT = 25.4 / 72
+
+# Default bodyPr insets of a text box (EMU)
+_INSET_LR = 91440
+_INSET_TB = 45720
+
+# Default master color map (bg1 = lt1, tx1 = dk1, ...)
+_CLR_MAP = {"bg1": "lt1", "tx1": "dk1", "bg2": "lt2", "tx2": "dk2"}
+
+# Text smaller than this (pixels) is drawn as a bar the width of the line
+# ("greeked"): unreadable at thumbnail size, and it is most of the render cost
+GREEK_BELOW_PX = 6
+
+WHITE = (255, 255, 255)
+SHEET_BACKGROUND = (38, 42, 51)
+SHEET_LABEL = (220, 224, 232)
+
+
+def _require_pil() -> None:
+    if not PIL_AVAILABLE:
+        raise ImportError("Pillow is required for previews. Install with: pip install pillow")
+
+
+@lru_cache(maxsize=256)
+def _font(font_name: str, bold: bool, italic: bool, px: int):
+    """Pillow font for a family/style at a pixel size (cached)."""
+    path = find_font_file(font_name, bold, italic)
+    px = max(1, px)
+    return ImageFont.truetype(path, px) if path else ImageFont.load_default(px)
+
+
+def _draw_line_of_text(draw, xy: Tuple[float, float], anchor: str, text: str,
+                       color: Color, font, px: float, width: Optional[float] = None) -> None:
+    """Draw one line at a baseline anchor ("ls"/"ms"/"rs"), greeking small text."""
+    if px >= GREEK_BELOW_PX:
+        draw.text(xy, text, fill=color, font=font, anchor=anchor)
+        return
+    if width is None:
+        width = font.getlength(text)
+    x, baseline = xy
+    if anchor[0] == "m":
+        x -= width / 2
+    elif anchor[0] == "r":
+        x -= width
+    indent = (len(text) - len(text.lstrip())) / max(1, len(text)) * width
+    tint = tuple(round(c + (255 - c) * 0.35) for c in color)  # x-height bar reads as grey text
+    draw.rectangle([x + indent, baseline - max(1.0, px * 0.4), x + width, baseline], fill=tint)
+
+
+def _hex_color(value: str) -> Color:
+    return tuple(int(value[i:i + 2], 16) for i in (0, 2, 4))
+
+
+# ─────────────────────────────────────────────
+# PITCH DECK SLIDES
+# ─────────────────────────────────────────────
+
+def _theme_colors(prs) -> Dict[str, Color]:
+    """Resolve the slide master's color scheme: slot name -> RGB."""
+    from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+    if not DEFUSEDXML_AVAILABLE:
+        return {}
+    theme = SafeET.fromstring(prs.slide_master.part.part_related_by(RT.THEME).blob)
+    colors: Dict[str, Color] = {}
+    scheme = theme.find(f"{_A}themeElements/{_A}clrScheme")
+    for slot in scheme if scheme is not None else []:
+        name = slot.tag[len(_A):]
+        for value in slot:
+            hex_value = value.get("val") if value.tag == _A + "srgbClr" else value.get("lastClr")
+            if hex_value:
+                colors[name] = _hex_color(hex_value)
+    for alias, slot in _CLR_MAP.items():
+        if slot in colors:
+            colors[alias] = colors[slot]
+    return colors
+
+
+def _color_of(parent, theme: Dict[str, Color]) -> Optional[Color]:
+    """Color of an a:solidFill-like element (srgbClr / schemeClr child)."""
+    if parent is None:
+        return None
+    srgb = parent.find(_A + "srgbClr")
+    if srgb is not None:
+        return _hex_color(srgb.get("val"))
+    scheme = parent.find(_A + "schemeClr")
+    if scheme is not None:
+        return theme.get(scheme.get("val"))
+    return None
+
+
+def _background(elements, theme: Dict[str, Color]) -> Color:
+    """First solid background among slide, layout and master (cSld/bg)."""
+    for element in elements:
+        fill = element.find(f"{_P}cSld/{_P}bg/{_P}bgPr/{_A}solidFill")
+        color = _color_of(fill, theme)
+        if color is not None:
+            return color
+    return WHITE
+
+
+def _paragraph_runs(p, slide_index: int) -> Tuple[str, Any]:
+    """(text, first a:rPr) of a paragraph, with slide-number fields filled in."""
+    parts: List[str] = []
+    rpr = None
+    for child in p:
+        if child.tag in (_A + "r", _A + "fld"):
+            if rpr is None:
+                rpr = child.find(_A + "rPr")
+            if child.tag == _A + "fld" and child.get("type") == "slidenum":
+                parts.append(str(slide_index))
+            else:
+                parts.append("".join(t.text or "" for t in child.iter(_A + "t")))
+        elif child.tag == _A + "br":
+            parts.append("\n")
+    return "".join(parts), rpr
+
+
+def _draw_text_body(draw, sp, box: Tuple[float, float, float, float], scale: float,
+                    theme: Dict[str, Color], slide_index: int) -> None:
+    """Draw a shape's text body into box (x, y, w, h in EMU), top-anchored."""
+    tx_body = sp.find(_P + "txBody")
+    if tx_body is None:
+        return
+    x, y, w, h = box
+    left, top = x + _INSET_LR, y + _INSET_TB
+    width_pt = max(1.0, (w - 2 * _INSET_LR) / EMU_PER_PT)
+    for p in tx_body.findall(_A + "p"):
+        text, rpr = _paragraph_runs(p, slide_index)
+        size = int(rpr.get("sz", "1800")) / 100 if rpr is not None else 18.0
+        bold = rpr is not None and rpr.get("b") == "1"
+        italic = rpr is not None and rpr.get("i") == "1"
+        latin = rpr.find(_A + "latin") if rpr is not None else None
+        font_name = latin.get("typeface") if latin is not None else "Calibri"
+        color = _color_of(rpr.find(_A + "solidFill"), theme) if rpr is not None else None
+        ppr = p.find(_A + "pPr")
+        align = ppr.get("algn", "l") if ppr is not None else "l"
+
+        line_height = size * 1.2 * EMU_PER_PT
+        font = _font(font_name, bold, italic, round(size * EMU_PER_PT * scale))
+        lines = wrap_lines(Paragraph(text, size, font_name, bold, italic), width_pt, size) \
+            if text else [""]
+        for line in lines:
+            if top + line_height > y + h + line_height:  # clip well past the box
+                return
+            if line.strip():
+                baseline = (top + size * EMU_PER_PT) * scale
+                if align == "ctr":
+                    anchor, tx = "ms", (x + w / 2) * scale
+                elif align == "r":
+                    anchor, tx = "rs", (x + w - _INSET_LR) * scale
+                else:
+                    anchor, tx = "ls", left * scale
+                _draw_line_of_text(draw, (tx, baseline), anchor, line, color or (0, 0, 0),
+                                   font, size * EMU_PER_PT * scale)
+            top += line_height
+
+
+def _draw_shape_tree(draw, sp_tree, scale: float, theme: Dict[str, Color],
+                     slide_index: int) -> None:
+    """Draw the non-placeholder rectangles, lines and text boxes of a shape tree."""
+    for sp in sp_tree:
+        if sp.tag not in (_P + "sp", _P + "cxnSp", _P + "pic"):
+            continue
+        if sp.find(f"./*/{_P}nvPr/{_P}ph") is not None:
+            continue  # placeholders only render when a slide fills them
+        sp_pr = sp.find(_P + "spPr")
+        xfrm = sp_pr.find(_A + "xfrm") if sp_pr is not None else None
+        if xfrm is None:
+            continue
+        off, ext = xfrm.find(_A + "off"), xfrm.find(_A + "ext")
+        x, y = int(off.get("x")), int(off.get("y"))
+        w, h = int(ext.get("cx")), int(ext.get("cy"))
+        rect = [x * scale, y * scale, (x + w) * scale, (y + h) * scale]
+
+        if sp.tag == _P + "pic":
+            draw.rectangle(rect, fill=(128, 128, 128))
+            continue
+        if sp.tag == _P + "cxnSp":
+            line = sp_pr.find(_A + "ln")
+            color = _color_of(line.find(_A + "solidFill"), theme) if line is not None else None
+            width = int(line.get("w", "12700")) if line is not None else 12700
+            draw.line(rect, fill=color or (0, 0, 0), width=max(1, round(width * scale)))
+            continue
+
+        fill = _color_of(sp_pr.find(_A + "solidFill"), theme)
+        if fill is not None:
+            draw.rectangle(rect, fill=fill)
+        _draw_text_body(draw, sp, (x, y, w, h), scale, theme, slide_index)
+
+
+def render_pptx_slides(source, width: int = 320) -> List["Image.Image"]:
+    """
+    Render every slide of a presentation to a thumbnail.
+
+    Args:
+        source: python-pptx Presentation or path to a .pptx file.
+        width: Thumbnail width in pixels (height follows the slide aspect).
+
+    Returns:
+        One RGB image per slide, in deck order.
+    """
+    _require_pil()
+    if isinstance(source, str):
+        from pptx import Presentation
+        source = Presentation(source)
+    prs = source
+    theme = _theme_colors(prs)
+    scale = width / prs.slide_width
+    size = (width, max(1, round(prs.slide_height * scale)))
+
+    images = []
+    for index, slide in enumerate(prs.slides, 1):
+        layout = slide.slide_layout
+        master = layout.slide_master
+        chain = [slide._element, layout._element, master._element]
+        image = Image.new("RGB", size, _background(chain, theme))
+        draw = ImageDraw.Draw(image)
+        for element in reversed(chain):
+            sp_tree = element.find(f"{_P}cSld/{_P}spTree")
+            _draw_shape_tree(draw, sp_tree, scale, theme, index)
+        images.append(image)
+    return images
+
+
+# ─────────────────────────────────────────────
+# PDF PAGES (RECORDED FPDF CALLS)
+# ─────────────────────────────────────────────
+
+class RectOp(NamedTuple):
+    x: float
+    y: float
+    w: float
+    h: float
+    fill: Optional[Color]
+    stroke: Optional[Color]
+    line_width: float
+
+
+class LineOp(NamedTuple):
+    x1: float
+    y1: float
+    x2: float
+    y2: float
+    color: Color
+    line_width: float
+
+
+class TextOp(NamedTuple):
+    x: float
+    y: float
+    w: float
+    h: float
+    text: str
+    text_width: float
+    align: str
+    family: str
+    style: str
+    size_pt: float
+    color: Color
+    fill: Optional[Color]
+    border: bool
+    c_margin: float
+
+
+def _rgb255(color) -> Color:
+    values = tuple(round(v) for v in color.colors255)
+    return values[:3] if len(values) >= 3 else (values[0],) * 3
+
+
+class RecordingMixin:
+    """
+    Mixin for FPDF subclasses that records drawing calls per page
+    (see recording_class). Recorded pages: self.preview_ops[page] -> ops.
+    """
+
+    def _preview_ops_for(self, page: int) -> list:
+        if not hasattr(self, "preview_ops"):
+            self.preview_ops: Dict[int, list] = {}
+        return self.preview_ops.setdefault(page, [])
+
+    def rect(self, x, y, w, h, style=None, *args, **kwargs):
+        style = (style or "D").upper()
+        self._preview_ops_for(self.page).append(RectOp(
+            x, y, w, h,
+            _rgb255(self.fill_color) if "F" in style else None,
+            _rgb255(self.draw_color) if "D" in style else None,
+            self.line_width,
+        ))
+        return super().rect(x, y, w, h, style, *args, **kwargs)
+
+    def line(self, x1, y1, x2, y2):
+        self._preview_ops_for(self.page).append(
+            LineOp(x1, y1, x2, y2, _rgb255(self.draw_color), self.line_width)
+        )
+        return super().line(x1, y1, x2, y2)
+
+    def _perform_page_break_if_need_be(self, h):
+        broke = super()._perform_page_break_if_need_be(h)
+        if broke:
+            self._preview_break_xy = (self.x, self.y)
+        return broke
+
+    def _render_styled_text_line(self, text_line, h=None, border=0, *args, **kwargs):
+        x, y = self.x, self.y
+        self._preview_break_xy = None
+        result = super()._render_styled_text_line(text_line, h, border, *args, **kwargs)
+        if self._preview_break_xy is not None:
+            x, y = self._preview_break_xy  # drawn at the top of the new page
+
+        fragments = text_line.fragments
+        first = fragments[0] if fragments else None
+        align = getattr(text_line.align, "value", text_line.align) or "L"
+        fill = kwargs.get("fill", args[2] if len(args) > 2 else False)
+        self._preview_ops_for(self.page).append(TextOp(
+            x, y,
+            text_line.max_width or text_line.text_width or 0,
+            h if h is not None else self.font_size,
+            "".join(f.string for f in fragments),
+            text_line.text_width,
+            align,
+            first.font_family if first else self.font_family,
+            first.font_style if first else self.font_style,
+            first.font_size_pt if first else self.font_size_pt,
+            _rgb255(first.text_color if first else self.text_color),
+            _rgb255(self.fill_color) if fill else None,
+            border in (1, "1") or (isinstance(border, str) and set(border) >= set("LTRB")),
+            self.c_margin,
+        ))
+        return result
+
+
+@lru_cache(maxsize=None)
+def recording_class(document_class: type) -> type:
+    """Return a recording subclass of an FPDF document class (cached)."""
+    return type(f"Recording{document_class.__name__}", (RecordingMixin, document_class), {})
+
+
+_PDF_FONTS = {"helvetica": "Helvetica", "arial": "Arial", "times": "Times New Roman",
+              "courier": "Courier New"}
+
+
+def render_recorded_pages(pdf, width: int = 320,
+                          max_pages: Optional[int] = None) -> List["Image.Image"]:
+    """
+    Render the pages of a recording FPDF document (see recording_class).
+
+    Args:
+        pdf: Document built from a recording_class() instance.
+        width: Thumbnail width in pixels (height follows the page aspect).
+        max_pages: Render only the first N pages.
+
+    Returns:
+        One RGB image per page.
+    """
+    _require_pil()
+    ops_by_page = getattr(pdf, "preview_ops", {})
+    page_count = pdf.pages_count if max_pages is None else min(pdf.pages_count, max_pages)
+    images = []
+    for page in range(1, page_count + 1):
+        page_w, page_h = pdf.pages[page].dimensions()  # points
+        scale = width / (page_w * MM_PER_PT) * (pdf.k * MM_PER_PT)  # px per user unit
+        image = Image.new("RGB", (width, max(1, round(width * page_h / page_w))), WHITE)
+        draw = ImageDraw.Draw(image)
+        for op in ops_by_page.get(page, []):
+            if isinstance(op, RectOp):
+                box = [op.x * scale, op.y * scale, (op.x + op.w) * scale, (op.y + op.h) * scale]
+                draw.rectangle(box, fill=op.fill, outline=op.stroke,
+                               width=max(1, round(op.line_width * scale)) if op.stroke else 0)
+            elif isinstance(op, LineOp):
+                draw.line([op.x1 * scale, op.y1 * scale, op.x2 * scale, op.y2 * scale],
+                          fill=op.color, width=max(1, round(op.line_width * scale)))
+            else:
+                _draw_pdf_text(draw, op, scale, pdf.k)
+        images.append(image)
+    return images
+
+
+def _draw_pdf_text(draw, op: TextOp, scale: float, k: float) -> None:
+    box = [op.x * scale, op.y * scale, (op.x + op.w) * scale, (op.y + op.h) * scale]
+    if op.fill is not None:
+        draw.rectangle(box, fill=op.fill)
+    if op.border:
+        draw.rectangle(box, outline=(0, 0, 0), width=1)
+    if not op.text.strip():
+        return
+    size_units = op.size_pt / k  # font size in user units
+    px = size_units * scale
+    family = _PDF_FONTS.get(op.family.lower(), op.family)
+    bold, italic = "B" in op.style, "I" in op.style
+    font = _font(family, bold, italic, round(px))
+    target = op.text_width * scale
+    if px >= GREEK_BELOW_PX and target > 0:
+        # Substitute fonts run wider than the PDF core fonts: shrink to fpdf's measured width
+        drawn = font.getlength(op.text)
+        if drawn > target * 1.02:
+            font = _font(family, bold, italic, max(1, int(px * target / drawn)))
+    baseline = (op.y + op.h / 2 + 0.3 * size_units) * scale
+    if op.align == "C":
+        anchor, x = "ms", (op.x + op.w / 2) * scale
+    elif op.align == "R":
+        anchor, x = "rs", (op.x + op.w - op.c_margin) * scale
+    else:
+        anchor, x = "ls", (op.x + op.c_margin) * scale
+    _draw_line_of_text(draw, (x, baseline), anchor, op.text, op.color, font, px,
+                       width=target or None)
+
+
+# ─────────────────────────────────────────────
+# CONTACT SHEET
+# ─────────────────────────────────────────────
+
+def contact_sheet(
+    groups: Sequence[Tuple[str, Sequence["Image.Image"]]],
+    columns: int = 4,
+    padding: int = 12,
+    label_size: int = 14
+) -> "Image.Image":
+    """
+    Lay thumbnails out on a grid, one labelled block of rows per group.
+
+    Args:
+        groups: (label, thumbnails) pairs, e.g. ("Pitch deck", slides).
+        columns: Thumbnails per row.
+        padding: Gap around thumbnails, in pixels.
+        label_size: Group label font size, in pixels.
+
+    Returns:
+        The contact sheet image.
+    """
+    _require_pil()
+    label_font = _font("DejaVu Sans", True, False, label_size)
+    label_height = label_size + padding
+    rows: List[Tuple[Optional[str], List["Image.Image"]]] = []
+    for label, images in groups:
+        images = list(images)
+        rows.append((label, []))
+        for start in range(0, len(images), columns):
+            rows.append((None, images[start:start + columns]))
+
+    sheet_width = padding + max(
+        (sum(img.width + padding for img in row) for _, row in rows if row), default=0
+    )
+    sheet_width = max(sheet_width, 2 * padding + 1)
+    sheet_height = padding + sum(
+        label_height if label is not None else max(img.height for img in row) + padding
+        for label, row in rows if label is not None or row
+    )
+    sheet = Image.new("RGB", (sheet_width, sheet_height), SHEET_BACKGROUND)
+    draw = ImageDraw.Draw(sheet)
+
+    y = padding
+    for label, row in rows:
+        if label is not None:
+            draw.text((padding, y), label, fill=SHEET_LABEL, font=label_font)
+            y += label_height
+            continue
+        if not row:
+            continue
+        x = padding
+        for img in row:
+            sheet.paste(img, (x, y))
+            x += img.width + padding
+        y += max(img.height for img in row) + padding
+    return sheet
+
+
+def page_label(images: Sequence["Image.Image"], first: int = 1) -> List["Image.Image"]:
+    """Stamp a small page number in the bottom-left corner of each thumbnail."""
+    _require_pil()
+    font = _font("DejaVu Sans", True, False, 11)
+    stamped = []
+    for number, image in enumerate(images, first):
+        image = image.copy()
+        draw = ImageDraw.Draw(image)
+        text = str(number)
+        left, top, right, bottom = draw.textbbox((4, image.height - 4), text, font=font,
+                                                 anchor="lb")
+        draw.rectangle([left - 2, top - 2, right + 2, bottom + 2], fill=SHEET_BACKGROUND)
+        draw.text((4, image.height - 4), text, fill=SHEET_LABEL, font=font, anchor="lb")
+        stamped.append(image)
+    return stamped
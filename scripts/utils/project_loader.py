@@ -0,0 +1,176 @@
+"""
+project_loader.py
+-----------------
+Loads GDD project configs, where section prose may live in separate files.
+
+A project is the usual JSON config, except that any entry of "sections"
+may point to a file instead of holding the text inline:
+
+    {
+      "game_title": "Echo Chamber",
+      "sections": {
+        "executive_summary": "Inline text still works.",
+        "game_mechanics": {"$file": "sections/mechanics.md"},
+        "world_building": {"$file": "sections/world.md", "subsections": [...]}
+      }
+    }
+
+Paths are relative to the config file and must stay inside its directory.
+Referenced files are only read when a renderer or validator looks the
+section up (sections["game_mechanics"]), and are then kept, so pitch decks
+and one-pagers of big projects never read the section prose they don't
+use. A reference with extra keys resolves to a dict of those keys plus
+"content" (the file text), the shape the GDD renderers already accept.
+
+A .gddpack file (see gddpack.py) or a version store (see version_store.py)
+can be given wherever a config is expected; their sections are inflated on
+lookup in the same way. So can a single Markdown GDD (see markdown_loader.py).
+
+Usage:
+    game_data = load_project("project/gdd.json")
+    game_data["sections"]["game_mechanics"]   # reads sections/mechanics.md now
+"""
+
+import json
+import os
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator, List, Optional
+
+from .gddpack import CorruptContentError, GddPack, is_gddpack
+from .markdown_loader import is_markdown_config, load_markdown
+from .render_output import emit_warnings
+from .version_store import VersionStore, is_version_store
+
+
+FILE_KEY = "$file"
+
+
+def is_file_reference(value: Any) -> bool:
+    """True for a {"$file": "<path>"} section entry."""
+    return isinstance(value, dict) and isinstance(value.get(FILE_KEY), str)
+
+
+def resolve_project_path(root: str, relative: str) -> str:
+    """
+    Resolve a path from a project config against its directory.
+
+    Raises:
+        ValueError: If the path is absolute or resolves outside root
+            (including through symlinks).
+    """
+    if os.path.isabs(relative):
+        raise ValueError(f"Section file must be a relative path: {relative}")
+    root = os.path.realpath(root)
+    path = os.path.realpath(os.path.join(root, relative))
+    if os.path.commonpath([root, path]) != root:
+        raise ValueError(f"Section file is outside the project directory: {relative}")
+    return path
+
+
+class LazySections(Mapping):
+    """
+    Read-only mapping of section key -> content that reads "$file" entries
+    on first access and caches them. Iteration, len() and `in` never read
+    files.
+    """
+
+    def __init__(self, entries: Dict[str, Any], root: str):
+        self._entries = dict(entries)
+        self._loaded: Dict[str, Any] = {}
+        self._paths: Dict[str, str] = {}
+        for key, value in self._entries.items():
+            if is_file_reference(value):
+                path = resolve_project_path(root, value[FILE_KEY])
+                if not os.path.isfile(path):
+                    raise FileNotFoundError(
+                        f"Section '{key}' points to a missing file: {value[FILE_KEY]}"
+                    )
+                self._paths[key] = path
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._loaded:
+            return self._loaded[key]
+        value = self._entries[key]
+        if key in self._paths:
+            with open(self._paths[key], "r", encoding="utf-8") as f:
+                text = f.read()
+            extra = {k: v for k, v in value.items() if k != FILE_KEY}
+            value = dict(extra, content=text) if extra else text
+            self._loaded[key] = value
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+    def source_path(self, key: str) -> Optional[str]:
+        """Absolute path of a file-backed section, or None if it is inline."""
+        return self._paths.get(key)
+
+    def is_loaded(self, key: str) -> bool:
+        """Whether a section's text is in memory (inline, or file already read)."""
+        return key not in self._paths or key in self._loaded
+
+    def __repr__(self) -> str:
+        return (f"LazySections({len(self._entries)} sections, "
+                f"{len(self._paths)} from files, {len(self._loaded)} loaded)")
+
+
+def load_project(path: str, version_id: Optional[int] = None,
+                 warnings: Optional[List[str]] = None) -> Dict[str, Any]:
+    """
+    Load a JSON config / project file.
+
+    Plain configs come back unchanged. If any section is a "$file"
+    reference, "sections" becomes a LazySections mapping rooted at the
+    config's directory (references are checked up front, read on access).
+    A .gddpack file comes back with its sections as a PackSections mapping,
+    and a version store with the requested (or newest) version's sections
+    as a StoredSections mapping and "version_history" filled in. A Markdown
+    GDD (.md) is parsed straight into a config dict.
+
+    Args:
+        path: Path to the JSON config, Markdown GDD, .gddpack or version store.
+        version_id: Stored version to load (version stores only).
+        warnings: List that collects load warnings (Markdown GDDs with no
+            numbered headings or a repeated section). They are printed
+            when it is None.
+
+    Returns:
+        The game data dictionary.
+
+    Raises:
+        FileNotFoundError: If the config or a referenced section file is missing.
+        ValueError: If the JSON is invalid or not an object, Markdown
+            front matter is malformed, a section file path escapes the
+            project directory, a .gddpack or version store is malformed,
+            or version_id is given for anything but a version store or
+            does not exist.
+    """
+    if is_version_store(path):
+        return VersionStore(path).load_version(version_id)  # Read-only
+    if version_id is not None:
+        raise ValueError(f"{path}: a version ID needs a version store, not a config")
+    if is_gddpack(path):
+        return GddPack(path).game_data()
+    if is_markdown_config(path):
+        found: List[str] = []
+        game_data = load_markdown(path, found)
+        emit_warnings(found, warnings)
+        return game_data
+
+    with open(path, "r", encoding="utf-8") as f:
+        game_data = json.load(f)
+    if not isinstance(game_data, dict):
+        raise ValueError(f"{path}: config must be a JSON object")
+
+    sections = game_data.get("sections")
+    if isinstance(sections, dict) and any(is_file_reference(v) for v in sections.values()):
+        root = os.path.dirname(os.path.abspath(path))
+        game_data["sections"] = LazySections(sections, root)
+    return game_data
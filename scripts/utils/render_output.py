@@ -0,0 +1,196 @@
+"""
+render_output.py
+----------------
+Shared result type for the in-memory generator API.
+
+Every generator has a render_* function that writes its document to a
+path, to a writable binary stream, or (by default) to memory, and hands
+back a RenderResult instead of printing:
+
+    result = render_gdd_docx(game_data)              # result.data is the .docx bytes
+    render_gdd_pdf(game_data, out=response_stream)   # streamed, nothing on disk
+    result.warnings                                  # validation / layout warnings
+    result.notes, result.stats                       # tips, size report, page counts
+
+The generate_* functions the CLIs use are thin wrappers that write to a
+path and print the result as before. Strict-mode failures raise
+StrictModeError, which carries the warnings that caused it; the wrappers
+turn it into the SystemExit the CLIs have always exited with.
+
+Per-render state (strict mode, pitch theme, the warning sink, progress and
+optionally a font metrics cache) travels in a RenderContext; create one per
+render. Pitch deck layouts are kept on the deck being built. Everything else
+a render reads is either immutable (section registry, style palettes, frozen
+PitchTheme defaults) or a process-wide cache that is safe to share between
+threads (the Word base template, and font metrics unless the context brings
+its own), so one warm process can serve renders from a thread pool:
+
+    with ThreadPoolExecutor() as pool:
+        pool.submit(render_pitch_deck, game_data, context=RenderContext(theme=theme))
+"""
+
+import io
+import os
+from dataclasses import dataclass, field
+from typing import IO, Any, Callable, Dict, List, NamedTuple, NoReturn, Optional, Union
+
+Output = Union[str, IO[bytes], None]
+
+
+class RenderProgress(NamedTuple):
+    """One finished step of a render: a GDD section, or a pitch slide."""
+    step: str
+    done: int
+    total: int
+
+
+class StrictModeError(ValueError):
+    """Strict-mode export aborted; .warnings holds the warnings found up to then."""
+
+    def __init__(self, message: str, warnings: List[str]):
+        # Both in args, so the error pickles back intact from a worker process
+        super().__init__(message, list(warnings))
+        self.message = message
+        self.warnings = list(warnings)
+
+    def __str__(self) -> str:
+        return self.message
+
+
+@dataclass
+class RenderContext:
+    """
+    Per-render settings and warning sink for the render_* functions.
+
+    Attributes:
+        strict: Raise StrictModeError on unsourced metrics or placeholders.
+        theme: PitchTheme for pitch decks; None for DEFAULT_THEME.
+        warnings: List that collects the render's warnings; the
+            RenderResult shares it, so a caller may pass its own.
+        progress: Called with a RenderProgress after each section (or
+            slide). It runs on the rendering thread; an exception it
+            raises aborts the render.
+        fonts: text_fit.FontMetricsCache the pitch deck autofit measures
+            with; None for the process-wide one. Pass one to scope loaded
+            fonts and cached widths to a set of renders and free them with it.
+    """
+    strict: bool = False
+    theme: Optional[Any] = None
+    warnings: List[str] = field(default_factory=list)
+    progress: Optional[Callable[[RenderProgress], None]] = None
+    fonts: Optional[Any] = None
+
+    def report(self, step: str, done: int, total: int) -> None:
+        """Pass one finished step to the progress callback, if there is one."""
+        if self.progress is not None:
+            self.progress(RenderProgress(step, done, total))
+
+    def new_result(self, content_type: str) -> "RenderResult":
+        """A RenderResult whose warnings go to this context's sink."""
+        return RenderResult(content_type, warnings=self.warnings)
+
+
+@dataclass
+class RenderResult:
+    """
+    Outcome of a render_* call.
+
+    Attributes:
+        content_type: MIME type of the document.
+        data: The document bytes when rendered to memory, else None.
+        path: Absolute output path when rendered to a path, else None.
+        warnings: Validation and layout warnings, in the order found.
+        notes: Non-warning messages (tips, size reports).
+        stats: Counts such as pages or slides.
+    """
+    content_type: str
+    data: Optional[bytes] = None
+    path: Optional[str] = None
+    warnings: List[str] = field(default_factory=list)
+    notes: List[str] = field(default_factory=list)
+    stats: Dict[str, Any] = field(default_factory=dict)
+
+    def print_report(self, printer: Callable[[str], None] = print) -> None:
+        """Print warnings and notes the way the CLIs always have."""
+        for warning in self.warnings:
+            printer(f"  WARNING: {warning}")
+        for note in self.notes:
+            printer(f"  {note}")
+
+
+def emit_warnings(found: List[str], warnings: Optional[List[str]]) -> None:
+    """
+    Hand warnings to the caller: append them to warnings when it is a list,
+    otherwise print them (the behaviour of the build_* helpers before
+    render_* existed, which previews and catalogs still rely on).
+    """
+    if warnings is None:
+        for warning in found:
+            print(f"  WARNING: {warning}")
+    else:
+        warnings.extend(found)
+
+
+def raise_if_strict(strict: bool, blocking: List[str], message: str,
+                    warnings: Optional[List[str]] = None) -> None:
+    """
+    Abort when strict mode is on and there are blocking warnings.
+
+    Raises:
+        StrictModeError: Carrying every warning collected so far.
+        SystemExit: With the message, when warnings were printed instead of
+            collected (the build_* helpers' CLI behaviour).
+    """
+    if strict and blocking:
+        if warnings is None:
+            raise SystemExit(message)
+        raise StrictModeError(message, warnings)
+
+
+def write_output(out: Output, save: Callable[[Any], None], result: RenderResult) -> RenderResult:
+    """
+    Save a document to a path, a binary stream or a memory buffer, and
+    record where it went on the result.
+
+    Args:
+        out: Output path, writable binary stream, or None for bytes.
+        save: Callable that saves the document to a path or stream
+            (e.g. Document.save, Presentation.save).
+        result: Result to fill in.
+
+    Returns:
+        result, with .path or .data set.
+    """
+    if out is None:
+        buffer = io.BytesIO()
+        save(buffer)
+        result.data = buffer.getvalue()
+    elif isinstance(out, str):
+        os.makedirs(os.path.dirname(os.path.abspath(out)), exist_ok=True)
+        save(out)
+        result.path = os.path.abspath(out)
+    else:
+        save(out)
+    return result
+
+
+def write_bytes(out: Output, data: bytes, result: RenderResult) -> RenderResult:
+    """write_output() for documents already rendered to bytes (fpdf2)."""
+    if out is None:
+        result.data = bytes(data)
+        return result
+
+    def save(target):
+        if isinstance(target, str):
+            with open(target, "wb") as f:
+                f.write(data)
+        else:
+            target.write(data)
+    return write_output(out, save, result)
+
+
+def exit_on_strict_failure(error: StrictModeError) -> NoReturn:
+    """Print the warnings behind a strict-mode failure and exit with its message."""
+    for warning in error.warnings:
+        print(f"  WARNING: {warning}")
+    raise SystemExit(error.message) from None
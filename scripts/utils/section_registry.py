@@ -5,6 +5,7 @@ Canonical registry of all 19 GDD sections with metadata for ordering,
 validation, and document generation. Import this in all generator scripts.
 """
 
+import re
 from typing import TypedDict, List, Optional
 
 
@@ -486,13 +487,36 @@ def get_section_for_genre(genre: str) -> List[str]:
     return result
 
 
+_SECTION_HEADING_RE = re.compile(r"^(?P<number>\d+)\.\s+(?P<name>.+?)\s*$")
+_KEYS_BY_NAME = {sdef["name"].lower(): key for key, sdef in SECTIONS.items()}
+_KEYS_BY_ORDER = {sdef["order"]: key for key, sdef in SECTIONS.items()}
+
+
+def section_key_for_heading(text: str) -> Optional[str]:
+    """
+    Map a "N. Name" section heading (as written by the generators) to its key.
+
+    The name wins over the number, so renumbered documents still map;
+    an unknown name falls back to the number.
+
+    Returns:
+        The section key, or None if the heading is not a numbered section.
+    """
+    match = _SECTION_HEADING_RE.match(text.strip())
+    if not match:
+        return None
+    key = _KEYS_BY_NAME.get(match.group("name").lower())
+    return key or _KEYS_BY_ORDER.get(int(match.group("number")))
+
+
 def validate_gdd_content(content: dict) -> List[str]:
     """
     Validate a GDD content dictionary against the section registry.
     Returns a list of validation warnings.
 
     Args:
-        content: Dict mapping section keys to content strings.
+        content: Dict mapping section keys to content strings, or to dicts
+            with "content" and "subsections".
 
     Returns:
         List of warning strings.
@@ -507,6 +531,8 @@ def validate_gdd_content(content: dict) -> List[str]:
             continue
 
         section_text = content[key]
+        if isinstance(section_text, dict):
+            section_text = section_text.get("content", "")
         word_count = len(section_text.split())
 
         if word_count < section["min_words"]:
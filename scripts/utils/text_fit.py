@@ -0,0 +1,427 @@
+"""
+text_fit.py
+-----------
+In-process text autofit for pitch deck text boxes.
+
+Text is measured with TrueType metrics through Pillow: font files are
+located once per process (GDD_FONT_DIRS, then the usual system and user
+font directories), each font is loaded once at a reference size, and word
+widths are cached, so fitting a whole deck costs a few milliseconds.
+Line breaking is greedy word wrap, like PowerPoint's.
+
+When the named font is not installed, a metric-compatible substitute is
+tried (Calibri → Carlito, Arial → Liberation Sans, ...), then DejaVu Sans,
+which is wider than the common presentation fonts and therefore errs on the
+side of smaller text. Theme font references (+mj-lt / +mn-lt) also use the
+fallback.
+
+Usage:
+    paragraphs = [Paragraph("Key Features", 13, bold=True),
+                  Paragraph("  •  Procedural districts", 10)]
+    result = fit_text(paragraphs, width=4.4, height=4.0, min_scale=0.7)
+    result.scale      # 1.0 if it fits as-is, smaller if shrunk
+    result.overflow   # paragraphs for a continuation slide ([] if none)
+"""
+
+import os
+import re
+import sys
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+try:
+    from PIL import ImageFont
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
+
+
+# python-pptx text box insets (inches): 0.1 left/right, 0.05 top/bottom
+INSET_X = 0.1
+INSET_Y = 0.05
+
+# PowerPoint single line spacing is about 1.2 × the font size
+MIN_LINE_HEIGHT = 1.2
+
+# Font sizes are searched (and rounded) in half-point steps
+SIZE_STEP = 0.5
+
+REFERENCE_SIZE = 256
+
+# Widths kept per font face (least recently used dropped first), so a
+# long-running server measuring new words forever stays bounded
+WIDTH_CACHE_SIZE = 20000
+
+_FONT_EXTENSIONS = (".ttf", ".otf", ".ttc")
+
+# Metric-compatible open substitutes for common presentation fonts
+_SUBSTITUTES = {
+    "calibri": ["carlito"],
+    "cambria": ["caladea"],
+    "arial": ["liberationsans", "arimo"],
+    "helvetica": ["liberationsans", "arimo"],
+    "timesnewroman": ["liberationserif", "tinos"],
+    "couriernew": ["liberationmono", "cousine"],
+    "georgia": ["gelasio"],
+}
+_FALLBACK = ["dejavusans", "liberationsans", "arial"]
+
+# Style suffixes used in font file names (Windows short names last)
+_STYLE_SUFFIXES = {
+    (False, False): ["", "regular", "r"],
+    (True, False): ["bold", "b", "bd"],
+    (False, True): ["italic", "oblique", "i"],
+    (True, True): ["bolditalic", "boldoblique", "bi", "z"],
+}
+
+
+class Paragraph(NamedTuple):
+    """One paragraph of a text box, at its preferred (maximum) size."""
+    text: str
+    size: float
+    font_name: str = "Calibri"
+    bold: bool = False
+    italic: bool = False
+
+
+class FitResult(NamedTuple):
+    """
+    scale: factor applied to every paragraph size (see scaled_size).
+    fitted: paragraphs to place in the box (at the given scale).
+    overflow: paragraphs that did not fit even at the minimum scale.
+    """
+    scale: float
+    fitted: List[Paragraph]
+    overflow: List[Paragraph]
+
+
+# ─────────────────────────────────────────────
+# FONT LOOKUP & METRICS
+# ─────────────────────────────────────────────
+
+def font_dirs() -> List[str]:
+    """Directories searched for font files, in priority order."""
+    dirs = [d for d in os.environ.get("GDD_FONT_DIRS", "").split(os.pathsep) if d]
+    home = os.path.expanduser("~")
+    dirs += [
+        os.path.join(home, ".fonts"),
+        os.path.join(home, ".local", "share", "fonts"),
+        "/usr/local/share/fonts",
+        "/usr/share/fonts",
+        os.path.join(home, "Library", "Fonts"),
+        "/Library/Fonts",
+        "/System/Library/Fonts",
+    ]
+    if sys.platform == "win32":
+        dirs.append(os.path.join(os.environ.get("WINDIR", r"C:\Windows"), "Fonts"))
+    return dirs
+
+
+def _normalize(name: str) -> str:
+    return re.sub(r"[\s_\-]+", "", name).lower()
+
+
+@lru_cache(maxsize=1)
+def _font_index() -> Dict[str, str]:
+    """Normalized font file stem → path, first match in font_dirs() order wins."""
+    index: Dict[str, str] = {}
+    for root_dir in font_dirs():
+        if not os.path.isdir(root_dir):
+            continue
+        for dirpath, _, filenames in os.walk(root_dir):
+            for filename in sorted(filenames):
+                stem, ext = os.path.splitext(filename)
+                if ext.lower() in _FONT_EXTENSIONS:
+                    index.setdefault(_normalize(stem), os.path.join(dirpath, filename))
+    return index
+
+
+def find_font_file(font_name: str, bold: bool = False, italic: bool = False) -> Optional[str]:
+    """
+    Locate a font file for a family name and style, trying metric-compatible
+    substitutes and then the generic fallback. Returns None if nothing is found.
+    """
+    index = _font_index()
+    family = _normalize(font_name)
+    families = [family] + _SUBSTITUTES.get(family, []) + _FALLBACK
+    for candidate in families:
+        for suffix in _STYLE_SUFFIXES[(bold, italic)]:
+            path = index.get(candidate + suffix)
+            if path:
+                return path
+    if bold or italic:
+        return find_font_file(font_name)
+    return None
+
+
+class FontMetrics:
+    """
+    Width and line-height measurements for one font face, in units of the
+    font size (multiply by the size in points to get points).
+    """
+
+    def __init__(self, path: Optional[str]):
+        self.path = path
+        if path:
+            self._font = ImageFont.truetype(path, REFERENCE_SIZE)
+        else:
+            self._font = ImageFont.load_default(REFERENCE_SIZE)
+        ascent, descent = self._font.getmetrics()
+        self.line_height = max(MIN_LINE_HEIGHT, (ascent + descent) / REFERENCE_SIZE)
+        self._widths = lru_cache(maxsize=WIDTH_CACHE_SIZE)(self._measure)
+        # FreeType faces are not safe to use from two threads at once
+        self._font_lock = threading.Lock()
+        self.space_width = self.width(" ")
+
+    def _measure(self, text: str) -> float:
+        with self._font_lock:
+            return self._font.getlength(text) / REFERENCE_SIZE
+
+    def width(self, text: str) -> float:
+        """Advance width of `text` relative to the font size (cached)."""
+        return self._widths(text)
+
+
+class FontMetricsCache:
+    """
+    FontMetrics per font family and style, loaded on first use. Safe to
+    share between threads. The process-wide instance serves every render
+    unless a RenderContext brings its own (see font_metrics_scope), which is
+    released with it. Pickles as a new, empty cache.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._metrics: Dict[Tuple[str, bool, bool], FontMetrics] = {}
+
+    def get(self, font_name: str, bold: bool = False, italic: bool = False) -> FontMetrics:
+        key = (font_name, bold, italic)
+        metrics = self._metrics.get(key)
+        if metrics is None:
+            with self._lock:
+                metrics = self._metrics.get(key)
+                if metrics is None:
+                    metrics = FontMetrics(find_font_file(font_name, bold, italic))
+                    self._metrics[key] = metrics
+        return metrics
+
+    def clear(self) -> None:
+        """Drop every loaded font and cached width."""
+        with self._lock:
+            self._metrics = {}
+
+    def __reduce__(self):
+        return FontMetricsCache, ()
+
+
+_shared_metrics = FontMetricsCache()
+_active_metrics: ContextVar[Optional[FontMetricsCache]] = ContextVar("font_metrics", default=None)
+
+
+@contextmanager
+def font_metrics_scope(cache: Optional[FontMetricsCache]) -> Iterator[None]:
+    """
+    Measure with cache inside the with block (on this thread / task only);
+    None keeps the process-wide cache.
+    """
+    token = _active_metrics.set(cache)
+    try:
+        yield
+    finally:
+        _active_metrics.reset(token)
+
+
+def get_metrics(font_name: str, bold: bool = False, italic: bool = False) -> FontMetrics:
+    """Return the cached FontMetrics for a font family and style."""
+    return (_active_metrics.get() or _shared_metrics).get(font_name, bold, italic)
+
+
+# ─────────────────────────────────────────────
+# WRAPPING & FITTING
+# ─────────────────────────────────────────────
+
+def scaled_size(size: float, scale: float) -> float:
+    """Scale a font size and round down to a half-point step."""
+    return max(SIZE_STEP, int(size * scale / SIZE_STEP + 1e-6) * SIZE_STEP)
+
+
+def _split_word(word: str, metrics: FontMetrics, max_width: float) -> List[str]:
+    """Break a word wider than the line into character chunks."""
+    chunks, current = [], ""
+    for char in word:
+        if current and metrics.width(current + char) > max_width:
+            chunks.append(current)
+            current = char
+        else:
+            current += char
+    chunks.append(current)
+    return chunks
+
+
+def wrap_lines(paragraph: Paragraph, width: float, size: float) -> List[str]:
+    """
+    Greedy word wrap of one paragraph.
+
+    Args:
+        paragraph: Paragraph to wrap.
+        width: Usable line width in points.
+        size: Font size in points.
+
+    Returns:
+        The wrapped lines (at least one, possibly empty).
+    """
+    metrics = get_metrics(paragraph.font_name, paragraph.bold, paragraph.italic)
+    max_width = width / size
+    lines: List[str] = []
+    for source_line in paragraph.text.split("\n"):
+        # Leading whitespace (e.g. the "  •  " bullet indent) counts on the first line
+        indent = source_line[:len(source_line) - len(source_line.lstrip())]
+        words: List[str] = []
+        line_width = metrics.width(indent) if indent else 0.0
+        for word in source_line.split():
+            word_width = metrics.width(word)
+            if word_width > max_width:
+                pieces = _split_word(word, metrics, max_width)
+            else:
+                pieces = [word]
+            for piece in pieces:
+                piece_width = metrics.width(piece)
+                needed = piece_width + (metrics.space_width if words else 0.0)
+                if words and line_width + needed > max_width:
+                    lines.append(indent + " ".join(words))
+                    indent = ""
+                    words, line_width = [piece], piece_width
+                else:
+                    words.append(piece)
+                    line_width += needed
+        lines.append(indent + " ".join(words))
+    return lines
+
+
+def _box_points(width: float, height: float) -> Tuple[float, float]:
+    """Usable text area of a box given in inches, in points."""
+    return (width - 2 * INSET_X) * 72.0, (height - 2 * INSET_Y) * 72.0
+
+
+def text_height(paragraphs: List[Paragraph], width: float, scale: float = 1.0) -> float:
+    """Height in points of the paragraphs wrapped in a box `width` inches wide."""
+    usable_width, _ = _box_points(width, 0)
+    total = 0.0
+    for paragraph in paragraphs:
+        size = scaled_size(paragraph.size, scale)
+        metrics = get_metrics(paragraph.font_name, paragraph.bold, paragraph.italic)
+        total += len(wrap_lines(paragraph, usable_width, size)) * size * metrics.line_height
+    return total
+
+
+def fits(paragraphs: List[Paragraph], width: float, height: float, scale: float = 1.0) -> bool:
+    """True if the paragraphs fit a width × height (inches) text box at `scale`."""
+    _, usable_height = _box_points(width, height)
+    return text_height(paragraphs, width, scale) <= usable_height
+
+
+def _candidate_sizes(base: float, min_scale: float) -> List[float]:
+    """Sizes from `base` down to base × min_scale in half-point steps (largest first)."""
+    sizes = [base]
+    while sizes[-1] - SIZE_STEP >= base * min_scale - 1e-6:
+        sizes.append(sizes[-1] - SIZE_STEP)
+    return sizes
+
+
+def fit_scale(
+    paragraphs: List[Paragraph],
+    width: float,
+    height: float,
+    min_scale: float = 0.6
+) -> Optional[float]:
+    """
+    Binary-search the largest scale (in half-point steps of the largest
+    paragraph size) at which the paragraphs fit the box.
+
+    Returns:
+        The scale (1.0 if no shrinking is needed), or None if the text does
+        not fit even at min_scale.
+    """
+    if not PIL_AVAILABLE or not paragraphs:
+        return 1.0
+    base = max(p.size for p in paragraphs)
+    sizes = _candidate_sizes(base, min_scale)
+    if not fits(paragraphs, width, height, sizes[-1] / base):
+        return None
+    if fits(paragraphs, width, height):
+        return 1.0
+    low, high = 0, len(sizes) - 1  # sizes[high] fits, sizes[0] does not
+    while high - low > 1:
+        middle = (low + high) // 2
+        if fits(paragraphs, width, height, sizes[middle] / base):
+            high = middle
+        else:
+            low = middle
+    return sizes[high] / base
+
+
+def _split_text(text: str, head_lines: List[str]) -> Tuple[str, str]:
+    """Split the original text after the characters of its first wrapped lines."""
+    remaining = sum(len(line.replace(" ", "")) for line in head_lines)
+    for position, char in enumerate(text):
+        if remaining == 0:
+            return text[:position].rstrip(), text[position:].strip()
+        if not char.isspace():
+            remaining -= 1
+    return text, ""
+
+
+def split_to_fit(
+    paragraphs: List[Paragraph],
+    width: float,
+    height: float,
+    scale: float
+) -> Tuple[List[Paragraph], List[Paragraph]]:
+    """
+    Split paragraphs at the last line that fits the box at `scale`. A
+    paragraph cut mid-way is split into its fitting lines and the rest.
+
+    Returns:
+        (fitted, overflow) paragraph lists.
+    """
+    usable_width, usable_height = _box_points(width, height)
+    used = 0.0
+    for i, paragraph in enumerate(paragraphs):
+        size = scaled_size(paragraph.size, scale)
+        line_height = size * get_metrics(
+            paragraph.font_name, paragraph.bold, paragraph.italic
+        ).line_height
+        lines = wrap_lines(paragraph, usable_width, size)
+        room = int((usable_height - used) / line_height + 1e-6)
+        if room >= len(lines):
+            used += len(lines) * line_height
+            continue
+        if room <= 0:
+            return paragraphs[:i], paragraphs[i:]
+        head_text, tail_text = _split_text(paragraph.text, lines[:room])
+        return (paragraphs[:i] + [paragraph._replace(text=head_text)],
+                [paragraph._replace(text=tail_text)] + paragraphs[i + 1:])
+    return list(paragraphs), []
+
+
+def fit_text(
+    paragraphs: List[Paragraph],
+    width: float,
+    height: float,
+    min_scale: float = 0.6
+) -> FitResult:
+    """
+    Fit paragraphs into a width × height (inches) text box: shrink them as
+    little as possible, and if they do not fit even at min_scale, keep what
+    fits at min_scale and return the rest as overflow.
+    """
+    scale = fit_scale(paragraphs, width, height, min_scale)
+    if scale is not None:
+        return FitResult(scale, list(paragraphs), [])
+    base = max(p.size for p in paragraphs)
+    scale = _candidate_sizes(base, min_scale)[-1] / base
+    fitted, overflow = split_to_fit(paragraphs, width, height, scale)
+    return FitResult(scale, fitted, overflow)
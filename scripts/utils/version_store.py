@@ -0,0 +1,481 @@
+"""
+version_store.py
+----------------
+SQLite store for GDD revisions, with section content deduplicated by hash.
+
+Each committed version records its top-level config and an ordered list of
+(section key, content hash). Content lives once in the blobs table, keyed
+by the SHA-256 of its JSON encoding, so revisions share every section they
+did not change. Which sections a version added, modified or removed
+relative to its parent is worked out at commit time and stored, so
+"which versions changed section X" is an index lookup rather than a scan.
+
+Schema:
+    blobs(hash PK, raw_size, data)                  zlib-compressed JSON
+    versions(id PK, project, label, created_at, author, summary,
+             parent_id, config_hash)                index (project, id)
+    version_sections(version_id, position, section_key, hash)
+                                                    PK (version_id, position)
+    section_changes(version_id, section_key, change)
+                                                    index (section_key, version_id)
+
+All SQL is parameterized; project, labels and section keys are never
+formatted into statements.
+
+Usage:
+    with VersionStore("echo_chamber.gddstore", create=True) as store:
+        version_id = store.commit(game_data, author="A. Designer", summary="Economy pass")
+        game_data = store.load_version(version_id)   # sections fetched on lookup
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import zlib
+from collections.abc import Mapping
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional
+
+from .gddpack import CorruptContentError
+
+SQLITE_MAGIC = b"SQLite format 3\0"
+STORE_EXTENSION = ".gddstore"
+SCHEMA_VERSION = 1  # also set by the PRAGMA at the end of _SCHEMA
+_MAX_ID = 2 ** 63 - 1
+# Stored-config key marking a version whose sections live in version_sections
+# (its "sections" entry is then only a placeholder that keeps the key order)
+_SPLIT_KEY = "$sections_stored"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS blobs (
+    hash      TEXT PRIMARY KEY,
+    raw_size  INTEGER NOT NULL,
+    data      BLOB NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS versions (
+    id           INTEGER PRIMARY KEY,
+    project      TEXT NOT NULL,
+    label        TEXT NOT NULL,
+    created_at   TEXT NOT NULL,
+    author       TEXT NOT NULL,
+    summary      TEXT NOT NULL,
+    parent_id    INTEGER REFERENCES versions(id),
+    config_hash  TEXT NOT NULL REFERENCES blobs(hash)
+);
+CREATE INDEX IF NOT EXISTS versions_by_project ON versions(project, id);
+CREATE TABLE IF NOT EXISTS version_sections (
+    version_id   INTEGER NOT NULL REFERENCES versions(id),
+    position     INTEGER NOT NULL,
+    section_key  TEXT NOT NULL,
+    hash         TEXT NOT NULL REFERENCES blobs(hash),
+    PRIMARY KEY (version_id, position)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS section_changes (
+    version_id   INTEGER NOT NULL REFERENCES versions(id),
+    section_key  TEXT NOT NULL,
+    change       TEXT NOT NULL CHECK (change IN ('added', 'modified', 'removed')),
+    PRIMARY KEY (version_id, section_key)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS changes_by_section ON section_changes(section_key, version_id);
+PRAGMA user_version = 1;
+"""
+
+
+class VersionInfo(NamedTuple):
+    """One row of the versions table."""
+    id: int
+    project: str
+    label: str
+    created_at: str
+    author: str
+    summary: str
+    parent_id: Optional[int]
+
+
+def is_version_store(path: str) -> bool:
+    """True if the file at path is an SQLite database."""
+    try:
+        with open(path, "rb") as f:
+            return f.read(len(SQLITE_MAGIC)) == SQLITE_MAGIC
+    except OSError:
+        return False
+
+
+def _encode(value: Any) -> bytes:
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def content_hash(value: Any) -> str:
+    """SHA-256 of a section's JSON encoding: the key content is stored under."""
+    return hashlib.sha256(_encode(value)).hexdigest()
+
+
+def _section_names(keys: List[str]) -> str:
+    try:
+        from .section_registry import SECTIONS
+    except ImportError:
+        SECTIONS = {}
+    names = [SECTIONS.get(k, {}).get("name", k) for k in keys]
+    if len(names) > 3:
+        names = names[:2] + [f"{len(names) - 2} more"]
+    return ", ".join(names)
+
+
+def history_table_rows(game_data: Dict[str, Any], version: str, date: str,
+                       author: str) -> List[List[str]]:
+    """
+    Cover page version history rows from game_data["version_history"] (set
+    by load_version), or a single "Initial draft" row.
+    """
+    rows = [
+        [str(entry.get(k, "")) for k in ("version", "date", "author", "summary")]
+        for entry in game_data.get("version_history") or []
+        if isinstance(entry, dict)
+    ]
+    return rows or [[version, date, author, "Initial draft"]]
+
+
+def _stored_sections(path: str, hashes: Dict[str, str]) -> "StoredSections":
+    """Unpickle a StoredSections by reopening its store."""
+    return StoredSections(VersionStore(path), hashes)
+
+
+class StoredSections(Mapping):
+    """
+    Read-only mapping of a stored version's sections. Content is fetched
+    and inflated on first lookup; iteration, len() and `in` only use the
+    version's section list. Lookups are safe from any thread. Pickles as
+    the store path and content hashes (so it can be sent to worker
+    processes) and reopens the store on unpickling.
+    """
+
+    def __init__(self, store: "VersionStore", hashes: Dict[str, str]):
+        self._store = store
+        self._hashes = hashes
+        self._loaded: Dict[str, Any] = {}
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self._loaded:
+            self._loaded[key] = self._store.read_blob(self._hashes[key])
+        return self._loaded[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._hashes)
+
+    def __len__(self) -> int:
+        return len(self._hashes)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._hashes
+
+    def is_loaded(self, key: str) -> bool:
+        """Whether a section has already been fetched."""
+        return key in self._loaded
+
+    def content_hash(self, key: str) -> str:
+        """The section's content hash, without fetching it."""
+        return self._hashes[key]
+
+    def __reduce__(self):
+        return _stored_sections, (self._store.path, self._hashes)
+
+    def __repr__(self) -> str:
+        return f"StoredSections({len(self._hashes)} sections, {len(self._loaded)} loaded)"
+
+
+class VersionStore:
+    """
+    A GDD version store backed by one SQLite file.
+
+    Opened read-only unless create is set, so loading a config never writes
+    to the file. With create, a missing file (or an empty database) gets the
+    schema; only commit() needs it.
+
+    read_blob() (and so StoredSections) may be called from any thread, so
+    versions loaded here can be rendered on a thread pool: its queries run
+    under a lock on the shared connection. The other methods are for one
+    thread at a time.
+
+    Raises:
+        ValueError: If the file is not an SQLite database, is one without
+            the version store tables (read-only opens), or has a different
+            schema version.
+    """
+
+    def __init__(self, path: str, create: bool = False):
+        self.path = path
+        if create:
+            self._conn = sqlite3.connect(path, check_same_thread=False)
+        else:
+            uri = f"{Path(path).resolve().as_uri()}?mode=ro"
+            try:
+                self._conn = sqlite3.connect(uri, uri=True, check_same_thread=False)
+            except sqlite3.Error as e:
+                raise ValueError(f"{path}: {e}") from None
+        self._lock = threading.Lock()
+        try:
+            user_version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+            if user_version not in (0, SCHEMA_VERSION):
+                raise ValueError(
+                    f"{path}: unsupported version store schema {user_version}"
+                )
+            if create:
+                self._conn.executescript(_SCHEMA)
+            elif self._conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'versions'"
+            ).fetchone() is None:
+                raise ValueError(f"{path}: SQLite database is not a GDD version store")
+        except sqlite3.DatabaseError as e:
+            self._conn.close()
+            raise ValueError(f"{path}: {e}") from None
+        except ValueError:
+            self._conn.close()
+            raise
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __reduce__(self):
+        return VersionStore, (self.path,)
+
+    def __enter__(self) -> "VersionStore":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _put_blob(self, value: Any) -> str:
+        raw = _encode(value)
+        digest = hashlib.sha256(raw).hexdigest()
+        known = self._conn.execute("SELECT 1 FROM blobs WHERE hash = ?", (digest,)).fetchone()
+        if known is None:
+            self._conn.execute(
+                "INSERT INTO blobs (hash, raw_size, data) VALUES (?, ?, ?)",
+                (digest, len(raw), zlib.compress(raw, 9)),
+            )
+        return digest
+
+    def read_blob(self, digest: str) -> Any:
+        """Fetch and decode one content blob; CorruptContentError if it is missing or damaged."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT raw_size, data FROM blobs WHERE hash = ?", (digest,)
+            ).fetchone()
+        if row is None:
+            raise CorruptContentError(f"{self.path}: missing blob {digest}")
+        try:
+            raw = zlib.decompress(row[1])
+        except zlib.error:
+            raw = b""
+        if len(raw) != row[0] or hashlib.sha256(raw).hexdigest() != digest:
+            raise CorruptContentError(f"{self.path}: corrupt blob {digest}")
+        return json.loads(raw.decode("utf-8"))
+
+    def _section_hashes(self, version_id: int) -> Dict[str, str]:
+        rows = self._conn.execute(
+            "SELECT section_key, hash FROM version_sections "
+            "WHERE version_id = ? ORDER BY position",
+            (version_id,),
+        )
+        return dict(rows.fetchall())
+
+    def commit(
+        self,
+        game_data: Dict[str, Any],
+        project: Optional[str] = None,
+        label: Optional[str] = None,
+        author: Optional[str] = None,
+        summary: Optional[str] = None,
+    ) -> int:
+        """
+        Store game data as the newest version of its project.
+
+        Args:
+            game_data: Game content, as loaded from a config.
+            project: Project name (default: game_title).
+            label: Version label (default: game_data["version"]).
+            author: Author (default: game_data["lead_designer"]).
+            summary: Summary of changes (default: generated from the
+                sections added, modified and removed since the last version).
+
+        Returns:
+            The new version ID.
+        """
+        project = project or game_data.get("game_title") or "Untitled Game"
+        sections = game_data.get("sections")
+        split = isinstance(sections, Mapping)
+        config = {k: v for k, v in game_data.items()
+                  if k != "version_history" and not (split and k == "sections")}
+        if split:
+            # Keep the position of "sections" among the top-level keys.
+            config["sections"] = None
+            config = {k: config[k] for k in game_data if k in config}
+            config[_SPLIT_KEY] = True
+
+        parent = self.latest_version(project)
+        with self._conn:
+            config_hash = self._put_blob(config)
+            hashes = {key: self._put_blob(value) for key, value in (sections.items() if split else [])}
+
+            old = self._section_hashes(parent.id) if parent else {}
+            changes = [(k, "added") for k in hashes if k not in old]
+            changes += [(k, "modified") for k in hashes if k in old and old[k] != hashes[k]]
+            changes += [(k, "removed") for k in old if k not in hashes]
+            if summary is None:
+                summary = "Initial draft" if parent is None else self._summarize(changes)
+
+            cursor = self._conn.execute(
+                "INSERT INTO versions (project, label, created_at, author, summary, "
+                "parent_id, config_hash) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    project,
+                    label or game_data.get("version") or "v0.1",
+                    datetime.now().isoformat(timespec="seconds"),
+                    author or game_data.get("lead_designer") or "Design Team",
+                    summary,
+                    parent.id if parent else None,
+                    config_hash,
+                ),
+            )
+            version_id = cursor.lastrowid
+            self._conn.executemany(
+                "INSERT INTO version_sections (version_id, position, section_key, hash) "
+                "VALUES (?, ?, ?, ?)",
+                [(version_id, i, k, h) for i, (k, h) in enumerate(hashes.items())],
+            )
+            self._conn.executemany(
+                "INSERT INTO section_changes (version_id, section_key, change) VALUES (?, ?, ?)",
+                [(version_id, k, change) for k, change in changes],
+            )
+        return version_id
+
+    @staticmethod
+    def _summarize(changes: List[tuple]) -> str:
+        if not changes:
+            return "No content changes"
+        parts = []
+        for kind, verb in (("modified", "Revised"), ("added", "Added"), ("removed", "Removed")):
+            keys = [k for k, change in changes if change == kind]
+            if keys:
+                parts.append(f"{verb} {_section_names(keys)}")
+        return "; ".join(parts)
+
+    def projects(self) -> List[str]:
+        """Project names, alphabetically."""
+        rows = self._conn.execute("SELECT DISTINCT project FROM versions ORDER BY project")
+        return [row[0] for row in rows]
+
+    def list_versions(self, project: Optional[str] = None,
+                      up_to: Optional[int] = None) -> List[VersionInfo]:
+        """Versions of one project (or all), oldest first, optionally up to an ID."""
+        up_to = _MAX_ID if up_to is None else up_to
+        if project is None:
+            rows = self._conn.execute(
+                "SELECT id, project, label, created_at, author, summary, parent_id "
+                "FROM versions WHERE id <= ? ORDER BY id",
+                (up_to,),
+            )
+        else:
+            rows = self._conn.execute(
+                "SELECT id, project, label, created_at, author, summary, parent_id "
+                "FROM versions WHERE project = ? AND id <= ? ORDER BY id",
+                (project, up_to),
+            )
+        return [VersionInfo(*row) for row in rows]
+
+    def get_version(self, version_id: int) -> VersionInfo:
+        """Look up one version. Raises ValueError if it does not exist."""
+        row = self._conn.execute(
+            "SELECT id, project, label, created_at, author, summary, parent_id "
+            "FROM versions WHERE id = ?",
+            (version_id,),
+        ).fetchone()
+        if row is None:
+            raise ValueError(f"{self.path}: no version {version_id}")
+        return VersionInfo(*row)
+
+    def latest_version(self, project: Optional[str] = None) -> Optional[VersionInfo]:
+        """Newest version of a project (or of the whole store), or None."""
+        if project is None:
+            row = self._conn.execute(
+                "SELECT id, project, label, created_at, author, summary, parent_id "
+                "FROM versions ORDER BY id DESC LIMIT 1"
+            ).fetchone()
+        else:
+            row = self._conn.execute(
+                "SELECT id, project, label, created_at, author, summary, parent_id "
+                "FROM versions WHERE project = ? ORDER BY id DESC LIMIT 1",
+                (project,),
+            ).fetchone()
+        return VersionInfo(*row) if row else None
+
+    def versions_changing(self, section_key: str,
+                          project: Optional[str] = None) -> List[VersionInfo]:
+        """Versions that added, modified or removed a section, oldest first."""
+        rows = self._conn.execute(
+            "SELECT v.id, v.project, v.label, v.created_at, v.author, v.summary, v.parent_id "
+            "FROM section_changes c JOIN versions v ON v.id = c.version_id "
+            "WHERE c.section_key = ? AND v.project = coalesce(?, v.project) "
+            "ORDER BY c.version_id",
+            (section_key, project),
+        )
+        return [VersionInfo(*row) for row in rows]
+
+    def changes(self, version_id: int) -> Dict[str, str]:
+        """Section key -> "added" / "modified" / "removed" for one version."""
+        rows = self._conn.execute(
+            "SELECT section_key, change FROM section_changes WHERE version_id = ?",
+            (version_id,),
+        )
+        return dict(rows.fetchall())
+
+    def version_history(self, version_id: int) -> List[Dict[str, str]]:
+        """
+        Rows for the cover page's version history table: every version of
+        the same project up to and including version_id.
+        """
+        info = self.get_version(version_id)
+        return [
+            {
+                "version": v.label,
+                "date": v.created_at[:10],
+                "author": v.author,
+                "summary": v.summary,
+            }
+            for v in self.list_versions(info.project, up_to=version_id)
+        ]
+
+    def load_version(self, version_id: Optional[int] = None,
+                     lazy: bool = True) -> Dict[str, Any]:
+        """
+        Rebuild a version's game data, with "version_history" filled in.
+
+        Args:
+            version_id: Version to load (default: the newest in the store).
+            lazy: Keep "sections" as a StoredSections mapping (fetched on
+                lookup) instead of reading every section now.
+
+        Raises:
+            ValueError: If the version does not exist or the store is empty.
+        """
+        if version_id is None:
+            latest = self.latest_version()
+            if latest is None:
+                raise ValueError(f"{self.path}: version store is empty")
+            version_id = latest.id
+        row = self._conn.execute(
+            "SELECT config_hash FROM versions WHERE id = ?", (version_id,)
+        ).fetchone()
+        if row is None:
+            raise ValueError(f"{self.path}: no version {version_id}")
+        game_data = self.read_blob(row[0])
+        hashes = self._section_hashes(version_id)
+        split = game_data.pop(_SPLIT_KEY, False)
+        # Versions stored before _SPLIT_KEY: a None placeholder with section rows
+        if split or (game_data.get("sections", ()) is None and hashes):
+            sections = StoredSections(self, hashes)
+            game_data["sections"] = sections if lazy else dict(sections)
+        game_data["version_history"] = self.version_history(version_id)
+        return game_data